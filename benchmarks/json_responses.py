@@ -0,0 +1,114 @@
+"""
+Benchmark of the JSON response paths on ``/collections`` and ``/organizations/{id}``.
+
+Compares FastAPI's default path (build the Pydantic response model, validate it against ``response_model``
+and encode it with the standard json module) with the zero-validation orjson path of
+``statikk.interfaces.api.responses``. Requests go through the full ASGI stack, in process.
+
+Run with ``PYTHONPATH=src python benchmarks/json_responses.py``.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from statikk.core.domain.entities.collection import Collection
+from statikk.core.domain.entities.organization import Organization
+from statikk.core.domain.entities.role import Role
+from statikk.core.domain.value_objects.collection_id import CollectionID
+from statikk.core.domain.value_objects.organization_id import OrganizationID
+from statikk.core.domain.value_objects.permissions import Permission
+from statikk.core.domain.value_objects.role_id import RoleID
+from statikk.core.domain.value_objects.user_id import UserID
+from statikk.interfaces.api.pagination import encode_cursor
+from statikk.interfaces.api.pagination import Page
+from statikk.interfaces.api.responses import entity_response
+from statikk.interfaces.api.responses import JSONResponse as FastJSONResponse
+from statikk.interfaces.api.responses import page_response
+
+PAGE_SIZE = 1000
+MEMBERS = 1000
+REQUESTS = 200
+
+
+class CollectionResponse(BaseModel):
+    collection_id: str
+    name: str
+    schema: dict[str, str]
+
+
+class OrganizationResponse(BaseModel):
+    organization_id: str
+    name: str
+    owner_id: str
+    members: dict[str, str]
+
+
+collections = [
+    Collection(CollectionID(), f"collection-{i}", {f"field_{j}": 'string' for j in range(10)}) for i in range(PAGE_SIZE)
+]
+member = Role(RoleID(), 'member', [Permission('read'), Permission('write')])
+organization = Organization(
+    OrganizationID(), 'organization', UserID(), members={str(UserID()): member for _ in range(MEMBERS)},
+)
+
+
+def create_default_app() -> FastAPI:
+    app = FastAPI(default_response_class=JSONResponse)
+
+    @app.get('/collections', response_model=Page[CollectionResponse])
+    async def list_collections():
+        return Page[CollectionResponse](
+            items=[CollectionResponse(**c.to_dict()) for c in collections],
+            next_cursor=encode_cursor(str(collections[-1].collection_id)),
+        )
+
+    @app.get('/organizations/{organization_id}', response_model=OrganizationResponse)
+    async def get_organization(organization_id: str):
+        values = organization.to_dict()
+        return OrganizationResponse(**{**values, 'members': {k: role.name for k, role in values['members'].items()}})
+
+    return app
+
+
+def create_fast_app() -> FastAPI:
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    @app.get('/collections', response_model=Page[CollectionResponse])
+    async def list_collections():
+        return page_response(collections, CollectionResponse, encode_cursor(str(collections[-1].collection_id)))
+
+    @app.get('/organizations/{organization_id}', response_model=OrganizationResponse)
+    async def get_organization(organization_id: str):
+        return entity_response(organization, OrganizationResponse)
+
+    return app
+
+
+async def measure(app: FastAPI, path: str) -> float:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://test') as client:
+        for _ in range(10):
+            await client.get(path)
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            response = await client.get(path)
+            response.raise_for_status()
+        return (time.perf_counter() - start) / REQUESTS * 1000
+
+
+async def main() -> None:
+    default_app, fast_app = create_default_app(), create_fast_app()
+    print(f"{'route':<28}{'default (ms)':>14}{'orjson (ms)':>14}{'speedup':>10}")
+    for path in ('/collections', f"/organizations/{organization.organization_id}"):
+        default = await measure(default_app, path)
+        fast = await measure(fast_app, path)
+        route = path if path == '/collections' else '/organizations/{id}'
+        print(f"{route:<28}{default:>14.2f}{fast:>14.2f}{default / fast:>9.1f}x")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
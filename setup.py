@@ -19,6 +19,8 @@ setup(
         'passlib',
         'python-jose',
         'aiofiles',
+        'surrealdb',
+        'orjson',
     ],
     extras_require={
         'dev': [
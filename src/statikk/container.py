@@ -0,0 +1,182 @@
+# container.py
+from __future__ import annotations
+
+import os
+
+from statikk.core.application.services.cloud_function_runtime import CloudFunctionRuntime
+from statikk.core.application.services.cloud_function_runtime import MEMORY_LIMIT
+from statikk.core.application.services.cloud_function_service import CloudFunctionService
+from statikk.core.application.services.collection_service import CollectionService
+from statikk.core.application.services.cron_scheduler import CronScheduler
+from statikk.core.application.services.organization_service import OrganizationService
+from statikk.core.application.services.permission_cache import PermissionCache
+from statikk.core.application.services.project_config_service import ProjectConfigService
+from statikk.core.application.services.project_service import ProjectService
+from statikk.core.application.services.trigger_registry import TriggerRegistry
+from statikk.core.application.services.user_service import UserService
+from statikk.core.application.unit_of_work import UnitOfWorkRepository
+from statikk.core.domain import events
+from statikk.core.domain.repositories.cloud_function_repository_impl import SubrrrealDBCloudFunctionRepository
+from statikk.core.domain.repositories.collection_repository_impl import SubrrealDBCollectionRepository
+from statikk.core.domain.repositories.organization_repository_impl import SubrrrealDBOrganizationRepository
+from statikk.core.domain.repositories.project_repository_impl import SubrrrealDBProjectRepository
+from statikk.core.domain.repositories.user_repository_impl import SubrrealDBUserRepository
+from statikk.infrastructure.caching.caching_repository import CachingRepository
+from statikk.infrastructure.databases.subrreal_db_client import SubrrealDBClient
+from statikk.infrastructure.events.event_bus import COALESCE
+from statikk.infrastructure.events.event_bus import EventBus
+from statikk.infrastructure.events.publishing_repository import EventPublishingRepository
+from statikk.infrastructure.execution.code_cache import CodeCache
+from statikk.infrastructure.execution.worker_pool import WorkerPool
+
+# Directory of the files the API process and the function workers keep between runs, in the user's cache
+# directory rather than a shared temporary one; ``ensure_private_directory`` keeps it private.
+STATE_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'statikk')
+
+# Directory of the compiled cloud function code shared by the API process and the function workers.
+CODE_CACHE_DIRECTORY = os.path.join(STATE_DIRECTORY, 'code-cache')
+
+# File saving the time the cron scheduler reached, so missed firings are caught up on restart.
+CRON_CHECKPOINT_PATH = os.path.join(STATE_DIRECTORY, 'cron-checkpoint')
+
+
+class Container:
+    """
+    Application object graph: the database client, the repositories and the services, built once and
+    shared by every request.
+
+    Each repository is wrapped in an ``EventPublishingRepository`` publishing its writes on the event bus,
+    then in a ``CachingRepository`` for read-through caching, then in a ``UnitOfWorkRepository`` so routes
+    running under the ``unit_of_work`` dependency get an identity map and deferred writes; writes deferred to
+    a unit of work publish their events when it commits.
+
+    :param db_client: The database client, owning the connection pool.
+    :type db_client: SubrrealDBClient
+    :param worker_pool: The worker processes running cloud functions.
+    :type worker_pool: WorkerPool, optional
+    :param code_cache: Cache of compiled cloud function code; its directory should be the worker pool's.
+    :type code_cache: CodeCache, optional
+    :param cron_checkpoint_path: File saving the time the cron scheduler reached, or None to not catch up
+        on missed firings.
+    :type cron_checkpoint_path: str, optional
+    :param authz_token: Bearer token trusted services present to call the batch authorization routes, or
+        None to close those routes.
+    :type authz_token: str, optional
+    """
+
+    def __init__(
+        self,
+        db_client: SubrrealDBClient,
+        worker_pool: WorkerPool | None = None,
+        code_cache: CodeCache | None = None,
+        cron_checkpoint_path: str | None = CRON_CHECKPOINT_PATH,
+        authz_token: str | None = None,
+    ):
+        self.db_client = db_client
+        self.authz_token = authz_token
+        self.code_cache = code_cache or CodeCache(CODE_CACHE_DIRECTORY)
+        # The runtime's per-invocation limit is also each worker's hard cap, so functions cannot lift it.
+        self.worker_pool = worker_pool or WorkerPool(code_cache_directory=self.code_cache.directory, memory_limit=MEMORY_LIMIT)
+
+        self.event_bus = EventBus()
+
+        self.collection_repository = UnitOfWorkRepository(
+            CachingRepository(
+                EventPublishingRepository(
+                    SubrrealDBCollectionRepository(db_client), self.event_bus, 'collection_id',
+                    events.CollectionCreated, events.CollectionUpdated, events.CollectionDeleted,
+                ),
+                'collection_id', ttl=30.0,
+            ),
+            'collection_id',
+        )
+        self.cloud_function_repository = UnitOfWorkRepository(
+            CachingRepository(
+                EventPublishingRepository(
+                    SubrrrealDBCloudFunctionRepository(db_client), self.event_bus, 'function_id',
+                    events.CloudFunctionCreated, events.CloudFunctionUpdated, events.CloudFunctionDeleted,
+                ),
+                'function_id', ttl=30.0,
+            ),
+            'function_id',
+        )
+        self.project_repository = UnitOfWorkRepository(
+            CachingRepository(
+                EventPublishingRepository(
+                    SubrrrealDBProjectRepository(db_client), self.event_bus, 'project_id',
+                    events.ProjectCreated, events.ProjectUpdated, events.ProjectDeleted,
+                ),
+                'project_id', ttl=60.0,
+            ),
+            'project_id',
+        )
+        # Organizations carry memberships, which authorization reads on every request: keep them fresher.
+        self.organization_repository = UnitOfWorkRepository(
+            CachingRepository(
+                EventPublishingRepository(
+                    SubrrrealDBOrganizationRepository(db_client), self.event_bus, 'organization_id',
+                    events.OrganizationCreated, events.OrganizationUpdated, events.OrganizationDeleted,
+                    details=events.organization_member_events,
+                ),
+                'organization_id', ttl=10.0,
+            ),
+            'organization_id',
+        )
+        self.user_repository = CachingRepository(
+            EventPublishingRepository(
+                SubrrealDBUserRepository(db_client), self.event_bus, 'user_id',
+                events.UserCreated, events.UserUpdated, events.UserDeleted,
+            ),
+            'user_id', ttl=60.0,
+        )
+
+        self.permission_cache = PermissionCache()
+        self.trigger_registry = TriggerRegistry()
+
+        self.collection_service = CollectionService(self.collection_repository)
+        self.cloud_function_service = CloudFunctionService(
+            self.cloud_function_repository, self.code_cache, self.trigger_registry,
+        )
+        self.cloud_function_runtime = CloudFunctionRuntime(
+            self.cloud_function_service, self.worker_pool, trigger_registry=self.trigger_registry,
+        )
+        self.cron_scheduler = CronScheduler(self.cloud_function_runtime, checkpoint_path=cron_checkpoint_path)
+        # Set afterwards: the scheduler runs functions through the runtime, which reads them through the service.
+        self.cloud_function_service.cron_scheduler = self.cron_scheduler
+        # The trigger registry and the cron scheduler must see every write: only the latest event per function is
+        # kept, and none is dropped.
+        self.event_bus.subscribe(
+            self.cloud_function_service.handle_cloud_function_events, [events.CloudFunctionEvent],
+            max_size=None, overflow=COALESCE,
+        )
+        self.project_service = ProjectService(self.project_repository)
+        self.organization_service = OrganizationService(self.organization_repository, self.permission_cache)
+        self.user_service = UserService(self.user_repository)
+        # There is no ProjectConfigRepository implementation yet.
+        self.project_config_service: ProjectConfigService | None = None
+
+    async def start(self) -> None:
+        """
+        Open the connection pool, define the indexes the repositories rely on, index the cloud functions'
+        triggers, start delivering events, start the function workers and start firing cron triggers.
+
+        :raises ConnectionError: If the database cannot be reached.
+        """
+        await self.db_client.connect()
+        await self.organization_repository.ensure_indexes()
+        async for cloud_function in self.cloud_function_service.iter_all_cloud_functions():
+            self.trigger_registry.register(cloud_function)
+            self.cron_scheduler.register(cloud_function)
+        await self.event_bus.start()
+        await self.worker_pool.start()
+        await self.cron_scheduler.start()
+
+    async def close(self) -> None:
+        """
+        Stop firing cron triggers, stop the function workers, deliver the pending events and close the
+        connection pool, once in-flight statements are flushed.
+        """
+        await self.cron_scheduler.close()
+        await self.worker_pool.close()
+        await self.event_bus.close()
+        await self.db_client.close()
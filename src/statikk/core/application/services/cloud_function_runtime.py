@@ -0,0 +1,117 @@
+# core/application/services/cloud_function_runtime.py
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from statikk.core.application.services.cloud_function_service import CloudFunctionService
+from statikk.core.application.services.trigger_registry import TriggerRegistry
+from statikk.infrastructure.execution.worker_pool import WorkerPool
+
+# Default maximum address space of a worker while it runs an invocation, in bytes.
+MEMORY_LIMIT = 512 * 1024 * 1024
+
+
+class CloudFunctionRuntime:
+    """
+    Runs cloud functions in a pool of warm worker processes.
+
+    A function's code must define ``handler(payload)``, which may be a coroutine function; its return value
+    is the result of the invocation. Each function runs at most ``max_concurrency`` invocations at once, so
+    one busy function cannot hold every worker; further invocations of it wait their turn.
+
+    :param cloud_function_service: Service reading the cloud functions to run.
+    :type cloud_function_service: CloudFunctionService
+    :param worker_pool: The worker processes running the functions.
+    :type worker_pool: WorkerPool
+    :param timeout: Default seconds an invocation may run.
+    :type timeout: float
+    :param memory_limit: Maximum address space of a worker while it runs an invocation, in bytes, or None
+        for no cap.
+    :type memory_limit: Optional[int]
+    :param max_concurrency: Maximum number of invocations of one function running at once.
+    :type max_concurrency: int
+    :param trigger_registry: Index of the functions fired by each trigger, used by ``dispatch``.
+    :type trigger_registry: TriggerRegistry, optional
+    """
+
+    def __init__(
+        self,
+        cloud_function_service: CloudFunctionService,
+        worker_pool: WorkerPool,
+        timeout: float = 10.0,
+        memory_limit: int | None = MEMORY_LIMIT,
+        max_concurrency: int = 10,
+        trigger_registry: TriggerRegistry | None = None,
+    ):
+        self.cloud_function_service = cloud_function_service
+        self.worker_pool = worker_pool
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.max_concurrency = max_concurrency
+        self.trigger_registry = trigger_registry
+        # Per-function semaphores and the number of invocations holding or awaiting each.
+        self._slots: dict[str, tuple[asyncio.Semaphore, int]] = {}
+
+    @asynccontextmanager
+    async def _slot(self, function_id: str) -> AsyncIterator[None]:
+        semaphore, users = self._slots.get(function_id, (None, 0))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._slots[function_id] = (semaphore, users + 1)
+        try:
+            async with semaphore:
+                yield
+        finally:
+            semaphore, users = self._slots[function_id]
+            if users == 1:
+                del self._slots[function_id]
+            else:
+                self._slots[function_id] = (semaphore, users - 1)
+
+    async def dispatch(self, trigger: str, payload: Any = None) -> dict[str, Any]:
+        """
+        Run every cloud function fired by an event, concurrently.
+
+        :param trigger: The event's trigger key, e.g. ``collection:c-1:create``.
+        :type trigger: str
+        :param payload: The argument passed to each function's handler.
+        :type payload: Any
+        :return: The result of each function fired, by function ID; functions that failed map to their
+            exception.
+        :rtype: Dict[str, Any]
+        :raises RuntimeError: If the runtime has no trigger registry.
+        """
+        if self.trigger_registry is None:
+            raise RuntimeError('The cloud function runtime has no trigger registry.')
+        function_ids = sorted(self.trigger_registry.match(trigger))
+        results = await asyncio.gather(
+            *(self.invoke(function_id, payload) for function_id in function_ids), return_exceptions=True,
+        )
+        return dict(zip(function_ids, results))
+
+    async def invoke(self, function_id: str, payload: Any = None, timeout: float | None = None) -> Any:
+        """
+        Run a cloud function with a payload and return its result.
+
+        :param function_id: The unique ID of the cloud function.
+        :type function_id: str
+        :param payload: The argument passed to the function's handler.
+        :type payload: Any
+        :param timeout: Seconds the invocation may run; defaults to the runtime's ``timeout``.
+        :type timeout: Optional[float]
+        :return: The value returned by the function's handler.
+        :rtype: Any
+        :raises KeyError: If the cloud function does not exist.
+        :raises TimeoutError: If the invocation ran longer than its timeout.
+        :raises FunctionExecutionError: If the function failed or its worker died.
+        """
+        cloud_function = await self.cloud_function_service.get_cloud_function(function_id)
+        # Keyed by version, so workers load the new code once the function is updated.
+        key = f"{cloud_function.function_id}@{cloud_function.version}"
+        async with self._slot(str(cloud_function.function_id)):
+            return await self.worker_pool.run(
+                key, cloud_function.code, payload, self.timeout if timeout is None else timeout, self.memory_limit,
+            )
@@ -1,9 +1,23 @@
 # core/application/services/cloud_function_service.py
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from statikk.core.application.services.retry import retry_on_conflict
+from statikk.core.application.services.trigger_registry import TriggerRegistry
 from statikk.core.domain.entities.cloud_function import CloudFunction
+from statikk.core.domain.events import CloudFunctionDeleted
+from statikk.core.domain.events import CloudFunctionEvent
+from statikk.core.domain.events import EntityEvent
 from statikk.core.domain.repositories.cloud_function_repository import CloudFunctionRepository
 from statikk.core.domain.value_objects.cloud_function_id import CloudFunctionID
+from statikk.infrastructure.execution.code_cache import CodeCache
+
+if TYPE_CHECKING:
+    # The scheduler runs functions through the runtime, which itself reads them through this service.
+    from statikk.core.application.services.cron_scheduler import CronScheduler
 
 
 class CloudFunctionService:
@@ -12,12 +26,63 @@ class CloudFunctionService:
 
     :param cloud_function_repository: Repository for interacting with cloud function data.
     :type cloud_function_repository: CloudFunctionRepository
+    :param code_cache: Cache of compiled function code, filled when code is deployed and cleared of code
+        that is replaced.
+    :type code_cache: CodeCache, optional
+    :param trigger_registry: Index of the functions fired by each trigger, kept current by
+        ``handle_cloud_function_events``.
+    :type trigger_registry: TriggerRegistry, optional
+    :param cron_scheduler: Scheduler of the functions' ``cron:`` triggers, kept current by
+        ``handle_cloud_function_events``.
+    :type cron_scheduler: CronScheduler, optional
     """
 
-    def __init__(self, cloud_function_repository: CloudFunctionRepository):
+    def __init__(
+        self,
+        cloud_function_repository: CloudFunctionRepository,
+        code_cache: CodeCache | None = None,
+        trigger_registry: TriggerRegistry | None = None,
+        cron_scheduler: CronScheduler | None = None,
+    ):
         self.cloud_function_repository = cloud_function_repository
+        self.code_cache = code_cache
+        self.trigger_registry = trigger_registry
+        self.cron_scheduler = cron_scheduler
+
+    async def _compile(self, code: str) -> None:
+        # Compiled on deploy, so workers load the bytecode instead of compiling it on their first invocation.
+        # Compiling and writing the bytecode happen in a thread, off the event loop. Code that does not
+        # compile is reported when it is invoked.
+        if self.code_cache is not None:
+            try:
+                await asyncio.to_thread(self.code_cache.get, code)
+            except (SyntaxError, ValueError):
+                pass
 
-    def create_cloud_function(self, name: str, code: str, triggers: list[str]) -> CloudFunction:
+    async def handle_cloud_function_events(self, events: list[EntityEvent]) -> None:
+        """
+        Event bus handler applying committed cloud function writes to the trigger registry and the cron
+        scheduler, so a write that is rolled back or fails never fires triggers.
+
+        Only the latest event of each function matters, but none may be lost: subscribe it with no
+        ``max_size`` and the ``coalesce`` policy.
+
+        :param events: The events delivered; others are ignored.
+        :type events: List[EntityEvent]
+        """
+        for event in events:
+            if isinstance(event, CloudFunctionDeleted):
+                if self.trigger_registry is not None:
+                    self.trigger_registry.unregister(event.entity_id)
+                if self.cron_scheduler is not None:
+                    self.cron_scheduler.unregister(event.entity_id)
+            elif isinstance(event, CloudFunctionEvent) and event.entity is not None:
+                if self.trigger_registry is not None:
+                    self.trigger_registry.register(event.entity)
+                if self.cron_scheduler is not None:
+                    self.cron_scheduler.register(event.entity)
+
+    async def create_cloud_function(self, name: str, code: str, triggers: list[str]) -> CloudFunction:
         """
         Create a new cloud function.
 
@@ -33,10 +98,11 @@ class CloudFunctionService:
             code=code,
             triggers=triggers,
         )
-        self.cloud_function_repository.save(cloud_function)
+        await self.cloud_function_repository.save(cloud_function)
+        await self._compile(code)
         return cloud_function
 
-    def get_cloud_function(self, function_id: str) -> CloudFunction:
+    async def get_cloud_function(self, function_id: str) -> CloudFunction:
         """
         Retrieve a cloud function by its unique identifier.
 
@@ -46,9 +112,9 @@ class CloudFunctionService:
         :rtype: CloudFunction
         :raises KeyError: If the cloud function does not exist.
         """
-        return self.cloud_function_repository.get_by_id(CloudFunctionID(function_id))
+        return await self.cloud_function_repository.get_by_id(CloudFunctionID(function_id))
 
-    def update_cloud_function(self, function_id: str, new_code: str, triggers: list[str]) -> CloudFunction:
+    async def update_cloud_function(self, function_id: str, new_code: str, triggers: list[str]) -> CloudFunction:
         """
         Update an existing cloud function.
 
@@ -58,14 +124,23 @@ class CloudFunctionService:
         :return: The updated CloudFunction object.
         :rtype: CloudFunction
         :raises KeyError: If the cloud function does not exist.
+        :raises ConcurrentUpdateError: If the cloud function kept changing concurrently through every retry.
         """
-        cloud_function = self.get_cloud_function(function_id)
-        cloud_function.update_code(new_code)
-        cloud_function.triggers = triggers
-        self.cloud_function_repository.update(cloud_function)
+        async def attempt() -> CloudFunction:
+            cloud_function = await self.get_cloud_function(function_id)
+            old_code = cloud_function.code
+            cloud_function.update_code(new_code)
+            cloud_function.triggers = triggers
+            await self.cloud_function_repository.update(cloud_function)
+            if self.code_cache is not None and old_code != new_code:
+                self.code_cache.invalidate(old_code)
+            return cloud_function
+
+        cloud_function = await retry_on_conflict(attempt)
+        await self._compile(new_code)
         return cloud_function
 
-    def delete_cloud_function(self, function_id: str) -> None:
+    async def delete_cloud_function(self, function_id: str) -> None:
         """
         Delete a cloud function by its unique identifier.
 
@@ -73,9 +148,9 @@ class CloudFunctionService:
         :type function_id: str
         :raises KeyError: If the cloud function does not exist.
         """
-        self.cloud_function_repository.delete(CloudFunctionID(function_id))
+        await self.cloud_function_repository.delete(CloudFunctionID(function_id))
 
-    def list_all_cloud_functions(self) -> list[CloudFunction]:
+    async def list_all_cloud_functions(self) -> list[CloudFunction]:
         """
         List all cloud functions.
 
@@ -83,4 +158,39 @@ class CloudFunctionService:
         :rtype: List[CloudFunction]
         """
         # Assuming list_all method exists in the repository
-        return self.cloud_function_repository.list_all()
+        return await self.cloud_function_repository.list_all()
+
+    def iter_all_cloud_functions(self, page_size: int = 500, after: str | None = None) -> AsyncIterator[CloudFunction]:
+        """
+        Iterate over all cloud functions page by page, keeping only one page in memory.
+
+        :param page_size: Number of cloud functions fetched per round trip.
+        :type page_size: int
+        :param after: ID to start after, or None to start from the first cloud function.
+        :type after: Optional[str]
+        :return: An async iterator over all cloud functions.
+        :rtype: AsyncIterator[CloudFunction]
+        """
+        after_id = CloudFunctionID(after) if after is not None else None
+        return self.cloud_function_repository.iter_all(page_size=page_size, after=after_id)
+
+    async def list_cloud_functions_page(self, limit: int, after: str | None = None) -> tuple[list[CloudFunction], str | None]:
+        """
+        Retrieve one page of cloud functions, ordered by ID.
+
+        One extra cloud function is read past the page to tell whether another page follows, so the last page
+        never ends with an empty follow-up request.
+
+        :param limit: Maximum number of cloud functions returned.
+        :type limit: int
+        :param after: ID of the last cloud function of the previous page, or None for the first page.
+        :type after: Optional[str]
+        :return: The cloud functions of the page and the ID to continue after, or None if this is the last page.
+        :rtype: Tuple[List[CloudFunction], Optional[str]]
+        """
+        after_id = CloudFunctionID(after) if after is not None else None
+        cloud_functions = await self.cloud_function_repository.list_page(limit + 1, after=after_id)
+        if len(cloud_functions) <= limit:
+            return cloud_functions, None
+        page = cloud_functions[:limit]
+        return page, str(page[-1].function_id)
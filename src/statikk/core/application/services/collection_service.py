@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+
+from statikk.core.application.services.retry import retry_on_conflict
 from statikk.core.domain.entities.collection import Collection
 from statikk.core.domain.repositories.collection_repository import CollectionRepository
 from statikk.core.domain.value_objects.collection_id import CollectionID
@@ -16,7 +19,7 @@ class CollectionService:
     def __init__(self, collection_repository: CollectionRepository):
         self.collection_repository = collection_repository
 
-    def create_collection(self, name: str, schema: dict) -> Collection:
+    async def create_collection(self, name: str, schema: dict) -> Collection:
         """
         Create a new collection.
 
@@ -32,10 +35,10 @@ class CollectionService:
             name=name,
             schema=schema,
         )
-        self.collection_repository.save(collection)
+        await self.collection_repository.save(collection)
         return collection
 
-    def get_collection(self, collection_id: str) -> Collection:
+    async def get_collection(self, collection_id: str) -> Collection:
         """
         Retrieve a collection by its unique identifier.
 
@@ -45,9 +48,9 @@ class CollectionService:
         :rtype: Collection
         :raises KeyError: If the collection does not exist.
         """
-        return self.collection_repository.get_by_id(CollectionID(collection_id))
+        return await self.collection_repository.get_by_id(CollectionID(collection_id))
 
-    def update_collection(self, collection_id: str, name: str, schema: dict) -> Collection:
+    async def update_collection(self, collection_id: str, name: str, schema: dict) -> Collection:
         """
         Update an existing collection.
 
@@ -59,14 +62,18 @@ class CollectionService:
         :return: The updated Collection object.
         :rtype: Collection
         :raises KeyError: If the collection does not exist.
+        :raises ConcurrentUpdateError: If the collection kept changing concurrently through every retry.
         """
-        collection = self.get_collection(collection_id)
-        collection.name = name
-        collection.schema = schema
-        self.collection_repository.update(collection)
-        return collection
+        async def attempt() -> Collection:
+            collection = await self.get_collection(collection_id)
+            collection.name = name
+            collection.schema = schema
+            await self.collection_repository.update(collection)
+            return collection
+
+        return await retry_on_conflict(attempt)
 
-    def delete_collection(self, collection_id: str) -> None:
+    async def delete_collection(self, collection_id: str) -> None:
         """
         Delete a collection by its unique identifier.
 
@@ -74,9 +81,9 @@ class CollectionService:
         :type collection_id: str
         :raises KeyError: If the collection does not exist.
         """
-        self.collection_repository.delete(CollectionID(collection_id))
+        await self.collection_repository.delete(CollectionID(collection_id))
 
-    def list_all_collections(self) -> list[Collection]:
+    async def list_all_collections(self) -> list[Collection]:
         """
         List all collections.
 
@@ -84,4 +91,39 @@ class CollectionService:
         :rtype: List[Collection]
         """
         # Assuming list_all method exists in the repository
-        return self.collection_repository.list_all()
+        return await self.collection_repository.list_all()
+
+    def iter_all_collections(self, page_size: int = 500, after: str | None = None) -> AsyncIterator[Collection]:
+        """
+        Iterate over all collections page by page, keeping only one page in memory.
+
+        :param page_size: Number of collections fetched per round trip.
+        :type page_size: int
+        :param after: ID to start after, or None to start from the first collection.
+        :type after: Optional[str]
+        :return: An async iterator over all collections.
+        :rtype: AsyncIterator[Collection]
+        """
+        after_id = CollectionID(after) if after is not None else None
+        return self.collection_repository.iter_all(page_size=page_size, after=after_id)
+
+    async def list_collections_page(self, limit: int, after: str | None = None) -> tuple[list[Collection], str | None]:
+        """
+        Retrieve one page of collections, ordered by ID.
+
+        One extra collection is read past the page to tell whether another page follows, so the last page
+        never ends with an empty follow-up request.
+
+        :param limit: Maximum number of collections returned.
+        :type limit: int
+        :param after: ID of the last collection of the previous page, or None for the first page.
+        :type after: Optional[str]
+        :return: The collections of the page and the ID to continue after, or None if this is the last page.
+        :rtype: Tuple[List[Collection], Optional[str]]
+        """
+        after_id = CollectionID(after) if after is not None else None
+        collections = await self.collection_repository.list_page(limit + 1, after=after_id)
+        if len(collections) <= limit:
+            return collections, None
+        page = collections[:limit]
+        return page, str(page[-1].collection_id)
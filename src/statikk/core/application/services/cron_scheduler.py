@@ -0,0 +1,261 @@
+# core/application/services/cron_scheduler.py
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+import time
+import zlib
+from collections.abc import Callable
+from datetime import datetime
+from datetime import timezone
+from functools import lru_cache
+from typing import Any
+
+from statikk.core.application.services.cloud_function_runtime import CloudFunctionRuntime
+from statikk.core.domain.entities.cloud_function import CloudFunction
+from statikk.core.domain.value_objects.cron_schedule import CronSchedule
+from statikk.infrastructure.files import ensure_private_directory
+from statikk.infrastructure.scheduling.timing_wheel import TimingWheel
+
+# Prefix of the triggers holding a cron expression, e.g. ``cron:*/5 * * * *``.
+CRON_PREFIX = 'cron:'
+
+
+@lru_cache(maxsize=1024)
+def _parse(expression: str) -> CronSchedule:
+    # Tenants mostly reuse a handful of expressions: parse each once.
+    return CronSchedule(expression)
+
+
+class _Firing:
+    """
+    A scheduled firing of one cron trigger of a cloud function.
+
+    :param function_id: The unique ID of the cloud function.
+    :type function_id: str
+    :param trigger: The trigger, including its ``cron:`` prefix.
+    :type trigger: str
+    :param schedule: The parsed cron expression.
+    :type schedule: CronSchedule
+    :param scheduled_at: When the firing is scheduled, before jitter, as a Unix timestamp.
+    :type scheduled_at: float
+    """
+
+    __slots__ = ('function_id', 'trigger', 'schedule', 'scheduled_at')
+
+    def __init__(self, function_id: str, trigger: str, schedule: CronSchedule, scheduled_at: float):
+        self.function_id = function_id
+        self.trigger = trigger
+        self.schedule = schedule
+        self.scheduled_at = scheduled_at
+
+
+class CronScheduler:
+    """
+    Fires the ``cron:`` triggers of cloud functions through the cloud function runtime.
+
+    Each trigger's next firing is held in a hierarchical ``TimingWheel``, so a tick costs O(1) amortized
+    however many functions are scheduled, rather than a scan of every schedule. A function fired by a
+    trigger receives ``{'trigger': ..., 'scheduled_at': ...}`` as its payload, the time in ISO 8601.
+
+    Firings are spread over ``max_jitter`` seconds after their scheduled time, by an offset derived from
+    the function's ID, so functions scheduled on the same minute do not all start at once while each one
+    still fires at a stable time.
+
+    The time the scheduler reached is saved to ``checkpoint_path`` every minute and on close. On the next
+    start, firings missed in between, up to ``catch_up_window`` seconds back, are fired once per trigger,
+    however many occurrences were missed. Only one process should run the scheduler, or functions fire once
+    per process. The checkpoint's directory must be private to the current user, see
+    ``ensure_private_directory``; a checkpoint in any other directory is neither read nor written.
+
+    Functions are registered and unregistered as they are written, by
+    ``CloudFunctionService.handle_cloud_function_events``; a write whose event is lost leaves its schedule
+    stale until restart, so that handler's subscription must not drop events.
+
+    :param runtime: The runtime running the functions fired.
+    :type runtime: CloudFunctionRuntime
+    :param checkpoint_path: File saving the time the scheduler reached, or None to not catch up on restart.
+    :type checkpoint_path: str, optional
+    :param catch_up_window: Maximum age, in seconds, of the missed firings fired on start.
+    :type catch_up_window: float
+    :param max_jitter: Maximum delay, in seconds, added to firings to spread them out.
+    :type max_jitter: float
+    :param tick: Resolution of the scheduler, in seconds.
+    :type tick: float
+    :param clock: Clock returning the Unix time.
+    :type clock: Callable[[], float]
+    """
+
+    def __init__(
+        self,
+        runtime: CloudFunctionRuntime,
+        checkpoint_path: str | None = None,
+        catch_up_window: float = 24 * 3600.0,
+        max_jitter: float = 30.0,
+        tick: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.runtime = runtime
+        self.checkpoint_path = checkpoint_path
+        self.catch_up_window = catch_up_window
+        self.max_jitter = max_jitter
+        self.tick = tick
+        self.clock = clock
+        self._wheel = TimingWheel(self._resume_time(), tick=tick)
+        # Wheel handle of the next firing of each cron trigger, by function ID and trigger.
+        self._handles: dict[str, dict[str, int]] = {}
+        self._invocations: set[asyncio.Task] = set()
+        self._task: asyncio.Task | None = None
+        self._checkpointed_at = self._wheel.time
+
+    def __len__(self) -> int:
+        return len(self._wheel)
+
+    def _resume_time(self) -> float:
+        now = self.clock()
+        if self.checkpoint_path is None:
+            return now
+        try:
+            ensure_private_directory(os.path.dirname(self.checkpoint_path) or '.')
+            with open(self.checkpoint_path) as file:
+                checkpoint = float(file.read())
+        except PermissionError as e:
+            print(f"Ignoring the cron checkpoint: {str(e)}")
+            return now
+        except (OSError, ValueError):
+            return now
+        return min(max(checkpoint, now - self.catch_up_window), now)
+
+    def _save_checkpoint(self) -> None:
+        if self.checkpoint_path is None:
+            return
+        try:
+            directory = ensure_private_directory(os.path.dirname(self.checkpoint_path) or '.')
+            descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(descriptor, 'w') as file:
+                file.write(repr(self._wheel.time))
+            os.replace(temporary_path, self.checkpoint_path)
+        except OSError as e:
+            print(f"Failed to save the cron checkpoint: {str(e)}")
+        self._checkpointed_at = self._wheel.time
+
+    def _jitter(self, function_id: str) -> float:
+        # crc32 rather than hash(), which is salted per process: offsets stay the same across restarts.
+        return zlib.crc32(function_id.encode()) % 1000 / 1000 * self.max_jitter
+
+    def _schedule(self, function_id: str, trigger: str, schedule: CronSchedule, after: float) -> int | None:
+        # Schedule the first occurrence after ``after``, to fire once its jitter elapsed.
+        try:
+            scheduled_at = schedule.next_after(datetime.fromtimestamp(after, timezone.utc)).timestamp()
+        except ValueError as e:
+            print(f"Cloud function {function_id} has a trigger that never fires: {str(e)}")
+            return None
+        firing = _Firing(function_id, trigger, schedule, scheduled_at)
+        return self._wheel.schedule(scheduled_at + self._jitter(function_id), firing)
+
+    def register(self, cloud_function: CloudFunction) -> None:
+        """
+        Schedule the cron triggers of a cloud function, replacing those it was registered with before.
+
+        Triggers that are not valid cron expressions are reported and skipped.
+
+        :param cloud_function: The cloud function.
+        :type cloud_function: CloudFunction
+        """
+        function_id = str(cloud_function.function_id)
+        self.unregister(function_id)
+        # Every occurrence that would have fired by the time the wheel reached has fired: on start, that
+        # time is the checkpoint, so the occurrences missed since come due at once.
+        after = self._wheel.time - self._jitter(function_id)
+        handles = {}
+        for trigger in cloud_function.triggers:
+            if not trigger.startswith(CRON_PREFIX) or trigger in handles:
+                continue
+            try:
+                schedule = _parse(trigger[len(CRON_PREFIX):])
+            except ValueError as e:
+                print(f"Skipping trigger '{trigger}' of cloud function {function_id}: {str(e)}")
+                continue
+            handle = self._schedule(function_id, trigger, schedule, after)
+            if handle is not None:
+                handles[trigger] = handle
+        if handles:
+            self._handles[function_id] = handles
+
+    def unregister(self, function_id: str) -> None:
+        """
+        Cancel the cron triggers of a cloud function.
+
+        :param function_id: The unique ID of the cloud function.
+        :type function_id: str
+        """
+        for handle in self._handles.pop(str(function_id), {}).values():
+            self._wheel.cancel(handle)
+
+    def advance(self, now: float | None = None) -> list[asyncio.Task]:
+        """
+        Advance to a time: fire the triggers that came due and schedule their next firing.
+
+        :param now: The current Unix time; defaults to the clock's.
+        :type now: Optional[float]
+        :return: The invocations started, running in the background.
+        :rtype: List[asyncio.Task]
+        """
+        now = self.clock() if now is None else now
+        started = []
+        for firing in self._wheel.advance(now):
+            handles = self._handles[firing.function_id]
+            # Missed occurrences are coalesced: the next one is the first that has not come due yet.
+            after = max(firing.scheduled_at, now - self._jitter(firing.function_id))
+            handle = self._schedule(firing.function_id, firing.trigger, firing.schedule, after)
+            if handle is None:
+                del handles[firing.trigger]
+            else:
+                handles[firing.trigger] = handle
+            started.append(self._fire(firing))
+        if self._wheel.time - self._checkpointed_at >= 60:
+            self._save_checkpoint()
+        return started
+
+    def _fire(self, firing: _Firing) -> asyncio.Task:
+        payload: dict[str, Any] = {
+            'trigger': firing.trigger,
+            'scheduled_at': datetime.fromtimestamp(firing.scheduled_at, timezone.utc).isoformat(),
+        }
+        task = asyncio.create_task(self._invoke(firing.function_id, payload))
+        self._invocations.add(task)
+        task.add_done_callback(self._invocations.discard)
+        return task
+
+    async def _invoke(self, function_id: str, payload: dict[str, Any]) -> None:
+        try:
+            await self.runtime.invoke(function_id, payload)
+        except Exception as e:
+            print(f"Scheduled invocation of cloud function {function_id} failed: {str(e)}")
+
+    async def _run(self) -> None:
+        while True:
+            self.advance()
+            # Wake up on the next tick boundary.
+            await asyncio.sleep(self.tick - self.clock() % self.tick)
+
+    async def start(self) -> None:
+        """
+        Start firing triggers in the background, first those missed since the last checkpoint.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """
+        Stop firing triggers, cancel the invocations still running and save the checkpoint.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for task in list(self._invocations):
+            task.cancel()
+        await asyncio.gather(*self._invocations, return_exceptions=True)
+        self._save_checkpoint()
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+
+from statikk.core.application.services.permission_cache import PermissionCache
+from statikk.core.application.services.retry import retry_on_conflict
+from statikk.core.domain.entities.membership import Membership
 from statikk.core.domain.entities.organization import Organization
 from statikk.core.domain.entities.role import Role
 from statikk.core.domain.repositories.organization_repository import OrganizationRepository
@@ -14,12 +20,26 @@ class OrganizationService:
 
     :param organization_repository: Repository for interacting with organization data.
     :type organization_repository: OrganizationRepository
+    :param permission_cache: Cache of effective permission masks; share one instance across requests. The
+        service invalidates it itself once a membership change or deletion is committed.
+    :type permission_cache: Optional[PermissionCache]
+    :param max_concurrent_loads: Maximum number of memberships ``check_permissions`` loads at once, across
+        all its callers; keep it below the size of the database connection pool (10 by default), so a large
+        batch of checks leaves connections for other requests instead of timing out waiting for one.
+    :type max_concurrent_loads: int
     """
 
-    def __init__(self, organization_repository: OrganizationRepository):
+    def __init__(
+        self,
+        organization_repository: OrganizationRepository,
+        permission_cache: PermissionCache | None = None,
+        max_concurrent_loads: int = 5,
+    ):
         self.organization_repository = organization_repository
+        self.permission_cache = permission_cache if permission_cache is not None else PermissionCache()
+        self._batch_loads = asyncio.Semaphore(max_concurrent_loads)
 
-    def create_organization(self, name: str, owner_id: str) -> Organization:
+    async def create_organization(self, name: str, owner_id: str) -> Organization:
         """
         Create a new organization.
 
@@ -35,10 +55,10 @@ class OrganizationService:
             name=name,
             owner_id=UserID(owner_id),
         )
-        self.organization_repository.save(organization)
+        await self.organization_repository.save(organization)
         return organization
 
-    def get_organization(self, organization_id: str) -> Organization:
+    async def get_organization(self, organization_id: str) -> Organization:
         """
         Retrieve an organization by its unique identifier.
 
@@ -48,9 +68,77 @@ class OrganizationService:
         :rtype: Organization
         :raises KeyError: If the organization does not exist.
         """
-        return self.organization_repository.get_by_id(OrganizationID(organization_id))
+        return await self.organization_repository.get_by_id(OrganizationID(organization_id))
+
+    def iter_all_organizations(self, page_size: int = 500, after: str | None = None) -> AsyncIterator[Organization]:
+        """
+        Iterate over all organizations page by page, keeping only one page in memory.
+
+        :param page_size: Number of organizations fetched per round trip.
+        :type page_size: int
+        :param after: ID to start after, or None to start from the first organization.
+        :type after: Optional[str]
+        :return: An async iterator over all organizations.
+        :rtype: AsyncIterator[Organization]
+        """
+        after_id = OrganizationID(after) if after is not None else None
+        return self.organization_repository.iter_all(page_size=page_size, after=after_id)
+
+    async def list_organizations_page(self, limit: int, after: str | None = None) -> tuple[list[Organization], str | None]:
+        """
+        Retrieve one page of organizations, ordered by ID.
 
-    def update_organization(self, organization_id: str, name: str, requesting_user_id: str) -> Organization:
+        One extra organization is read past the page to tell whether another page follows, so the last page
+        never ends with an empty follow-up request.
+
+        :param limit: Maximum number of organizations returned.
+        :type limit: int
+        :param after: ID of the last organization of the previous page, or None for the first page.
+        :type after: Optional[str]
+        :return: The organizations of the page and the ID to continue after, or None if this is the last page.
+        :rtype: Tuple[List[Organization], Optional[str]]
+        """
+        after_id = OrganizationID(after) if after is not None else None
+        organizations = await self.organization_repository.list_page(limit + 1, after=after_id)
+        if len(organizations) <= limit:
+            return organizations, None
+        page = organizations[:limit]
+        return page, str(page[-1].organization_id)
+
+    async def list_members_page(
+        self, organization_id: str, limit: int, after: str | None = None,
+    ) -> tuple[list[Membership], str | None]:
+        """
+        Retrieve one page of the members of an organization, ordered by user ID.
+
+        :param organization_id: The unique ID of the organization.
+        :type organization_id: str
+        :param limit: Maximum number of members returned.
+        :type limit: int
+        :param after: User ID of the last member of the previous page, or None for the first page.
+        :type after: Optional[str]
+        :return: The members of the page and the user ID to continue after, or None if this is the last page.
+        :rtype: Tuple[List[Membership], Optional[str]]
+        """
+        cursor = UserID(after) if after is not None else None
+        members = await self.organization_repository.list_members(OrganizationID(organization_id), cursor, limit=limit + 1)
+        if len(members) <= limit:
+            return members, None
+        page = members[:limit]
+        return page, str(page[-1].user_id)
+
+    async def list_organizations_for_user(self, user_id: str) -> list[Membership]:
+        """
+        Retrieve the organizations a user belongs to, with the user's role in each.
+
+        :param user_id: The unique ID of the user.
+        :type user_id: str
+        :return: The user's memberships, one per organization.
+        :rtype: List[Membership]
+        """
+        return await self.organization_repository.list_organizations_for_user(UserID(user_id))
+
+    async def update_organization(self, organization_id: str, name: str, requesting_user_id: str) -> Organization:
         """
         Update an existing organization.
 
@@ -64,16 +152,20 @@ class OrganizationService:
         :rtype: Organization
         :raises KeyError: If the organization does not exist.
         :raises PermissionError: If the requesting user does not have permission to update the organization.
+        :raises ConcurrentUpdateError: If the organization kept changing concurrently through every retry.
         """
-        organization = self.get_organization(organization_id)
-        if not self.check_permission(organization_id, requesting_user_id, Permission('update_organization')):
-            raise PermissionError('User does not have permission to update the organization.')
+        async def attempt() -> Organization:
+            organization = await self.get_organization(organization_id)
+            if not await self.check_permission(organization_id, requesting_user_id, Permission('update_organization')):
+                raise PermissionError('User does not have permission to update the organization.')
 
-        organization.name = name
-        self.organization_repository.update(organization)
-        return organization
+            organization.name = name
+            await self.organization_repository.update(organization)
+            return organization
+
+        return await retry_on_conflict(attempt)
 
-    def delete_organization(self, organization_id: str, requesting_user_id: str) -> None:
+    async def delete_organization(self, organization_id: str, requesting_user_id: str) -> None:
         """
         Delete an organization by its unique identifier.
 
@@ -84,11 +176,18 @@ class OrganizationService:
         :raises KeyError: If the organization does not exist.
         :raises PermissionError: If the requesting user does not have permission to delete the organization.
         """
-        if not self.check_permission(organization_id, requesting_user_id, Permission('delete_organization')):
+        if not await self.check_permission(organization_id, requesting_user_id, Permission('delete_organization')):
             raise PermissionError('User does not have permission to delete the organization.')
-        self.organization_repository.delete(OrganizationID(organization_id))
 
-    def add_member(self, organization_id: str, user_id: str, role: Role, requesting_user_id: str) -> Organization:
+        async def attempt() -> None:
+            await self.organization_repository.delete(OrganizationID(organization_id))
+
+        # Run like the other writes so that, under a unit of work, the deletion is committed before the cached
+        # masks are dropped; otherwise a check in between could cache them again.
+        await retry_on_conflict(attempt)
+        self.permission_cache.invalidate(organization_id)
+
+    async def add_member(self, organization_id: str, user_id: str, role: Role, requesting_user_id: str) -> Organization:
         """
         Add a member to the organization.
 
@@ -100,19 +199,25 @@ class OrganizationService:
         :type role: Role
         :param requesting_user_id: The UserID of the user making the request.
         :type requesting_user_id: str
-        :return: The updated Organization object.
+        :return: The updated organization, with only the changed member loaded; see ``Organization.partial``.
         :rtype: Organization
         :raises PermissionError: If the requesting user does not have permission to add members.
+        :raises ConcurrentUpdateError: If the organization kept changing concurrently through every retry.
         """
-        organization = self.get_organization(organization_id)
-        if not self.check_permission(organization_id, requesting_user_id, Permission('add_member')):
-            raise PermissionError('User does not have permission to add members to the organization.')
+        async def attempt() -> Organization:
+            organization = await self._get_with_member(organization_id, user_id)
+            if not await self.check_permission(organization_id, requesting_user_id, Permission('add_member')):
+                raise PermissionError('User does not have permission to add members to the organization.')
+
+            organization.add_member(UserID(user_id), role)
+            await self.organization_repository.update(organization)
+            return organization
 
-        organization.add_member(UserID(user_id), role)
-        self.organization_repository.update(organization)
+        organization = await retry_on_conflict(attempt)
+        self.permission_cache.invalidate(organization_id, user_id)
         return organization
 
-    def remove_member(self, organization_id: str, user_id: str, requesting_user_id: str) -> Organization:
+    async def remove_member(self, organization_id: str, user_id: str, requesting_user_id: str) -> Organization:
         """
         Remove a member from the organization.
 
@@ -122,19 +227,27 @@ class OrganizationService:
         :type user_id: str
         :param requesting_user_id: The UserID of the user making the request.
         :type requesting_user_id: str
-        :return: The updated Organization object.
+        :return: The updated organization, with only the changed member loaded; see ``Organization.partial``.
         :rtype: Organization
         :raises PermissionError: If the requesting user does not have permission to remove members.
+        :raises ConcurrentUpdateError: If the organization kept changing concurrently through every retry.
         """
-        organization = self.get_organization(organization_id)
-        if not self.check_permission(organization_id, requesting_user_id, Permission('remove_member')):
-            raise PermissionError('User does not have permission to remove members from the organization.')
+        async def attempt() -> Organization:
+            organization = await self._get_with_member(organization_id, user_id)
+            if not await self.check_permission(organization_id, requesting_user_id, Permission('remove_member')):
+                raise PermissionError('User does not have permission to remove members from the organization.')
+
+            organization.remove_member(UserID(user_id))
+            await self.organization_repository.update(organization)
+            return organization
 
-        organization.remove_member(UserID(user_id))
-        self.organization_repository.update(organization)
+        organization = await retry_on_conflict(attempt)
+        self.permission_cache.invalidate(organization_id, user_id)
         return organization
 
-    def update_member_role(self, organization_id: str, user_id: str, new_role: Role, requesting_user_id: str) -> Organization:
+    async def update_member_role(
+        self, organization_id: str, user_id: str, new_role: Role, requesting_user_id: str,
+    ) -> Organization:
         """
         Update the role of a member within the organization.
 
@@ -146,22 +259,30 @@ class OrganizationService:
         :type new_role: Role
         :param requesting_user_id: The UserID of the user making the request.
         :type requesting_user_id: str
-        :return: The updated Organization object.
+        :return: The updated organization, with only the changed member loaded; see ``Organization.partial``.
         :rtype: Organization
         :raises PermissionError: If the requesting user does not have permission to update member roles.
+        :raises ConcurrentUpdateError: If the organization kept changing concurrently through every retry.
         """
-        organization = self.get_organization(organization_id)
-        if not self.check_permission(organization_id, requesting_user_id, Permission('update_member_role')):
-            raise PermissionError('User does not have permission to update member roles.')
+        async def attempt() -> Organization:
+            organization = await self._get_with_member(organization_id, user_id)
+            if not await self.check_permission(organization_id, requesting_user_id, Permission('update_member_role')):
+                raise PermissionError('User does not have permission to update member roles.')
+
+            organization.update_member_role(UserID(user_id), new_role)
+            await self.organization_repository.update(organization)
+            return organization
 
-        organization.update_member_role(UserID(user_id), new_role)
-        self.organization_repository.update(organization)
+        organization = await retry_on_conflict(attempt)
+        self.permission_cache.invalidate(organization_id, user_id)
         return organization
 
-    def check_permission(self, organization_id: str, user_id: str, permission: Permission) -> bool:
+    async def check_permission(self, organization_id: str, user_id: str, permission: Permission) -> bool:
         """
         Check if a member has the specified permission within the organization.
 
+        The member's effective permission mask is cached, so repeated checks do not reload the organization.
+
         :param organization_id: The unique ID of the organization.
         :type organization_id: str
         :param user_id: The UserID of the member.
@@ -171,6 +292,82 @@ class OrganizationService:
         :return: True if the member has the permission, otherwise False.
         :rtype: bool
         """
-        organization = self.get_organization(organization_id)
+        return bool(await self._effective_mask(organization_id, user_id) & permission.bit)
+
+    async def check_permissions(
+        self, user_id: str, checks: list[tuple[str, Permission]], return_exceptions: bool = False,
+    ) -> list[bool | BaseException]:
+        """
+        Check many permissions of a user at once, possibly across several organizations.
+
+        Checks are grouped by organization: each organization's mask is read from the cache or loaded once,
+        the loads run concurrently, at most ``max_concurrent_loads`` at a time, and every check is then a
+        single AND. A check against an organization that does not exist is denied rather than failing the
+        batch.
+
+        :param user_id: The UserID of the member.
+        :type user_id: str
+        :param checks: ``(organization_id, permission)`` pairs to check.
+        :type checks: List[Tuple[str, Permission]]
+        :param return_exceptions: Return the error of an organization that could not be loaded, e.g. because
+            its ID is malformed, in place of each of its checks instead of raising it.
+        :type return_exceptions: bool
+        :return: Whether each check is allowed, or its error, in the order of ``checks``.
+        :rtype: List[Union[bool, BaseException]]
+        :raises Exception: If an organization could not be loaded, unless ``return_exceptions`` is set.
+        """
+        organization_ids = list(dict.fromkeys(organization_id for organization_id, _ in checks))
+        results = await asyncio.gather(
+            *(self._effective_mask(organization_id, user_id, self._batch_loads) for organization_id in organization_ids),
+            return_exceptions=True,
+        )
+        masks = {}
+        for organization_id, result in zip(organization_ids, results):
+            if isinstance(result, KeyError):
+                result = 0
+            elif isinstance(result, BaseException) and not return_exceptions:
+                raise result
+            masks[organization_id] = result
+        allowed = []
+        for organization_id, permission in checks:
+            mask = masks[organization_id]
+            allowed.append(mask if isinstance(mask, BaseException) else bool(mask & permission.bit))
+        return allowed
+
+    async def _get_with_member(self, organization_id: str, user_id: str) -> Organization:
+        """
+        Load an organization with only one member's membership, if any, rather than all of them.
+
+        :raises KeyError: If the organization does not exist.
+        """
+        return await self.organization_repository.get_with_members(OrganizationID(organization_id), [UserID(user_id)])
+
+    async def _effective_mask(self, organization_id: str, user_id: str, slots: asyncio.Semaphore | None = None) -> int:
+        """
+        Return the permission mask of a user within an organization, from the cache or by loading the user's
+        membership; with ``slots``, the load waits for one of them.
+
+        :raises KeyError: If the organization does not exist.
+        """
+        mask = self.permission_cache.get(organization_id, user_id)
+        if mask is None:
+            if slots is None:
+                return await self._load_mask(organization_id, user_id)
+            async with slots:
+                return await self._load_mask(organization_id, user_id)
+        return mask
+
+    async def _load_mask(self, organization_id: str, user_id: str) -> int:
+        generation = self.permission_cache.generation
+        organization = await self._get_with_member(organization_id, user_id)
+        mask = self._member_mask(organization, user_id)
+        self.permission_cache.put(organization_id, user_id, mask, generation=generation)
+        return mask
+
+    @staticmethod
+    def _member_mask(organization: Organization, user_id: str) -> int:
+        """
+        Return the compiled permission mask of a member's role, or 0 if the user is not a member.
+        """
         role = organization.get_member_role(UserID(user_id))
-        return role.has_permission(permission) if role else False
+        return role.mask if role is not None else 0
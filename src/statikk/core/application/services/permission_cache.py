@@ -0,0 +1,122 @@
+# core/application/services/permission_cache.py
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from statikk.infrastructure.databases.subrreal_db_client import record_key
+
+
+class PermissionCache:
+    """
+    Bounded LRU cache of the effective permission mask of a user within an organization.
+
+    Entries are keyed by ``(organization_id, user_id)`` and expire ``ttl`` seconds after they were stored,
+    which bounds staleness when another process changes a membership. Organization IDs are normalized to
+    their record key, so ``org-1`` and ``organizations:⟨org-1⟩`` name the same entries. Changes made in this
+    process are applied through ``invalidate``, which the organization service calls once a membership
+    change or deletion is committed.
+
+    Every invalidation bumps ``generation``. A caller computing a mask reads the generation first and
+    passes it to ``put``, so a mask computed from data read before an invalidation is never cached.
+
+    :param max_size: Maximum number of entries kept.
+    :type max_size: int
+    :param ttl: Seconds an entry stays valid.
+    :type ttl: float
+    :param clock: Monotonic clock returning seconds.
+    :type clock: Callable[[], float]
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[float, int]] = OrderedDict()
+        # Users cached per organization, so an organization can be invalidated without a scan.
+        self._users: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, organization_id: str, user_id: str) -> int | None:
+        """
+        Return the cached mask of a user within an organization.
+
+        :param organization_id: The unique ID of the organization.
+        :type organization_id: str
+        :param user_id: The unique ID of the user.
+        :type user_id: str
+        :return: The mask, or None if it is not cached or expired.
+        :rtype: Optional[int]
+        """
+        key = (record_key('organizations', organization_id), user_id)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self.clock():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, organization_id: str, user_id: str, mask: int, generation: int | None = None) -> None:
+        """
+        Cache the mask of a user within an organization, evicting the least recently used entries beyond
+        ``max_size``.
+
+        :param organization_id: The unique ID of the organization.
+        :type organization_id: str
+        :param user_id: The unique ID of the user.
+        :type user_id: str
+        :param mask: The user's effective permission mask.
+        :type mask: int
+        :param generation: The ``generation`` read before the mask was computed; the mask is dropped if
+            an invalidation happened since.
+        :type generation: Optional[int]
+        """
+        if generation is not None and generation != self.generation:
+            return
+        organization_id = record_key('organizations', organization_id)
+        self._entries[(organization_id, user_id)] = (self.clock() + self.ttl, mask)
+        self._entries.move_to_end((organization_id, user_id))
+        self._users.setdefault(organization_id, set()).add(user_id)
+        while len(self._entries) > self.max_size:
+            (evicted_organization_id, evicted_user_id), _ = self._entries.popitem(last=False)
+            self._forget(evicted_organization_id, evicted_user_id)
+
+    def _forget(self, organization_id: str, user_id: str) -> None:
+        users = self._users.get(organization_id)
+        if users is not None:
+            users.discard(user_id)
+            if not users:
+                del self._users[organization_id]
+
+    def invalidate(self, organization_id: str, user_id: str | None = None) -> None:
+        """
+        Drop the cached mask of one member of an organization, or of all its members.
+
+        :param organization_id: The unique ID of the organization.
+        :type organization_id: str
+        :param user_id: The member whose membership or role changed, or None for every member.
+        :type user_id: Optional[str]
+        """
+        self.generation += 1
+        organization_id = record_key('organizations', organization_id)
+        if user_id is not None:
+            self._entries.pop((organization_id, user_id), None)
+            self._forget(organization_id, user_id)
+            return
+        for cached_user_id in self._users.pop(organization_id, ()):
+            self._entries.pop((organization_id, cached_user_id), None)
+
+    def clear(self) -> None:
+        """
+        Drop every entry, e.g. after a role's permissions changed.
+        """
+        self.generation += 1
+        self._entries.clear()
+        self._users.clear()
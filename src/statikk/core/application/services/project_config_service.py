@@ -1,6 +1,7 @@
 # core/application/services/project_config_service.py
 from __future__ import annotations
 
+from statikk.core.application.services.retry import retry_on_conflict
 from statikk.core.domain.entities.project_config import ProjectConfig
 from statikk.core.domain.repositories.project_config_repository import ProjectConfigRepository
 from statikk.core.domain.value_objects.config_key import ConfigKey
@@ -18,7 +19,7 @@ class ProjectConfigService:
     def __init__(self, project_config_repository: ProjectConfigRepository):
         self.project_config_repository = project_config_repository
 
-    def create_project_config(self, project_id: str, config: dict) -> ProjectConfig:
+    async def create_project_config(self, project_id: str, config: dict) -> ProjectConfig:
         """
         Create a new project configuration.
 
@@ -33,10 +34,10 @@ class ProjectConfigService:
             project_id=ProjectID(project_id),
             config={ConfigKey(k): v for k, v in config.items()},
         )
-        self.project_config_repository.save(project_config)
+        await self.project_config_repository.save(project_config)
         return project_config
 
-    def get_project_config(self, project_id: str) -> ProjectConfig:
+    async def get_project_config(self, project_id: str) -> ProjectConfig:
         """
         Retrieve a project configuration by its project ID.
 
@@ -46,9 +47,9 @@ class ProjectConfigService:
         :rtype: ProjectConfig
         :raises KeyError: If the project configuration does not exist.
         """
-        return self.project_config_repository.get_by_project_id(ProjectID(project_id))
+        return await self.project_config_repository.get_by_project_id(ProjectID(project_id))
 
-    def update_project_config(self, project_id: str, config: dict) -> ProjectConfig:
+    async def update_project_config(self, project_id: str, config: dict) -> ProjectConfig:
         """
         Update an existing project configuration.
 
@@ -59,14 +60,18 @@ class ProjectConfigService:
         :return: The updated ProjectConfig object.
         :rtype: ProjectConfig
         :raises KeyError: If the project configuration does not exist.
+        :raises ConcurrentUpdateError: If the project configuration kept changing concurrently through every retry.
         """
-        project_config = self.get_project_config(project_id)
-        for key, value in config.items():
-            project_config.update_config(ConfigKey(key), value)
-        self.project_config_repository.update(project_config)
-        return project_config
+        async def attempt() -> ProjectConfig:
+            project_config = await self.get_project_config(project_id)
+            for key, value in config.items():
+                project_config.update_config(ConfigKey(key), value)
+            await self.project_config_repository.update(project_config)
+            return project_config
+
+        return await retry_on_conflict(attempt)
 
-    def delete_project_config(self, project_id: str) -> None:
+    async def delete_project_config(self, project_id: str) -> None:
         """
         Delete a project configuration by its project ID.
 
@@ -74,4 +79,4 @@ class ProjectConfigService:
         :type project_id: str
         :raises KeyError: If the project configuration does not exist.
         """
-        self.project_config_repository.delete(ProjectID(project_id))
+        await self.project_config_repository.delete(ProjectID(project_id))
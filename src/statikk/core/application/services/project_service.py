@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import List
 
 from statikk.core.domain.entities.project import Project
@@ -18,7 +19,7 @@ class ProjectService:
     def __init__(self, project_repository: ProjectRepository):
         self.project_repository = project_repository
 
-    def create_project(self, name: str, description: str) -> Project:
+    async def create_project(self, name: str, description: str) -> Project:
         """
         Create a new project.
 
@@ -27,14 +28,49 @@ class ProjectService:
         :return: The created Project object.
         """
         project = Project(project_id=ProjectID(), name=name, description=description)
-        self.project_repository.save(project)
+        await self.project_repository.save(project)
         return project
 
-    def list_all_projects(self) -> list[Project]:
+    async def list_all_projects(self) -> list[Project]:
         """
         Retrieve all projects.
 
         :return: A list of all projects.
         :rtype: List[Project]
         """
-        return self.project_repository.list_all()
+        return await self.project_repository.list_all()
+
+    def iter_all_projects(self, page_size: int = 500, after: str | None = None) -> AsyncIterator[Project]:
+        """
+        Iterate over all projects page by page, keeping only one page in memory.
+
+        :param page_size: Number of projects fetched per round trip.
+        :type page_size: int
+        :param after: ID to start after, or None to start from the first project.
+        :type after: Optional[str]
+        :return: An async iterator over all projects.
+        :rtype: AsyncIterator[Project]
+        """
+        after_id = ProjectID(after) if after is not None else None
+        return self.project_repository.iter_all(page_size=page_size, after=after_id)
+
+    async def list_projects_page(self, limit: int, after: str | None = None) -> tuple[list[Project], str | None]:
+        """
+        Retrieve one page of projects, ordered by ID.
+
+        One extra project is read past the page to tell whether another page follows, so the last page
+        never ends with an empty follow-up request.
+
+        :param limit: Maximum number of projects returned.
+        :type limit: int
+        :param after: ID of the last project of the previous page, or None for the first page.
+        :type after: Optional[str]
+        :return: The projects of the page and the ID to continue after, or None if this is the last page.
+        :rtype: Tuple[List[Project], Optional[str]]
+        """
+        after_id = ProjectID(after) if after is not None else None
+        projects = await self.project_repository.list_page(limit + 1, after=after_id)
+        if len(projects) <= limit:
+            return projects, None
+        page = projects[:limit]
+        return page, str(page[-1].project_id)
@@ -0,0 +1,67 @@
+# core/application/services/retry.py
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import TypeVar
+
+from statikk.core.application.unit_of_work import current_unit_of_work
+from statikk.core.application.unit_of_work import UnitOfWork
+from statikk.core.domain.exceptions import ConcurrentUpdateError
+
+T = TypeVar('T')
+
+
+async def retry_on_conflict(
+    operation: Callable[[], Awaitable[T]],
+    attempts: int = 5,
+    base_delay: float = 0.005,
+    max_delay: float = 0.1,
+) -> T:
+    """
+    Run a read-modify-write operation, running it again when its write loses a race with another writer.
+
+    Under a unit of work, each attempt runs in a nested unit of work of its own, committed when the
+    attempt returns, so the version-checked write happens within the attempt where a conflict can still be
+    retried. The first attempt starts from the entities the enclosing unit of work already loaded; later
+    ones read them afresh instead of getting the stale ones from its identity map. Once committed, the
+    entities the attempt loaded replace those of the enclosing unit of work.
+
+    Between attempts it sleeps for a random time of up to ``base_delay * 2 ** attempt`` seconds, capped at
+    ``max_delay``. The random jitter keeps writers that collided from colliding again.
+
+    :param operation: Coroutine function reading the entity, changing it and writing it back.
+    :type operation: Callable[[], Awaitable[T]]
+    :param attempts: Maximum number of times the operation is run.
+    :type attempts: int
+    :param base_delay: Backoff before the second attempt, in seconds; doubled on every further attempt.
+    :type base_delay: float
+    :param max_delay: Upper bound of the backoff, in seconds.
+    :type max_delay: float
+    :return: The result of the first attempt that succeeds.
+    :rtype: T
+    :raises ConcurrentUpdateError: If every attempt lost its race.
+    """
+    parent = current_unit_of_work.get()
+    for attempt in range(attempts):
+        try:
+            if parent is None:
+                return await operation()
+            with UnitOfWork() as work:
+                if attempt == 0:
+                    work.adopt(parent)
+                try:
+                    result = await operation()
+                except BaseException:
+                    work.rollback()
+                    raise
+                await work.commit()
+            parent.merge(work)
+            return result
+        except ConcurrentUpdateError:
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** attempt)))
+    raise ValueError('attempts must be at least 1.')
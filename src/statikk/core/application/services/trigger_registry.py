@@ -0,0 +1,145 @@
+# core/application/services/trigger_registry.py
+from __future__ import annotations
+
+import re
+from collections.abc import AsyncIterable
+from collections.abc import Iterable
+
+from statikk.core.domain.entities.cloud_function import CloudFunction
+
+# Matches exactly one segment of a trigger key.
+SEGMENT_WILDCARD = '*'
+# Matches any number of segments, including none.
+TAIL_WILDCARD = '**'
+
+_SEPARATORS = re.compile(r'[:/]')
+
+
+def split_trigger(trigger: str) -> tuple[str, ...]:
+    """
+    Split a trigger key into its segments, on ``:`` and ``/``.
+
+    ``collection:c-1:create`` gives ``('collection', 'c-1', 'create')`` and ``http:/orders/*`` gives
+    ``('http', 'orders', '*')``. Empty segments are dropped.
+
+    :param trigger: The trigger key or pattern.
+    :type trigger: str
+    :return: The segments.
+    :rtype: Tuple[str, ...]
+    """
+    return tuple(segment for segment in _SEPARATORS.split(trigger.strip()) if segment)
+
+
+class _TrieNode:
+    """
+    A node of the trigger trie: the children by segment and the functions whose trigger ends here.
+    """
+
+    __slots__ = ('children', 'functions')
+
+    def __init__(self):
+        self.children: dict[str, _TrieNode] = {}
+        self.functions: set[str] = set()
+
+
+class TriggerRegistry:
+    """
+    In-memory index from trigger keys to the cloud functions they fire.
+
+    Triggers are stored in a trie keyed by segment (see ``split_trigger``), so finding the functions fired
+    by an event walks the event key's segments rather than scanning every function. Trigger patterns may
+    use ``*`` for exactly one segment and ``**`` for any number of segments: ``collection:*:create`` fires
+    on creations in any collection and ``http:/orders/**`` on any path under ``/orders``.
+
+    The registry is built at startup with ``load`` and kept current by ``CloudFunctionService``. It only
+    sees the changes made in this process; other processes catch up on their next start.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._triggers: dict[str, tuple[tuple[str, ...], ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._triggers)
+
+    def __contains__(self, function_id: object) -> bool:
+        return str(function_id) in self._triggers
+
+    def register(self, cloud_function: CloudFunction) -> None:
+        """
+        Index the triggers of a cloud function, replacing those it was registered with before.
+
+        :param cloud_function: The cloud function.
+        :type cloud_function: CloudFunction
+        """
+        function_id = str(cloud_function.function_id)
+        self.unregister(function_id)
+        patterns = tuple({split_trigger(trigger) for trigger in cloud_function.triggers} - {()})
+        if not patterns:
+            return
+        for pattern in patterns:
+            node = self._root
+            for segment in pattern:
+                node = node.children.setdefault(segment, _TrieNode())
+            node.functions.add(function_id)
+        self._triggers[function_id] = patterns
+
+    def unregister(self, function_id: str) -> None:
+        """
+        Remove a cloud function from the index.
+
+        :param function_id: The unique ID of the cloud function.
+        :type function_id: str
+        """
+        for pattern in self._triggers.pop(str(function_id), ()):
+            self._remove(self._root, pattern, 0, str(function_id))
+
+    def _remove(self, node: _TrieNode, pattern: tuple[str, ...], depth: int, function_id: str) -> bool:
+        # Returns whether the node became empty, so its parent drops it.
+        if depth == len(pattern):
+            node.functions.discard(function_id)
+        else:
+            child = node.children.get(pattern[depth])
+            if child is not None and self._remove(child, pattern, depth + 1, function_id):
+                del node.children[pattern[depth]]
+        return not node.functions and not node.children
+
+    async def load(self, cloud_functions: AsyncIterable[CloudFunction]) -> None:
+        """
+        Index every cloud function, e.g. those of ``CloudFunctionService.iter_all_cloud_functions()`` at startup.
+
+        :param cloud_functions: The cloud functions.
+        :type cloud_functions: AsyncIterable[CloudFunction]
+        """
+        async for cloud_function in cloud_functions:
+            self.register(cloud_function)
+
+    def match(self, event: str | Iterable[str]) -> set[str]:
+        """
+        Return the cloud functions fired by an event.
+
+        :param event: The event's trigger key, e.g. ``collection:c-1:create``, or its segments.
+        :type event: Union[str, Iterable[str]]
+        :return: The unique IDs of the cloud functions whose triggers match the event.
+        :rtype: Set[str]
+        """
+        segments = split_trigger(event) if isinstance(event, str) else tuple(event)
+        matched: set[str] = set()
+        self._match(self._root, segments, 0, matched)
+        return matched
+
+    def _match(self, node: _TrieNode, segments: tuple[str, ...], depth: int, matched: set[str]) -> None:
+        tail = node.children.get(TAIL_WILDCARD)
+        if tail is not None:
+            # ``**`` consumes any number of the remaining segments, none included.
+            for start in range(depth, len(segments) + 1):
+                self._match(tail, segments, start, matched)
+        if depth == len(segments):
+            matched |= node.functions
+            return
+        child = node.children.get(segments[depth])
+        if child is not None:
+            self._match(child, segments, depth + 1, matched)
+        wildcard = node.children.get(SEGMENT_WILDCARD)
+        if wildcard is not None:
+            self._match(wildcard, segments, depth + 1, matched)
@@ -16,7 +16,7 @@ class UserManagementService:
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
-    def register_user(self, username: str, email: str) -> User:
+    async def register_user(self, username: str, email: str) -> User:
         """
         Register a new user.
 
@@ -26,5 +26,5 @@ class UserManagementService:
         """
         # Business logic for registering a user
         user = User(user_id=UserID(), username=username, email=email)
-        self.user_repository.save(user)
+        await self.user_repository.save(user)
         return user
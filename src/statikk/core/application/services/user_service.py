@@ -19,7 +19,7 @@ class UserService:
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
-    def get_user(self, user_id: str) -> User:
+    async def get_user(self, user_id: str) -> User:
         """
         Retrieve a user by their unique identifier.
 
@@ -29,12 +29,12 @@ class UserService:
         :rtype: User
         :raises ValueError: If the user with the given ID does not exist.
         """
-        user = self.user_repository.get_by_id(user_id)
+        user = await self.user_repository.get_by_id(user_id)
         if not user:
             raise ValueError(f"User with ID {user_id} does not exist.")
         return user
 
-    def create_user(self, username: str, email: str) -> User:
+    async def create_user(self, username: str, email: str) -> User:
         """
         Create a new user with the specified username and email.
 
@@ -46,10 +46,10 @@ class UserService:
         :rtype: User
         """
         user = User(user_id=UserID(), username=username, email=email)
-        self.user_repository.save(user)
+        await self.user_repository.save(user)
         return user
 
-    def update_user_email(self, user_id: str, new_email: str) -> User:
+    async def update_user_email(self, user_id: str, new_email: str) -> User:
         """
         Update the email address of an existing user.
 
@@ -61,12 +61,12 @@ class UserService:
         :rtype: User
         :raises ValueError: If the user with the given ID does not exist.
         """
-        user = self.get_user(user_id)
+        user = await self.get_user(user_id)
         user.email = new_email
-        self.user_repository.save(user)
+        await self.user_repository.save(user)
         return user
 
-    def delete_user(self, user_id: str) -> None:
+    async def delete_user(self, user_id: str) -> None:
         """
         Delete a user by their unique identifier.
 
@@ -74,5 +74,5 @@ class UserService:
         :type user_id: str
         :raises ValueError: If the user with the given ID does not exist.
         """
-        user = self.get_user(user_id)
-        self.user_repository.delete(user)
+        user = await self.get_user(user_id)
+        await self.user_repository.delete(user)
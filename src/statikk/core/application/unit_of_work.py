@@ -0,0 +1,220 @@
+# core/application/unit_of_work.py
+from __future__ import annotations
+
+import asyncio
+import copy
+from contextvars import ContextVar
+from typing import Any
+
+from statikk.core.domain.entities.entity import Entity
+
+# The unit of work of the request being handled, if any.
+current_unit_of_work: ContextVar[UnitOfWork | None] = ContextVar('current_unit_of_work', default=None)
+
+
+def _state(entity: Any) -> dict[str, Any]:
+    return entity.to_dict() if isinstance(entity, Entity) else vars(entity)
+
+
+class UnitOfWork:
+    """
+    Request-scoped identity map and change tracker.
+
+    Entities read through a ``UnitOfWorkRepository`` while the unit of work is active are loaded once and
+    the same object is returned on every later lookup. Saves, updates and deletes are recorded instead of
+    being written, then flushed by ``commit``: an entity updated several times is written once, and an
+    entity whose state did not change since it was loaded is not written at all.
+
+    A commit is not a transaction. Each write is its own statement, so when one fails the others may
+    already be applied, and they are not rolled back.
+    """
+
+    def __init__(self):
+        self._identity_map: dict[tuple[int, str], Any] = {}
+        self._snapshots: dict[tuple[int, str], dict[str, Any]] = {}
+        self._new: dict[tuple[int, str], tuple[Any, Any]] = {}
+        self._dirty: dict[tuple[int, str], tuple[Any, Any]] = {}
+        self._deleted: dict[tuple[int, str], tuple[Any, Any]] = {}
+
+    def __enter__(self) -> UnitOfWork:
+        self._token = current_unit_of_work.set(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        current_unit_of_work.reset(self._token)
+
+    def get(self, repository: Any, key: str) -> Any | None:
+        """
+        Return the entity already loaded under a key, if any.
+        """
+        return self._identity_map.get((id(repository), key))
+
+    def register_clean(self, repository: Any, key: str, entity: Any) -> None:
+        """
+        Record an entity as loaded, remembering its state to detect changes at commit.
+        """
+        self._identity_map[(id(repository), key)] = entity
+        self._snapshots[(id(repository), key)] = copy.deepcopy(_state(entity))
+
+    def register_new(self, repository: Any, key: str, entity: Any) -> None:
+        """
+        Record an entity to insert at commit.
+        """
+        self._identity_map[(id(repository), key)] = entity
+        self._deleted.pop((id(repository), key), None)
+        self._new[(id(repository), key)] = (repository, entity)
+
+    def register_dirty(self, repository: Any, key: str, entity: Any) -> None:
+        """
+        Record an entity to update at commit. Entities that are new are inserted with their latest state instead.
+        """
+        self._identity_map[(id(repository), key)] = entity
+        if (id(repository), key) not in self._new:
+            self._dirty[(id(repository), key)] = (repository, entity)
+
+    def register_deleted(self, repository: Any, key: str, entity_or_id: Any) -> None:
+        """
+        Record an entity to delete at commit. Entities that are new are simply never inserted.
+        """
+        self._identity_map.pop((id(repository), key), None)
+        self._dirty.pop((id(repository), key), None)
+        if self._new.pop((id(repository), key), None) is None:
+            self._deleted[(id(repository), key)] = (repository, entity_or_id)
+
+    @property
+    def has_changes(self) -> bool:
+        """
+        True if commit would write anything.
+        """
+        return bool(self._new or self._deleted or any(self._is_dirty(key, entity) for key, (_, entity) in self._dirty.items()))
+
+    def _is_dirty(self, key: tuple[int, str], entity: Any) -> bool:
+        snapshot = self._snapshots.get(key)
+        return snapshot is None or snapshot != _state(entity)
+
+    async def commit(self) -> None:
+        """
+        Write every recorded change.
+
+        The writes are issued concurrently, one statement each through its repository; they are neither
+        atomic nor batched into one query. Only a database client with ``auto_batch_window`` set, which the
+        application container does not set, sends the single statements among them in a shared round trip.
+        Every write is attempted, and the first failure is raised once all have completed. The writes that
+        succeeded stay applied.
+
+        :raises Exception: If any write fails.
+        """
+        updated = [
+            (key, (repository, entity)) for key, (repository, entity) in self._dirty.items() if self._is_dirty(key, entity)
+        ]
+        written = list(self._new.items()) + updated
+        writes = [repository.save(entity) for repository, entity in self._new.values()]
+        writes += [repository.update(entity) for _, (repository, entity) in updated]
+        writes += [repository.delete(entity_or_id) for repository, entity_or_id in self._deleted.values()]
+        deleted = list(self._deleted)
+        self._new.clear()
+        self._dirty.clear()
+        self._deleted.clear()
+        results = await asyncio.gather(*writes, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        for key, (_, entity) in written:
+            self._snapshots[key] = copy.deepcopy(_state(entity))
+        for key in deleted:
+            self._snapshots.pop(key, None)
+
+    def adopt(self, other: UnitOfWork) -> None:
+        """
+        Start from the entities another unit of work already loaded, without its pending changes; entities
+        it has yet to insert are left out.
+        """
+        for key, entity in other._identity_map.items():
+            if key not in other._new:
+                self._identity_map[key] = entity
+                if key in other._snapshots:
+                    self._snapshots[key] = other._snapshots[key]
+
+    def merge(self, other: UnitOfWork) -> None:
+        """
+        Take over the entities a nested unit of work loaded, once it committed. Those replacing an entity
+        loaded here, which is then stale, drop its pending update.
+        """
+        for key, entity in other._identity_map.items():
+            if self._identity_map.get(key) is not entity:
+                self._dirty.pop(key, None)
+            self._identity_map[key] = entity
+            if key in other._snapshots:
+                self._snapshots[key] = other._snapshots[key]
+
+    def rollback(self) -> None:
+        """
+        Forget every recorded change and every loaded entity.
+        """
+        self._identity_map.clear()
+        self._snapshots.clear()
+        self._new.clear()
+        self._dirty.clear()
+        self._deleted.clear()
+
+
+class UnitOfWorkRepository:
+    """
+    Repository wrapper taking part in the active unit of work.
+
+    With a unit of work active, lookups by ID go through its identity map and ``save``, ``update`` and
+    ``delete`` are recorded for its commit. With none active, every call goes straight to the wrapped
+    repository. Other methods are passed through.
+
+    :param repository: The repository to wrap.
+    :type repository: Any
+    :param id_attribute: Name of the entity attribute holding its ID, e.g. ``organization_id``.
+    :type id_attribute: str
+    :param lookup: Name of the repository method reading one entity by ID.
+    :type lookup: str
+    """
+
+    def __init__(self, repository: Any, id_attribute: str, lookup: str = 'get_by_id'):
+        self.repository = repository
+        self.id_attribute = id_attribute
+        self.lookup = lookup
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names not found on the wrapper itself; guard against lookups before __init__ ran.
+        if name in ('repository', 'lookup'):
+            raise AttributeError(name)
+        if name == self.lookup:
+            return self._get
+        return getattr(self.repository, name)
+
+    def _key(self, value: Any) -> str:
+        return str(getattr(value, self.id_attribute, value))
+
+    async def _get(self, entity_id: Any) -> Any:
+        unit_of_work = current_unit_of_work.get()
+        if unit_of_work is None:
+            return await getattr(self.repository, self.lookup)(entity_id)
+        key = self._key(entity_id)
+        entity = unit_of_work.get(self.repository, key)
+        if entity is None:
+            entity = await getattr(self.repository, self.lookup)(entity_id)
+            unit_of_work.register_clean(self.repository, key, entity)
+        return entity
+
+    async def save(self, entity: Any) -> None:
+        unit_of_work = current_unit_of_work.get()
+        if unit_of_work is None:
+            return await self.repository.save(entity)
+        unit_of_work.register_new(self.repository, self._key(entity), entity)
+
+    async def update(self, entity: Any) -> None:
+        unit_of_work = current_unit_of_work.get()
+        if unit_of_work is None:
+            return await self.repository.update(entity)
+        unit_of_work.register_dirty(self.repository, self._key(entity), entity)
+
+    async def delete(self, entity_or_id: Any) -> None:
+        unit_of_work = current_unit_of_work.get()
+        if unit_of_work is None:
+            return await self.repository.delete(entity_or_id)
+        unit_of_work.register_deleted(self.repository, self._key(entity_or_id), entity_or_id)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from statikk.core.domain.entities.entity import Entity
 from statikk.core.domain.value_objects import CloudFunctionID
 
 
-class CloudFunction:
+class CloudFunction(Entity):
     """
     Represents a serverless function in the system.
 
@@ -15,13 +16,23 @@ class CloudFunction:
     :type code: str
     :param triggers: The events that trigger the function (e.g., HTTP request, data change).
     :type triggers: list
+    :param version: Number of times the cloud function was updated, used to detect concurrent updates.
+    :type version: int
     """
 
-    def __init__(self, function_id: CloudFunctionID, name: str, code: str, triggers: list):
+    __slots__ = ('function_id', 'name', 'code', 'triggers', 'version')
+
+    _id_attribute = 'function_id'
+    _table = 'cloud_functions'
+    _converters = {'function_id': CloudFunctionID.from_trusted}
+    _default_factories = {'version': int}
+
+    def __init__(self, function_id: CloudFunctionID, name: str, code: str, triggers: list, version: int = 0):
         self.function_id = function_id
         self.name = name
         self.code = code
         self.triggers = triggers
+        self.version = version
 
     def update_code(self, new_code: str):
         """
@@ -39,4 +50,4 @@ class CloudFunction:
         :param trigger: The event that will trigger the function.
         :type trigger: str
         """
-        self.triggers.append(trigger)
+        self.triggers = [*self.triggers, trigger]
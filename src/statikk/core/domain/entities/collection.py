@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from statikk.core.domain.entities.entity import Entity
 from statikk.core.domain.value_objects import CollectionID
 
 
-class Collection:
+class Collection(Entity):
     """
     Represents a data collection in the system, similar to a database table.
 
@@ -13,12 +14,22 @@ class Collection:
     :type name: str
     :param schema: The schema of the collection, defining the structure of the data.
     :type schema: dict
+    :param version: Number of times the collection was updated, used to detect concurrent updates.
+    :type version: int
     """
 
-    def __init__(self, collection_id: CollectionID, name: str, schema: dict):
+    __slots__ = ('collection_id', 'name', 'schema', 'version')
+
+    _id_attribute = 'collection_id'
+    _table = 'collections'
+    _converters = {'collection_id': CollectionID.from_trusted}
+    _default_factories = {'version': int}
+
+    def __init__(self, collection_id: CollectionID, name: str, schema: dict, version: int = 0):
         self.collection_id = collection_id
         self.name = name
         self.schema = schema
+        self.version = version
 
     def add_field(self, field_name: str, field_type: str):
         """
@@ -29,4 +40,4 @@ class Collection:
         :param field_type: The type of the field (e.g., string, integer).
         :type field_type: str
         """
-        self.schema[field_name] = field_type
+        self.schema = {**self.schema, field_name: field_type}
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from statikk.infrastructure.databases.subrreal_db_client import record_key
+
+
+class Entity:
+    """
+    Base class of the entities: ``__slots__`` storage plus codecs generated from the class's slots.
+
+    Subclasses list their attributes in ``__slots__``, their own constructor assigning them as usual, and
+    describe how they are stored with a few class attributes:
+
+    - ``_id_attribute``: the attribute stored in the ``id`` column, if any.
+    - ``_table``: the table the entity is stored in. Rows read back hold the full record ID, like
+      ``projects:⟨0190-ab⟩``, in their ``id`` column; ``from_row`` keeps only the key.
+    - ``_converters``: attributes holding value objects, mapped to the callable rebuilding one from its
+      stored string. These attributes are stored as ``str(value)``. Attributes holding another entity map
+      to its class instead: they are stored as that entity's row and shown in ``to_dict`` as ``str(value)``.
+    - ``_default_factories``: attributes whose column may be missing from older rows, mapped to a callable
+      building the default.
+    - ``_not_stored``: public attributes left out of rows because they are stored elsewhere.
+
+    Slots starting with an underscore are internal state and are never serialized. From these, the
+    codecs ``to_row``/``from_row`` used by the repositories and ``to_dict`` used by the API are compiled
+    once per class, so (de)serializing an entity runs straight-line code with no per-field introspection.
+
+    Entities are copy-on-write: their methods replace a list or dict attribute rather than change it in
+    place, so ``copy`` can share them between the copy and the original. Code changing an entity from the
+    outside must do the same, e.g. ``collection.schema = {**collection.schema, 'age': 'int'}``. Entities
+    held by another, like the roles of an organization's members, are shared too: replace them, e.g. with
+    ``update_member_role``, rather than change them.
+    """
+
+    __slots__ = ()
+
+    _id_attribute: str | None = None
+    _table: str | None = None
+    _converters: dict[str, Callable[[Any], Any]] = {}
+    _default_factories: dict[str, Callable[[], Any]] = {}
+    _not_stored: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if '__slots__' in cls.__dict__:
+            _compile_codecs(cls)
+
+    def to_row(self) -> dict[str, Any]:
+        """
+        Map the entity to its database row.
+
+        :return: The row, with the ID under ``id`` and value objects as strings.
+        :rtype: Dict[str, Any]
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]):
+        """
+        Build an entity from its database row, without running the constructor.
+
+        The row is trusted: IDs are rebuilt without validation.
+
+        :param row: The database row.
+        :type row: Dict[str, Any]
+        :return: The entity.
+        """
+        raise NotImplementedError
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Map the entity to a dict keyed by attribute name, with value objects as strings, e.g. to build an
+        API response.
+
+        :return: The entity's public attributes.
+        :rtype: Dict[str, Any]
+        """
+        raise NotImplementedError
+
+    def copy(self):
+        """
+        Return a copy of the entity, sharing its attribute values, so copying costs the same however large
+        they are.
+
+        :return: The copy.
+        """
+        raise NotImplementedError
+
+    def _loaded(self) -> None:
+        """
+        Called by ``from_row`` once the stored attributes are set, to initialize internal state.
+        """
+
+    def _copied(self, other) -> None:
+        """
+        Called by ``copy`` with the copy once its attributes are set, to adjust internal state that the
+        original and the copy now share.
+        """
+
+
+def _compile_codecs(cls: type) -> None:
+    fields = [name for name in cls.__slots__ if not name.startswith('_')]
+    stored = [name for name in fields if name not in cls._not_stored]
+    namespace: dict[str, Any] = {'new': object.__new__}
+
+    def column(name: str) -> str:
+        return 'id' if name == cls._id_attribute else name
+
+    def holds_entity(name: str) -> bool:
+        converter = cls._converters.get(name)
+        return isinstance(converter, type) and issubclass(converter, Entity)
+
+    def dumped(name: str) -> str:
+        return f"str(self.{name})" if name in cls._converters else f"self.{name}"
+
+    to_row = [
+        f"    {column(name)!r}: {f'self.{name}.to_row()' if holds_entity(name) else dumped(name)}," for name in stored
+    ]
+    to_dict = [f"    {name!r}: {dumped(name)}," for name in fields]
+    from_row = []
+    for name in fields:
+        if name in cls._default_factories:
+            namespace[f"default_{name}"] = cls._default_factories[name]
+            value = f"row[{column(name)!r}] if {column(name)!r} in row else default_{name}()"
+            if name not in stored:
+                value = f"default_{name}()"
+        else:
+            value = f"row[{column(name)!r}]"
+        if name == cls._id_attribute and cls._table is not None:
+            namespace['record_key'] = record_key
+            value = f"record_key({cls._table!r}, {value})"
+        if name in cls._converters and name in stored:
+            converter = cls._converters[name]
+            namespace[f"convert_{name}"] = converter.from_row if holds_entity(name) else converter
+            value = f"convert_{name}({value})"
+        from_row.append(f"    self.{name} = {value}")
+    slots = dict.fromkeys(name for klass in reversed(cls.__mro__) for name in klass.__dict__.get('__slots__', ()))
+    copy = [f"    other.{name} = self.{name}" for name in slots]
+
+    source = '\n'.join([
+        'def to_row(self):',
+        '    return {',
+        *to_row,
+        '    }',
+        'def to_dict(self):',
+        '    return {',
+        *to_dict,
+        '    }',
+        'def from_row(cls, row):',
+        '    self = new(cls)',
+        *from_row,
+        '    self._loaded()',
+        '    return self',
+        'def copy(self):',
+        '    other = new(type(self))',
+        *copy,
+        '    self._copied(other)',
+        '    return other',
+    ])
+    exec(compile(source, f"<{cls.__name__} codecs>", 'exec'), namespace)
+    for name in ('to_row', 'to_dict', 'from_row', 'copy'):
+        function = namespace[name]
+        function.__qualname__ = f"{cls.__qualname__}.{name}"
+        function.__doc__ = getattr(Entity, name).__doc__
+    if 'to_row' not in cls.__dict__:
+        cls.to_row = namespace['to_row']
+    if 'to_dict' not in cls.__dict__:
+        cls.to_dict = namespace['to_dict']
+    if 'from_row' not in cls.__dict__:
+        cls.from_row = classmethod(namespace['from_row'])
+    if 'copy' not in cls.__dict__:
+        cls.copy = namespace['copy']
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from statikk.core.domain.entities.entity import Entity
+from statikk.core.domain.entities.role import Role
+from statikk.core.domain.value_objects.organization_id import OrganizationID
+from statikk.core.domain.value_objects.user_id import UserID
+
+
+class Membership(Entity):
+    """
+    Represents a user's membership of an organization.
+
+    :param organization_id: The organization the user belongs to.
+    :type organization_id: OrganizationID
+    :param user_id: The member.
+    :type user_id: UserID
+    :param role: The role of the member within the organization.
+    :type role: Role
+    """
+
+    __slots__ = ('organization_id', 'user_id', 'role')
+
+    _converters = {'organization_id': OrganizationID.intern, 'user_id': UserID.from_trusted, 'role': Role}
+
+    def __init__(self, organization_id: OrganizationID, user_id: UserID, role: Role):
+        self.organization_id = organization_id
+        self.user_id = user_id
+        self.role = role
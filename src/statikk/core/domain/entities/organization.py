@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from statikk.core.domain.entities.entity import Entity
 from statikk.core.domain.entities.role import Role
 from statikk.core.domain.value_objects.organization_id import OrganizationID
 from statikk.core.domain.value_objects.user_id import UserID
 
 
-class Organization:
+class Organization(Entity):
     """
     Represents an organization that can own resources like collections, cloud functions, etc.
 
@@ -15,15 +16,90 @@ class Organization:
     :type name: str
     :param owner_id: The UserID of the organization's owner.
     :type owner_id: UserID
-    :param members: A dictionary of members and their roles within the organization.
-    :type members: Dict[UserID, Role]
+    :param members: The role of each member within the organization, keyed by the member's user ID string.
+    :type members: Dict[str, Role]
+    :param version: Number of times the organization was updated, used to detect concurrent updates.
+    :type version: int
     """
 
-    def __init__(self, organization_id: OrganizationID, name: str, owner_id: UserID, members: dict[str, Role] | None = None):
+    __slots__ = ('organization_id', 'name', 'owner_id', 'members', 'version', '_member_changes', '_partial', '_own_members')
+
+    _id_attribute = 'organization_id'
+    _table = 'organizations'
+    _converters = {'organization_id': OrganizationID.from_trusted, 'owner_id': UserID.intern}
+    _default_factories = {'members': dict, 'version': int}
+    # Members are stored as membership rows of their own.
+    _not_stored = ('members',)
+
+    def __init__(
+        self,
+        organization_id: OrganizationID,
+        name: str,
+        owner_id: UserID,
+        members: dict[str, Role] | None = None,
+        version: int = 0,
+    ):
         self.organization_id = organization_id
         self.name = name
         self.owner_id = owner_id
         self.members = members or {}
+        self.version = version
+        # Member entries added or changed (their role) or removed (None) since the organization was last persisted.
+        self._member_changes: dict[str, Role | None] = {}
+        self._partial = False
+        # The members dict once this organization copied it for itself, which it may then change in place.
+        self._own_members: dict[str, Role] | None = None
+
+    def _loaded(self):
+        self._member_changes = {}
+        self._partial = False
+        self._own_members = None
+
+    def _copied(self, other):
+        # The members are shared with the copy now: whichever changes them first copies them.
+        self._own_members = other._own_members = None
+        other._member_changes = dict(self._member_changes)
+
+    def _change_member(self, user_id: str, role: Role | None):
+        # Members may be shared, with a copy or with whoever passed them in: copy them on the first change
+        # only, then change them in place, so a series of changes does not copy them each time.
+        if self.members is not self._own_members:
+            self.members = dict(self.members)
+            self._own_members = self.members
+        if role is None:
+            del self.members[user_id]
+        else:
+            self.members[user_id] = role
+        self._member_changes[user_id] = role
+
+    @property
+    def partial(self) -> bool:
+        """
+        True if only some of the members were loaded, e.g. by ``get_with_members`` to change one of them.
+        Such an organization can be updated, which only writes the member changes, but must not be cached or
+        shown as the whole organization.
+        """
+        return self._partial
+
+    def mark_partial(self):
+        """
+        Record that ``members`` holds only some of the organization's members.
+        """
+        self._partial = True
+
+    @property
+    def member_changes(self) -> dict[str, Role | None]:
+        """
+        Member entries changed since the organization was loaded or last persisted: the new role of each
+        added or updated member, and None for each removed one.
+        """
+        return self._member_changes
+
+    def mark_persisted(self):
+        """
+        Forget the tracked member changes, once they have been written.
+        """
+        self._member_changes = {}
 
     def add_member(self, user_id: UserID, role: Role):
         """
@@ -34,7 +110,7 @@ class Organization:
         :param role: The role of the member within the organization.
         :type role: Role
         """
-        self.members[user_id.id] = role
+        self._change_member(user_id.id, role)
 
     def remove_member(self, user_id: UserID):
         """
@@ -43,9 +119,8 @@ class Organization:
         :param user_id: The UserID of the member to remove.
         :type user_id: UserID
         """
-        print(self.members)
         if user_id.id in self.members:
-            del self.members[user_id.id]
+            self._change_member(user_id.id, None)
 
     def update_member_role(self, user_id: UserID, new_role: Role):
         """
@@ -57,7 +132,7 @@ class Organization:
         :type new_role: Role
         """
         if user_id.id in self.members:
-            self.members[user_id.id] = new_role
+            self._change_member(user_id.id, new_role)
 
     def get_member_role(self, user_id: UserID) -> Role | None:
         """
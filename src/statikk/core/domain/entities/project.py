@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from statikk.core.domain.entities.entity import Entity
 from statikk.core.domain.value_objects import ProjectID
 
 
-class Project:
+class Project(Entity):
     """
     Represents a Project in the system.
 
@@ -15,6 +16,13 @@ class Project:
     :type description: str
     """
 
+    __slots__ = ('project_id', 'name', 'description')
+
+    _id_attribute = 'project_id'
+    _table = 'projects'
+    _converters = {'project_id': ProjectID.from_trusted}
+    _default_factories = {'description': str}
+
     def __init__(self, project_id: ProjectID, name: str, description: str = ''):
         self.project_id = project_id
         self.name = name
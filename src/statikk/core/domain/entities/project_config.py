@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from typing import Any
+
+from statikk.core.domain.entities.entity import Entity
 from statikk.core.domain.value_objects.config_key import ConfigKey
 from statikk.core.domain.value_objects.project_id import ProjectID
 
 
-class ProjectConfig:
+class ProjectConfig(Entity):
     """
     Represents a configuration for a project.
 
@@ -12,11 +15,38 @@ class ProjectConfig:
     :type project_id: ProjectID
     :param config: A dictionary containing configuration keys and their values.
     :type config: Dict[ConfigKey, str]
+    :param version: Number of times the configuration was updated, used to detect concurrent updates.
+    :type version: int
     """
 
-    def __init__(self, project_id: ProjectID, config: dict[ConfigKey, str] | None = None):
+    __slots__ = ('project_id', 'config', 'version')
+
+    def __init__(self, project_id: ProjectID, config: dict[ConfigKey, str] | None = None, version: int = 0):
         self.project_id = project_id
         self.config = config or {}
+        self.version = version
+
+    def to_row(self) -> dict[str, Any]:
+        return {
+            'id': str(self.project_id),
+            'config': {str(k): v for k, v in self.config.items()},
+            'version': self.version,
+        }
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> ProjectConfig:
+        return cls(
+            project_id=ProjectID.from_trusted(row['id']),
+            config={ConfigKey(k): v for k, v in row['config'].items()},
+            version=row.get('version', 0),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'project_id': str(self.project_id),
+            'config': {str(k): v for k, v in self.config.items()},
+            'version': self.version,
+        }
 
     def add_config(self, key: ConfigKey, value: str):
         """
@@ -27,7 +57,7 @@ class ProjectConfig:
         :param value: The value for the configuration key.
         :type value: str
         """
-        self.config[key] = value
+        self.config = {**self.config, key: value}
 
     def update_config(self, key: ConfigKey, value: str):
         """
@@ -38,7 +68,7 @@ class ProjectConfig:
         :param value: The new value for the configuration key.
         :type value: str
         """
-        self.config[key] = value
+        self.config = {**self.config, key: value}
 
     def remove_config(self, key: ConfigKey):
         """
@@ -48,4 +78,4 @@ class ProjectConfig:
         :type key: ConfigKey
         """
         if key in self.config:
-            del self.config[key]
+            self.config = {k: v for k, v in self.config.items() if k != key}
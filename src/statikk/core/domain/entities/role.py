@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from typing import Any
 from typing import List
 
+from statikk.core.domain.entities.entity import Entity
 from statikk.core.domain.value_objects.permissions import Permission
+from statikk.core.domain.value_objects.permissions import permission_registry
 from statikk.core.domain.value_objects.role_id import RoleID
 
 
-class Role:
+class Role(Entity):
     """
     Represents a user role with specific permissions.
 
@@ -16,13 +19,53 @@ class Role:
     :type name: str
     :param permissions: A list of permissions associated with the role.
     :type permissions: List[Permission]
+
+    The permissions are also compiled into ``mask``, an int with the registry bit of each permission set,
+    so checks do not scan the list. Change them through ``add_permission``, ``remove_permission`` or by
+    assigning ``permissions`` to keep the two in step.
     """
 
+    __slots__ = ('role_id', 'name', '_permissions', 'mask')
+
     def __init__(self, role_id: RoleID, name: str, permissions: list[Permission]):
         self.role_id = role_id
         self.name = name
         self.permissions = permissions
 
+    @property
+    def permissions(self) -> list[Permission]:
+        return self._permissions
+
+    @permissions.setter
+    def permissions(self, permissions: list[Permission]):
+        self._permissions = permissions
+        self.mask = permission_registry.mask(permissions)
+
+    def __str__(self):
+        return self.name
+
+    def __eq__(self, other):
+        if not isinstance(other, Role):
+            return NotImplemented
+        return self.role_id == other.role_id and self.name == other.name and self.permissions == other.permissions
+
+    # Roles are mutable: equal roles may stop being equal, so they cannot be hashed.
+    __hash__ = None
+
+    def to_row(self) -> dict[str, Any]:
+        return {'id': str(self.role_id), 'name': self.name, 'permissions': [str(p) for p in self.permissions]}
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> Role:
+        return cls(
+            role_id=RoleID.from_trusted(row['id']),
+            name=row['name'],
+            permissions=[Permission(name) for name in row['permissions']],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'role_id': str(self.role_id), 'name': self.name, 'permissions': [str(p) for p in self.permissions]}
+
     def add_permission(self, permission: Permission):
         """
         Add a permission to the role.
@@ -31,7 +74,7 @@ class Role:
         :type permission: Permission
         """
         if permission not in self.permissions:
-            self.permissions.append(permission)
+            self.permissions = [*self.permissions, permission]
 
     def remove_permission(self, permission: Permission):
         """
@@ -41,7 +84,7 @@ class Role:
         :type permission: Permission
         """
         if permission in self.permissions:
-            self.permissions.remove(permission)
+            self.permissions = [p for p in self.permissions if p != permission]
 
     def has_permission(self, permission: Permission) -> bool:
         """
@@ -52,4 +95,4 @@ class Role:
         :return: True if the role has the permission, otherwise False.
         :rtype: bool
         """
-        return permission in self.permissions
+        return bool(self.mask & permission.bit)
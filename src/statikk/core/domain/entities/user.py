@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from statikk.core.domain.entities.entity import Entity
 from statikk.core.domain.value_objects import UserID
 
 
-class User:
+class User(Entity):
     """
     Represents a User in the system.
 
@@ -15,6 +16,12 @@ class User:
     :type email: str
     """
 
+    __slots__ = ('user_id', 'username', 'email')
+
+    _id_attribute = 'user_id'
+    _table = 'users'
+    _converters = {'user_id': UserID.from_trusted}
+
     def __init__(self, user_id: UserID, username: str, email: str):
         self.user_id = user_id
         self.username = username
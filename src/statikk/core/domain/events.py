@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+
+class EntityEvent:
+    """
+    A write to an entity, published once the write succeeded.
+
+    Each entity type has one event class per kind of write, e.g. ``CollectionCreated``, so subscribers pick
+    what they receive by class: ``CollectionEvent`` for every write to a collection, ``EntityDeleted`` for
+    every deletion, or ``EntityEvent`` for everything.
+
+    The entity is a copy-on-write snapshot taken once the write succeeded, so later changes the writer makes
+    are not seen by subscribers; subscribers must not change it either, as it shares its values with the
+    writer's entity.
+
+    :param entity_id: The unique ID of the entity written.
+    :type entity_id: str
+    :param entity: The entity written, or None for deletions by ID.
+    :type entity: Any, optional
+    :param occurred_at: When the write completed, as a Unix timestamp; defaults to now.
+    :type occurred_at: float, optional
+    """
+
+    __slots__ = ('entity_id', 'entity', 'occurred_at')
+
+    # Set by the subclasses: the kind of entity, as in trigger keys, and the kind of write.
+    entity_type = ''
+    action = ''
+
+    def __init__(self, entity_id: str, entity: Any = None, occurred_at: float | None = None):
+        self.entity_id = entity_id
+        self.entity = entity
+        self.occurred_at = time.time() if occurred_at is None else occurred_at
+
+    @property
+    def key(self) -> tuple[str, ...]:
+        """
+        What the event is about, e.g. ``('collection', 'c-1')``: a newer event with the same key supersedes it.
+        """
+        return (self.entity_type, self.entity_id)
+
+    @property
+    def trigger(self) -> str:
+        """
+        The event's trigger key, e.g. ``collection:c-1:create``, as matched by the ``TriggerRegistry``.
+        """
+        return f"{self.entity_type}:{self.entity_id}:{self.action}"
+
+    def __repr__(self):
+        return f"{type(self).__name__}(entity_id='{self.entity_id}')"
+
+
+class EntityCreated(EntityEvent):
+    """
+    An entity was saved.
+    """
+
+    __slots__ = ()
+    action = 'create'
+
+
+class EntityUpdated(EntityEvent):
+    """
+    An entity was updated.
+    """
+
+    __slots__ = ()
+    action = 'update'
+
+
+class EntityDeleted(EntityEvent):
+    """
+    An entity was deleted.
+    """
+
+    __slots__ = ()
+    action = 'delete'
+
+
+class CollectionEvent(EntityEvent):
+    """
+    A write to a collection.
+    """
+
+    __slots__ = ()
+    entity_type = 'collection'
+
+
+class CollectionCreated(CollectionEvent, EntityCreated):
+    __slots__ = ()
+
+
+class CollectionUpdated(CollectionEvent, EntityUpdated):
+    __slots__ = ()
+
+
+class CollectionDeleted(CollectionEvent, EntityDeleted):
+    __slots__ = ()
+
+
+class UserEvent(EntityEvent):
+    """
+    A write to a user.
+    """
+
+    __slots__ = ()
+    entity_type = 'user'
+
+
+class UserCreated(UserEvent, EntityCreated):
+    __slots__ = ()
+
+
+class UserUpdated(UserEvent, EntityUpdated):
+    __slots__ = ()
+
+
+class UserDeleted(UserEvent, EntityDeleted):
+    __slots__ = ()
+
+
+class OrganizationEvent(EntityEvent):
+    """
+    A write to an organization, including changes to its members.
+    """
+
+    __slots__ = ()
+    entity_type = 'organization'
+
+
+class OrganizationCreated(OrganizationEvent, EntityCreated):
+    __slots__ = ()
+
+
+class OrganizationUpdated(OrganizationEvent, EntityUpdated):
+    __slots__ = ()
+
+
+class OrganizationDeleted(OrganizationEvent, EntityDeleted):
+    __slots__ = ()
+
+
+class OrganizationMemberEvent(OrganizationEvent):
+    """
+    A change to one member of an organization, published along with the event of the organization write
+    that made it.
+
+    :param entity_id: The unique ID of the organization.
+    :type entity_id: str
+    :param user_id: The unique ID of the member.
+    :type user_id: str
+    :param role: The member's new role, or None if the member was removed.
+    :type role: Role, optional
+    :param occurred_at: When the write completed, as a Unix timestamp; defaults to now.
+    :type occurred_at: float, optional
+    """
+
+    __slots__ = ('user_id', 'role')
+
+    def __init__(self, entity_id: str, user_id: str, role: Any = None, occurred_at: float | None = None):
+        super().__init__(entity_id, occurred_at=occurred_at)
+        self.user_id = user_id
+        self.role = role
+
+    @property
+    def key(self) -> tuple[str, ...]:
+        return (self.entity_type, self.entity_id, self.user_id)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(entity_id='{self.entity_id}', user_id='{self.user_id}')"
+
+
+class OrganizationMemberUpdated(OrganizationMemberEvent):
+    """
+    A member was added to an organization, or given another role.
+    """
+
+    __slots__ = ()
+    action = 'member_update'
+
+
+class OrganizationMemberRemoved(OrganizationMemberEvent):
+    """
+    A member was removed from an organization.
+    """
+
+    __slots__ = ()
+    action = 'member_remove'
+
+
+def organization_member_events(organization: Any) -> list[OrganizationMemberEvent]:
+    """
+    Build the events of the member changes an organization write is about to persist.
+
+    :param organization: The organization being written, before the write clears its ``member_changes``.
+    :type organization: Organization
+    :return: One event per changed member.
+    :rtype: List[OrganizationMemberEvent]
+    """
+    organization_id = str(organization.organization_id)
+    return [
+        OrganizationMemberRemoved(organization_id, user_id) if role is None
+        else OrganizationMemberUpdated(organization_id, user_id, role)
+        for user_id, role in organization.member_changes.items()
+    ]
+
+
+class ProjectEvent(EntityEvent):
+    """
+    A write to a project.
+    """
+
+    __slots__ = ()
+    entity_type = 'project'
+
+
+class ProjectCreated(ProjectEvent, EntityCreated):
+    __slots__ = ()
+
+
+class ProjectUpdated(ProjectEvent, EntityUpdated):
+    __slots__ = ()
+
+
+class ProjectDeleted(ProjectEvent, EntityDeleted):
+    __slots__ = ()
+
+
+class CloudFunctionEvent(EntityEvent):
+    """
+    A write to a cloud function.
+    """
+
+    __slots__ = ()
+    entity_type = 'cloud_function'
+
+
+class CloudFunctionCreated(CloudFunctionEvent, EntityCreated):
+    __slots__ = ()
+
+
+class CloudFunctionUpdated(CloudFunctionEvent, EntityUpdated):
+    __slots__ = ()
+
+
+class CloudFunctionDeleted(CloudFunctionEvent, EntityDeleted):
+    __slots__ = ()
@@ -0,0 +1,29 @@
+# core/domain/exceptions.py
+from __future__ import annotations
+
+
+class ConcurrentUpdateError(Exception):
+    """
+    Raised when a versioned entity was changed by another writer since it was read.
+
+    The write that raised it had no effect; reading the entity again and reapplying the change is safe.
+    """
+
+
+class FunctionExecutionError(Exception):
+    """
+    Raised when a cloud function fails: its code does not compile, it has no handler, its handler raised,
+    or its worker process died while running it.
+
+    :param message: Description of the failure.
+    :type message: str
+    :param error_type: Name of the exception raised inside the function, if any.
+    :type error_type: str, optional
+    :param traceback: Formatted traceback from the worker process, if any.
+    :type traceback: str, optional
+    """
+
+    def __init__(self, message: str, error_type: str | None = None, traceback: str | None = None):
+        super().__init__(message)
+        self.error_type = error_type
+        self.traceback = traceback
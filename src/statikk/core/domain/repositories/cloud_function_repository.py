@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
 
 from statikk.core.domain.entities.cloud_function import CloudFunction
 from statikk.core.domain.value_objects.cloud_function_id import CloudFunctionID
+from statikk.infrastructure.databases.bulk_write import BulkWriteResult
 
 
 class CloudFunctionRepository(ABC):
@@ -13,22 +16,36 @@ class CloudFunctionRepository(ABC):
     """
 
     @abstractmethod
-    def get_by_id(self, function_id: CloudFunctionID) -> CloudFunction:
+    async def get_by_id(self, function_id: CloudFunctionID) -> CloudFunction:
         pass
 
     @abstractmethod
-    def save(self, cloud_function: CloudFunction) -> None:
+    async def save(self, cloud_function: CloudFunction) -> None:
         pass
 
     @abstractmethod
-    def update(self, cloud_function: CloudFunction) -> None:
+    async def save_many(
+        self, cloud_functions: Iterable[CloudFunction], chunk_size: int = 500, upsert: bool = False,
+    ) -> BulkWriteResult:
         pass
 
     @abstractmethod
-    def delete(self, function_id: CloudFunctionID) -> None:
+    async def update(self, cloud_function: CloudFunction) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, function_id: CloudFunctionID) -> None:
+
+        pass
 
+    @abstractmethod
+    async def list_all(self) -> list[CloudFunction]:
+        pass
+
+    @abstractmethod
+    def iter_all(self, page_size: int = 500, after: CloudFunctionID | None = None) -> AsyncIterator[CloudFunction]:
         pass
 
     @abstractmethod
-    def list_all(self) -> list[CloudFunction]:
+    async def list_page(self, limit: int, after: CloudFunctionID | None = None) -> list[CloudFunction]:
         pass
@@ -1,9 +1,15 @@
 # infrastructure/database/cloud_function_repository_impl.py
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+
 from statikk.core.domain.entities.cloud_function import CloudFunction
+from statikk.core.domain.exceptions import ConcurrentUpdateError
 from statikk.core.domain.repositories.cloud_function_repository import CloudFunctionRepository
 from statikk.core.domain.value_objects.cloud_function_id import CloudFunctionID
+from statikk.infrastructure.databases.bulk_write import BulkWriteResult
+from statikk.infrastructure.databases.subrreal_db_client import record_key
 from statikk.infrastructure.databases.subrreal_db_client import SubrrealDBClient
 
 
@@ -18,7 +24,7 @@ class SubrrrealDBCloudFunctionRepository(CloudFunctionRepository):
     def __init__(self, db_client: SubrrealDBClient):
         self.db_client = db_client
 
-    def get_by_id(self, function_id: CloudFunctionID) -> CloudFunction:
+    async def get_by_id(self, function_id: CloudFunctionID) -> CloudFunction:
         """
         Retrieve a cloud function by its unique identifier.
 
@@ -29,16 +35,12 @@ class SubrrrealDBCloudFunctionRepository(CloudFunctionRepository):
         :raises KeyError: If the cloud function does not exist.
         """
         try:
-            query = f"SELECT * FROM cloud_functions WHERE id = '{function_id}'"
-            result = self.db_client.query(query)
-            if not result:
-                raise KeyError(f"Cloud function with ID {function_id} not found.")
-            return CloudFunction(
-                function_id=CloudFunctionID(result['id']),
-                name=result['name'],
-                code=result['code'],
-                triggers=result['triggers'],
+            rows = await self.db_client.query(
+                "SELECT * FROM type::thing('cloud_functions', $id)", {'id': record_key('cloud_functions', function_id)},
             )
+            if not rows:
+                raise KeyError(f"Cloud function with ID {function_id} not found.")
+            return CloudFunction.from_row(rows[0])
         except KeyError as e:
             print(f"Error: {str(e)}")
             raise e
@@ -46,7 +48,7 @@ class SubrrrealDBCloudFunctionRepository(CloudFunctionRepository):
             print(f"Failed to retrieve cloud function: {str(e)}")
             raise Exception(f"Database error: Could not retrieve cloud function with ID {function_id}.") from e
 
-    def save(self, cloud_function: CloudFunction) -> None:
+    async def save(self, cloud_function: CloudFunction) -> None:
         """
         Save a cloud function entity to the database.
 
@@ -54,50 +56,85 @@ class SubrrrealDBCloudFunctionRepository(CloudFunctionRepository):
         :type cloud_function: CloudFunction
         """
         try:
-            self.db_client.insert(
+            await self.db_client.insert(
                 collection='cloud_functions',
-                data={
-                    'id': str(cloud_function.function_id),
-                    'name': cloud_function.name,
-                    'code': cloud_function.code,
-                    'triggers': cloud_function.triggers,
-                },
+                data=cloud_function.to_row(),
             )
             print(f"Cloud function {cloud_function.name} saved successfully.")
         except Exception as e:
             print(f"Failed to save cloud function: {str(e)}")
             raise Exception(f"Database error: Could not save cloud function {cloud_function.name}.") from e
 
-    def update(self, cloud_function: CloudFunction) -> None:
+    async def save_many(
+        self, cloud_functions: Iterable[CloudFunction], chunk_size: int = 500, upsert: bool = False,
+    ) -> BulkWriteResult:
+        """
+        Save many cloud function entities to the database, several per statement.
+
+        :param cloud_functions: The cloud function entities to save; consumed lazily.
+        :type cloud_functions: Iterable[CloudFunction]
+        :param chunk_size: Number of cloud functions written per statement.
+        :type chunk_size: int
+        :param upsert: Merge into cloud functions that already exist instead of failing their chunk.
+        :type upsert: bool
+        :return: The number of cloud functions written and the chunks that failed.
+        :rtype: BulkWriteResult
+        """
+        write_many = self.db_client.upsert_many if upsert else self.db_client.insert_many
+        try:
+            result = await write_many(
+                collection='cloud_functions',
+                rows=(cloud_function.to_row() for cloud_function in cloud_functions),
+                chunk_size=chunk_size,
+            )
+            print(f"Saved {result.written} cloud functions in {result.chunks} chunks, {result.failed} failed.")
+            return result
+        except Exception as e:
+            print(f"Failed to save cloud functions: {str(e)}")
+            raise Exception('Database error: Could not save cloud functions.') from e
+
+    async def update(self, cloud_function: CloudFunction) -> None:
         """
         Update an existing cloud function entity in the database.
 
-        :param cloud_function: The cloud function entity to update.
+        :param cloud_function: The cloud function entity to update; its ``version`` is incremented on success.
         :type cloud_function: CloudFunction
+        :raises KeyError: If the cloud function does not exist.
+        :raises ConcurrentUpdateError: If the cloud function was updated since it was read.
         """
         try:
-            existing_function = self.get_by_id(cloud_function.function_id)
-            if not existing_function:
-                raise KeyError(f"Cloud function with ID {cloud_function.function_id} not found for update.")
-
-            self.db_client.update(
+            updated = await self.db_client.update(
                 collection='cloud_functions',
                 identifier=str(cloud_function.function_id),
                 data={
                     'name': cloud_function.name,
                     'code': cloud_function.code,
                     'triggers': cloud_function.triggers,
+                    'version': cloud_function.version + 1,
                 },
+                version=cloud_function.version,
             )
+            if not updated:
+                exists = await self.db_client.query(
+                    "SELECT id FROM type::thing('cloud_functions', $id)",
+                    {'id': record_key('cloud_functions', cloud_function.function_id)},
+                )
+                if exists:
+                    raise ConcurrentUpdateError(
+                        f"Cloud function with ID {cloud_function.function_id} "
+                        f"was modified since version {cloud_function.version}.",
+                    )
+                raise KeyError(f"Cloud function with ID {cloud_function.function_id} not found for update.")
+            cloud_function.version += 1
             print(f"Cloud function {cloud_function.name} updated successfully.")
-        except KeyError as e:
+        except (KeyError, ConcurrentUpdateError) as e:
             print(f"Error: {str(e)}")
             raise e
         except Exception as e:
             print(f"Failed to update cloud function: {str(e)}")
             raise Exception(f"Database error: Could not update cloud function with ID {cloud_function.function_id}.") from e
 
-    def delete(self, function_id: CloudFunctionID) -> None:
+    async def delete(self, function_id: CloudFunctionID) -> None:
         """
         Delete a cloud function by its unique identifier.
 
@@ -105,14 +142,12 @@ class SubrrrealDBCloudFunctionRepository(CloudFunctionRepository):
         :type function_id: CloudFunctionID
         """
         try:
-            existing_function = self.get_by_id(function_id)
-            if not existing_function:
-                raise KeyError(f"Cloud function with ID {function_id} not found for deletion.")
-
-            self.db_client.delete(
+            deleted = await self.db_client.delete(
                 collection='cloud_functions',
                 identifier=str(function_id),
             )
+            if not deleted:
+                raise KeyError(f"Cloud function with ID {function_id} not found for deletion.")
             print(f"Cloud function with ID {function_id} deleted successfully.")
         except KeyError as e:
             print(f"Error: {str(e)}")
@@ -121,7 +156,7 @@ class SubrrrealDBCloudFunctionRepository(CloudFunctionRepository):
             print(f"Failed to delete cloud function: {str(e)}")
             raise Exception(f"Database error: Could not delete cloud function with ID {function_id}.") from e
 
-    def list_all(self) -> list[CloudFunction]:
+    async def list_all(self) -> list[CloudFunction]:
         """
         List all cloud functions in the database.
 
@@ -129,17 +164,47 @@ class SubrrrealDBCloudFunctionRepository(CloudFunctionRepository):
         :rtype: List[CloudFunction]
         """
         try:
-            results = self.db_client.query('SELECT * FROM cloud_functions')
-            cloud_functions = [
-                CloudFunction(
-                    function_id=CloudFunctionID(result['id']),
-                    name=result['name'],
-                    code=result['code'],
-                    triggers=result['triggers'],
-                )
-                for result in results
-            ]
-            return cloud_functions
+            results = await self.db_client.query('SELECT * FROM cloud_functions')
+            return [CloudFunction.from_row(result) for result in results]
+        except Exception as e:
+            print(f"Failed to list cloud functions: {str(e)}")
+            raise Exception('Database error: Could not list cloud functions.') from e
+
+    async def iter_all(self, page_size: int = 500, after: CloudFunctionID | None = None) -> AsyncIterator[CloudFunction]:
+        """
+        Iterate over all cloud functions in the database, fetching them page by page.
+
+        :param page_size: Number of cloud functions fetched per round trip.
+        :type page_size: int
+        :param after: ID to start after, or None to start from the first cloud function.
+        :type after: Optional[CloudFunctionID]
+        :return: An async iterator over the cloud functions, in ID order.
+        :rtype: AsyncIterator[CloudFunction]
+        """
+        try:
+            async for page in self.db_client.cursor(
+                'cloud_functions', page_size=page_size, after=str(after) if after is not None else None,
+            ):
+                for row in page:
+                    yield CloudFunction.from_row(row)
+        except Exception as e:
+            print(f"Failed to iterate cloud functions: {str(e)}")
+            raise Exception('Database error: Could not list cloud functions.') from e
+
+    async def list_page(self, limit: int, after: CloudFunctionID | None = None) -> list[CloudFunction]:
+        """
+        Retrieve one page of cloud functions, ordered by ID.
+
+        :param limit: Maximum number of cloud functions returned.
+        :type limit: int
+        :param after: ID of the last cloud function of the previous page, or None for the first page.
+        :type after: Optional[CloudFunctionID]
+        :return: The cloud functions following ``after``.
+        :rtype: List[CloudFunction]
+        """
+        try:
+            rows = await self.db_client.fetch_page('cloud_functions', limit, after=str(after) if after is not None else None)
+            return [CloudFunction.from_row(row) for row in rows]
         except Exception as e:
             print(f"Failed to list cloud functions: {str(e)}")
             raise Exception('Database error: Could not list cloud functions.') from e
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
 
 from statikk.core.domain.entities.collection import Collection
 from statikk.core.domain.value_objects.collection_id import CollectionID
+from statikk.infrastructure.databases.bulk_write import BulkWriteResult
 
 
 class CollectionRepository(ABC):
@@ -13,21 +16,33 @@ class CollectionRepository(ABC):
     """
 
     @abstractmethod
-    def get_by_id(self, collection_id: CollectionID) -> Collection:
+    async def get_by_id(self, collection_id: CollectionID) -> Collection:
         pass
 
     @abstractmethod
-    def save(self, collection: Collection) -> None:
+    async def save(self, collection: Collection) -> None:
         pass
 
     @abstractmethod
-    def update(self, collection: Collection) -> None:
+    async def save_many(self, collections: Iterable[Collection], chunk_size: int = 500, upsert: bool = False) -> BulkWriteResult:
         pass
 
     @abstractmethod
-    def delete(self, collection_id: CollectionID) -> None:
+    async def update(self, collection: Collection) -> None:
         pass
 
     @abstractmethod
-    def list_all(self) -> list[Collection]:
+    async def delete(self, collection_id: CollectionID) -> None:
+        pass
+
+    @abstractmethod
+    async def list_all(self) -> list[Collection]:
+        pass
+
+    @abstractmethod
+    def iter_all(self, page_size: int = 500, after: CollectionID | None = None) -> AsyncIterator[Collection]:
+        pass
+
+    @abstractmethod
+    async def list_page(self, limit: int, after: CollectionID | None = None) -> list[Collection]:
         pass
@@ -1,9 +1,15 @@
 # infrastructure/database/collection_repository_impl.py
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+
 from statikk.core.domain.entities.collection import Collection
+from statikk.core.domain.exceptions import ConcurrentUpdateError
 from statikk.core.domain.repositories.collection_repository import CollectionRepository
 from statikk.core.domain.value_objects.collection_id import CollectionID
+from statikk.infrastructure.databases.bulk_write import BulkWriteResult
+from statikk.infrastructure.databases.subrreal_db_client import record_key
 from statikk.infrastructure.databases.subrreal_db_client import SubrrealDBClient
 
 
@@ -18,7 +24,7 @@ class SubrrealDBCollectionRepository(CollectionRepository):
     def __init__(self, db_client: SubrrealDBClient):
         self.db_client = db_client
 
-    def get_by_id(self, collection_id: CollectionID) -> Collection:
+    async def get_by_id(self, collection_id: CollectionID) -> Collection:
         """
         Retrieve a collection by its unique identifier.
 
@@ -29,15 +35,12 @@ class SubrrealDBCollectionRepository(CollectionRepository):
         :raises KeyError: If the collection does not exist.
         """
         try:
-            query = f"SELECT * FROM collections WHERE id = '{collection_id}'"
-            result = self.db_client.query(query)
-            if not result:
-                raise KeyError(f"Collection with ID {collection_id} not found.")
-            return Collection(
-                collection_id=CollectionID(result['id']),
-                name=result['name'],
-                schema=result['schema'],
+            rows = await self.db_client.query(
+                "SELECT * FROM type::thing('collections', $id)", {'id': record_key('collections', collection_id)},
             )
+            if not rows:
+                raise KeyError(f"Collection with ID {collection_id} not found.")
+            return Collection.from_row(rows[0])
         except KeyError as e:
             print(f"Error: {str(e)}")
             raise e
@@ -45,7 +48,7 @@ class SubrrealDBCollectionRepository(CollectionRepository):
             print(f"Failed to retrieve collection: {str(e)}")
             raise Exception(f"Database error: Could not retrieve collection with ID {collection_id}.") from e
 
-    def save(self, collection: Collection) -> None:
+    async def save(self, collection: Collection) -> None:
         """
         Save a collection entity to the database.
 
@@ -53,48 +56,80 @@ class SubrrealDBCollectionRepository(CollectionRepository):
         :type collection: Collection
         """
         try:
-            self.db_client.insert(
+            await self.db_client.insert(
                 collection='collections',
-                data={
-                    'id': str(collection.collection_id),
-                    'name': collection.name,
-                    'schema': collection.schema,
-                },
+                data=collection.to_row(),
             )
             print(f"Collection {collection.name} saved successfully.")
         except Exception as e:
             print(f"Failed to save collection: {str(e)}")
             raise Exception(f"Database error: Could not save collection {collection.name}.") from e
 
-    def update(self, collection: Collection) -> None:
+    async def save_many(self, collections: Iterable[Collection], chunk_size: int = 500, upsert: bool = False) -> BulkWriteResult:
+        """
+        Save many collection entities to the database, several per statement.
+
+        :param collections: The collection entities to save; consumed lazily.
+        :type collections: Iterable[Collection]
+        :param chunk_size: Number of collections written per statement.
+        :type chunk_size: int
+        :param upsert: Merge into collections that already exist instead of failing their chunk.
+        :type upsert: bool
+        :return: The number of collections written and the chunks that failed.
+        :rtype: BulkWriteResult
+        """
+        write_many = self.db_client.upsert_many if upsert else self.db_client.insert_many
+        try:
+            result = await write_many(
+                collection='collections',
+                rows=(collection.to_row() for collection in collections),
+                chunk_size=chunk_size,
+            )
+            print(f"Saved {result.written} collections in {result.chunks} chunks, {result.failed} failed.")
+            return result
+        except Exception as e:
+            print(f"Failed to save collections: {str(e)}")
+            raise Exception('Database error: Could not save collections.') from e
+
+    async def update(self, collection: Collection) -> None:
         """
         Update an existing collection entity in the database.
 
-        :param collection: The collection entity to update.
+        :param collection: The collection entity to update; its ``version`` is incremented on success.
         :type collection: Collection
+        :raises KeyError: If the collection does not exist.
+        :raises ConcurrentUpdateError: If the collection was updated since it was read.
         """
         try:
-            existing_collection = self.get_by_id(collection.collection_id)
-            if not existing_collection:
-                raise KeyError(f"Collection with ID {collection.collection_id} not found for update.")
-
-            self.db_client.update(
+            updated = await self.db_client.update(
                 collection='collections',
                 identifier=str(collection.collection_id),
                 data={
                     'name': collection.name,
                     'schema': collection.schema,
+                    'version': collection.version + 1,
                 },
+                version=collection.version,
             )
+            if not updated:
+                exists = await self.db_client.query(
+                    "SELECT id FROM type::thing('collections', $id)", {'id': record_key('collections', collection.collection_id)},
+                )
+                if exists:
+                    raise ConcurrentUpdateError(
+                        f"Collection with ID {collection.collection_id} was modified since version {collection.version}.",
+                    )
+                raise KeyError(f"Collection with ID {collection.collection_id} not found for update.")
+            collection.version += 1
             print(f"Collection {collection.name} updated successfully.")
-        except KeyError as e:
+        except (KeyError, ConcurrentUpdateError) as e:
             print(f"Error: {str(e)}")
             raise e
         except Exception as e:
             print(f"Failed to update collection: {str(e)}")
             raise Exception(f"Database error: Could not update collection with ID {collection.collection_id}.") from e
 
-    def delete(self, collection_id: CollectionID) -> None:
+    async def delete(self, collection_id: CollectionID) -> None:
         """
         Delete a collection by its unique identifier.
 
@@ -102,14 +137,12 @@ class SubrrealDBCollectionRepository(CollectionRepository):
         :type collection_id: CollectionID
         """
         try:
-            existing_collection = self.get_by_id(collection_id)
-            if not existing_collection:
-                raise KeyError(f"Collection with ID {collection_id} not found for deletion.")
-
-            self.db_client.delete(
+            deleted = await self.db_client.delete(
                 collection='collections',
                 identifier=str(collection_id),
             )
+            if not deleted:
+                raise KeyError(f"Collection with ID {collection_id} not found for deletion.")
             print(f"Collection with ID {collection_id} deleted successfully.")
         except KeyError as e:
             print(f"Error: {str(e)}")
@@ -117,3 +150,51 @@ class SubrrealDBCollectionRepository(CollectionRepository):
         except Exception as e:
             print(f"Failed to delete collection: {str(e)}")
             raise Exception(f"Database error: Could not delete collection with ID {collection_id}.") from e
+
+    async def iter_all(self, page_size: int = 500, after: CollectionID | None = None) -> AsyncIterator[Collection]:
+        """
+        Iterate over all collections in the database, fetching them page by page.
+
+        :param page_size: Number of collections fetched per round trip.
+        :type page_size: int
+        :param after: ID to start after, or None to start from the first collection.
+        :type after: Optional[CollectionID]
+        :return: An async iterator over the collections, in ID order.
+        :rtype: AsyncIterator[Collection]
+        """
+        try:
+            async for page in self.db_client.cursor(
+                'collections', page_size=page_size, after=str(after) if after is not None else None,
+            ):
+                for row in page:
+                    yield Collection.from_row(row)
+        except Exception as e:
+            print(f"Failed to iterate collections: {str(e)}")
+            raise Exception('Database error: Could not list collections.') from e
+
+    async def list_all(self) -> list[Collection]:
+        """
+        List all collections in the database.
+
+        :return: A list of all collections.
+        :rtype: List[Collection]
+        """
+        return [collection async for collection in self.iter_all()]
+
+    async def list_page(self, limit: int, after: CollectionID | None = None) -> list[Collection]:
+        """
+        Retrieve one page of collections, ordered by ID.
+
+        :param limit: Maximum number of collections returned.
+        :type limit: int
+        :param after: ID of the last collection of the previous page, or None for the first page.
+        :type after: Optional[CollectionID]
+        :return: The collections following ``after``.
+        :rtype: List[Collection]
+        """
+        try:
+            rows = await self.db_client.fetch_page('collections', limit, after=str(after) if after is not None else None)
+            return [Collection.from_row(row) for row in rows]
+        except Exception as e:
+            print(f"Failed to list collections: {str(e)}")
+            raise Exception('Database error: Could not list collections.') from e
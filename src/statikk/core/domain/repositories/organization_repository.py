@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 
+from statikk.core.domain.entities.membership import Membership
 from statikk.core.domain.entities.organization import Organization
 from statikk.core.domain.value_objects.organization_id import OrganizationID
+from statikk.core.domain.value_objects.user_id import UserID
 
 
 class OrganizationRepository(ABC):
@@ -13,17 +16,39 @@ class OrganizationRepository(ABC):
     """
 
     @abstractmethod
-    def get_by_id(self, organization_id: OrganizationID) -> Organization:
+    async def get_by_id(self, organization_id: OrganizationID) -> Organization:
         pass
 
     @abstractmethod
-    def save(self, organization: Organization) -> None:
+    async def get_with_members(self, organization_id: OrganizationID, user_ids: list[UserID]) -> Organization:
         pass
 
     @abstractmethod
-    def update(self, organization: Organization) -> None:
+    async def save(self, organization: Organization) -> None:
         pass
 
     @abstractmethod
-    def delete(self, organization_id: OrganizationID) -> None:
+    async def update(self, organization: Organization) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, organization_id: OrganizationID) -> None:
+        pass
+
+    @abstractmethod
+    def iter_all(self, page_size: int = 500, after: OrganizationID | None = None) -> AsyncIterator[Organization]:
+        pass
+
+    @abstractmethod
+    async def list_page(self, limit: int, after: OrganizationID | None = None) -> list[Organization]:
+        pass
+
+    @abstractmethod
+    async def list_members(
+        self, organization_id: OrganizationID, cursor: UserID | None = None, limit: int = 100,
+    ) -> list[Membership]:
+        pass
+
+    @abstractmethod
+    async def list_organizations_for_user(self, user_id: UserID) -> list[Membership]:
         pass
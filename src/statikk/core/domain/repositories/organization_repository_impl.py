@@ -1,12 +1,63 @@
 # infrastructure/database/organization_repository_impl.py
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from typing import Any
+
+from statikk.core.domain.entities.membership import Membership
 from statikk.core.domain.entities.organization import Organization
+from statikk.core.domain.entities.role import Role
+from statikk.core.domain.exceptions import ConcurrentUpdateError
 from statikk.core.domain.repositories.organization_repository import OrganizationRepository
 from statikk.core.domain.value_objects.organization_id import OrganizationID
 from statikk.core.domain.value_objects.user_id import UserID
+from statikk.infrastructure.databases.subrreal_db_client import record_key
 from statikk.infrastructure.databases.subrreal_db_client import SubrrealDBClient
 
+# Members are stored one row per (organization, user) pair, under a record ID derived from both so a
+# membership can be written or removed without looking it up first. ``$identifier`` is the organization ID
+# as stored in membership rows, ``$key`` the key of the organization's own record.
+_DEFINE_MEMBERSHIP_INDEXES = '''
+DEFINE INDEX membership_organization ON TABLE memberships COLUMNS organization_id, user_id;
+DEFINE INDEX membership_user ON TABLE memberships COLUMNS user_id;
+'''
+
+_CREATE_ORGANIZATION = '''
+BEGIN TRANSACTION;
+CREATE organizations CONTENT $organization;
+FOR $member IN $members {
+    CREATE type::thing('memberships', [$identifier, $member.user_id]) CONTENT $member;
+};
+COMMIT TRANSACTION;
+'''
+
+_UPDATE_ORGANIZATION = '''
+BEGIN TRANSACTION;
+LET $updated = (
+    UPDATE type::thing('organizations', $key) MERGE $data WHERE (version ?? 0) = $version RETURN id
+);
+IF $updated {
+    FOR $member IN $upserts {
+        UPDATE type::thing('memberships', [$identifier, $member.user_id]) CONTENT $member;
+    };
+    FOR $user_id IN $removals {
+        DELETE type::thing('memberships', [$identifier, $user_id]);
+    };
+};
+RETURN $updated;
+COMMIT TRANSACTION;
+'''
+
+_DELETE_ORGANIZATION = '''
+BEGIN TRANSACTION;
+LET $deleted = (DELETE type::thing('organizations', $key) RETURN BEFORE);
+IF $deleted {
+    DELETE memberships WHERE organization_id = $identifier;
+};
+RETURN $deleted;
+COMMIT TRANSACTION;
+'''
+
 
 class SubrrrealDBOrganizationRepository(OrganizationRepository):
     """
@@ -19,7 +70,44 @@ class SubrrrealDBOrganizationRepository(OrganizationRepository):
     def __init__(self, db_client: SubrrealDBClient):
         self.db_client = db_client
 
-    def get_by_id(self, organization_id: OrganizationID) -> Organization:
+    @staticmethod
+    def _from_rows(row: dict[str, Any], members: list[dict[str, Any]]) -> Organization:
+        """
+        Map a database row and its membership rows to an organization entity.
+        """
+        organization = Organization.from_row(row)
+        organization.members = {member['user_id']: Role.from_row(member['role']) for member in members}
+        return organization
+
+    async def _with_members(self, rows: list[dict[str, Any]]) -> list[Organization]:
+        """
+        Map a page of organization rows to entities, reading the members of the whole page in one query.
+        """
+        if not rows:
+            return []
+        members = await self.db_client.query(
+            'SELECT organization_id, user_id, role FROM memberships WHERE organization_id IN $ids',
+            {'ids': [record_key('organizations', row['id']) for row in rows]},
+        )
+        members_by_organization: dict[str, list[dict[str, Any]]] = {}
+        for member in members:
+            members_by_organization.setdefault(member['organization_id'], []).append(member)
+        return [
+            self._from_rows(row, members_by_organization.get(record_key('organizations', row['id']), [])) for row in rows
+        ]
+
+    async def ensure_indexes(self) -> None:
+        """
+        Define the indexes backing membership lookups in both directions: the members of an organization,
+        ordered by user ID, and the organizations of a user. Safe to run on every startup.
+        """
+        try:
+            await self.db_client.query(_DEFINE_MEMBERSHIP_INDEXES)
+        except Exception as e:
+            print(f"Failed to define membership indexes: {str(e)}")
+            raise Exception('Database error: Could not define membership indexes.') from e
+
+    async def get_by_id(self, organization_id: OrganizationID) -> Organization:
         """
         Retrieve an organization by its unique identifier.
 
@@ -30,16 +118,14 @@ class SubrrrealDBOrganizationRepository(OrganizationRepository):
         :raises KeyError: If the organization does not exist.
         """
         try:
-            query = f"SELECT * FROM organizations WHERE id = '{organization_id}'"
-            result = self.db_client.query(query)
-            if not result:
+            key = record_key('organizations', organization_id)
+            rows, members = await self.db_client.batch([
+                ("SELECT * FROM type::thing('organizations', $id)", {'id': key}),
+                ('SELECT user_id, role FROM memberships WHERE organization_id = $id', {'id': key}),
+            ])
+            if not rows:
                 raise KeyError(f"Organization with ID {organization_id} not found.")
-            return Organization(
-                organization_id=OrganizationID(result['id']),
-                name=result['name'],
-                owner_id=UserID(result['owner_id']),
-                members={UserID(k): v for k, v in result['members'].items()},
-            )
+            return self._from_rows(rows[0], members)
         except KeyError as e:
             print(f"Error: {str(e)}")
             raise e
@@ -47,73 +133,138 @@ class SubrrrealDBOrganizationRepository(OrganizationRepository):
             print(f"Failed to retrieve organization: {str(e)}")
             raise Exception(f"Database error: Could not retrieve organization with ID {organization_id}.") from e
 
-    def save(self, organization: Organization) -> None:
+    async def get_with_members(self, organization_id: OrganizationID, user_ids: list[UserID]) -> Organization:
         """
-        Save an organization entity to the database.
+        Retrieve an organization with only some of its members loaded, reading each one's membership record
+        directly, so the cost does not depend on the size of the organization.
+
+        :param organization_id: The unique ID of the organization.
+        :type organization_id: OrganizationID
+        :param user_ids: The users to load, if they are members.
+        :type user_ids: List[UserID]
+        :return: The organization, marked ``partial``, whose ``members`` holds those of ``user_ids`` who
+            are members.
+        :rtype: Organization
+        :raises KeyError: If the organization does not exist.
+        """
+        try:
+            identifier = str(organization_id)
+            rows, *members = await self.db_client.batch([
+                (
+                    "SELECT * FROM type::thing('organizations', $id)",
+                    {'id': record_key('organizations', organization_id)},
+                ),
+                *(
+                    (
+                        "SELECT user_id, role FROM type::thing('memberships', [$identifier, $user_id])",
+                        {'identifier': identifier, 'user_id': str(user_id)},
+                    )
+                    for user_id in user_ids
+                ),
+            ])
+            if not rows:
+                raise KeyError(f"Organization with ID {organization_id} not found.")
+            organization = self._from_rows(rows[0], [member for found in members for member in found])
+            organization.mark_partial()
+            return organization
+        except KeyError as e:
+            print(f"Error: {str(e)}")
+            raise e
+        except Exception as e:
+            print(f"Failed to retrieve organization: {str(e)}")
+            raise Exception(f"Database error: Could not retrieve organization with ID {organization_id}.") from e
+
+    async def save(self, organization: Organization) -> None:
+        """
+        Save an organization entity and its memberships to the database.
 
         :param organization: The organization entity to save.
         :type organization: Organization
         """
         try:
-            self.db_client.insert(
-                collection='organizations',
-                data={
-                    'id': str(organization.organization_id),
-                    'name': organization.name,
-                    'owner_id': str(organization.owner_id),
-                    'members': {str(k): v for k, v in organization.members.items()},
+            await self.db_client.query(
+                _CREATE_ORGANIZATION,
+                {
+                    'organization': organization.to_row(),
+                    'identifier': str(organization.organization_id),
+                    'members': [
+                        Membership(organization.organization_id, UserID.from_trusted(user_id), role).to_row()
+                        for user_id, role in organization.members.items()
+                    ],
                 },
             )
+            organization.mark_persisted()
             print(f"Organization {organization.name} saved successfully.")
         except Exception as e:
             print(f"Failed to save organization: {str(e)}")
             raise Exception(f"Database error: Could not save organization {organization.name}.") from e
 
-    def update(self, organization: Organization) -> None:
+    async def update(self, organization: Organization) -> None:
         """
         Update an existing organization entity in the database.
 
-        :param organization: The organization entity to update.
+        Only the membership rows that changed are written, so adding one member to a large organization
+        does not rewrite its other members.
+
+        :param organization: The organization entity to update; its ``version`` is incremented on success.
         :type organization: Organization
+        :raises KeyError: If the organization does not exist.
+        :raises ConcurrentUpdateError: If the organization was updated since it was read.
         """
+        changes = organization.member_changes
         try:
-            existing_org = self.get_by_id(organization.organization_id)
-            if not existing_org:
-                raise KeyError(f"Organization with ID {organization.organization_id} not found for update.")
-
-            self.db_client.update(
-                collection='organizations',
-                identifier=str(organization.organization_id),
-                data={
-                    'name': organization.name,
-                    'owner_id': str(organization.owner_id),
-                    'members': {str(k): v for k, v in organization.members.items()},
+            updated = await self.db_client.query(
+                _UPDATE_ORGANIZATION,
+                {
+                    'identifier': str(organization.organization_id),
+                    'key': record_key('organizations', organization.organization_id),
+                    'version': organization.version,
+                    'data': {
+                        'name': organization.name,
+                        'owner_id': str(organization.owner_id),
+                        'version': organization.version + 1,
+                    },
+                    'upserts': [
+                        Membership(organization.organization_id, UserID.from_trusted(user_id), role).to_row()
+                        for user_id, role in changes.items() if role is not None
+                    ],
+                    'removals': [user_id for user_id, role in changes.items() if role is None],
                 },
             )
+            if not updated:
+                exists = await self.db_client.query(
+                    "SELECT id FROM type::thing('organizations', $id)",
+                    {'id': record_key('organizations', organization.organization_id)},
+                )
+                if exists:
+                    raise ConcurrentUpdateError(
+                        f"Organization with ID {organization.organization_id} was modified since version {organization.version}.",
+                    )
+                raise KeyError(f"Organization with ID {organization.organization_id} not found for update.")
+            organization.version += 1
+            organization.mark_persisted()
             print(f"Organization {organization.name} updated successfully.")
-        except KeyError as e:
+        except (KeyError, ConcurrentUpdateError) as e:
             print(f"Error: {str(e)}")
             raise e
         except Exception as e:
             print(f"Failed to update organization: {str(e)}")
             raise Exception(f"Database error: Could not update organization with ID {organization.organization_id}.") from e
 
-    def delete(self, organization_id: OrganizationID) -> None:
+    async def delete(self, organization_id: OrganizationID) -> None:
         """
-        Delete an organization by its unique identifier.
+        Delete an organization and its memberships by its unique identifier.
 
         :param organization_id: The unique ID of the organization to delete.
         :type organization_id: OrganizationID
         """
         try:
-            existing_org = self.get_by_id(organization_id)
-            if not existing_org:
-                raise KeyError(f"Organization with ID {organization_id} not found for deletion.")
-
-            self.db_client.delete(
-                collection='organizations',
-                identifier=str(organization_id),
+            deleted = await self.db_client.query(
+                _DELETE_ORGANIZATION,
+                {'identifier': str(organization_id), 'key': record_key('organizations', organization_id)},
             )
+            if not deleted:
+                raise KeyError(f"Organization with ID {organization_id} not found for deletion.")
             print(f"Organization with ID {organization_id} deleted successfully.")
         except KeyError as e:
             print(f"Error: {str(e)}")
@@ -121,3 +272,90 @@ class SubrrrealDBOrganizationRepository(OrganizationRepository):
         except Exception as e:
             print(f"Failed to delete organization: {str(e)}")
             raise Exception(f"Database error: Could not delete organization with ID {organization_id}.") from e
+
+    async def list_members(
+        self, organization_id: OrganizationID, cursor: UserID | None = None, limit: int = 100,
+    ) -> list[Membership]:
+        """
+        Retrieve one page of the members of an organization, ordered by user ID.
+
+        :param organization_id: The unique ID of the organization.
+        :type organization_id: OrganizationID
+        :param cursor: User ID of the last member of the previous page, or None for the first page.
+        :type cursor: Optional[UserID]
+        :param limit: Maximum number of members returned.
+        :type limit: int
+        :return: The memberships following ``cursor``.
+        :rtype: List[Membership]
+        """
+        parameters = {'organization_id': str(organization_id), 'limit': limit}
+        query = 'SELECT organization_id, user_id, role FROM memberships WHERE organization_id = $organization_id'
+        if cursor is not None:
+            query += ' AND user_id > $after'
+            parameters['after'] = str(cursor)
+        try:
+            rows = await self.db_client.query(query + ' ORDER BY user_id LIMIT $limit', parameters)
+            return [Membership.from_row(row) for row in rows]
+        except Exception as e:
+            print(f"Failed to list members: {str(e)}")
+            raise Exception(f"Database error: Could not list members of organization with ID {organization_id}.") from e
+
+    async def list_organizations_for_user(self, user_id: UserID) -> list[Membership]:
+        """
+        Retrieve the memberships of a user across all organizations.
+
+        Served from the ``user_id`` index, so the cost depends on the number of organizations the user
+        belongs to rather than on the number of organizations stored.
+
+        :param user_id: The unique ID of the user.
+        :type user_id: UserID
+        :return: The user's memberships, one per organization.
+        :rtype: List[Membership]
+        """
+        try:
+            rows = await self.db_client.query(
+                'SELECT organization_id, user_id, role FROM memberships WHERE user_id = $user_id', {'user_id': str(user_id)},
+            )
+            return [Membership.from_row(row) for row in rows]
+        except Exception as e:
+            print(f"Failed to list organizations of user: {str(e)}")
+            raise Exception(f"Database error: Could not list organizations of user with ID {user_id}.") from e
+
+    async def iter_all(self, page_size: int = 500, after: OrganizationID | None = None) -> AsyncIterator[Organization]:
+        """
+        Iterate over all organizations in the database, fetching them page by page.
+
+        :param page_size: Number of organizations fetched per round trip.
+        :type page_size: int
+        :param after: ID to start after, or None to start from the first organization.
+        :type after: Optional[OrganizationID]
+        :return: An async iterator over the organizations, in ID order.
+        :rtype: AsyncIterator[Organization]
+        """
+        try:
+            async for page in self.db_client.cursor(
+                'organizations', page_size=page_size, after=str(after) if after is not None else None,
+            ):
+                for organization in await self._with_members(page):
+                    yield organization
+        except Exception as e:
+            print(f"Failed to iterate organizations: {str(e)}")
+            raise Exception('Database error: Could not list organizations.') from e
+
+    async def list_page(self, limit: int, after: OrganizationID | None = None) -> list[Organization]:
+        """
+        Retrieve one page of organizations, ordered by ID.
+
+        :param limit: Maximum number of organizations returned.
+        :type limit: int
+        :param after: ID of the last organization of the previous page, or None for the first page.
+        :type after: Optional[OrganizationID]
+        :return: The organizations following ``after``.
+        :rtype: List[Organization]
+        """
+        try:
+            rows = await self.db_client.fetch_page('organizations', limit, after=str(after) if after is not None else None)
+            return await self._with_members(rows)
+        except Exception as e:
+            print(f"Failed to list organizations: {str(e)}")
+            raise Exception('Database error: Could not list organizations.') from e
@@ -14,17 +14,17 @@ class ProjectConfigRepository(ABC):
     """
 
     @abstractmethod
-    def get_by_project_id(self, project_id: ProjectID) -> ProjectConfig:
+    async def get_by_project_id(self, project_id: ProjectID) -> ProjectConfig:
         pass
 
     @abstractmethod
-    def save(self, project_config: ProjectConfig) -> None:
+    async def save(self, project_config: ProjectConfig) -> None:
         pass
 
     @abstractmethod
-    def update(self, project_config: ProjectConfig) -> None:
+    async def update(self, project_config: ProjectConfig) -> None:
         pass
 
     @abstractmethod
-    def delete(self, project_id: ProjectID) -> None:
+    async def delete(self, project_id: ProjectID) -> None:
         pass
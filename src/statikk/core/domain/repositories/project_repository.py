@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from typing import List
 
 from statikk.core.domain.entities.project import Project
@@ -14,7 +15,7 @@ class ProjectRepository(ABC):
     """
 
     @abstractmethod
-    def get_by_id(self, project_id: ProjectID) -> Project:
+    async def get_by_id(self, project_id: ProjectID) -> Project:
         """
         Retrieve a project by its unique identifier.
 
@@ -27,7 +28,7 @@ class ProjectRepository(ABC):
         pass
 
     @abstractmethod
-    def save(self, project: Project) -> None:
+    async def save(self, project: Project) -> None:
         """
         Save a project entity to the repository.
 
@@ -37,7 +38,7 @@ class ProjectRepository(ABC):
         pass
 
     @abstractmethod
-    def update(self, project: Project) -> None:
+    async def update(self, project: Project) -> None:
         """
         Update an existing project entity in the repository.
 
@@ -47,7 +48,7 @@ class ProjectRepository(ABC):
         pass
 
     @abstractmethod
-    def delete(self, project_id: ProjectID) -> None:
+    async def delete(self, project_id: ProjectID) -> None:
         """
         Delete a project by its unique identifier.
 
@@ -57,7 +58,7 @@ class ProjectRepository(ABC):
         pass
 
     @abstractmethod
-    def list_all(self) -> list[Project]:
+    async def list_all(self) -> list[Project]:
         """
         Retrieve a list of all projects.
 
@@ -65,3 +66,31 @@ class ProjectRepository(ABC):
         :rtype: List[Project]
         """
         pass
+
+    @abstractmethod
+    def iter_all(self, page_size: int = 500, after: ProjectID | None = None) -> AsyncIterator[Project]:
+        """
+        Iterate over all projects without loading them all into memory.
+
+        :param page_size: Number of projects fetched per round trip.
+        :type page_size: int
+        :param after: ID to start after, or None to start from the first project.
+        :type after: Optional[ProjectID]
+        :return: An async iterator over all projects.
+        :rtype: AsyncIterator[Project]
+        """
+        pass
+
+    @abstractmethod
+    async def list_page(self, limit: int, after: ProjectID | None = None) -> list[Project]:
+        """
+        Retrieve one page of projects, ordered by ID.
+
+        :param limit: Maximum number of projects returned.
+        :type limit: int
+        :param after: ID of the last project of the previous page, or None for the first page.
+        :type after: Optional[ProjectID]
+        :return: The projects following ``after``.
+        :rtype: List[Project]
+        """
+        pass
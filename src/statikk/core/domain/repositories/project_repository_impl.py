@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+
 from statikk.core.domain.entities.project import Project
 from statikk.core.domain.repositories.project_repository import ProjectRepository
 from statikk.core.domain.value_objects.project_id import ProjectID
+from statikk.infrastructure.databases.subrreal_db_client import record_key
 from statikk.infrastructure.databases.subrreal_db_client import SubrrealDBClient
 
 
@@ -17,7 +20,7 @@ class SubrrrealDBProjectRepository(ProjectRepository):
     def __init__(self, db_client: SubrrealDBClient):
         self.db_client = db_client
 
-    def get_by_id(self, project_id: ProjectID) -> Project:
+    async def get_by_id(self, project_id: ProjectID) -> Project:
         """
         Retrieve a project by its unique identifier.
 
@@ -29,15 +32,12 @@ class SubrrrealDBProjectRepository(ProjectRepository):
         :raises Exception: If a database error occurs.
         """
         try:
-            query = f"SELECT * FROM projects WHERE id = '{project_id}'"
-            result = self.db_client.query(query)
-            if not result:
-                raise KeyError(f"Project with ID {project_id} not found.")
-            return Project(
-                project_id=ProjectID(result['id']),
-                name=result['name'],
-                description=result['description'],
+            rows = await self.db_client.query(
+                "SELECT * FROM type::thing('projects', $id)", {'id': record_key('projects', project_id)},
             )
+            if not rows:
+                raise KeyError(f"Project with ID {project_id} not found.")
+            return Project.from_row(rows[0])
         except KeyError as e:
             # Specific handling if the project is not found
             print(f"Error: {str(e)}")
@@ -47,7 +47,7 @@ class SubrrrealDBProjectRepository(ProjectRepository):
             print(f"Failed to retrieve project: {str(e)}")
             raise Exception(f"Database error: Could not retrieve project with ID {project_id}.") from e
 
-    def save(self, project: Project) -> None:
+    async def save(self, project: Project) -> None:
         """
         Save a project entity to the database.
 
@@ -56,20 +56,16 @@ class SubrrrealDBProjectRepository(ProjectRepository):
         :raises Exception: If a database error occurs.
         """
         try:
-            self.db_client.insert(
+            await self.db_client.insert(
                 collection='projects',
-                data={
-                    'id': str(project.project_id),
-                    'name': project.name,
-                    'description': project.description,
-                },
+                data=project.to_row(),
             )
             print(f"Project {project.name} saved successfully.")
         except Exception as e:
             print(f"Failed to save project: {str(e)}")
             raise Exception(f"Database error: Could not save project {project.name}.") from e
 
-    def update(self, project: Project) -> None:
+    async def update(self, project: Project) -> None:
         """
         Update an existing project entity in the database.
 
@@ -79,12 +75,8 @@ class SubrrrealDBProjectRepository(ProjectRepository):
         :raises Exception: If a database error occurs.
         """
         try:
-            # Check if the project exists before updating
-            existing_project = self.get_by_id(project.project_id)
-            if not existing_project:
-                raise KeyError(f"Project with ID {project.project_id} not found for update.")
-
-            self.db_client.update(
+            # The update reports the rows it matched, so a missing project needs no separate read
+            updated = await self.db_client.update(
                 collection='projects',
                 identifier=str(project.project_id),
                 data={
@@ -92,6 +84,8 @@ class SubrrrealDBProjectRepository(ProjectRepository):
                     'description': project.description,
                 },
             )
+            if not updated:
+                raise KeyError(f"Project with ID {project.project_id} not found for update.")
             print(f"Project {project.name} updated successfully.")
         except KeyError as e:
             # Specific handling if the project to update is not found
@@ -102,7 +96,7 @@ class SubrrrealDBProjectRepository(ProjectRepository):
             print(f"Failed to update project: {str(e)}")
             raise Exception(f"Database error: Could not update project with ID {project.project_id}.") from e
 
-    def delete(self, project_id: ProjectID) -> None:
+    async def delete(self, project_id: ProjectID) -> None:
         """
         Delete a project by its unique identifier.
 
@@ -112,15 +106,13 @@ class SubrrrealDBProjectRepository(ProjectRepository):
         :raises Exception: If a database error occurs.
         """
         try:
-            # Check if the project exists before deleting
-            existing_project = self.get_by_id(project_id)
-            if not existing_project:
-                raise KeyError(f"Project with ID {project_id} not found for deletion.")
-
-            self.db_client.delete(
+            # The delete reports the rows it matched, so a missing project needs no separate read
+            deleted = await self.db_client.delete(
                 collection='projects',
                 identifier=str(project_id),
             )
+            if not deleted:
+                raise KeyError(f"Project with ID {project_id} not found for deletion.")
             print(f"Project with ID {project_id} deleted successfully.")
         except KeyError as e:
             # Specific handling if the project to delete is not found
@@ -130,3 +122,51 @@ class SubrrrealDBProjectRepository(ProjectRepository):
             # General error handling for database errors
             print(f"Failed to delete project: {str(e)}")
             raise Exception(f"Database error: Could not delete project with ID {project_id}.") from e
+
+    async def iter_all(self, page_size: int = 500, after: ProjectID | None = None) -> AsyncIterator[Project]:
+        """
+        Iterate over all projects in the database, fetching them page by page.
+
+        :param page_size: Number of projects fetched per round trip.
+        :type page_size: int
+        :param after: ID to start after, or None to start from the first project.
+        :type after: Optional[ProjectID]
+        :return: An async iterator over the projects, in ID order.
+        :rtype: AsyncIterator[Project]
+        """
+        try:
+            async for page in self.db_client.cursor(
+                'projects', page_size=page_size, after=str(after) if after is not None else None,
+            ):
+                for row in page:
+                    yield Project.from_row(row)
+        except Exception as e:
+            print(f"Failed to iterate projects: {str(e)}")
+            raise Exception('Database error: Could not list projects.') from e
+
+    async def list_all(self) -> list[Project]:
+        """
+        List all projects in the database.
+
+        :return: A list of all projects.
+        :rtype: List[Project]
+        """
+        return [project async for project in self.iter_all()]
+
+    async def list_page(self, limit: int, after: ProjectID | None = None) -> list[Project]:
+        """
+        Retrieve one page of projects, ordered by ID.
+
+        :param limit: Maximum number of projects returned.
+        :type limit: int
+        :param after: ID of the last project of the previous page, or None for the first page.
+        :type after: Optional[ProjectID]
+        :return: The projects following ``after``.
+        :rtype: List[Project]
+        """
+        try:
+            rows = await self.db_client.fetch_page('projects', limit, after=str(after) if after is not None else None)
+            return [Project.from_row(row) for row in rows]
+        except Exception as e:
+            print(f"Failed to list projects: {str(e)}")
+            raise Exception('Database error: Could not list projects.') from e
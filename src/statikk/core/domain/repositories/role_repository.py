@@ -13,17 +13,17 @@ class RoleRepository(ABC):
     """
 
     @abstractmethod
-    def get_by_id(self, role_id: RoleID) -> Role:
+    async def get_by_id(self, role_id: RoleID) -> Role:
         pass
 
     @abstractmethod
-    def save(self, role: Role) -> None:
+    async def save(self, role: Role) -> None:
         pass
 
     @abstractmethod
-    def update(self, role: Role) -> None:
+    async def update(self, role: Role) -> None:
         pass
 
     @abstractmethod
-    def delete(self, role_id: RoleID) -> None:
+    async def delete(self, role_id: RoleID) -> None:
         pass
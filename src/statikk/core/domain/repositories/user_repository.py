@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Iterable
 
 from statikk.core.domain.entities.user import User
+from statikk.infrastructure.databases.bulk_write import BulkWriteResult
 
 
 class UserRepository(ABC):
@@ -14,21 +16,37 @@ class UserRepository(ABC):
     """
 
     @abstractmethod
-    def get_by_id(self, user_id: str) -> User:
+    async def get_by_id(self, user_id: str) -> User:
         """
         Retrieve a user by their unique identifier.
         """
         pass
 
     @abstractmethod
-    def save(self, user: User) -> None:
+    async def save(self, user: User) -> None:
         """
         Save a user entity to the repository.
         """
         pass
 
     @abstractmethod
-    def delete(self, user: User) -> None:
+    async def save_many(self, users: Iterable[User], chunk_size: int = 500, upsert: bool = False) -> BulkWriteResult:
+        """
+        Save many user entities to the repository in chunks.
+
+        :param users: The user entities to save.
+        :type users: Iterable[User]
+        :param chunk_size: Number of users written per round trip.
+        :type chunk_size: int
+        :param upsert: Overwrite users that already exist.
+        :type upsert: bool
+        :return: The number of users written and the chunks that failed.
+        :rtype: BulkWriteResult
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, user: User) -> None:
         """
         Delete a user entity from the repository.
 
@@ -1,9 +1,13 @@
 # infrastructure/database/user_repository_impl.py
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from statikk.core.domain.entities.user import User
 from statikk.core.domain.repositories.user_repository import UserRepository
 from statikk.core.domain.value_objects.user_id import UserID
+from statikk.infrastructure.databases.bulk_write import BulkWriteResult
+from statikk.infrastructure.databases.subrreal_db_client import record_key
 from statikk.infrastructure.databases.subrreal_db_client import SubrrealDBClient
 
 
@@ -18,7 +22,7 @@ class SubrrealDBUserRepository(UserRepository):
     def __init__(self, db_client: SubrrealDBClient):
         self.db_client = db_client
 
-    def get_by_id(self, user_id: UserID) -> User:
+    async def get_by_id(self, user_id: UserID) -> User:
         """
         Retrieve a user by their unique identifier.
 
@@ -29,19 +33,16 @@ class SubrrealDBUserRepository(UserRepository):
         :raises KeyError: If the user does not exist.
         """
         try:
-            query = f"SELECT * FROM users WHERE id = '{user_id}'"
-            result = self.db_client.query(query)
-            if not result:
-                raise KeyError(f"User with ID {user_id} not found.")
-            return User(
-                user_id=UserID(result['id']),
-                username=result['username'],
-                email=result['email'],
+            rows = await self.db_client.query(
+                "SELECT * FROM type::thing('users', $id)", {'id': record_key('users', user_id)},
             )
+            if not rows:
+                raise KeyError(f"User with ID {user_id} not found.")
+            return User.from_row(rows[0])
         except Exception as e:
             raise KeyError(f"Failed to retrieve user: {str(e)}")
 
-    def save(self, user: User) -> None:
+    async def save(self, user: User) -> None:
         """
         Save a user entity to the database.
 
@@ -49,19 +50,40 @@ class SubrrealDBUserRepository(UserRepository):
         :type user: User
         """
         try:
-            self.db_client.insert(
+            await self.db_client.insert(
                 collection='users',
-                data={
-                    'id': str(user.user_id),
-                    'username': user.username,
-                    'email': user.email,
-                },
+                data=user.to_row(),
             )
             print(f"User {user.username} saved successfully.")
         except Exception as e:
             raise Exception(f"Failed to save user: {str(e)}")
 
-    def update(self, user: User) -> None:
+    async def save_many(self, users: Iterable[User], chunk_size: int = 500, upsert: bool = False) -> BulkWriteResult:
+        """
+        Save many user entities to the database, several per statement.
+
+        :param users: The user entities to save; consumed lazily.
+        :type users: Iterable[User]
+        :param chunk_size: Number of users written per statement.
+        :type chunk_size: int
+        :param upsert: Merge into users that already exist instead of failing their chunk.
+        :type upsert: bool
+        :return: The number of users written and the chunks that failed.
+        :rtype: BulkWriteResult
+        """
+        write_many = self.db_client.upsert_many if upsert else self.db_client.insert_many
+        try:
+            result = await write_many(
+                collection='users',
+                rows=(user.to_row() for user in users),
+                chunk_size=chunk_size,
+            )
+            print(f"Saved {result.written} users in {result.chunks} chunks, {result.failed} failed.")
+            return result
+        except Exception as e:
+            raise Exception(f"Failed to save users: {str(e)}")
+
+    async def update(self, user: User) -> None:
         """
         Update an existing user entity in the database.
 
@@ -69,7 +91,7 @@ class SubrrealDBUserRepository(UserRepository):
         :type user: User
         """
         try:
-            self.db_client.update(
+            await self.db_client.update(
                 collection='users',
                 identifier=str(user.user_id),
                 data={
@@ -81,7 +103,7 @@ class SubrrealDBUserRepository(UserRepository):
         except Exception as e:
             raise Exception(f"Failed to update user: {str(e)}")
 
-    def delete(self, user_id: UserID) -> None:
+    async def delete(self, user_id: UserID) -> None:
         """
         Delete a user by their unique identifier.
 
@@ -89,7 +111,7 @@ class SubrrealDBUserRepository(UserRepository):
         :type user_id: UserID
         """
         try:
-            self.db_client.delete(
+            await self.db_client.delete(
                 collection='users',
                 identifier=str(user_id),
             )
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from .cloud_function_id import CloudFunctionID
 from .collection_id import CollectionID
+from .cron_schedule import CronSchedule
+from .identifier import Identifier
 from .organization_id import OrganizationID
 from .project_id import ProjectID
 from .role_id import RoleID
 from .user_id import UserID
 
-__all__ = ['UserID', 'ProjectID', 'CollectionID', 'OrganizationID', 'RoleID', 'CloudFunctionID']
+__all__ = ['Identifier', 'UserID', 'ProjectID', 'CollectionID', 'OrganizationID', 'RoleID', 'CloudFunctionID', 'CronSchedule']
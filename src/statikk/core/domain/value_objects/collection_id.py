@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import uuid
+from statikk.core.domain.value_objects.identifier import Identifier
 
 
-class CollectionID:
+class CollectionID(Identifier):
     """
     Represents a unique identifier for a Collection.
 
@@ -11,11 +11,4 @@ class CollectionID:
     :type id: str, optional
     """
 
-    def __init__(self, id: str | None = None):
-        self.id = id or str(uuid.uuid4())
-
-    def __eq__(self, other):
-        return isinstance(other, CollectionID) and self.id == other.id
-
-    def __str__(self):
-        return self.id
+    __slots__ = ()
@@ -9,11 +9,31 @@ class ConfigKey:
     :type key: str
     """
 
+    __slots__ = ('key',)
+
     def __init__(self, key: str):
-        self.key = key
+        object.__setattr__(self, 'key', key)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('ConfigKey is immutable.')
+
+    def __delattr__(self, name):
+        raise AttributeError('ConfigKey is immutable.')
 
     def __eq__(self, other):
         return isinstance(other, ConfigKey) and self.key == other.key
 
+    def __hash__(self):
+        return hash(self.key)
+
+    def __reduce__(self):
+        return ConfigKey, (self.key,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __str__(self):
         return self.key
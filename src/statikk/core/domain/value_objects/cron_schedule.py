@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+_MACROS = {
+    '@yearly': '0 0 1 1 *',
+    '@annually': '0 0 1 1 *',
+    '@monthly': '0 0 1 * *',
+    '@weekly': '0 0 * * 0',
+    '@daily': '0 0 * * *',
+    '@midnight': '0 0 * * *',
+    '@hourly': '0 * * * *',
+}
+
+_MONTH_NAMES = {
+    name: number for number, name in enumerate(
+        ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), start=1,
+    )
+}
+_DAY_NAMES = {name: number for number, name in enumerate(('sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat'))}
+
+# Searching further ahead than this means the expression can never fire, e.g. ``0 0 30 2 *``.
+_MAX_SEARCH = timedelta(days=366 * 5)
+
+
+def _parse_field(field: str, low: int, high: int, names: dict[str, int] | None = None) -> frozenset[int]:
+    values: set[int] = set()
+    for part in field.lower().split(','):
+        part, _, step_text = part.partition('/')
+        step = int(step_text) if step_text else 1
+        if part == '*':
+            start, end = low, high
+        else:
+            start_text, _, end_text = part.partition('-')
+            start = names[start_text] if names and start_text in names else int(start_text)
+            if end_text:
+                end = names[end_text] if names and end_text in names else int(end_text)
+            else:
+                # ``a/n`` runs from ``a`` to the end of the range.
+                end = high if step_text else start
+        if step < 1 or not low <= start <= end <= high:
+            raise ValueError(f"Invalid cron field '{field}'.")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    """
+    A cron expression: ``minute hour day-of-month month day-of-week``, evaluated in UTC.
+
+    Each field accepts ``*``, values, ranges ``a-b``, steps ``*/n``, ``a-b/n`` and ``a/n``, and comma-separated
+    lists of these. Months and days of the week also accept three-letter names, and Sunday is 0 or 7. The
+    macros ``@yearly``, ``@monthly``, ``@weekly``, ``@daily`` and ``@hourly`` are supported too. As in cron,
+    when both the day of the month and the day of the week are restricted, a day matching either fires.
+
+    :param expression: The cron expression, e.g. ``*/5 * * * *``.
+    :type expression: str
+    :raises ValueError: If the expression is not a valid cron expression.
+    """
+
+    __slots__ = (
+        'expression', 'minutes', 'hours', 'days', 'months', 'weekdays',
+        '_any_day', '_any_weekday', '_sorted_minutes', '_sorted_hours',
+    )
+
+    def __init__(self, expression: str):
+        expression = ' '.join(expression.split())
+        fields = _MACROS.get(expression.lower(), expression).split(' ')
+        if len(fields) != 5:
+            raise ValueError(f"Invalid cron expression '{expression}': expected 5 fields.")
+        try:
+            weekdays = _parse_field(fields[4], 0, 7, _DAY_NAMES)
+            values = {
+                'expression': expression,
+                'minutes': _parse_field(fields[0], 0, 59),
+                'hours': _parse_field(fields[1], 0, 23),
+                'days': _parse_field(fields[2], 1, 31),
+                'months': _parse_field(fields[3], 1, 12, _MONTH_NAMES),
+                'weekdays': frozenset(day % 7 for day in weekdays),
+                '_any_day': fields[2].startswith('*'),
+                '_any_weekday': fields[4].startswith('*'),
+            }
+            values['_sorted_minutes'] = tuple(sorted(values['minutes']))
+            values['_sorted_hours'] = tuple(sorted(values['hours']))
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid cron expression '{expression}'.")
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('CronSchedule is immutable.')
+
+    def __delattr__(self, name):
+        raise AttributeError('CronSchedule is immutable.')
+
+    def __eq__(self, other):
+        return isinstance(other, CronSchedule) and self.expression == other.expression
+
+    def __hash__(self):
+        return hash(self.expression)
+
+    def __reduce__(self):
+        return CronSchedule, (self.expression,)
+
+    def __str__(self):
+        return self.expression
+
+    def __repr__(self):
+        return f"CronSchedule('{self.expression}')"
+
+    def _matches_day(self, moment: datetime) -> bool:
+        in_month = moment.day in self.days
+        # isoweekday() is 1 (Monday) to 7 (Sunday); cron counts Sunday as 0.
+        in_week = moment.isoweekday() % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return in_month and in_week
+        return in_month or in_week
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Return the first time the schedule fires strictly after a moment.
+
+        :param moment: The moment to search from; naive datetimes are taken as UTC.
+        :type moment: datetime
+        :return: The next firing time, in UTC, on a whole minute.
+        :rtype: datetime
+        :raises ValueError: If the schedule never fires, e.g. on February 30th.
+        """
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        moment = moment.astimezone(timezone.utc)
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + _MAX_SEARCH
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0)
+            elif not self._matches_day(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                index = bisect_right(self._sorted_hours, candidate.hour)
+                if index < len(self._sorted_hours):
+                    candidate = candidate.replace(hour=self._sorted_hours[index], minute=0)
+                else:
+                    candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.minute not in self.minutes:
+                index = bisect_right(self._sorted_minutes, candidate.minute)
+                if index < len(self._sorted_minutes):
+                    candidate = candidate.replace(minute=self._sorted_minutes[index])
+                else:
+                    candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression '{self.expression}' never fires.")
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+import weakref
+
+_uuid7_lock = threading.Lock()
+_uuid7_last = (0, 0)
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits hold the Unix time in milliseconds and the 12 bits after the version hold a counter,
+    randomly seeded each millisecond, so IDs generated by this process sort in generation order even
+    within the same millisecond. The remaining 62 bits are random.
+
+    :return: The new UUID.
+    :rtype: uuid.UUID
+    """
+    global _uuid7_last
+    with _uuid7_lock:
+        timestamp = time.time_ns() // 1_000_000
+        last_timestamp, counter = _uuid7_last
+        if timestamp > last_timestamp:
+            counter = int.from_bytes(os.urandom(2), 'big') & 0x7FF
+        else:
+            # Same millisecond, or the clock went back: keep counting from the last ID.
+            timestamp = last_timestamp
+            counter += 1
+            if counter > 0xFFF:
+                timestamp += 1
+                counter = 0
+        _uuid7_last = (timestamp, counter)
+    rand_b = int.from_bytes(os.urandom(8), 'big') & 0x3FFF_FFFF_FFFF_FFFF
+    return uuid.UUID(int=timestamp << 80 | 0x7 << 76 | counter << 64 | 0b10 << 62 | rand_b)
+
+
+class Identifier:
+    """
+    Base class of the ID value objects: an immutable, hashable wrapper around an ID string.
+
+    Instances are compared and hashed by their ``id`` and cannot be changed once built, so they can be
+    used as dict keys and shared freely, including between the copies the caches and the unit of work
+    make of entities.
+
+    New IDs are time-ordered UUIDv7 by default, so rows inserted together sit together in the ``id`` index
+    and ordering by ``id`` follows creation time. Set ``UUID_VERSION`` to 4, on this class or a subclass,
+    to generate random UUIDv4 instead. Existing IDs of either version are accepted as they are.
+
+    :param id: The unique ID string. If not provided, a new UUID is generated.
+    :type id: str, optional
+    """
+
+    __slots__ = ('id', '__weakref__')
+
+    # Version of the UUIDs generated for new IDs: 7 (time-ordered) or 4 (random).
+    UUID_VERSION = 7
+
+    # Each subclass's interned IDs, held weakly: an ID nothing else refers to any more drops out.
+    _interned: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._interned = weakref.WeakValueDictionary()
+
+    def __init__(self, id: str | None = None):
+        object.__setattr__(self, 'id', id or self._generate())
+
+    @classmethod
+    def _generate(cls) -> str:
+        return str(uuid7() if cls.UUID_VERSION == 7 else uuid.uuid4())
+
+    @classmethod
+    def from_trusted(cls, id: str):
+        """
+        Build an ID from a value known to be valid, e.g. one read back from the database, skipping validation.
+
+        :param id: The unique ID string.
+        :type id: str
+        :return: The ID value object.
+        """
+        instance = object.__new__(cls)
+        object.__setattr__(instance, 'id', id)
+        return instance
+
+    @classmethod
+    def intern(cls, id: str):
+        """
+        Return the shared instance for an ID string, building it on first use.
+
+        Meant for hot IDs seen over and over, such as the owners and members of organizations being listed:
+        every lookup returns the same object instead of a new one, for as long as something still refers
+        to it. The ID must be trusted, as with ``from_trusted``.
+
+        :param id: The unique ID string.
+        :type id: str
+        :return: The shared ID value object.
+        """
+        instance = cls._interned.get(id)
+        if instance is None:
+            instance = cls.from_trusted(id)
+            cls._interned[id] = instance
+        return instance
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __eq__(self, other):
+        return isinstance(other, type(self)) and self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __str__(self):
+        return self.id
+
+    def __repr__(self):
+        return f"{type(self).__name__}(id='{self.id}')"
+
+    def __reduce__(self):
+        return type(self).from_trusted, (self.id,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
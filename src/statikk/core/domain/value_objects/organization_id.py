@@ -1,21 +1,14 @@
 from __future__ import annotations
 
-import uuid
+from statikk.core.domain.value_objects.identifier import Identifier
 
 
-class OrganizationID:
+class OrganizationID(Identifier):
     """
-    Represents a unique identifier for an Organization.
+    Represents a unique identifier for a Organization.
 
     :param id: The unique ID string. If not provided, a new UUID is generated.
     :type id: str, optional
     """
 
-    def __init__(self, id: str | None = None):
-        self.id = id or str(uuid.uuid4())
-
-    def __eq__(self, other):
-        return isinstance(other, OrganizationID) and self.id == other.id
-
-    def __str__(self):
-        return self.id
+    __slots__ = ()
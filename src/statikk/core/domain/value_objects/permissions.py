@@ -1,5 +1,77 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
+
+class PermissionRegistry:
+    """
+    Interns permission names into bit positions, so a set of permissions can be held as an int bitmask
+    and checked with a single AND.
+
+    Bits are assigned on first registration and never reused, so masks stay valid for the lifetime of
+    the process. Masks are not meant to be persisted: the bit of a name depends on registration order.
+    """
+
+    def __init__(self):
+        self._bits: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._bits)
+
+    def register(self, name: str) -> int:
+        """
+        Return the bit of a permission name, assigning the next free one if the name is new.
+
+        :param name: The name of the permission.
+        :type name: str
+        :return: An int with only the permission's bit set.
+        :rtype: int
+        """
+        bit = self._bits.get(name)
+        if bit is None:
+            bit = self._bits.setdefault(name, 1 << len(self._bits))
+        return bit
+
+    def bit(self, name: str) -> int:
+        """
+        Return the bit of a permission name without registering it.
+
+        :param name: The name of the permission.
+        :type name: str
+        :return: The permission's bit, or 0 if no role was ever granted it.
+        :rtype: int
+        """
+        return self._bits.get(name, 0)
+
+    def mask(self, permissions: Iterable[Permission]) -> int:
+        """
+        Compile permissions into a bitmask, registering any new names.
+
+        :param permissions: The permissions to compile.
+        :type permissions: Iterable[Permission]
+        :return: The union of the permissions' bits.
+        :rtype: int
+        """
+        mask = 0
+        for permission in permissions:
+            mask |= self.register(permission.name)
+        return mask
+
+    def names(self, mask: int) -> list[str]:
+        """
+        Decode a bitmask back into the names of its permissions.
+
+        :param mask: The bitmask to decode.
+        :type mask: int
+        :return: The names whose bit is set in the mask, in registration order.
+        :rtype: List[str]
+        """
+        return [name for name, bit in self._bits.items() if mask & bit]
+
+
+# Process-wide registry used by roles and permission checks.
+permission_registry = PermissionRegistry()
+
 
 class Permission:
     """
@@ -9,11 +81,38 @@ class Permission:
     :type name: str
     """
 
+    __slots__ = ('name',)
+
     def __init__(self, name: str):
-        self.name = name
+        object.__setattr__(self, 'name', name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Permission is immutable.')
+
+    def __delattr__(self, name):
+        raise AttributeError('Permission is immutable.')
 
     def __eq__(self, other):
         return isinstance(other, Permission) and self.name == other.name
 
+    def __hash__(self):
+        return hash(self.name)
+
     def __str__(self):
         return self.name
+
+    def __reduce__(self):
+        return Permission, (self.name,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @property
+    def bit(self) -> int:
+        """
+        The bit of this permission in the process-wide registry, or 0 if no role was ever granted it.
+        """
+        return permission_registry.bit(self.name)
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from uuid import uuid4
+from statikk.core.domain.value_objects.identifier import Identifier
 
 
-class UserID:
+class UserID(Identifier):
     """
     Represents a unique identifier for a User.
 
@@ -11,8 +11,4 @@ class UserID:
     :type id: Optional[str]
     """
 
-    def __init__(self, id: str | None = None):
-        self.id = id or str(uuid4())
-
-    def __str__(self):
-        return self.id
+    __slots__ = ()
@@ -0,0 +1,148 @@
+# infrastructure/caching/caching_repository.py
+from __future__ import annotations
+
+import asyncio
+import copy
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Any
+
+from statikk.core.domain.entities.entity import Entity
+from statikk.infrastructure.caching.entity_cache import EntityCache
+
+
+def _copy(entity: Any) -> Any:
+    return entity.copy() if isinstance(entity, Entity) else copy.deepcopy(entity)
+
+
+class CachingRepository:
+    """
+    Read-through, write-through cache in front of a repository.
+
+    Wraps any of the ``*Repository`` implementations and exposes the same methods. Lookups by ID
+    (``get_by_id``, or the method named by ``lookup``) are served from an ``EntityCache``; concurrent
+    misses for the same ID share one database read. ``save`` and ``update`` refresh the cached entity once
+    the write succeeds and ``delete``/``save_many`` invalidate it; writing an entity loaded only in part,
+    whose ``partial`` is true, invalidates it too. Every other method is passed through uncached.
+
+    Entities are mutable, so the cache hands out and stores copies: a caller changing an entity it read
+    never changes what other callers see. Entities are copied with ``Entity.copy``, which shares their
+    attribute values since entities are copy-on-write, so a read costs the same for an organization of a
+    thousand members as for one of ten. Other objects are deep-copied.
+
+    :param repository: The repository to wrap.
+    :type repository: Any
+    :param id_attribute: Name of the entity attribute holding its ID, e.g. ``organization_id``.
+    :type id_attribute: str
+    :param ttl: Seconds an entity stays cached; choose it per entity type.
+    :type ttl: float
+    :param max_size: Maximum number of entities cached.
+    :type max_size: int
+    :param lookup: Name of the repository method reading one entity by ID.
+    :type lookup: str
+    """
+
+    def __init__(
+        self, repository: Any, id_attribute: str, ttl: float = 30.0, max_size: int = 1024, lookup: str = 'get_by_id',
+    ):
+        self.repository = repository
+        self.id_attribute = id_attribute
+        self.lookup = lookup
+        self.cache = EntityCache(ttl=ttl, max_size=max_size)
+        self._loads: dict[str, asyncio.Future] = {}
+        # Bumped on every write so a read that raced with it does not cache what it read.
+        self._generation = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names not found on the wrapper itself; guard against lookups before __init__ ran.
+        if name in ('repository', 'lookup'):
+            raise AttributeError(name)
+        if name == self.lookup:
+            return self._get
+        return getattr(self.repository, name)
+
+    def _key(self, value: Any) -> str:
+        return str(getattr(value, self.id_attribute, value))
+
+    def _invalidate(self, key: str) -> None:
+        self._generation += 1
+        self.cache.invalidate(key)
+        self._loads.pop(key, None)
+
+    async def _get(self, entity_id: Any) -> Any:
+        key = self._key(entity_id)
+        entity = self.cache.get(key)
+        if entity is not None:
+            return _copy(entity)
+        load = self._loads.get(key)
+        if load is None:
+            load = asyncio.ensure_future(self._load(key, entity_id))
+            self._loads[key] = load
+            load.add_done_callback(lambda _: self._loads.pop(key) if self._loads.get(key) is load else None)
+        return _copy(await asyncio.shield(load))
+
+    async def _load(self, key: str, entity_id: Any) -> Any:
+        generation = self._generation
+        entity = await getattr(self.repository, self.lookup)(entity_id)
+        if generation == self._generation:
+            self.cache.put(key, entity)
+        return entity
+
+    async def _write(self, method: str, entity: Any) -> None:
+        key = self._key(entity)
+        self._invalidate(key)
+        await getattr(self.repository, method)(entity)
+        if not getattr(entity, 'partial', False):
+            self.cache.put(key, _copy(entity))
+
+    async def save(self, entity: Any) -> None:
+        """
+        Save an entity and cache it.
+
+        :param entity: The entity to save.
+        :type entity: Any
+        """
+        await self._write('save', entity)
+
+    async def update(self, entity: Any) -> None:
+        """
+        Update an entity and refresh its cached copy.
+
+        :param entity: The entity to update.
+        :type entity: Any
+        """
+        await self._write('update', entity)
+
+    async def delete(self, entity_or_id: Any) -> None:
+        """
+        Delete an entity and drop it from the cache.
+
+        :param entity_or_id: The entity, or its ID, as the wrapped repository expects.
+        :type entity_or_id: Any
+        """
+        key = self._key(entity_or_id)
+        self._invalidate(key)
+        try:
+            await self.repository.delete(entity_or_id)
+        finally:
+            self._invalidate(key)
+
+    async def save_many(self, entities: Iterable[Any], chunk_size: int = 500, upsert: bool = False) -> Any:
+        """
+        Save many entities, dropping each one from the cache as it is written.
+
+        :param entities: The entities to save; consumed lazily.
+        :type entities: Iterable[Any]
+        :param chunk_size: Number of entities written per statement.
+        :type chunk_size: int
+        :param upsert: Merge into entities that already exist instead of failing their chunk.
+        :type upsert: bool
+        :return: The result of the wrapped repository's ``save_many``.
+        :rtype: BulkWriteResult
+        """
+        def invalidated(entities: Iterable[Any]) -> Iterator[Any]:
+            for entity in entities:
+                self._invalidate(self._key(entity))
+                yield entity
+
+        return await self.repository.save_many(invalidated(entities), chunk_size=chunk_size, upsert=upsert)
@@ -0,0 +1,120 @@
+# infrastructure/caching/entity_cache.py
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+
+class EntityCache:
+    """
+    Bounded LRU cache whose entries expire ``ttl`` seconds after they were stored.
+
+    Expired entries are dropped lazily when they are looked up or when they reach the cold end of the LRU.
+
+    :param ttl: Seconds an entry stays valid.
+    :type ttl: float
+    :param max_size: Maximum number of entries kept.
+    :type max_size: int
+    :param clock: Monotonic clock returning seconds.
+    :type clock: Callable[[], float]
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > self.clock()
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Fraction of lookups served from the cache.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: str) -> Any | None:
+        """
+        Return the value cached under a key.
+
+        :param key: The cache key.
+        :type key: str
+        :return: The cached value, or None if it is missing or expired.
+        :rtype: Optional[Any]
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Cache a value, evicting the least recently used entries beyond ``max_size``.
+
+        :param key: The cache key.
+        :type key: str
+        :param value: The value to cache.
+        :type value: Any
+        """
+        self._entries[key] = (self.clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drop the value cached under a key, if any.
+
+        :param key: The cache key.
+        :type key: str
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the counters.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Snapshot of the cache counters, suitable for metrics export.
+
+        :return: Size, hits, misses, evictions, expirations and hit ratio.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_ratio': self.hit_ratio,
+        }
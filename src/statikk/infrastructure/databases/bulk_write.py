@@ -0,0 +1,92 @@
+# infrastructure/databases/bulk_write.py
+from __future__ import annotations
+
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+from typing import Any
+
+
+class ChunkError:
+    """
+    A chunk of a bulk write that the database rejected.
+
+    :param index: Position of the chunk in the write.
+    :type index: int
+    :param offset: Position of the chunk's first row in the input.
+    :type offset: int
+    :param size: Number of rows in the chunk.
+    :type size: int
+    :param error: The error raised while writing the chunk.
+    :type error: Exception
+    """
+
+    def __init__(self, index: int, offset: int, size: int, error: Exception):
+        self.index = index
+        self.offset = offset
+        self.size = size
+        self.error = error
+
+    def __repr__(self):
+        return f"ChunkError(index={self.index}, offset={self.offset}, size={self.size}, error={self.error!r})"
+
+
+class BulkWriteResult:
+    """
+    Outcome of a bulk write.
+
+    Chunks are written independently, so a failed chunk does not stop the rest of the write; the rows it
+    held can be found in the input from each error's ``offset`` and ``size``.
+    """
+
+    def __init__(self):
+        self.chunks = 0
+        self.written = 0
+        self.errors: list[ChunkError] = []
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if every chunk was written.
+        """
+        return not self.errors
+
+    @property
+    def failed(self) -> int:
+        """
+        Number of rows in chunks that failed.
+        """
+        return sum(error.size for error in self.errors)
+
+    def __repr__(self):
+        return f"BulkWriteResult(chunks={self.chunks}, written={self.written}, failed={self.failed})"
+
+
+async def chunked(rows: Iterable[Any] | AsyncIterable[Any], chunk_size: int) -> AsyncIterator[list[Any]]:
+    """
+    Lazily split a sync or async iterable into lists of at most ``chunk_size`` items.
+
+    :param rows: The items to split.
+    :type rows: Union[Iterable[Any], AsyncIterable[Any]]
+    :param chunk_size: Maximum number of items per chunk.
+    :type chunk_size: int
+    :return: An async iterator over the chunks.
+    :rtype: AsyncIterator[List[Any]]
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1.')
+    chunk: list[Any] = []
+    if isinstance(rows, AsyncIterable):
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,206 @@
+# infrastructure/databases/connection_pool.py
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+
+class _IdleConnection:
+    """
+    An idle connection together with the time it was returned to the pool.
+
+    :param connection: The underlying driver connection.
+    :type connection: Any
+    """
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+        self.released_at = time.monotonic()
+
+
+class ConnectionPool:
+    """
+    Bounded asyncio pool of database connections.
+
+    Connections are opened lazily up to ``max_size`` and handed out in LIFO order, so a hot set of
+    connections stays warm while the rest age out and are reaped once they have been idle for longer
+    than ``max_idle_time`` (the pool never shrinks below ``min_size``).
+
+    :param factory: Coroutine function opening a new connection.
+    :type factory: Callable[[], Awaitable[Any]]
+    :param closer: Coroutine function closing a connection.
+    :type closer: Callable[[Any], Awaitable[None]]
+    :param health_check: Coroutine function run on checkout; returns False, or raises, if the connection is unusable.
+    :type health_check: Optional[Callable[[Any], Awaitable[bool]]]
+    :param min_size: Number of connections opened eagerly and kept open.
+    :type min_size: int
+    :param max_size: Maximum number of connections open at the same time.
+    :type max_size: int
+    :param max_idle_time: Seconds an idle connection is kept before being reaped, or None to never reap.
+    :type max_idle_time: Optional[float]
+    :param acquire_timeout: Default number of seconds to wait for a free connection.
+    :type acquire_timeout: float
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        closer: Callable[[Any], Awaitable[None]],
+        health_check: Callable[[Any], Awaitable[bool]] | None = None,
+        min_size: int = 1,
+        max_size: int = 10,
+        max_idle_time: float | None = 300.0,
+        acquire_timeout: float = 5.0,
+    ):
+        if max_size < 1:
+            raise ValueError('max_size must be at least 1.')
+        if not 0 <= min_size <= max_size:
+            raise ValueError('min_size must be between 0 and max_size.')
+        self.factory = factory
+        self.closer = closer
+        self.health_check = health_check
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle_time = max_idle_time
+        self.acquire_timeout = acquire_timeout
+        self._idle: deque[_IdleConnection] = deque()
+        self._size = 0
+        self._semaphore = asyncio.Semaphore(max_size)
+        self._reaper: asyncio.Task | None = None
+        self._closed = True
+
+    @property
+    def size(self) -> int:
+        """
+        Number of open connections, idle or checked out.
+        """
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """
+        Number of open connections currently waiting in the pool.
+        """
+        return len(self._idle)
+
+    async def open(self) -> None:
+        """
+        Open ``min_size`` connections and start the idle reaper.
+        """
+        self._closed = False
+        while self._size < self.min_size:
+            connection = await self.factory()
+            self._size += 1
+            self._idle.append(_IdleConnection(connection))
+        if self.max_idle_time is not None and self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap_periodically())
+
+    @asynccontextmanager
+    async def acquire(self, timeout: float | None = None) -> AsyncIterator[Any]:
+        """
+        Check a connection out of the pool for the duration of the ``async with`` block.
+
+        A connection whose block raises is closed rather than returned, since the state of its
+        protocol stream is unknown.
+
+        :param timeout: Seconds to wait for a free connection; defaults to ``acquire_timeout``.
+        :type timeout: Optional[float]
+        :raises TimeoutError: If no connection becomes available in time.
+        :raises ConnectionError: If the pool is closed.
+        """
+        connection = await self._checkout(self.acquire_timeout if timeout is None else timeout)
+        try:
+            yield connection
+        except BaseException:
+            await self._discard(connection)
+            raise
+        else:
+            await self._checkin(connection)
+
+    async def reap_idle(self) -> None:
+        """
+        Close connections that have been idle for longer than ``max_idle_time``.
+        """
+        if self.max_idle_time is None:
+            return
+        now = time.monotonic()
+        # The left end of the deque holds the connections that have been idle the longest.
+        while self._idle and self._size > self.min_size and now - self._idle[0].released_at > self.max_idle_time:
+            await self._close(self._idle.popleft().connection)
+
+    async def close(self) -> None:
+        """
+        Close every idle connection and stop handing out new ones.
+
+        Connections that are checked out are closed when they are released.
+        """
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        while self._idle:
+            await self._close(self._idle.pop().connection)
+
+    async def _checkout(self, timeout: float) -> Any:
+        if self._closed:
+            raise ConnectionError('Connection pool is closed.')
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout)
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(f"Timed out after {timeout}s waiting for a database connection.") from e
+        try:
+            while self._idle:
+                connection = self._idle.pop().connection
+                if await self._healthy(connection):
+                    return connection
+                await self._close(connection)
+            connection = await self.factory()
+            self._size += 1
+            return connection
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def _healthy(self, connection: Any) -> bool:
+        if self.health_check is None:
+            return True
+        try:
+            return await self.health_check(connection)
+        except Exception as e:
+            print(f"Database connection health check failed: {str(e)}")
+            return False
+        except BaseException:
+            # Cancelled mid-check: the connection is neither idle nor handed out any more.
+            await self._close(connection)
+            raise
+
+    async def _checkin(self, connection: Any) -> None:
+        if self._closed:
+            await self._discard(connection)
+            return
+        self._idle.append(_IdleConnection(connection))
+        self._semaphore.release()
+
+    async def _discard(self, connection: Any) -> None:
+        try:
+            await self._close(connection)
+        finally:
+            self._semaphore.release()
+
+    async def _close(self, connection: Any) -> None:
+        self._size -= 1
+        try:
+            await self.closer(connection)
+        except Exception as e:
+            print(f"Failed to close database connection: {str(e)}")
+
+    async def _reap_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(max(self.max_idle_time / 2, 1.0))
+            await self.reap_idle()
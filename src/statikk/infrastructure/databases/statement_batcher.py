@@ -0,0 +1,126 @@
+# infrastructure/databases/statement_batcher.py
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+
+from statikk.infrastructure.databases.statement_cache import PreparedStatement
+
+# A single SurrealQL statement and the variables bound to it.
+Statement = tuple[str, 'dict[str, Any] | None']
+
+
+def merge_statements(statements: list[tuple[PreparedStatement, dict[str, Any] | None]]) -> tuple[str, dict[str, Any]]:
+    """
+    Merge single prepared statements into one SurrealQL request.
+
+    Every bound variable is renamed with a per-statement prefix (``$id`` of the third statement becomes
+    ``$s2_id``), so statements that use the same variable names with different values can share a request.
+    Variables that are not bound (``$before``, ``$this``...) are left untouched.
+
+    :param statements: The prepared statements to merge with their variables, each a single SurrealQL statement.
+    :type statements: List[Tuple[PreparedStatement, Optional[Dict[str, Any]]]]
+    :return: The merged query text and its variables.
+    :rtype: Tuple[str, Dict[str, Any]]
+    """
+    texts = []
+    merged: dict[str, Any] = {}
+    for index, (statement, parameters) in enumerate(statements):
+        parameters = parameters or {}
+        prefix = f"s{index}_"
+        texts.append(statement.render(prefix, parameters))
+        merged.update({f"{prefix}{name}": value for name, value in parameters.items()})
+    return ';\n'.join(texts) + ';', merged
+
+
+class StatementBatcher:
+    """
+    Coalesces statements submitted concurrently into a single database round trip.
+
+    The first statement submitted to an empty batch opens a window of ``window`` seconds; everything
+    submitted before the window closes (or until ``max_batch_size`` statements are queued) is sent as one
+    request, and each caller receives the result of its own statement.
+
+    :param execute: Coroutine function sending a list of statements and returning one response entry per statement.
+    :type execute: Callable[[List[Statement]], Awaitable[List[Dict[str, Any]]]]
+    :param window: Seconds to wait for more statements before flushing.
+    :type window: float
+    :param max_batch_size: Number of queued statements that triggers an immediate flush.
+    :type max_batch_size: int
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[list[Statement]], Awaitable[list[dict[str, Any]]]],
+        window: float = 0.002,
+        max_batch_size: int = 100,
+    ):
+        self.execute = execute
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending: list[tuple[Statement, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def submit(self, query: str, parameters: dict[str, Any] | None = None) -> Any:
+        """
+        Queue a single statement and wait for its result.
+
+        :param query: A single SurrealQL statement.
+        :type query: str
+        :param parameters: Variables bound to the statement.
+        :type parameters: Optional[Dict[str, Any]]
+        :return: The result of the statement.
+        :rtype: Any
+        :raises Exception: If the statement fails.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(((query, parameters), future))
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """
+        Send every queued statement now.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.ensure_future(self._send(pending))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def drain(self) -> None:
+        """
+        Send every queued statement and wait for all in-flight batches to complete.
+        """
+        self.flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    async def _send(self, pending: list[tuple[Statement, asyncio.Future]]) -> None:
+        try:
+            response = await self.execute([statement for statement, _ in pending])
+        except BaseException as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), entry in zip(pending, response):
+            if future.done():
+                continue
+            if entry.get('status') == 'OK':
+                future.set_result(entry['result'])
+            else:
+                future.set_exception(Exception(entry.get('result') or entry.get('detail')))
+        for _, future in pending[len(response):]:
+            if not future.done():
+                future.set_exception(Exception(f"Expected {len(pending)} results from the batch, got {len(response)}."))
@@ -0,0 +1,144 @@
+# infrastructure/databases/statement_cache.py
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from typing import Any
+
+# String literals, whitespace runs, bound variables and statement separators, in that order of precedence.
+_TOKEN = re.compile(r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")|(\s+)|\$(\w+)|(;)""")
+
+
+class PreparedStatement:
+    """
+    A parsed, normalized SurrealQL query.
+
+    The query text is split around its ``$variables`` so the statement can be rendered with renamed
+    variables (as needed when several statements share a request) without being parsed again.
+
+    :param parts: The normalized text surrounding each variable; one more element than ``variables``.
+    :type parts: List[str]
+    :param variables: The variable names, in order of appearance.
+    :type variables: List[str]
+    :param statement_count: The number of statements in the query.
+    :type statement_count: int
+    """
+
+    def __init__(self, parts: list[str], variables: list[str], statement_count: int):
+        self.parts = parts
+        self.variables = variables
+        self.statement_count = statement_count
+        self.text = self.render()
+
+    @classmethod
+    def parse(cls, query: str) -> PreparedStatement:
+        """
+        Parse and normalize a query: whitespace outside string literals is collapsed and trailing
+        semicolons are dropped.
+
+        :param query: The SurrealQL query text.
+        :type query: str
+        :return: The prepared statement.
+        :rtype: PreparedStatement
+        """
+        parts: list[str] = []
+        variables: list[str] = []
+        current: list[str] = []
+        separators = 0
+        position = 0
+        query = query.strip().rstrip(';').rstrip()
+        for match in _TOKEN.finditer(query):
+            current.append(query[position:match.start()])
+            position = match.end()
+            literal, whitespace, variable, separator = match.groups()
+            if literal is not None:
+                current.append(literal)
+            elif whitespace is not None:
+                current.append(' ')
+            elif variable is not None:
+                parts.append(''.join(current))
+                variables.append(variable)
+                current = []
+            else:
+                separators += 1
+                current.append(separator)
+        current.append(query[position:])
+        parts.append(''.join(current))
+        return cls(parts, variables, separators + 1)
+
+    def render(self, prefix: str = '', bound: set[str] | dict[str, Any] | None = None) -> str:
+        """
+        Render the statement text, prefixing the names of bound variables.
+
+        :param prefix: Prefix added to every bound variable name.
+        :type prefix: str
+        :param bound: Names of the variables to rename; variables not listed (``$before``, ``$this``...) are left as is.
+        :type bound: Optional[Union[Set[str], Dict[str, Any]]]
+        :return: The statement text.
+        :rtype: str
+        """
+        pieces = [self.parts[0]]
+        for variable, part in zip(self.variables, self.parts[1:]):
+            renamed = prefix and bound is not None and variable in bound
+            pieces.append(f"${prefix}{variable}" if renamed else f"${variable}")
+            pieces.append(part)
+        return ''.join(pieces)
+
+
+class StatementCache:
+    """
+    Bounded LRU cache of prepared statements, keyed by the raw query text.
+
+    Repositories issue the same handful of parameterized queries over and over, so after warm-up every
+    query is served from the cache instead of being tokenized again by the client. This only saves
+    client-side work: the server still parses the text of every query it receives.
+
+    :param max_size: Maximum number of statements kept.
+    :type max_size: int
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._statements: OrderedDict[str, PreparedStatement] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Fraction of lookups served from the cache.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def prepare(self, query: str) -> PreparedStatement:
+        """
+        Return the prepared form of a query, parsing it on a cache miss.
+
+        :param query: The SurrealQL query text.
+        :type query: str
+        :return: The prepared statement.
+        :rtype: PreparedStatement
+        """
+        statement = self._statements.get(query)
+        if statement is not None:
+            self.hits += 1
+            self._statements.move_to_end(query)
+            return statement
+        self.misses += 1
+        statement = PreparedStatement.parse(query)
+        self._statements[query] = statement
+        if len(self._statements) > self.max_size:
+            self._statements.popitem(last=False)
+        return statement
+
+    def clear(self) -> None:
+        """
+        Drop every cached statement and reset the counters.
+        """
+        self._statements.clear()
+        self.hits = 0
+        self.misses = 0
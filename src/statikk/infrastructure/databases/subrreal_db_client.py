@@ -1,17 +1,92 @@
 # infrastructure/database/subrrreal_db_client.py
 from __future__ import annotations
 
+import asyncio
+import re
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
 from typing import Any
 
+from statikk.infrastructure.databases.bulk_write import BulkWriteResult
+from statikk.infrastructure.databases.bulk_write import chunked
+from statikk.infrastructure.databases.bulk_write import ChunkError
+from statikk.infrastructure.databases.connection_pool import ConnectionPool
+from statikk.infrastructure.databases.statement_batcher import merge_statements
+from statikk.infrastructure.databases.statement_batcher import Statement
+from statikk.infrastructure.databases.statement_batcher import StatementBatcher
+from statikk.infrastructure.databases.statement_cache import StatementCache
+from surrealdb import Surreal
+from surrealdb.ws import ConnectionState
+
+_IDENTIFIER = re.compile(r'[A-Za-z_]\w*')
+
+_UPSERT_ROWS = '''
+FOR $row IN $rows {
+    IF (SELECT VALUE id FROM type::thing($collection, $row.id)) {
+        UPDATE type::thing($collection, $row.id) MERGE $row;
+    } ELSE {
+        CREATE type::table($collection) CONTENT $row;
+    };
+}
+'''
+
+
+def record_key(table: str, identifier: Any) -> str:
+    """
+    Return the key of a record, to look it up with ``type::thing(table, $key)``.
+
+    Record IDs compare as records, not strings, so a lookup must build one from the table and the key.
+    Entity IDs hold the key alone, while IDs read back from rows are full record IDs, ``table:key`` or
+    ``table:⟨key⟩``; both give the same key.
+
+    :param table: The table the record belongs to.
+    :type table: str
+    :param identifier: The key, or the full record ID.
+    :type identifier: Any
+    :return: The record's key.
+    :rtype: str
+    """
+    key = str(identifier)
+    if key.startswith(f"{table}:"):
+        key = key[len(table) + 1:]
+        if key[:1] in ('⟨', '`') and key[-1:] in ('⟩', '`'):
+            key = key[1:-1]
+    return key
+
 
 class SubrrealDBClient:
     """
-    Client for interacting with SubrrrealDB.
+    Asynchronous client for interacting with SubrrrealDB.
+
+    Handles connection pooling, queries, and data operations for SubrrrealDB. Every operation checks a
+    connection out of a bounded pool, so concurrent requests never share a connection and a slow query
+    only ties up the connection it runs on. Several statements can be sent in one round trip with
+    :meth:`batch`, and with ``auto_batch_window`` set, single statements issued concurrently are
+    coalesced into shared round trips automatically.
 
-    Handles connection, queries, and data operations for SubrrrealDB.
+    Queries should bind values through ``parameters`` (``type::thing('users', $id)``) rather than formatting them
+    into the query text: the server then binds them safely. The client keeps an LRU of normalized statements
+    keyed by query text, so it only tokenizes each distinct query once when merging batches; the protocol
+    has no server-side prepared statements, so the server still parses every query it receives.
     """
 
-    def __init__(self, host: str, port: int, database: str, username: str | None = None, password: str | None = None):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        database: str,
+        username: str | None = None,
+        password: str | None = None,
+        namespace: str = 'statikk',
+        min_pool_size: int = 1,
+        max_pool_size: int = 10,
+        max_idle_time: float | None = 300.0,
+        acquire_timeout: float = 5.0,
+        auto_batch_window: float | None = None,
+        max_batch_size: int = 100,
+        statement_cache_size: int = 256,
+    ):
         """
         Initializes the SubrrrealDB client with connection details.
 
@@ -25,56 +100,197 @@ class SubrrealDBClient:
         :type username: Optional[str]
         :param password: The password for authentication, if required.
         :type password: Optional[str]
+        :param namespace: The namespace the database lives in.
+        :type namespace: str
+        :param min_pool_size: Number of connections kept open at all times.
+        :type min_pool_size: int
+        :param max_pool_size: Maximum number of concurrently open connections.
+        :type max_pool_size: int
+        :param max_idle_time: Seconds an idle connection is kept before being closed, or None to keep it forever.
+        :type max_idle_time: Optional[float]
+        :param acquire_timeout: Seconds to wait for a free connection before giving up.
+        :type acquire_timeout: float
+        :param auto_batch_window: Seconds to hold a statement while waiting for concurrent ones to batch with, or None to disable.
+        :type auto_batch_window: Optional[float]
+        :param max_batch_size: Maximum number of statements sent in one automatic batch.
+        :type max_batch_size: int
+        :param statement_cache_size: Maximum number of prepared statements kept in the statement cache.
+        :type statement_cache_size: int
         """
         self.host = host
         self.port = port
         self.database = database
         self.username = username
         self.password = password
-        self.connection = None
+        self.namespace = namespace
+        self.pool = ConnectionPool(
+            factory=self._create_connection,
+            closer=self._close_connection,
+            health_check=self._check_connection,
+            min_size=min_pool_size,
+            max_size=max_pool_size,
+            max_idle_time=max_idle_time,
+            acquire_timeout=acquire_timeout,
+        )
+        self.statement_cache = StatementCache(max_size=statement_cache_size)
+        self.batcher = None
+        if auto_batch_window is not None:
+            self.batcher = StatementBatcher(self._send, window=auto_batch_window, max_batch_size=max_batch_size)
 
-    def connect(self):
+    async def connect(self):
         """
-        Establishes a connection to the SubrrrealDB.
+        Opens the connection pool to the SubrrrealDB.
 
         :raises ConnectionError: If the connection to the database fails.
         """
         try:
-            # Replace with actual connection logic for SubrrrealDB
-            self.connection = self._create_connection()
+            await self.pool.open()
             print(f"Connected to SubrrrealDB at {self.host}:{self.port}")
         except Exception as e:
-            raise ConnectionError(f"Failed to connect to SubrrrealDB: {str(e)}")
+            raise ConnectionError(f"Failed to connect to SubrrrealDB: {str(e)}") from e
+
+    async def _create_connection(self) -> Surreal:
+        """
+        Private method to open and authenticate a single database connection.
+
+        :return: A connected driver instance.
+        :rtype: Surreal
+        """
+        connection = Surreal(f"ws://{self.host}:{self.port}/rpc")
+        await connection.connect()
+        if self.username:
+            await connection.signin({'user': self.username, 'pass': self.password})
+        await connection.use(self.namespace, self.database)
+        return connection
+
+    async def _close_connection(self, connection: Surreal) -> None:
+        """
+        Private method to close a single database connection.
+        """
+        await connection.close()
+
+    async def _check_connection(self, connection: Surreal) -> bool:
+        """
+        Private method used by the pool to check a connection on checkout.
+
+        :return: True if the connection is still open.
+        :rtype: bool
+        """
+        return connection.client_state == ConnectionState.CONNECTED
+
+    async def _send(self, statements: list[Statement]) -> list[dict[str, Any]]:
+        """
+        Sends single statements in one request and returns the raw response entry of each.
+        """
+        query, parameters = merge_statements([
+            (self.statement_cache.prepare(statement), statement_parameters) for statement, statement_parameters in statements
+        ])
+        async with self.pool.acquire() as connection:
+            return await connection.query(query, parameters)
+
+    async def _execute(self, query: str, parameters: dict[str, Any] | None = None) -> list[Any]:
+        """
+        Runs SurrealQL on a pooled connection and returns the result of each statement.
+
+        :raises Exception: If any statement reports an error.
+        """
+        async with self.pool.acquire() as connection:
+            response = await connection.query(query, parameters)
+        for statement in response:
+            if statement.get('status') != 'OK':
+                raise Exception(statement.get('result') or statement.get('detail'))
+        return [statement['result'] for statement in response]
+
+    async def _run(self, query: str, parameters: dict[str, Any] | None = None) -> Any:
+        """
+        Runs SurrealQL and returns the result of its last statement, going through the batcher when enabled.
+        """
+        statement = self.statement_cache.prepare(query)
+        if self.batcher is not None and statement.statement_count == 1:
+            return await self.batcher.submit(query, parameters)
+        results = await self._execute(statement.text, parameters)
+        return results[-1] if results else []
+
+    async def batch(self, statements: list[Statement]) -> list[Any]:
+        """
+        Executes several statements in a single round trip.
+
+        :param statements: ``(query, parameters)`` pairs, each holding a single SurrealQL statement.
+        :type statements: List[Tuple[str, Optional[Dict[str, Any]]]]
+        :return: The result of each statement, in order.
+        :rtype: List[Any]
+        :raises Exception: If the request or any of the statements fails.
+        """
+        if not statements:
+            return []
+        try:
+            response = await self._send(statements)
+        except Exception as e:
+            raise Exception(f"Failed to execute batch: {str(e)}") from e
+        for index, statement in enumerate(response):
+            if statement.get('status') != 'OK':
+                error = statement.get('result') or statement.get('detail')
+                raise Exception(f"Failed to execute batch statement {index}: {error}")
+        return [statement['result'] for statement in response]
+
+    def insert_statement(self, collection: str, data: dict[str, Any]) -> Statement:
+        """
+        Builds the statement used by :meth:`insert`, for use in :meth:`batch`.
+        """
+        return 'CREATE type::table($collection) CONTENT $data', {'collection': collection, 'data': data}
+
+    def update_statement(self, collection: str, identifier: Any, data: dict[str, Any], version: int | None = None) -> Statement:
+        """
+        Builds the statement used by :meth:`update`, for use in :meth:`batch`.
+
+        The statement returns only the ``id`` of each matched row, so whether the row existed is known
+        without reading it first.
+        """
+        return self._conditional_update('MERGE $data', collection, identifier, {'data': data}, version)
+
+    @staticmethod
+    def _conditional_update(
+        change: str, collection: str, identifier: Any, parameters: dict[str, Any], version: int | None,
+    ) -> Statement:
+        # Targets the record itself, so only that record is read. Unlike UPSERT, UPDATE leaves a missing record
+        # missing and returns nothing for it.
+        parameters = {'collection': collection, 'identifier': record_key(collection, identifier), **parameters}
+        condition = ''
+        if version is not None:
+            condition = ' WHERE (version ?? 0) = $version'
+            parameters['version'] = version
+        return f"UPDATE type::thing($collection, $identifier) {change}{condition} RETURN id", parameters
 
-    def _create_connection(self):
+    def delete_statement(self, collection: str, identifier: Any) -> Statement:
         """
-        Private method to create a database connection.
+        Builds the statement used by :meth:`delete`, for use in :meth:`batch`.
 
-        :return: A mock connection object (replace with actual connection logic).
+        The statement returns each deleted row as it was before deletion, so whether the row existed is
+        known without reading it first.
         """
-        # This is a placeholder. Replace with actual connection setup, like using a specific SubrrrealDB client library.
-        return f"Connection({self.host}, {self.port}, {self.database})"
+        return (
+            'DELETE type::thing($collection, $identifier) RETURN BEFORE',
+            {'collection': collection, 'identifier': record_key(collection, identifier)},
+        )
 
-    def query(self, query: str, parameters: dict[str, Any] | None = None) -> Any:
+    async def query(self, query: str, parameters: dict[str, Any] | None = None) -> Any:
         """
         Executes a query against the SubrrrealDB.
 
         :param query: The query string to execute.
         :type query: str
-        :param parameters: Optional parameters for the query.
+        :param parameters: Values bound to the ``$variables`` used in the query.
         :type parameters: Optional[Dict[str, Any]]
-        :return: The result of the query.
+        :return: The result of the last statement in the query.
         :rtype: Any
         :raises Exception: If the query execution fails.
         """
         try:
-            # Replace with actual query execution logic for SubrrrealDB
-            print(f"Executing query: {query} with parameters: {parameters}")
-            return 'query_result'  # Placeholder for the query result
+            return await self._run(query, parameters)
         except Exception as e:
-            raise Exception(f"Failed to execute query: {str(e)}")
+            raise Exception(f"Failed to execute query: {str(e)}") from e
 
-    def insert(self, collection: str, data: dict[str, Any]) -> Any:
+    async def insert(self, collection: str, data: dict[str, Any]) -> Any:
         """
         Inserts data into a specified collection.
 
@@ -87,13 +303,11 @@ class SubrrealDBClient:
         :raises Exception: If the insert operation fails.
         """
         try:
-            # Replace with actual insert logic for SubrrrealDB
-            print(f"Inserting into {collection}: {data}")
-            return 'insert_result'  # Placeholder for the insert result
+            return await self._run(*self.insert_statement(collection, data))
         except Exception as e:
-            raise Exception(f"Failed to insert data: {str(e)}")
+            raise Exception(f"Failed to insert data: {str(e)}") from e
 
-    def update(self, collection: str, identifier: Any, data: dict[str, Any]) -> Any:
+    async def update(self, collection: str, identifier: Any, data: dict[str, Any], version: int | None = None) -> Any:
         """
         Updates data in a specified collection.
 
@@ -103,18 +317,18 @@ class SubrrealDBClient:
         :type identifier: Any
         :param data: The data to update as a dictionary.
         :type data: Dict[str, Any]
-        :return: The result of the update operation.
-        :rtype: Any
+        :param version: If given, only update the row if its ``version`` field (0 when unset) equals it.
+        :type version: Optional[int]
+        :return: The ``id`` of every updated row; empty if no row matched.
+        :rtype: List[Dict[str, Any]]
         :raises Exception: If the update operation fails.
         """
         try:
-            # Replace with actual update logic for SubrrrealDB
-            print(f"Updating {collection} where id={identifier}: {data}")
-            return 'update_result'  # Placeholder for the update result
+            return await self._run(*self.update_statement(collection, identifier, data, version))
         except Exception as e:
-            raise Exception(f"Failed to update data: {str(e)}")
+            raise Exception(f"Failed to update data: {str(e)}") from e
 
-    def delete(self, collection: str, identifier: Any) -> Any:
+    async def delete(self, collection: str, identifier: Any) -> Any:
         """
         Deletes data from a specified collection.
 
@@ -122,21 +336,163 @@ class SubrrealDBClient:
         :type collection: str
         :param identifier: The identifier to locate the data to delete.
         :type identifier: Any
-        :return: The result of the delete operation.
-        :rtype: Any
+        :return: Every deleted row; empty if no row matched.
+        :rtype: List[Dict[str, Any]]
         :raises Exception: If the delete operation fails.
         """
         try:
-            # Replace with actual delete logic for SubrrrealDB
-            print(f"Deleting from {collection} where id={identifier}")
-            return 'delete_result'  # Placeholder for the delete result
+            return await self._run(*self.delete_statement(collection, identifier))
         except Exception as e:
-            raise Exception(f"Failed to delete data: {str(e)}")
+            raise Exception(f"Failed to delete data: {str(e)}") from e
+
+    async def fetch_page(self, collection: str, limit: int, after: Any | None = None) -> list[dict[str, Any]]:
+        """
+        Fetches one page of a collection ordered by ``id``, using keyset pagination.
+
+        Pages are located with ``WHERE id > type::thing($collection, $after)`` rather than ``START``, so
+        reaching a page deep into the collection costs the same as reaching the first one. Record IDs compare
+        as records, so ``after`` may be the key or the full record ID of the row, as ``cursor`` passes it.
+
+        :param collection: The name of the collection (or table) to read.
+        :type collection: str
+        :param limit: Maximum number of rows in the page.
+        :type limit: int
+        :param after: The ``id`` of the last row of the previous page, or None for the first page.
+        :type after: Optional[Any]
+        :return: The rows of the page.
+        :rtype: List[Dict[str, Any]]
+        :raises Exception: If the query execution fails.
+        """
+        if after is None:
+            return await self.query(
+                'SELECT * FROM type::table($collection) ORDER BY id LIMIT $limit',
+                {'collection': collection, 'limit': limit},
+            )
+        return await self.query(
+            'SELECT * FROM type::table($collection) WHERE id > type::thing($collection, $after) ORDER BY id LIMIT $limit',
+            {'collection': collection, 'after': record_key(collection, after), 'limit': limit},
+        )
+
+    async def cursor(
+        self, collection: str, page_size: int = 500, after: Any | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Iterates over a whole collection in ``id`` order, one page of at most ``page_size`` rows at a time.
+
+        Only one page is held in memory, and no connection is held between pages.
+
+        :param collection: The name of the collection (or table) to read.
+        :type collection: str
+        :param page_size: Number of rows fetched per round trip.
+        :type page_size: int
+        :param after: Start after the row with this ``id`` instead of at the beginning.
+        :type after: Optional[Any]
+        :return: An async iterator over the pages.
+        :rtype: AsyncIterator[List[Dict[str, Any]]]
+        :raises Exception: If a query execution fails.
+        """
+        if page_size < 1:
+            raise ValueError('page_size must be at least 1.')
+        while True:
+            page = await self.fetch_page(collection, page_size, after)
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            after = page[-1]['id']
+
+    async def insert_many(
+        self,
+        collection: str,
+        rows: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+        chunk_size: int = 500,
+        max_in_flight: int = 4,
+    ) -> BulkWriteResult:
+        """
+        Inserts many rows into a specified collection, one ``INSERT`` statement per chunk.
+
+        :param collection: The name of the collection (or table) to insert into.
+        :type collection: str
+        :param rows: The rows to insert; consumed lazily, so generators of any size can be passed.
+        :type rows: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+        :param chunk_size: Number of rows sent per statement.
+        :type chunk_size: int
+        :param max_in_flight: Maximum number of chunks being written at once; reading ``rows`` pauses while the limit is reached.
+        :type max_in_flight: int
+        :return: The number of rows written and the chunks that failed.
+        :rtype: BulkWriteResult
+        """
+        if not _IDENTIFIER.fullmatch(collection):
+            raise ValueError(f"Invalid collection name: {collection}")
+        return await self._write_many(f"INSERT INTO {collection} $rows", collection, rows, chunk_size, max_in_flight)
+
+    async def upsert_many(
+        self,
+        collection: str,
+        rows: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+        chunk_size: int = 500,
+        max_in_flight: int = 4,
+    ) -> BulkWriteResult:
+        """
+        Inserts many rows into a specified collection, merging into the rows that already exist with the same ``id``.
+
+        :param collection: The name of the collection (or table) to write to.
+        :type collection: str
+        :param rows: The rows to write, each with an ``id``; consumed lazily.
+        :type rows: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+        :param chunk_size: Number of rows sent per statement.
+        :type chunk_size: int
+        :param max_in_flight: Maximum number of chunks being written at once; reading ``rows`` pauses while the limit is reached.
+        :type max_in_flight: int
+        :return: The number of rows written and the chunks that failed.
+        :rtype: BulkWriteResult
+        """
+        return await self._write_many(_UPSERT_ROWS, collection, rows, chunk_size, max_in_flight)
+
+    async def _write_many(
+        self,
+        query: str,
+        collection: str,
+        rows: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+        chunk_size: int,
+        max_in_flight: int,
+    ) -> BulkWriteResult:
+        """
+        Writes ``rows`` chunk by chunk with ``query``, keeping at most ``max_in_flight`` chunks in flight.
+        """
+        statement = self.statement_cache.prepare(query)
+        result = BulkWriteResult()
+        slots = asyncio.Semaphore(max_in_flight)
+        in_flight: set[asyncio.Task] = set()
+
+        async def write_chunk(index: int, offset: int, chunk: list[dict[str, Any]]) -> None:
+            try:
+                await self._execute(statement.text, {'collection': collection, 'rows': chunk})
+                result.written += len(chunk)
+            except Exception as e:
+                print(f"Failed to write chunk {index} of {collection}: {str(e)}")
+                result.errors.append(ChunkError(index, offset, len(chunk), e))
+            finally:
+                slots.release()
+
+        offset = 0
+        async for chunk in chunked(rows, chunk_size):
+            await slots.acquire()
+            task = asyncio.create_task(write_chunk(result.chunks, offset, chunk))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+            result.chunks += 1
+            offset += len(chunk)
+        if in_flight:
+            await asyncio.gather(*in_flight)
+        result.errors.sort(key=lambda error: error.index)
+        return result
 
-    def close(self):
+    async def close(self):
         """
-        Closes the connection to the SubrrrealDB.
+        Closes every pooled connection to the SubrrrealDB.
         """
-        if self.connection:
-            print('Closing connection')
-            self.connection = None
+        print('Closing connection pool')
+        if self.batcher is not None:
+            await self.batcher.drain()
+        await self.pool.close()
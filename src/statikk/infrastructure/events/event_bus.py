@@ -0,0 +1,295 @@
+# infrastructure/events/event_bus.py
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections import OrderedDict
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+
+from statikk.core.domain.events import EntityEvent
+
+# What a subscription whose queue is full does with a new event.
+DROP_OLDEST = 'drop_oldest'
+DROP_NEWEST = 'drop_newest'
+# Also keeps only the latest pending event per key (usually the entity), whether the queue is full or not.
+COALESCE = 'coalesce'
+
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, COALESCE)
+
+Handler = Callable[[list[EntityEvent]], Awaitable[None]]
+
+
+class Subscription:
+    """
+    A subscriber's queue of pending events and the task delivering them.
+
+    Created by ``EventBus.subscribe``. The queue holds at most ``max_size`` events: a subscriber that falls
+    behind loses events, as its ``overflow`` policy decides, rather than slowing the writers down or holding
+    an unbounded backlog. ``dropped`` and ``coalesced`` count the events lost so.
+
+    A subscriber that must not miss a write, like an index kept in step with the entities, passes no
+    ``max_size`` and the ``coalesce`` policy: nothing is dropped, and the queue still holds at most one
+    event per entity, the latest.
+
+    Events are delivered in batches of up to ``batch_size``, in publication order; those published while the
+    handler runs make up the next batch. With ``max_delay`` set, a batch that is not full waits that long for
+    more events first, trading latency for fewer handler calls.
+
+    :param handler: Coroutine function called with each batch of events.
+    :type handler: Callable[[List[EntityEvent]], Awaitable[None]]
+    :param event_types: The event classes delivered, subclasses included.
+    :type event_types: Tuple[type, ...]
+    :param max_size: Maximum number of pending events, or None for no limit.
+    :type max_size: Optional[int]
+    :param overflow: One of ``drop_oldest``, ``drop_newest`` or ``coalesce``.
+    :type overflow: str
+    :param batch_size: Maximum number of events per handler call.
+    :type batch_size: int
+    :param max_delay: Seconds a batch that is not full waits for more events.
+    :type max_delay: float
+    :raises ValueError: If the overflow policy is unknown or a size is not positive.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        event_types: tuple[type, ...],
+        max_size: int | None = 1000,
+        overflow: str = DROP_OLDEST,
+        batch_size: int = 100,
+        max_delay: float = 0.0,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}', expected one of {', '.join(OVERFLOW_POLICIES)}.")
+        if (max_size is not None and max_size < 1) or batch_size < 1:
+            raise ValueError('A subscription needs a positive queue size and batch size.')
+        self.handler = handler
+        self.event_types = event_types
+        self.max_size = max_size
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        # Pending events; coalescing subscriptions key them by ``EntityEvent.key`` so a newer event replaces an older one
+        # in place.
+        self._queue: deque[EntityEvent] | OrderedDict[tuple[str, ...], EntityEvent] = (
+            OrderedDict() if overflow == COALESCE else deque()
+        )
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def offer(self, event: EntityEvent) -> None:
+        """
+        Queue an event for delivery, without waiting.
+
+        :param event: The event.
+        :type event: EntityEvent
+        """
+        queue = self._queue
+        if self.overflow == COALESCE:
+            key = event.key
+            if key in queue:
+                self.coalesced += 1
+            elif self.max_size is not None and len(queue) >= self.max_size:
+                queue.popitem(last=False)
+                self.dropped += 1
+            queue[key] = event
+        elif self.max_size is None or len(queue) < self.max_size:
+            queue.append(event)
+        elif self.overflow == DROP_OLDEST:
+            queue.popleft()
+            queue.append(event)
+            self.dropped += 1
+        else:
+            self.dropped += 1
+            return
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _take(self) -> list[EntityEvent]:
+        count = min(self.batch_size, len(self._queue))
+        if self.overflow == COALESCE:
+            return [self._queue.popitem(last=False)[1] for _ in range(count)]
+        return [self._queue.popleft() for _ in range(count)]
+
+    async def _run(self) -> None:
+        while True:
+            if not self._queue:
+                if self._closing:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            if self.max_delay and len(self._queue) < self.batch_size and not self._closing:
+                await asyncio.sleep(self.max_delay)
+            batch = self._take()
+            try:
+                await self.handler(batch)
+            except Exception as e:
+                print(f"Event handler {getattr(self.handler, '__qualname__', self.handler)} failed: {str(e)}")
+            self.delivered += len(batch)
+
+    def start(self) -> None:
+        """
+        Start delivering events in the background; must be called from the event loop.
+        """
+        if self._task is None:
+            self._closing = False
+            self._wakeup = asyncio.Event()
+            self._wakeup.set()
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self, timeout: float | None = None) -> None:
+        """
+        Deliver the pending events, then stop.
+
+        :param timeout: Seconds to wait for the pending events to be delivered before dropping them.
+        :type timeout: Optional[float]
+        """
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            print(f"Dropped {len(self._queue)} undelivered events on close.")
+            self.dropped += len(self._queue)
+            self._queue.clear()
+        self._task = None
+
+
+class EventBus:
+    """
+    In-process fan-out of entity events to asynchronous subscribers.
+
+    ``publish`` never waits: it appends the event to the bounded queue of each subscription it matches and
+    returns, so a write costs the same however many subscribers there are and however slow they are. Each
+    subscription then delivers its events from its own task; see ``Subscription`` for the overflow and
+    batching options.
+
+    Which subscriptions an event class matches is worked out once per class and kept until the
+    subscriptions change. Events must be published from the event loop's thread.
+    """
+
+    def __init__(self):
+        self._subscriptions: list[Subscription] = []
+        self._routes: dict[type, tuple[Subscription, ...]] = {}
+        self._started = False
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(
+        self,
+        handler: Handler,
+        event_types: Iterable[type] = (EntityEvent,),
+        max_size: int | None = 1000,
+        overflow: str = DROP_OLDEST,
+        batch_size: int = 100,
+        max_delay: float = 0.0,
+    ) -> Subscription:
+        """
+        Deliver events of some classes to a handler, in batches.
+
+        :param handler: Coroutine function called with each batch of events; its exceptions are reported
+            and the batch is not retried.
+        :type handler: Callable[[List[EntityEvent]], Awaitable[None]]
+        :param event_types: The event classes delivered, subclasses included; defaults to every event.
+        :type event_types: Iterable[type]
+        :param max_size: Maximum number of events pending for the handler, or None for no limit.
+        :type max_size: Optional[int]
+        :param overflow: What to do once ``max_size`` events are pending: ``drop_oldest`` or ``drop_newest``
+            events, or ``coalesce`` them into the latest event per ``EntityEvent.key``.
+        :type overflow: str
+        :param batch_size: Maximum number of events per handler call.
+        :type batch_size: int
+        :param max_delay: Seconds a batch that is not full waits for more events.
+        :type max_delay: float
+        :return: The subscription, to read its counters or unsubscribe.
+        :rtype: Subscription
+        :raises ValueError: If the overflow policy is unknown or a size is not positive.
+        """
+        subscription = Subscription(handler, tuple(event_types), max_size, overflow, batch_size, max_delay)
+        self._subscriptions.append(subscription)
+        self._routes.clear()
+        if self._started:
+            subscription.start()
+        return subscription
+
+    async def unsubscribe(self, subscription: Subscription, timeout: float | None = None) -> None:
+        """
+        Stop delivering events to a subscription, once those pending are delivered.
+
+        :param subscription: The subscription returned by ``subscribe``.
+        :type subscription: Subscription
+        :param timeout: Seconds to wait for the pending events to be delivered.
+        :type timeout: Optional[float]
+        """
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            self._routes.clear()
+        await subscription.close(timeout)
+
+    def _route(self, event_type: type) -> tuple[Subscription, ...]:
+        subscriptions = tuple(
+            subscription for subscription in self._subscriptions if issubclass(event_type, subscription.event_types)
+        )
+        self._routes[event_type] = subscriptions
+        return subscriptions
+
+    def has_subscribers(self, event_type: type) -> bool:
+        """
+        True if events of a class would be delivered to anyone, so publishers can skip building them.
+
+        :param event_type: The event class.
+        :type event_type: type
+        """
+        routes = self._routes.get(event_type)
+        return bool(self._route(event_type) if routes is None else routes)
+
+    def publish(self, event: EntityEvent) -> None:
+        """
+        Queue an event for every subscription it matches, without waiting; ignored once the bus is closed.
+
+        :param event: The event.
+        :type event: EntityEvent
+        """
+        if self._closed:
+            return
+        subscriptions = self._routes.get(type(event))
+        if subscriptions is None:
+            subscriptions = self._route(type(event))
+        for subscription in subscriptions:
+            subscription.offer(event)
+
+    async def start(self) -> None:
+        """
+        Start delivering events, including those published before.
+        """
+        self._started = True
+        self._closed = False
+        for subscription in self._subscriptions:
+            subscription.start()
+
+    async def close(self, timeout: float | None = 5.0) -> None:
+        """
+        Stop accepting events and deliver those pending.
+
+        :param timeout: Seconds each subscription may take to deliver its pending events.
+        :type timeout: Optional[float]
+        """
+        self._closed = True
+        self._started = False
+        await asyncio.gather(*(subscription.close(timeout) for subscription in self._subscriptions))
@@ -0,0 +1,142 @@
+# infrastructure/events/publishing_repository.py
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Any
+
+from statikk.core.domain.entities.entity import Entity
+from statikk.core.domain.events import EntityEvent
+from statikk.infrastructure.events.event_bus import EventBus
+
+
+def _snapshot(entity: Any) -> Any:
+    return entity.copy() if isinstance(entity, Entity) else entity
+
+
+class EventPublishingRepository:
+    """
+    Publishes an event on an ``EventBus`` for every write to a repository.
+
+    Wraps any of the ``*Repository`` implementations and exposes the same methods. ``save``, ``update`` and
+    ``delete`` publish the ``created``, ``updated`` and ``deleted`` event once the write succeeded; a write
+    that raises publishes nothing. ``save_many`` publishes one event per entity in the chunks that were
+    written, ``updated`` ones when upserting since those may have existed. Every other method is passed
+    through.
+
+    Events carry a copy-on-write snapshot of the entity taken once the write succeeded, so subscribers do not
+    see later changes the writer makes. With ``details`` set, ``save`` and ``update`` also publish the finer
+    events it builds from the entity before the write, e.g. one per changed organization member.
+
+    Publishing only queues the events, so the writer never waits for the subscribers.
+
+    :param repository: The repository to wrap.
+    :type repository: Any
+    :param event_bus: The bus the events are published on.
+    :type event_bus: EventBus
+    :param id_attribute: Name of the entity attribute holding its ID, e.g. ``collection_id``.
+    :type id_attribute: str
+    :param created: Event class published when an entity is saved, e.g. ``CollectionCreated``.
+    :type created: type
+    :param updated: Event class published when an entity is updated.
+    :type updated: type
+    :param deleted: Event class published when an entity is deleted.
+    :type deleted: type
+    :param details: Builds the further events of a write to an entity, called before the write.
+    :type details: Callable[[Any], List[EntityEvent]], optional
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        event_bus: EventBus,
+        id_attribute: str,
+        created: type,
+        updated: type,
+        deleted: type,
+        details: Callable[[Any], list[EntityEvent]] | None = None,
+    ):
+        self.repository = repository
+        self.event_bus = event_bus
+        self.id_attribute = id_attribute
+        self.created = created
+        self.updated = updated
+        self.deleted = deleted
+        self.details = details
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names not found on the wrapper itself; guard against lookups before __init__ ran.
+        if name == 'repository':
+            raise AttributeError(name)
+        return getattr(self.repository, name)
+
+    def _key(self, value: Any) -> str:
+        return str(getattr(value, self.id_attribute, value))
+
+    async def _write(self, method: str, event_type: type, entity: Any) -> None:
+        details = self.details(entity) if self.details is not None else ()
+        await getattr(self.repository, method)(entity)
+        self.event_bus.publish(event_type(self._key(entity), _snapshot(entity)))
+        for event in details:
+            self.event_bus.publish(event)
+
+    async def save(self, entity: Any) -> None:
+        """
+        Save an entity and publish its ``created`` event.
+
+        :param entity: The entity to save.
+        :type entity: Any
+        """
+        await self._write('save', self.created, entity)
+
+    async def update(self, entity: Any) -> None:
+        """
+        Update an entity and publish its ``updated`` event.
+
+        :param entity: The entity to update.
+        :type entity: Any
+        """
+        await self._write('update', self.updated, entity)
+
+    async def delete(self, entity_or_id: Any) -> None:
+        """
+        Delete an entity and publish its ``deleted`` event.
+
+        :param entity_or_id: The entity, or its ID, as the wrapped repository expects.
+        :type entity_or_id: Any
+        """
+        await self.repository.delete(entity_or_id)
+        entity = _snapshot(entity_or_id) if hasattr(entity_or_id, self.id_attribute) else None
+        self.event_bus.publish(self.deleted(self._key(entity_or_id), entity))
+
+    async def save_many(self, entities: Iterable[Any], chunk_size: int = 500, upsert: bool = False) -> Any:
+        """
+        Save many entities and publish an event for each one written.
+
+        :param entities: The entities to save; consumed lazily, though they are held until the write ends
+            when anyone subscribes to their events.
+        :type entities: Iterable[Any]
+        :param chunk_size: Number of entities written per statement.
+        :type chunk_size: int
+        :param upsert: Merge into entities that already exist instead of failing their chunk.
+        :type upsert: bool
+        :return: The result of the wrapped repository's ``save_many``.
+        :rtype: BulkWriteResult
+        """
+        event_type = self.updated if upsert else self.created
+        if not self.event_bus.has_subscribers(event_type):
+            return await self.repository.save_many(entities, chunk_size=chunk_size, upsert=upsert)
+        written: list[Any] = []
+
+        def recorded(entities: Iterable[Any]) -> Iterator[Any]:
+            for entity in entities:
+                written.append(entity)
+                yield entity
+
+        result = await self.repository.save_many(recorded(entities), chunk_size=chunk_size, upsert=upsert)
+        failed = {index for error in result.errors for index in range(error.offset, error.offset + error.size)}
+        for index, entity in enumerate(written):
+            if index not in failed:
+                self.event_bus.publish(event_type(self._key(entity), _snapshot(entity)))
+        return result
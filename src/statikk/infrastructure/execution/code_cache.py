@@ -0,0 +1,174 @@
+# infrastructure/execution/code_cache.py
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from types import CodeType
+
+from statikk.infrastructure.files import ensure_private_directory
+
+
+class CodeCache:
+    """
+    Cache of compiled cloud function code, keyed by the SHA-256 of the source.
+
+    Code objects are kept in a bounded in-memory LRU and, when ``directory`` is set, marshalled to one file
+    per source there, so another process, such as a freshly started worker, loads the bytecode instead of
+    compiling the source again. Files are named after the interpreter's cache tag and start with its magic
+    number, as ``.pyc`` files do, since marshalled code only loads in the Python version that wrote it.
+
+    Since entries are keyed by content, updated code never hits a stale entry; ``invalidate`` only frees
+    the entry of code that is no longer deployed.
+
+    The bytecode read from ``directory`` is executed, so the directory must be private to the current user:
+    it is created with mode 0700, and an existing one that is not private is refused. The cache is
+    thread-safe, so code can be compiled off the event loop.
+
+    :param directory: Directory holding the marshalled bytecode, created if needed; None keeps the cache in
+        memory only.
+    :type directory: str, optional
+    :param max_size: Maximum number of code objects kept in memory.
+    :type max_size: int
+    :raises PermissionError: If the directory exists but is not private to the current user.
+    """
+
+    def __init__(self, directory: str | None = None, max_size: int = 256):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._code: OrderedDict[str, CodeType] = OrderedDict()
+        # Guards the in-memory LRU and the counters; compiling and file I/O happen outside it.
+        self._lock = threading.Lock()
+        if directory is not None:
+            ensure_private_directory(directory)
+
+    @staticmethod
+    def digest(source: str) -> str:
+        """
+        Return the cache key of a source: the hex SHA-256 of its UTF-8 encoding.
+
+        :param source: The source code.
+        :type source: str
+        :return: The cache key.
+        :rtype: str
+        """
+        return hashlib.sha256(source.encode()).hexdigest()
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, f"{digest}.{sys.implementation.cache_tag}.bin")
+
+    def _remember(self, digest: str, code: CodeType) -> None:
+        with self._lock:
+            self._code[digest] = code
+            self._code.move_to_end(digest)
+            while len(self._code) > self.max_size:
+                self._code.popitem(last=False)
+
+    def _read(self, path: str) -> CodeType | None:
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+        if data[:len(importlib.util.MAGIC_NUMBER)] != importlib.util.MAGIC_NUMBER:
+            return None
+        try:
+            code = marshal.loads(data[len(importlib.util.MAGIC_NUMBER):])
+        except (EOFError, ValueError, TypeError):
+            return None
+        return code if isinstance(code, CodeType) else None
+
+    def _write(self, path: str, code: CodeType) -> None:
+        temporary_path = None
+        try:
+            descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(importlib.util.MAGIC_NUMBER + marshal.dumps(code))
+            # Atomic, so concurrent readers see either no file or a complete one.
+            os.replace(temporary_path, path)
+        except OSError as e:
+            print(f"Failed to write compiled code to {path}: {str(e)}")
+            if temporary_path is not None and os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def get(self, source: str) -> CodeType:
+        """
+        Return the compiled code of a source, from memory, from disk or by compiling it.
+
+        :param source: The source code.
+        :type source: str
+        :return: The code object of the module.
+        :rtype: CodeType
+        :raises SyntaxError: If the source does not compile.
+        """
+        digest = self.digest(source)
+        with self._lock:
+            code = self._code.get(digest)
+            if code is not None:
+                self._code.move_to_end(digest)
+                self.hits += 1
+                return code
+        if self.directory is not None:
+            code = self._read(self._path(digest))
+        if code is None:
+            with self._lock:
+                self.misses += 1
+            code = compile(source, f"<cloud function {digest[:12]}>", 'exec')
+            if self.directory is not None:
+                self._write(self._path(digest), code)
+        else:
+            with self._lock:
+                self.hits += 1
+        self._remember(digest, code)
+        return code
+
+    def invalidate(self, source: str) -> None:
+        """
+        Drop the compiled code of a source, in memory and on disk.
+
+        :param source: The source code that is no longer deployed.
+        :type source: str
+        """
+        digest = self.digest(source)
+        with self._lock:
+            self._code.pop(digest, None)
+        if self.directory is not None:
+            try:
+                os.remove(self._path(digest))
+            except FileNotFoundError:
+                pass
+
+    def preload(self) -> int:
+        """
+        Load the most recently written bytecode files into memory, up to ``max_size``, e.g. when a worker
+        starts, so its first invocations neither compile nor read from disk.
+
+        :return: The number of code objects loaded.
+        :rtype: int
+        """
+        if self.directory is None:
+            return 0
+        suffix = f".{sys.implementation.cache_tag}.bin"
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(suffix):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.name[:-len(suffix)], entry.path))
+                    except OSError:
+                        continue
+        loaded = 0
+        # Oldest first, so the most recent files end up most recently used.
+        for _, digest, path in sorted(entries)[-self.max_size:]:
+            code = self._read(path)
+            if code is not None:
+                self._remember(digest, code)
+                loaded += 1
+        return loaded
@@ -0,0 +1,178 @@
+# infrastructure/execution/worker.py
+from __future__ import annotations
+
+import asyncio
+import inspect
+import os
+import signal
+import traceback
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from multiprocessing.connection import Connection
+from typing import Any
+
+from statikk.infrastructure.execution.code_cache import CodeCache
+
+try:
+    import resource
+except ImportError:  # Not available on Windows: memory limits are not enforced there.
+    resource = None
+
+# Name of the function each cloud function's code must define; it is called with the invocation payload.
+ENTRY_POINT = 'handler'
+
+# Environment variables workers keep; the others, like secrets meant for the API process, are removed.
+WORKER_ENVIRONMENT = ('PATH', 'HOME', 'LANG', 'LC_ALL', 'LC_CTYPE', 'TZ', 'TMPDIR')
+
+
+def load_handler(code: str, code_cache: CodeCache) -> Callable[[Any], Any]:
+    """
+    Run a cloud function's code in a fresh namespace and return its entry point.
+
+    The namespace is fresh but the process is not: the code gets full builtins and can import anything,
+    including modules other functions loaded and changed in this worker. There is no isolation between
+    functions sharing a worker.
+
+    :param code: The source code of the cloud function.
+    :type code: str
+    :param code_cache: The cache providing the compiled code.
+    :type code_cache: CodeCache
+    :return: The function's ``handler``.
+    :rtype: Callable[[Any], Any]
+    :raises SyntaxError: If the code does not compile.
+    :raises TypeError: If the code does not define a callable ``handler``.
+    """
+    namespace: dict[str, Any] = {'__name__': 'cloud_function', '__builtins__': __builtins__}
+    exec(code_cache.get(code), namespace)
+    handler = namespace.get(ENTRY_POINT)
+    if not callable(handler):
+        raise TypeError(f"Cloud function code must define a {ENTRY_POINT}(payload) function.")
+    return handler
+
+
+def cap_address_space(limit: int | None) -> None:
+    """
+    Set both the soft and the hard limit of this process's address space for good; the hard limit cannot
+    be raised again, even by function code.
+
+    :param limit: Maximum address space in bytes, or None for no cap.
+    :type limit: Optional[int]
+    """
+    if limit is not None and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def clean_environment() -> None:
+    """
+    Remove from this process's environment every variable but those in ``WORKER_ENVIRONMENT``.
+    """
+    kept = {name: os.environ[name] for name in WORKER_ENVIRONMENT if name in os.environ}
+    os.environ.clear()
+    os.environ.update(kept)
+
+
+@contextmanager
+def address_space_limit(limit: int | None) -> Iterator[None]:
+    """
+    Cap the address space of this process while the block runs; allocations beyond it raise MemoryError.
+
+    Only the soft limit is lowered, so it can be restored afterwards; code in the block could raise it up to
+    the hard limit, which ``cap_address_space`` sets.
+
+    :param limit: Maximum address space in bytes, or None for no cap.
+    :type limit: Optional[int]
+    """
+    if limit is None or resource is None:
+        yield
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    resource.setrlimit(resource.RLIMIT_AS, (limit if hard == resource.RLIM_INFINITY else min(limit, hard), hard))
+    try:
+        yield
+    finally:
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def _error(e: BaseException, status: str = 'error') -> tuple[str, str, str, str]:
+    return status, type(e).__name__, str(e), traceback.format_exc()
+
+
+def serve(
+    connection: Connection, max_loaded: int, code_cache_directory: str | None = None, memory_limit: int | None = None,
+) -> None:
+    """
+    Main loop of a worker process: run invocations received on ``connection`` until told to stop.
+
+    Each message is ``(key, code, payload, memory_limit)``. The worker keeps the handlers of the last
+    ``max_loaded`` function versions it ran, keyed by ``key``, so ``code`` is only sent the first time;
+    when it is None and the handler is not loaded, the worker answers ``('missing',)`` and the pool sends
+    the code. Replies are ``('ok', result)``, ``('error', type, message, traceback)`` when the handler
+    raised, or ``('load_error', type, message, traceback)`` when the code could not be loaded. A None
+    message, or the pool closing its end, stops the worker.
+
+    Code is compiled through a ``CodeCache`` on ``code_cache_directory``, warmed from it at startup, so a
+    new worker loads the bytecode other processes already compiled instead of compiling it again.
+
+    Before any function code runs, the environment is reduced to ``WORKER_ENVIRONMENT`` and the address
+    space is capped to ``memory_limit``.
+
+    :param connection: The worker's end of the pipe to the pool.
+    :type connection: Connection
+    :param max_loaded: Maximum number of function versions kept compiled.
+    :type max_loaded: int
+    :param code_cache_directory: Directory of the marshalled bytecode shared with other processes.
+    :type code_cache_directory: str, optional
+    :param memory_limit: Hard cap on the worker's address space, in bytes, set before any function code runs.
+    :type memory_limit: Optional[int]
+    """
+    # Interrupts are for the parent process, which shuts the workers down itself.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    clean_environment()
+    cap_address_space(memory_limit)
+    code_cache = CodeCache(code_cache_directory, max_size=max_loaded)
+    code_cache.preload()
+    handlers: OrderedDict[str, Callable[[Any], Any]] = OrderedDict()
+    while True:
+        try:
+            message = connection.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+        key, code, payload, memory_limit = message
+
+        handler = handlers.get(key)
+        if handler is not None:
+            handlers.move_to_end(key)
+        elif code is None:
+            connection.send(('missing',))
+            continue
+        else:
+            try:
+                handler = load_handler(code, code_cache)
+            except BaseException as e:
+                connection.send(_error(e, 'load_error'))
+                continue
+            handlers[key] = handler
+            if len(handlers) > max_loaded:
+                handlers.popitem(last=False)
+
+        try:
+            with address_space_limit(memory_limit):
+                result = handler(payload)
+                if inspect.isawaitable(result):
+                    result = asyncio.run(_await(result))
+            reply = ('ok', result)
+        except BaseException as e:
+            reply = _error(e)
+        try:
+            connection.send(reply)
+        except Exception as e:
+            # The result could not be pickled back to the pool.
+            connection.send(_error(e))
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
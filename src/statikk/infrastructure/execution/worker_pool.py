@@ -0,0 +1,246 @@
+# infrastructure/execution/worker_pool.py
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from collections import OrderedDict
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import ForkingPickler
+from typing import Any
+
+from statikk.core.domain.exceptions import FunctionExecutionError
+from statikk.infrastructure.execution.worker import serve
+
+# Messages up to this size are written straight from the event loop: an idle worker has drained its pipe,
+# whose buffer holds at least this much, so the write cannot block. Larger ones are written from a thread.
+INLINE_SEND_LIMIT = 16 * 1024
+
+
+class _Worker:
+    """
+    A worker process, the pool's end of its pipe and the function versions it has loaded.
+
+    :param process: The worker process.
+    :type process: multiprocessing.Process
+    :param connection: The pool's end of the pipe to the worker.
+    :type connection: Connection
+    """
+
+    def __init__(self, process: multiprocessing.Process, connection: Connection):
+        self.process = process
+        self.connection = connection
+        # Mirrors the worker's own LRU of loaded handlers, so code is only sent to workers lacking it.
+        self.loaded: OrderedDict[str, None] = OrderedDict()
+
+    def kill(self) -> None:
+        self.connection.close()
+        self.process.kill()
+        self.process.join()
+
+
+class WorkerPool:
+    """
+    Pool of pre-started worker processes running cloud function code.
+
+    Workers are started once, so invocations do not pay for interpreter startup, and each keeps the
+    compiled handlers of the functions it recently ran. Every invocation runs alone in a worker process,
+    apart from the API process and from other invocations running at the same time; invocations beyond
+    ``size`` wait for a worker to become idle.
+
+    This is not a sandbox. Function code runs with full builtins and the worker's privileges, and the
+    workers are shared by every function: code can import modules, touch the file system, and see or change
+    module state left behind by other functions that ran in the same worker. Only run code from trusted
+    authors; the API only lets trusted callers deploy and invoke functions, which is why workers are shared
+    rather than given to each function or tenant. Workers drop every environment variable but a few
+    harmless ones (see ``WORKER_ENVIRONMENT``) before running any function code, so secrets passed to the
+    API process through its environment are not handed to function code.
+
+    A worker that times out or dies is killed and replaced in the background, so one runaway function
+    cannot take a worker out of the pool for good. Starting, stopping and writing large messages to workers
+    happen in threads, so they never block the event loop.
+
+    :param size: Number of worker processes.
+    :type size: int
+    :param max_loaded: Maximum number of function versions each worker keeps compiled.
+    :type max_loaded: int
+    :param code_cache_directory: Directory of the marshalled bytecode the workers share, see ``CodeCache``;
+        None keeps each worker's compiled code in its own memory.
+    :type code_cache_directory: str, optional
+    :param start_method: The multiprocessing start method; ``forkserver`` where available, so workers
+        do not inherit the API process's sockets and threads.
+    :type start_method: str, optional
+    :param memory_limit: Hard cap on each worker's address space, in bytes, set before it runs any function
+        code. Unlike the limit given to ``run``, function code cannot raise it.
+    :type memory_limit: Optional[int]
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        max_loaded: int = 128,
+        code_cache_directory: str | None = None,
+        start_method: str | None = None,
+        memory_limit: int | None = None,
+    ):
+        if size < 1:
+            raise ValueError('A worker pool needs at least one worker.')
+        self.size = size
+        self.max_loaded = max_loaded
+        self.code_cache_directory = code_cache_directory
+        self.memory_limit = memory_limit
+        if start_method is None:
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        self._context = multiprocessing.get_context(start_method)
+        self._workers: list[_Worker] = []
+        self._idle: asyncio.Queue[_Worker] | None = None
+        # Background replacements of workers that timed out, died or were interrupted.
+        self._recycling: set[asyncio.Task] = set()
+
+    def _spawn(self) -> _Worker:
+        connection, child_connection = self._context.Pipe()
+        process = self._context.Process(
+            target=serve,
+            args=(child_connection, self.max_loaded, self.code_cache_directory, self.memory_limit),
+            name='statikk-function-worker',
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        worker = _Worker(process, connection)
+        self._workers.append(worker)
+        return worker
+
+    async def _recycle(self, idle: asyncio.Queue[_Worker], worker: _Worker, replace: bool) -> None:
+        if worker in self._workers:
+            self._workers.remove(worker)
+        await asyncio.to_thread(worker.kill)
+        if replace and self._idle is idle:
+            replacement = await asyncio.to_thread(self._spawn)
+            if self._idle is idle:
+                idle.put_nowait(replacement)
+            else:
+                self._workers.remove(replacement)
+                await asyncio.to_thread(replacement.kill)
+
+    def _release(self, idle: asyncio.Queue[_Worker], worker: _Worker, replace: bool) -> None:
+        if not replace and self._idle is idle:
+            idle.put_nowait(worker)
+            return
+        # Replaced, or the pool was closed while the function ran.
+        task = asyncio.ensure_future(self._recycle(idle, worker, replace))
+        self._recycling.add(task)
+        task.add_done_callback(self._recycling.discard)
+
+    async def start(self) -> None:
+        """
+        Start the worker processes.
+        """
+        if self._idle is not None:
+            return
+        self._idle = asyncio.Queue()
+        for _ in range(self.size):
+            self._idle.put_nowait(await asyncio.to_thread(self._spawn))
+
+    async def run(self, key: str, code: str, payload: Any, timeout: float, memory_limit: int | None = None) -> Any:
+        """
+        Run a cloud function in an idle worker, waiting for one if all are busy.
+
+        :param key: Identifies the function version; workers reuse the handler compiled for a key.
+        :type key: str
+        :param code: The source code of the function.
+        :type code: str
+        :param payload: The argument passed to the function's handler; must be picklable.
+        :type payload: Any
+        :param timeout: Seconds the function may run, not counting the wait for a worker.
+        :type timeout: float
+        :param memory_limit: Maximum address space of the worker while the function runs, in bytes.
+        :type memory_limit: Optional[int]
+        :return: The value returned by the handler.
+        :rtype: Any
+        :raises RuntimeError: If the pool is not started.
+        :raises TimeoutError: If the function ran longer than ``timeout``.
+        :raises FunctionExecutionError: If the function failed or its worker died.
+        """
+        idle = self._idle
+        if idle is None:
+            raise RuntimeError('The worker pool is not started.')
+        worker = await idle.get()
+        replace = True
+        try:
+            reply = await self._call(worker, key, code, payload, timeout, memory_limit)
+            replace = False
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Cloud function {key} did not finish within {timeout} seconds.")
+        except (EOFError, OSError) as e:
+            raise FunctionExecutionError(f"The worker running cloud function {key} exited.") from e
+        finally:
+            # Otherwise cancelled mid-call, or unable to send: the worker's reply would be read by the next
+            # invocation, so it is replaced too.
+            self._release(idle, worker, replace)
+        if reply[0] != 'ok':
+            _, error_type, message, traceback = reply
+            raise FunctionExecutionError(f"{error_type}: {message}", error_type, traceback)
+        return reply[1]
+
+    async def _call(
+        self, worker: _Worker, key: str, code: str, payload: Any, timeout: float, memory_limit: int | None,
+    ) -> tuple:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        loaded = key in worker.loaded
+        await self._send(worker, (key, None if loaded else code, payload, memory_limit))
+        reply = await self._receive(worker, deadline - loop.time())
+        if reply[0] == 'missing':
+            await self._send(worker, (key, code, payload, memory_limit))
+            reply = await self._receive(worker, deadline - loop.time())
+        if reply[0] != 'load_error':
+            worker.loaded[key] = None
+            worker.loaded.move_to_end(key)
+            if len(worker.loaded) > self.max_loaded:
+                worker.loaded.popitem(last=False)
+        return reply
+
+    @staticmethod
+    async def _send(worker: _Worker, message: tuple) -> None:
+        # Pickled here, as Connection.send would, to tell whether the write may block.
+        data = bytes(ForkingPickler.dumps(message))
+        if len(data) <= INLINE_SEND_LIMIT:
+            worker.connection.send_bytes(data)
+        else:
+            await asyncio.to_thread(worker.connection.send_bytes, data)
+
+    async def _receive(self, worker: _Worker, timeout: float) -> tuple:
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        fd = worker.connection.fileno()
+        loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+        try:
+            await asyncio.wait_for(ready, max(timeout, 0))
+        finally:
+            loop.remove_reader(fd)
+        return worker.connection.recv()
+
+    async def close(self) -> None:
+        """
+        Stop the worker processes, killing those that do not exit promptly.
+        """
+        if self._idle is None:
+            return
+        self._idle = None
+        await asyncio.gather(*self._recycling, return_exceptions=True)
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            try:
+                worker.connection.send(None)
+            except OSError:
+                pass
+        await asyncio.to_thread(_join, workers)
+
+
+def _join(workers: list[_Worker], timeout: float = 1.0) -> None:
+    for worker in workers:
+        worker.process.join(timeout)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        worker.connection.close()
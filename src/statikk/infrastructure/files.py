@@ -0,0 +1,33 @@
+# infrastructure/files.py
+from __future__ import annotations
+
+import os
+import stat
+
+
+def ensure_private_directory(path: str) -> str:
+    """
+    Create a directory only the current user can access, or check that an existing one is.
+
+    Files read back from such a directory, like marshalled bytecode that gets executed, can only have been
+    written by this user. A directory that another user owns, that others can access, or that is a symlink
+    is refused rather than fixed, since someone else may already have written to it.
+
+    :param path: The directory.
+    :type path: str
+    :return: The directory.
+    :rtype: str
+    :raises PermissionError: If the directory exists but is not private to the current user.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    status = os.lstat(path)
+    if not stat.S_ISDIR(status.st_mode):
+        raise PermissionError(f"{path} is not a directory.")
+    if not hasattr(os, 'getuid'):
+        # Windows: ownership and access are governed by ACLs, not checked here.
+        return path
+    if status.st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by another user.")
+    if status.st_mode & 0o077:
+        raise PermissionError(f"{path} is accessible to other users; expected mode 0700.")
+    return path
@@ -0,0 +1,141 @@
+# infrastructure/scheduling/timing_wheel.py
+from __future__ import annotations
+
+import itertools
+import math
+from typing import Any
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel holding items until their deadline.
+
+    Time advances in ticks of ``tick`` seconds. Level 0 has ``wheel_size`` slots of one tick each, and each
+    level above has as many slots, each as wide as a whole revolution of the level below; levels are added
+    as far deadlines need them. An item is filed in the lowest level whose span covers its deadline. When a
+    higher-level slot comes due, its items cascade down to the level below, so each item is moved at most
+    once per level. Scheduling, cancelling and each tick are O(1) amortized, however many items are held.
+
+    :param start: The current time, in seconds.
+    :type start: float
+    :param tick: Length of a tick, in seconds; deadlines are rounded down to a tick.
+    :type tick: float
+    :param wheel_size: Number of slots per level.
+    :type wheel_size: int
+    """
+
+    def __init__(self, start: float, tick: float = 1.0, wheel_size: int = 64):
+        if tick <= 0 or wheel_size < 2:
+            raise ValueError('A timing wheel needs a positive tick and at least two slots per level.')
+        self.tick = tick
+        self.wheel_size = wheel_size
+        self._now = math.floor(start / tick)
+        self._levels: list[list[dict[int, tuple[int, Any]]]] = []
+        self._due: dict[int, tuple[int, Any]] = {}
+        # Slot holding each scheduled item, so it can be cancelled without a search.
+        self._slots: dict[int, dict[int, tuple[int, Any]]] = {}
+        self._handles = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @property
+    def time(self) -> float:
+        """
+        The time the wheel has advanced to, in seconds.
+        """
+        return self._now * self.tick
+
+    def _file(self, handle: int, deadline: int, item: Any) -> None:
+        delta = deadline - self._now
+        if delta <= 0:
+            slot = self._due
+        else:
+            level = 0
+            span = self.wheel_size
+            while delta >= span:
+                level += 1
+                span *= self.wheel_size
+            while len(self._levels) <= level:
+                self._levels.append([{} for _ in range(self.wheel_size)])
+            width = span // self.wheel_size
+            slot = self._levels[level][deadline // width % self.wheel_size]
+        slot[handle] = (deadline, item)
+        self._slots[handle] = slot
+
+    def schedule(self, deadline: float, item: Any) -> int:
+        """
+        Hold an item until a deadline; items whose deadline has passed are returned by the next ``advance``.
+
+        :param deadline: The time the item is due, in seconds.
+        :type deadline: float
+        :param item: The item.
+        :type item: Any
+        :return: A handle to cancel the item with.
+        :rtype: int
+        """
+        handle = next(self._handles)
+        self._file(handle, math.floor(deadline / self.tick), item)
+        return handle
+
+    def cancel(self, handle: int) -> bool:
+        """
+        Drop a scheduled item.
+
+        :param handle: The handle returned by ``schedule``.
+        :type handle: int
+        :return: Whether the item was still scheduled.
+        :rtype: bool
+        """
+        slot = self._slots.pop(handle, None)
+        if slot is None:
+            return False
+        del slot[handle]
+        return True
+
+    def advance(self, now: float) -> list[Any]:
+        """
+        Advance the wheel to a time and return the items that came due, in deadline order.
+
+        :param now: The current time, in seconds; a time before the wheel's is ignored.
+        :type now: float
+        :return: The items whose deadline is at or before ``now``.
+        :rtype: List[Any]
+        """
+        target = math.floor(now / self.tick)
+        while self._now < target:
+            if not self._slots or len(self._due) == len(self._slots):
+                # Nothing left in the wheel: skip the empty ticks.
+                self._now = target
+                break
+            self._now += 1
+            self._cascade()
+            slot = self._levels[0][self._now % self.wheel_size]
+            for handle, entry in slot.items():
+                self._due[handle] = entry
+                self._slots[handle] = self._due
+            slot.clear()
+        due = sorted(self._due.items(), key=lambda entry: (entry[1][0], entry[0]))
+        for handle, _ in due:
+            del self._slots[handle]
+        self._due.clear()
+        return [item for _, (_, item) in due]
+
+    def _cascade(self) -> None:
+        # From the highest level whose slot boundary this tick crosses down to level 1, move that slot's
+        # items down; they land in lower levels, or among the due items.
+        width = 1
+        crossed = 0
+        for level in range(1, len(self._levels)):
+            width *= self.wheel_size
+            if self._now % width:
+                break
+            crossed = level
+        width = self.wheel_size ** crossed
+        for level in range(crossed, 0, -1):
+            slot = self._levels[level][self._now // width % self.wheel_size]
+            entries = list(slot.items())
+            slot.clear()
+            for handle, (deadline, item) in entries:
+                self._file(handle, deadline, item)
+            width //= self.wheel_size
@@ -0,0 +1,83 @@
+# interfaces/api/controllers/authz_controller.py
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import HTTPException
+from pydantic import BaseModel
+from pydantic import Field
+from statikk.core.application.services.organization_service import OrganizationService
+from statikk.core.domain.value_objects.permissions import Permission
+from statikk.interfaces.api.dependencies import get_organization_service
+from statikk.interfaces.api.dependencies import require_trusted_caller
+from statikk.interfaces.api.responses import ORJSONRoute
+
+# The checks are run for the user named in the body, so only trusted services, which authenticated that
+# user themselves, may call these routes.
+router = APIRouter(dependencies=[Depends(require_trusted_caller)], route_class=ORJSONRoute)
+
+# Maximum number of checks accepted in one batch.
+MAX_BATCH_SIZE = 1000
+
+# Pydantic models for request and response bodies
+
+
+class PermissionCheck(BaseModel):
+    organization_id: str
+    permission: str
+
+
+class BatchCheckRequest(BaseModel):
+    user_id: str
+    checks: list[PermissionCheck] = Field(max_length=MAX_BATCH_SIZE)
+
+
+class PermissionCheckResult(BaseModel):
+    organization_id: str
+    permission: str
+    allowed: bool
+    error: str | None = None
+
+
+class BatchCheckResponse(BaseModel):
+    results: list[PermissionCheckResult]
+
+
+@router.post('/authz/batch', response_model=BatchCheckResponse)
+async def check_permissions(request: BatchCheckRequest, service: OrganizationService = Depends(get_organization_service)):
+    """
+    Check many permissions of a user in one call, e.g. to decide which actions a page offers.
+
+    Each organization involved is loaded at most once, however many checks refer to it. Checks against an
+    organization that does not exist are denied, and those against an organization that could not be
+    loaded, e.g. because its ID is malformed, are denied with the error, without failing the other checks.
+
+    Only trusted callers presenting the container's ``authz_token`` may call it, since it answers for any
+    user.
+
+    :param request: The request body containing the user's ID and the checks to run.
+    :type request: BatchCheckRequest
+    :param service: The service used to handle organization-related operations.
+    :type service: OrganizationService
+    :return: The outcome of each check, in request order.
+    :rtype: BatchCheckResponse
+    """
+    try:
+        allowed = await service.check_permissions(
+            request.user_id,
+            [(check.organization_id, Permission(check.permission)) for check in request.checks],
+            return_exceptions=True,
+        )
+        return BatchCheckResponse(
+            results=[
+                PermissionCheckResult(
+                    organization_id=check.organization_id,
+                    permission=check.permission,
+                    allowed=a is True,
+                    error=str(a) if isinstance(a, BaseException) else None,
+                )
+                for check, a in zip(request.checks, allowed)
+            ],
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
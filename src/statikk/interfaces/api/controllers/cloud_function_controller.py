@@ -1,16 +1,36 @@
 from __future__ import annotations
 
+from typing import Any
 from typing import List
 
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
+from fastapi import Request
 from fastapi import status
 from pydantic import BaseModel
+from statikk.core.application.services.cloud_function_runtime import CloudFunctionRuntime
 from statikk.core.application.services.cloud_function_service import CloudFunctionService
+from statikk.core.domain.entities.cloud_function import CloudFunction
+from statikk.core.domain.exceptions import ConcurrentUpdateError
+from statikk.core.domain.exceptions import FunctionExecutionError
+from statikk.interfaces.api.dependencies import get_cloud_function_runtime
+from statikk.interfaces.api.dependencies import get_cloud_function_service
+from statikk.interfaces.api.dependencies import require_trusted_caller
+from statikk.interfaces.api.dependencies import unit_of_work
+from statikk.interfaces.api.pagination import encode_cursor
+from statikk.interfaces.api.pagination import Page
+from statikk.interfaces.api.pagination import page_params
+from statikk.interfaces.api.pagination import PageParams
+from statikk.interfaces.api.responses import entity_response
+from statikk.interfaces.api.responses import ORJSONRoute
+from statikk.interfaces.api.responses import page_response
+from statikk.interfaces.api.streaming import ndjson_response
+from statikk.interfaces.api.streaming import NDJSON_RESPONSES
+from statikk.interfaces.api.streaming import wants_ndjson
 
 # Initialize the APIRouter for cloud functions
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(unit_of_work)], route_class=ORJSONRoute)
 
 # Pydantic models for request and response bodies
 
@@ -28,10 +48,24 @@ class CloudFunctionResponse(BaseModel):
     triggers: list[str]
 
 
-@router.post('/cloud_functions', response_model=CloudFunctionResponse, status_code=status.HTTP_201_CREATED)
-async def create_cloud_function(request: CloudFunctionRequest, service: CloudFunctionService = Depends()):
+class InvokeRequest(BaseModel):
+    payload: Any = None
+
+
+class InvokeResponse(BaseModel):
+    function_id: str
+    result: Any
+
+
+@router.post(
+    '/cloud_functions', response_model=CloudFunctionResponse, status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_trusted_caller)],
+)
+async def create_cloud_function(
+    request: CloudFunctionRequest, service: CloudFunctionService = Depends(get_cloud_function_service),
+):
     """
-    Create a new cloud function.
+    Create a new cloud function. Restricted to trusted callers: the code runs unsandboxed in the workers.
 
     :param request: The request body containing the cloud function's name, code, and triggers.
     :type request: CloudFunctionRequest
@@ -41,19 +75,14 @@ async def create_cloud_function(request: CloudFunctionRequest, service: CloudFun
     :rtype: CloudFunctionResponse
     """
     try:
-        cloud_function = service.create_cloud_function(name=request.name, code=request.code, triggers=request.triggers)
-        return CloudFunctionResponse(
-            function_id=str(cloud_function.function_id),
-            name=cloud_function.name,
-            code=cloud_function.code,
-            triggers=cloud_function.triggers,
-        )
+        cloud_function = await service.create_cloud_function(name=request.name, code=request.code, triggers=request.triggers)
+        return CloudFunctionResponse(**cloud_function.to_dict())
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get('/cloud_functions/{function_id}', response_model=CloudFunctionResponse)
-async def get_cloud_function(function_id: str, service: CloudFunctionService = Depends()):
+async def get_cloud_function(function_id: str, service: CloudFunctionService = Depends(get_cloud_function_service)):
     """
     Retrieve a cloud function by its unique identifier.
 
@@ -66,23 +95,22 @@ async def get_cloud_function(function_id: str, service: CloudFunctionService = D
     :raises HTTPException: If the cloud function does not exist.
     """
     try:
-        cloud_function = service.get_cloud_function(function_id)
-        return CloudFunctionResponse(
-            function_id=str(cloud_function.function_id),
-            name=cloud_function.name,
-            code=cloud_function.code,
-            triggers=cloud_function.triggers,
-        )
+        cloud_function = await service.get_cloud_function(function_id)
+        return entity_response(cloud_function, CloudFunctionResponse)
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Cloud function not found')
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.put('/cloud_functions/{function_id}', response_model=CloudFunctionResponse)
-async def update_cloud_function(function_id: str, request: CloudFunctionRequest, service: CloudFunctionService = Depends()):
+@router.put(
+    '/cloud_functions/{function_id}', response_model=CloudFunctionResponse, dependencies=[Depends(require_trusted_caller)],
+)
+async def update_cloud_function(
+    function_id: str, request: CloudFunctionRequest, service: CloudFunctionService = Depends(get_cloud_function_service),
+):
     """
-    Update an existing cloud function.
+    Update an existing cloud function. Restricted to trusted callers.
 
     :param function_id: The unique ID of the cloud function.
     :type function_id: str
@@ -95,27 +123,26 @@ async def update_cloud_function(function_id: str, request: CloudFunctionRequest,
     :raises HTTPException: If the cloud function does not exist.
     """
     try:
-        updated_cloud_function = service.update_cloud_function(
+        updated_cloud_function = await service.update_cloud_function(
             function_id=function_id,
             new_code=request.code,
             triggers=request.triggers,
         )
-        return CloudFunctionResponse(
-            function_id=str(updated_cloud_function.function_id),
-            name=updated_cloud_function.name,
-            code=updated_cloud_function.code,
-            triggers=updated_cloud_function.triggers,
-        )
+        return CloudFunctionResponse(**updated_cloud_function.to_dict())
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Cloud function not found')
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.delete('/cloud_functions/{function_id}', status_code=status.HTTP_204_NO_CONTENT)
-async def delete_cloud_function(function_id: str, service: CloudFunctionService = Depends()):
+@router.delete(
+    '/cloud_functions/{function_id}', status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(require_trusted_caller)],
+)
+async def delete_cloud_function(function_id: str, service: CloudFunctionService = Depends(get_cloud_function_service)):
     """
-    Delete a cloud function by its unique identifier.
+    Delete a cloud function by its unique identifier. Restricted to trusted callers.
 
     :param function_id: The unique ID of the cloud function to delete.
     :type function_id: str
@@ -124,32 +151,72 @@ async def delete_cloud_function(function_id: str, service: CloudFunctionService
     :raises HTTPException: If the cloud function does not exist.
     """
     try:
-        service.delete_cloud_function(function_id)
+        await service.delete_cloud_function(function_id)
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Cloud function not found')
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get('/cloud_functions', response_model=list[CloudFunctionResponse])
-async def list_cloud_functions(service: CloudFunctionService = Depends()):
+@router.post(
+    '/cloud_functions/{function_id}/invoke', response_model=InvokeResponse, dependencies=[Depends(require_trusted_caller)],
+)
+async def invoke_cloud_function(
+    function_id: str, request: InvokeRequest, runtime: CloudFunctionRuntime = Depends(get_cloud_function_runtime),
+):
+    """
+    Run a cloud function with a payload and return its result. Restricted to trusted callers.
+
+    :param function_id: The unique ID of the cloud function.
+    :type function_id: str
+    :param request: The request body containing the payload passed to the function's handler.
+    :type request: InvokeRequest
+    :param runtime: The runtime running cloud functions.
+    :type runtime: CloudFunctionRuntime
+    :return: The value returned by the function.
+    :rtype: InvokeResponse
+    :raises HTTPException: If the cloud function does not exist, fails or times out.
     """
-    List all cloud functions.
+    try:
+        result = await runtime.invoke(function_id, request.payload)
+        return InvokeResponse(function_id=function_id, result=result)
+    except KeyError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Cloud function not found')
+    except FunctionExecutionError as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(e))
+    except TimeoutError as e:
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _cloud_function_response(cloud_function: CloudFunction) -> CloudFunctionResponse:
+    return CloudFunctionResponse(**cloud_function.to_dict())
+
+
+@router.get('/cloud_functions', response_model=Page[CloudFunctionResponse], responses=NDJSON_RESPONSES)
+async def list_cloud_functions(
+    request: Request, page: PageParams = Depends(page_params),
+    service: CloudFunctionService = Depends(get_cloud_function_service),
+):
+    """
+    List cloud functions, one page at a time.
+
+    With ``Accept: application/x-ndjson``, every cloud function after the cursor is streamed instead, one per line.
 
+    :param request: The incoming request, used to negotiate the response format.
+    :type request: Request
+    :param page: The page size and the cursor returned by the previous page.
+    :type page: PageParams
     :param service: The service used to handle cloud function-related operations.
     :type service: CloudFunctionService
-    :return: A list of all cloud functions.
-    :rtype: List[CloudFunctionResponse]
+    :return: A page of cloud functions and the cursor of the next page.
+    :rtype: Page[CloudFunctionResponse]
     """
+    if wants_ndjson(request):
+        return ndjson_response(service.iter_all_cloud_functions(after=page.after), _cloud_function_response)
     try:
-        cloud_functions = service.list_all_cloud_functions()
-        return [
-            CloudFunctionResponse(
-                function_id=str(cf.function_id),
-                name=cf.name,
-                code=cf.code,
-                triggers=cf.triggers,
-            ) for cf in cloud_functions
-        ]
+        cloud_functions, after = await service.list_cloud_functions_page(page.limit, after=page.after)
+        return page_response(cloud_functions, CloudFunctionResponse, encode_cursor(after))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -6,12 +6,27 @@ from typing import List
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
+from fastapi import Request
 from fastapi import status
 from pydantic import BaseModel
 from statikk.core.application.services.collection_service import CollectionService
+from statikk.core.domain.entities.collection import Collection
+from statikk.core.domain.exceptions import ConcurrentUpdateError
+from statikk.interfaces.api.dependencies import get_collection_service
+from statikk.interfaces.api.dependencies import unit_of_work
+from statikk.interfaces.api.pagination import encode_cursor
+from statikk.interfaces.api.pagination import Page
+from statikk.interfaces.api.pagination import page_params
+from statikk.interfaces.api.pagination import PageParams
+from statikk.interfaces.api.responses import entity_response
+from statikk.interfaces.api.responses import ORJSONRoute
+from statikk.interfaces.api.responses import page_response
+from statikk.interfaces.api.streaming import ndjson_response
+from statikk.interfaces.api.streaming import NDJSON_RESPONSES
+from statikk.interfaces.api.streaming import wants_ndjson
 
 # Initialize the APIRouter for collections
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(unit_of_work)], route_class=ORJSONRoute)
 
 # Pydantic models for request and response bodies
 
@@ -28,7 +43,7 @@ class CollectionResponse(BaseModel):
 
 
 @router.post('/collections', response_model=CollectionResponse, status_code=status.HTTP_201_CREATED)
-async def create_collection(request: CollectionRequest, service: CollectionService = Depends()):
+async def create_collection(request: CollectionRequest, service: CollectionService = Depends(get_collection_service)):
     """
     Create a new collection.
 
@@ -40,18 +55,14 @@ async def create_collection(request: CollectionRequest, service: CollectionServi
     :rtype: CollectionResponse
     """
     try:
-        collection = service.create_collection(name=request.name, schema=request.schema)
-        return CollectionResponse(
-            collection_id=str(collection.collection_id),
-            name=collection.name,
-            schema=collection.schema,
-        )
+        collection = await service.create_collection(name=request.name, schema=request.schema)
+        return CollectionResponse(**collection.to_dict())
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get('/collections/{collection_id}', response_model=CollectionResponse)
-async def get_collection(collection_id: str, service: CollectionService = Depends()):
+async def get_collection(collection_id: str, service: CollectionService = Depends(get_collection_service)):
     """
     Retrieve a collection by its unique identifier.
 
@@ -64,12 +75,8 @@ async def get_collection(collection_id: str, service: CollectionService = Depend
     :raises HTTPException: If the collection does not exist.
     """
     try:
-        collection = service.get_collection(collection_id)
-        return CollectionResponse(
-            collection_id=str(collection.collection_id),
-            name=collection.name,
-            schema=collection.schema,
-        )
+        collection = await service.get_collection(collection_id)
+        return entity_response(collection, CollectionResponse)
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Collection not found')
     except Exception as e:
@@ -77,7 +84,9 @@ async def get_collection(collection_id: str, service: CollectionService = Depend
 
 
 @router.put('/collections/{collection_id}', response_model=CollectionResponse)
-async def update_collection(collection_id: str, request: CollectionRequest, service: CollectionService = Depends()):
+async def update_collection(
+    collection_id: str, request: CollectionRequest, service: CollectionService = Depends(get_collection_service),
+):
     """
     Update an existing collection.
 
@@ -92,20 +101,18 @@ async def update_collection(collection_id: str, request: CollectionRequest, serv
     :raises HTTPException: If the collection does not exist.
     """
     try:
-        updated_collection = service.update_collection(collection_id, name=request.name, schema=request.schema)
-        return CollectionResponse(
-            collection_id=str(updated_collection.collection_id),
-            name=updated_collection.name,
-            schema=updated_collection.schema,
-        )
+        updated_collection = await service.update_collection(collection_id, name=request.name, schema=request.schema)
+        return CollectionResponse(**updated_collection.to_dict())
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Collection not found')
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.delete('/collections/{collection_id}', status_code=status.HTTP_204_NO_CONTENT)
-async def delete_collection(collection_id: str, service: CollectionService = Depends()):
+async def delete_collection(collection_id: str, service: CollectionService = Depends(get_collection_service)):
     """
     Delete a collection by its unique identifier.
 
@@ -116,31 +123,39 @@ async def delete_collection(collection_id: str, service: CollectionService = Dep
     :raises HTTPException: If the collection does not exist.
     """
     try:
-        service.delete_collection(collection_id)
+        await service.delete_collection(collection_id)
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Collection not found')
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get('/collections', response_model=list[CollectionResponse])
-async def list_collections(service: CollectionService = Depends()):
+def _collection_response(collection: Collection) -> CollectionResponse:
+    return CollectionResponse(**collection.to_dict())
+
+
+@router.get('/collections', response_model=Page[CollectionResponse], responses=NDJSON_RESPONSES)
+async def list_collections(
+    request: Request, page: PageParams = Depends(page_params), service: CollectionService = Depends(get_collection_service),
+):
     """
-    List all collections.
+    List collections, one page at a time.
+
+    With ``Accept: application/x-ndjson``, every collection after the cursor is streamed instead, one per line.
 
+    :param request: The incoming request, used to negotiate the response format.
+    :type request: Request
+    :param page: The page size and the cursor returned by the previous page.
+    :type page: PageParams
     :param service: The service used to handle collection-related operations.
     :type service: CollectionService
-    :return: A list of all collections.
-    :rtype: List[CollectionResponse]
+    :return: A page of collections and the cursor of the next page.
+    :rtype: Page[CollectionResponse]
     """
+    if wants_ndjson(request):
+        return ndjson_response(service.iter_all_collections(after=page.after), _collection_response)
     try:
-        collections = service.list_all_collections()
-        return [
-            CollectionResponse(
-                collection_id=str(c.collection_id),
-                name=c.name,
-                schema=c.schema,
-            ) for c in collections
-        ]
+        collections, after = await service.list_collections_page(page.limit, after=page.after)
+        return page_response(collections, CollectionResponse, encode_cursor(after))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -3,12 +3,29 @@ from __future__ import annotations
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
+from fastapi import Request
 from fastapi import status
 from pydantic import BaseModel
 from statikk.core.application.services.organization_service import OrganizationService
+from statikk.core.domain.entities.organization import Organization
+from statikk.core.domain.exceptions import ConcurrentUpdateError
+from statikk.interfaces.api.dependencies import get_organization_service
+from statikk.interfaces.api.dependencies import unit_of_work
+from statikk.interfaces.api.pagination import encode_cursor
+from statikk.interfaces.api.pagination import Page
+from statikk.interfaces.api.pagination import page_params
+from statikk.interfaces.api.pagination import PageParams
+from statikk.interfaces.api.responses import entity_response
+from statikk.interfaces.api.responses import list_response
+from statikk.interfaces.api.responses import ORJSONRoute
+from statikk.interfaces.api.responses import page_response
+from statikk.interfaces.api.responses import project
+from statikk.interfaces.api.streaming import ndjson_response
+from statikk.interfaces.api.streaming import NDJSON_RESPONSES
+from statikk.interfaces.api.streaming import wants_ndjson
 
 # Initialize the APIRouter for organizations
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(unit_of_work)], route_class=ORJSONRoute)
 
 # Pydantic models for request and response bodies
 
@@ -25,13 +42,19 @@ class OrganizationResponse(BaseModel):
     members: dict[str, str]
 
 
+class MembershipResponse(BaseModel):
+    organization_id: str
+    user_id: str
+    role: str
+
+
 class AddMemberRequest(BaseModel):
     user_id: str
     role: str
 
 
 @router.post('/organizations', response_model=OrganizationResponse, status_code=status.HTTP_201_CREATED)
-async def create_organization(request: OrganizationRequest, service: OrganizationService = Depends()):
+async def create_organization(request: OrganizationRequest, service: OrganizationService = Depends(get_organization_service)):
     """
     Create a new organization.
 
@@ -43,19 +66,45 @@ async def create_organization(request: OrganizationRequest, service: Organizatio
     :rtype: OrganizationResponse
     """
     try:
-        organization = service.create_organization(name=request.name, owner_id=request.owner_id)
-        return OrganizationResponse(
-            organization_id=str(organization.organization_id),
-            name=organization.name,
-            owner_id=str(organization.owner_id),
-            members={str(k): v for k, v in organization.members.items()},
-        )
+        organization = await service.create_organization(name=request.name, owner_id=request.owner_id)
+        return _organization_response(organization)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _organization_response(organization: Organization) -> OrganizationResponse:
+    return OrganizationResponse(**project(organization, OrganizationResponse))
+
+
+@router.get('/organizations', response_model=Page[OrganizationResponse], responses=NDJSON_RESPONSES)
+async def list_organizations(
+    request: Request, page: PageParams = Depends(page_params), service: OrganizationService = Depends(get_organization_service),
+):
+    """
+    List organizations, one page at a time.
+
+    With ``Accept: application/x-ndjson``, every organization after the cursor is streamed instead, one per line.
+
+    :param request: The incoming request, used to negotiate the response format.
+    :type request: Request
+    :param page: The page size and the cursor returned by the previous page.
+    :type page: PageParams
+    :param service: The service used to handle organization-related operations.
+    :type service: OrganizationService
+    :return: A page of organizations and the cursor of the next page.
+    :rtype: Page[OrganizationResponse]
+    """
+    if wants_ndjson(request):
+        return ndjson_response(service.iter_all_organizations(after=page.after), _organization_response)
+    try:
+        organizations, after = await service.list_organizations_page(page.limit, after=page.after)
+        return page_response(organizations, OrganizationResponse, encode_cursor(after))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get('/organizations/{organization_id}', response_model=OrganizationResponse)
-async def get_organization(organization_id: str, service: OrganizationService = Depends()):
+async def get_organization(organization_id: str, service: OrganizationService = Depends(get_organization_service)):
     """
     Retrieve an organization by its unique identifier.
 
@@ -68,13 +117,8 @@ async def get_organization(organization_id: str, service: OrganizationService =
     :raises HTTPException: If the organization does not exist.
     """
     try:
-        organization = service.get_organization(organization_id)
-        return OrganizationResponse(
-            organization_id=str(organization.organization_id),
-            name=organization.name,
-            owner_id=str(organization.owner_id),
-            members={str(k): v for k, v in organization.members.items()},
-        )
+        organization = await service.get_organization(organization_id)
+        return entity_response(organization, OrganizationResponse)
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Organization not found')
     except Exception as e:
@@ -82,7 +126,9 @@ async def get_organization(organization_id: str, service: OrganizationService =
 
 
 @router.put('/organizations/{organization_id}', response_model=OrganizationResponse)
-async def update_organization(organization_id: str, request: OrganizationRequest, service: OrganizationService = Depends()):
+async def update_organization(
+    organization_id: str, request: OrganizationRequest, service: OrganizationService = Depends(get_organization_service),
+):
     """
     Update an existing organization.
 
@@ -97,21 +143,18 @@ async def update_organization(organization_id: str, request: OrganizationRequest
     :raises HTTPException: If the organization does not exist.
     """
     try:
-        updated_organization = service.update_organization(organization_id, name=request.name)
-        return OrganizationResponse(
-            organization_id=str(updated_organization.organization_id),
-            name=updated_organization.name,
-            owner_id=str(updated_organization.owner_id),
-            members={str(k): v for k, v in updated_organization.members.items()},
-        )
+        updated_organization = await service.update_organization(organization_id, name=request.name)
+        return _organization_response(updated_organization)
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Organization not found')
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.delete('/organizations/{organization_id}', status_code=status.HTTP_204_NO_CONTENT)
-async def delete_organization(organization_id: str, service: OrganizationService = Depends()):
+async def delete_organization(organization_id: str, service: OrganizationService = Depends(get_organization_service)):
     """
     Delete an organization by its unique identifier.
 
@@ -122,7 +165,7 @@ async def delete_organization(organization_id: str, service: OrganizationService
     :raises HTTPException: If the organization does not exist.
     """
     try:
-        service.delete_organization(organization_id)
+        await service.delete_organization(organization_id)
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Organization not found')
     except Exception as e:
@@ -130,7 +173,9 @@ async def delete_organization(organization_id: str, service: OrganizationService
 
 
 @router.post('/organizations/{organization_id}/members', response_model=OrganizationResponse)
-async def add_member(organization_id: str, request: AddMemberRequest, service: OrganizationService = Depends()):
+async def add_member(
+    organization_id: str, request: AddMemberRequest, service: OrganizationService = Depends(get_organization_service),
+):
     """
     Add a member to the organization.
 
@@ -144,14 +189,54 @@ async def add_member(organization_id: str, request: AddMemberRequest, service: O
     :rtype: OrganizationResponse
     """
     try:
-        organization = service.add_member(organization_id, user_id=request.user_id, role=request.role)
-        return OrganizationResponse(
-            organization_id=str(organization.organization_id),
-            name=organization.name,
-            owner_id=str(organization.owner_id),
-            members={str(k): v for k, v in organization.members.items()},
-        )
+        organization = await service.add_member(organization_id, user_id=request.user_id, role=request.role)
+        return _organization_response(organization)
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Organization not found')
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get('/organizations/{organization_id}/members', response_model=Page[MembershipResponse])
+async def list_members(
+    organization_id: str, page: PageParams = Depends(page_params),
+    service: OrganizationService = Depends(get_organization_service),
+):
+    """
+    List the members of an organization, one page at a time.
+
+    :param organization_id: The unique ID of the organization.
+    :type organization_id: str
+    :param page: The page size and the cursor returned by the previous page.
+    :type page: PageParams
+    :param service: The service used to handle organization-related operations.
+    :type service: OrganizationService
+    :return: A page of members and the cursor of the next page.
+    :rtype: Page[MembershipResponse]
+    """
+    try:
+        members, after = await service.list_members_page(organization_id, page.limit, after=page.after)
+        return page_response(members, MembershipResponse, encode_cursor(after))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get('/users/{user_id}/organizations', response_model=list[MembershipResponse])
+async def list_organizations_for_user(user_id: str, service: OrganizationService = Depends(get_organization_service)):
+    """
+    List the organizations a user belongs to, with the user's role in each.
+
+    :param user_id: The unique ID of the user.
+    :type user_id: str
+    :param service: The service used to handle organization-related operations.
+    :type service: OrganizationService
+    :return: The user's memberships.
+    :rtype: List[MembershipResponse]
+    """
+    try:
+        memberships = await service.list_organizations_for_user(user_id)
+        return list_response(memberships, MembershipResponse)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -7,8 +7,11 @@ from fastapi import HTTPException
 from fastapi import status
 from pydantic import BaseModel
 from statikk.core.application.services.project_config_service import ProjectConfigService
+from statikk.core.domain.exceptions import ConcurrentUpdateError
+from statikk.interfaces.api.dependencies import get_project_config_service
+from statikk.interfaces.api.responses import ORJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 # Pydantic models for request and response bodies
 
@@ -23,7 +26,9 @@ class ProjectConfigResponse(BaseModel):
 
 
 @router.post('/projects/{project_id}/config', response_model=ProjectConfigResponse, status_code=status.HTTP_201_CREATED)
-async def create_project_config(project_id: str, request: ProjectConfigRequest, service: ProjectConfigService = Depends()):
+async def create_project_config(
+    project_id: str, request: ProjectConfigRequest, service: ProjectConfigService = Depends(get_project_config_service),
+):
     """
     Create a new project configuration.
 
@@ -37,17 +42,14 @@ async def create_project_config(project_id: str, request: ProjectConfigRequest,
     :rtype: ProjectConfigResponse
     """
     try:
-        project_config = service.create_project_config(project_id, request.config)
-        return ProjectConfigResponse(
-            project_id=str(project_config.project_id),
-            config={str(k): v for k, v in project_config.config.items()},
-        )
+        project_config = await service.create_project_config(project_id, request.config)
+        return ProjectConfigResponse(**project_config.to_dict())
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get('/projects/{project_id}/config', response_model=ProjectConfigResponse)
-async def get_project_config(project_id: str, service: ProjectConfigService = Depends()):
+async def get_project_config(project_id: str, service: ProjectConfigService = Depends(get_project_config_service)):
     """
     Retrieve a project configuration by its project ID.
 
@@ -60,11 +62,8 @@ async def get_project_config(project_id: str, service: ProjectConfigService = De
     :raises HTTPException: If the project configuration does not exist.
     """
     try:
-        project_config = service.get_project_config(project_id)
-        return ProjectConfigResponse(
-            project_id=str(project_config.project_id),
-            config={str(k): v for k, v in project_config.config.items()},
-        )
+        project_config = await service.get_project_config(project_id)
+        return ProjectConfigResponse(**project_config.to_dict())
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Project configuration not found')
     except Exception as e:
@@ -72,7 +71,9 @@ async def get_project_config(project_id: str, service: ProjectConfigService = De
 
 
 @router.put('/projects/{project_id}/config', response_model=ProjectConfigResponse)
-async def update_project_config(project_id: str, request: ProjectConfigRequest, service: ProjectConfigService = Depends()):
+async def update_project_config(
+    project_id: str, request: ProjectConfigRequest, service: ProjectConfigService = Depends(get_project_config_service),
+):
     """
     Update an existing project configuration.
 
@@ -87,19 +88,18 @@ async def update_project_config(project_id: str, request: ProjectConfigRequest,
     :raises HTTPException: If the project configuration does not exist.
     """
     try:
-        project_config = service.update_project_config(project_id, request.config)
-        return ProjectConfigResponse(
-            project_id=str(project_config.project_id),
-            config={str(k): v for k, v in project_config.config.items()},
-        )
+        project_config = await service.update_project_config(project_id, request.config)
+        return ProjectConfigResponse(**project_config.to_dict())
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Project configuration not found')
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.delete('/projects/{project_id}/config', status_code=status.HTTP_204_NO_CONTENT)
-async def delete_project_config(project_id: str, service: ProjectConfigService = Depends()):
+async def delete_project_config(project_id: str, service: ProjectConfigService = Depends(get_project_config_service)):
     """
     Delete a project configuration by its project ID.
 
@@ -110,7 +110,7 @@ async def delete_project_config(project_id: str, service: ProjectConfigService =
     :raises HTTPException: If the project configuration does not exist.
     """
     try:
-        service.delete_project_config(project_id)
+        await service.delete_project_config(project_id)
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Project configuration not found')
     except Exception as e:
@@ -5,10 +5,24 @@ from typing import List
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
+from fastapi import Request
+from fastapi import status
 from pydantic import BaseModel
 from statikk.core.application.services.project_service import ProjectService
+from statikk.core.domain.entities.project import Project
+from statikk.interfaces.api.dependencies import get_project_service
+from statikk.interfaces.api.dependencies import unit_of_work
+from statikk.interfaces.api.pagination import encode_cursor
+from statikk.interfaces.api.pagination import Page
+from statikk.interfaces.api.pagination import page_params
+from statikk.interfaces.api.pagination import PageParams
+from statikk.interfaces.api.responses import ORJSONRoute
+from statikk.interfaces.api.responses import page_response
+from statikk.interfaces.api.streaming import ndjson_response
+from statikk.interfaces.api.streaming import NDJSON_RESPONSES
+from statikk.interfaces.api.streaming import wants_ndjson
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(unit_of_work)], route_class=ORJSONRoute)
 
 # Pydantic model for project response
 
@@ -19,15 +33,34 @@ class ProjectResponse(BaseModel):
     description: str
 
 
-@router.get('/projects', response_model=list[ProjectResponse])
-async def list_projects(project_service: ProjectService = Depends()):
+def _project_response(project: Project) -> ProjectResponse:
+    return ProjectResponse(**project.to_dict())
+
+
+@router.get('/projects', response_model=Page[ProjectResponse], responses=NDJSON_RESPONSES)
+async def list_projects(
+    request: Request, page: PageParams = Depends(page_params), project_service: ProjectService = Depends(get_project_service),
+):
     """
-    Endpoint to list all projects.
+    Endpoint to list projects, one page at a time.
+
+    With ``Accept: application/x-ndjson``, every project after the cursor is streamed instead, one per line.
 
+    :param request: The incoming request, used to negotiate the response format.
+    :type request: Request
+    :param page: The page size and the cursor returned by the previous page.
+    :type page: PageParams
     :param project_service: Service for handling project operations.
     :type project_service: ProjectService
-    :return: A list of all projects.
-    :rtype: List[ProjectResponse]
+    :return: A page of projects and the cursor of the next page.
+    :rtype: Page[ProjectResponse]
+    :raises HTTPException: If the cursor does not hold a valid project ID.
     """
-    projects = project_service.list_all_projects()
-    return [ProjectResponse(project_id=str(p.project_id), name=p.name, description=p.description) for p in projects]
+    try:
+        if wants_ndjson(request):
+            return ndjson_response(project_service.iter_all_projects(after=page.after), _project_response)
+        projects, after = await project_service.list_projects_page(page.limit, after=page.after)
+    except ValueError as e:
+        # The cursor decoded, but the key it holds is not a project ID.
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return page_response(projects, ProjectResponse, encode_cursor(after))
@@ -12,8 +12,10 @@ from statikk.core.application.services.organization_service import OrganizationS
 from statikk.core.domain.entities.role import Role
 from statikk.core.domain.value_objects.permissions import Permission
 from statikk.core.domain.value_objects.role_id import RoleID
+from statikk.interfaces.api.dependencies import get_organization_service
+from statikk.interfaces.api.responses import ORJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 # Pydantic models for request and response bodies
 
@@ -35,7 +37,7 @@ class AssignRoleRequest(BaseModel):
 
 
 @router.post('/roles', response_model=RoleResponse, status_code=status.HTTP_201_CREATED)
-async def create_role(request: RoleRequest, service: OrganizationService = Depends()):
+async def create_role(request: RoleRequest, service: OrganizationService = Depends(get_organization_service)):
     """
     Create a new role with specified permissions.
 
@@ -53,18 +55,14 @@ async def create_role(request: RoleRequest, service: OrganizationService = Depen
             permissions=[Permission(name) for name in request.permissions],
         )
         # Assuming you have a method in the service to handle role saving
-        service.organization_repository.save_role(role)  # This should be handled within the appropriate service/repository
-        return RoleResponse(
-            role_id=str(role.role_id),
-            name=role.name,
-            permissions=[str(p) for p in role.permissions],
-        )
+        await service.organization_repository.save_role(role)  # This should be handled within the appropriate service/repository
+        return RoleResponse(**role.to_dict())
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get('/roles/{role_id}', response_model=RoleResponse)
-async def get_role(role_id: str, service: OrganizationService = Depends()):
+async def get_role(role_id: str, service: OrganizationService = Depends(get_organization_service)):
     """
     Retrieve a role by its unique identifier.
 
@@ -77,12 +75,8 @@ async def get_role(role_id: str, service: OrganizationService = Depends()):
     :raises HTTPException: If the role does not exist.
     """
     try:
-        role = service.organization_repository.get_role_by_id(RoleID(role_id))  # Retrieve role using the repository
-        return RoleResponse(
-            role_id=str(role.role_id),
-            name=role.name,
-            permissions=[str(p) for p in role.permissions],
-        )
+        role = await service.organization_repository.get_role_by_id(RoleID(role_id))  # Retrieve role using the repository
+        return RoleResponse(**role.to_dict())
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Role not found')
     except Exception as e:
@@ -90,7 +84,7 @@ async def get_role(role_id: str, service: OrganizationService = Depends()):
 
 
 @router.put('/roles/{role_id}', response_model=RoleResponse)
-async def update_role(role_id: str, request: RoleRequest, service: OrganizationService = Depends()):
+async def update_role(role_id: str, request: RoleRequest, service: OrganizationService = Depends(get_organization_service)):
     """
     Update an existing role's name and permissions.
 
@@ -105,15 +99,11 @@ async def update_role(role_id: str, request: RoleRequest, service: OrganizationS
     :raises HTTPException: If the role does not exist.
     """
     try:
-        role = service.organization_repository.get_role_by_id(RoleID(role_id))
+        role = await service.organization_repository.get_role_by_id(RoleID(role_id))
         role.name = request.name
         role.permissions = [Permission(name) for name in request.permissions]
-        service.organization_repository.update_role(role)  # Update the role using the repository
-        return RoleResponse(
-            role_id=str(role.role_id),
-            name=role.name,
-            permissions=[str(p) for p in role.permissions],
-        )
+        await service.organization_repository.update_role(role)  # Update the role using the repository
+        return RoleResponse(**role.to_dict())
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Role not found')
     except Exception as e:
@@ -121,7 +111,7 @@ async def update_role(role_id: str, request: RoleRequest, service: OrganizationS
 
 
 @router.delete('/roles/{role_id}', status_code=status.HTTP_204_NO_CONTENT)
-async def delete_role(role_id: str, service: OrganizationService = Depends()):
+async def delete_role(role_id: str, service: OrganizationService = Depends(get_organization_service)):
     """
     Delete a role by its unique identifier.
 
@@ -132,7 +122,7 @@ async def delete_role(role_id: str, service: OrganizationService = Depends()):
     :raises HTTPException: If the role does not exist.
     """
     try:
-        service.organization_repository.delete_role(RoleID(role_id))  # Delete the role using the repository
+        await service.organization_repository.delete_role(RoleID(role_id))  # Delete the role using the repository
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Role not found')
     except Exception as e:
@@ -144,7 +134,7 @@ async def assign_role_to_member(
     organization_id: str,
     user_id: str,
     request: AssignRoleRequest,
-    service: OrganizationService = Depends(),
+    service: OrganizationService = Depends(get_organization_service),
 ):
     """
     Assign a role to a member of the organization.
@@ -162,13 +152,9 @@ async def assign_role_to_member(
     :raises HTTPException: If the role or organization does not exist.
     """
     try:
-        role = service.organization_repository.get_role_by_id(RoleID(request.role_id))
-        organization = service.assign_role_to_member(organization_id, user_id, role)
-        return RoleResponse(
-            role_id=str(role.role_id),
-            name=role.name,
-            permissions=[str(p) for p in role.permissions],
-        )
+        role = await service.organization_repository.get_role_by_id(RoleID(request.role_id))
+        organization = await service.assign_role_to_member(organization_id, user_id, role)
+        return RoleResponse(**role.to_dict())
     except KeyError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Role or organization not found')
     except Exception as e:
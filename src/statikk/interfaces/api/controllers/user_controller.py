@@ -1,26 +1,13 @@
 from __future__ import annotations
 
-from typing import Annotated
-
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import status
 from pydantic import BaseModel
 from statikk.core.application.services.user_service import UserService
-from statikk.core.domain.repositories.user_repository import UserRepository
-
-
-# Dependency Injection of UserService
-# Dependency Injection function for UserService
-def get_user_service(repository: Annotated[UserRepository, Depends()]) -> UserService:
-    """
-    Provides an instance of UserService for dependency injection.
-
-    :return: An instance of UserService.
-    :rtype: UserService
-    """
-    return UserService(repository)
+from statikk.interfaces.api.dependencies import get_user_service
+from statikk.interfaces.api.responses import ORJSONRoute
 
 
 # Pydantic models for request and response bodies
@@ -38,7 +25,7 @@ class UserResponse(BaseModel):
 
 
 # Initialize the APIRouter for user-related endpoints
-user_router = APIRouter()
+user_router = APIRouter(route_class=ORJSONRoute)
 
 
 @user_router.get('/users/{user_id}', response_model=UserResponse)
@@ -55,8 +42,8 @@ async def get_user(user_id: str, user_service: UserService = Depends(get_user_se
     :raises HTTPException: If the user does not exist.
     """
     try:
-        user = user_service.get_user(user_id)
-        return UserResponse(user_id=user.user_id.id, username=user.username, email=user.email)
+        user = await user_service.get_user(user_id)
+        return UserResponse(**user.to_dict())
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(e),
@@ -75,10 +62,10 @@ async def create_user(request: UserCreateRequest, user_service: UserService = De
     :return: A UserResponse object with the created user's details.
     :rtype: UserResponse
     """
-    user = user_service.create_user(
+    user = await user_service.create_user(
         username=request.username, email=request.email,
     )
-    return UserResponse(user_id=user.user_id.id, username=user.username, email=user.email)
+    return UserResponse(**user.to_dict())
 
 
 @user_router.put('/users/{user_id}/email', response_model=UserResponse)
@@ -97,8 +84,8 @@ async def update_user_email(user_id: str, new_email: str, user_service: UserServ
     :raises HTTPException: If the user does not exist.
     """
     try:
-        user = user_service.update_user_email(user_id, new_email)
-        return UserResponse(user_id=user.user_id.id, username=user.username, email=user.email)
+        user = await user_service.update_user_email(user_id, new_email)
+        return UserResponse(**user.to_dict())
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(e),
@@ -117,7 +104,7 @@ async def delete_user(user_id: str, user_service: UserService = Depends(get_user
     :raises HTTPException: If the user does not exist.
     """
     try:
-        user_service.delete_user(user_id)
+        await user_service.delete_user(user_id)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(e),
@@ -0,0 +1,168 @@
+# interfaces/api/dependencies.py
+from __future__ import annotations
+
+import secrets
+from collections.abc import AsyncIterator
+
+from fastapi import Header
+from fastapi import HTTPException
+from fastapi import Request
+from fastapi import status
+from statikk.container import Container
+from statikk.core.application.services.cloud_function_runtime import CloudFunctionRuntime
+from statikk.core.application.services.cloud_function_service import CloudFunctionService
+from statikk.core.application.services.collection_service import CollectionService
+from statikk.core.application.services.organization_service import OrganizationService
+from statikk.core.application.services.project_config_service import ProjectConfigService
+from statikk.core.application.services.project_service import ProjectService
+from statikk.core.application.services.user_service import UserService
+from statikk.core.application.unit_of_work import UnitOfWork
+from statikk.core.domain.exceptions import ConcurrentUpdateError
+
+
+async def unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """
+    Dependency running the request inside a unit of work.
+
+    Changes recorded by the route are committed once it returns, before the response is sent, and
+    discarded if it raises. A row that disappeared before the commit is reported as a 404, and a row
+    updated by another writer since it was read as a 409.
+
+    :return: The unit of work of the request.
+    :rtype: AsyncIterator[UnitOfWork]
+    :raises HTTPException: If a recorded change targets a row that does not exist or changed concurrently.
+    """
+    with UnitOfWork() as work:
+        try:
+            yield work
+        except BaseException:
+            work.rollback()
+            raise
+        try:
+            await work.commit()
+        except KeyError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e).strip("'"))
+        except ConcurrentUpdateError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
+def get_container(request: Request) -> Container:
+    """
+    Dependency returning the application container, built once by the lifespan handler.
+
+    :param request: The current request.
+    :type request: Request
+    :return: The application container.
+    :rtype: Container
+    """
+    return request.app.state.container
+
+
+def require_trusted_caller(request: Request, authorization: str | None = Header(default=None)) -> None:
+    """
+    Dependency restricting a route to trusted services, which present the container's ``authz_token`` as
+    a bearer token. With no token configured, the route is closed to everyone.
+
+    :param request: The current request.
+    :type request: Request
+    :param authorization: The request's ``Authorization`` header.
+    :type authorization: Optional[str]
+    :raises HTTPException: If the request does not present the configured token.
+    """
+    token = request.app.state.container.authz_token
+    if token is None or authorization is None or not secrets.compare_digest(
+        authorization.encode(), f"Bearer {token}".encode(),
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail='A trusted caller token is required.',
+            headers={'WWW-Authenticate': 'Bearer'},
+        )
+
+
+def get_collection_service(request: Request) -> CollectionService:
+    """
+    Dependency returning the shared collection service.
+
+    :param request: The current request.
+    :type request: Request
+    :return: The collection service.
+    :rtype: CollectionService
+    """
+    return request.app.state.container.collection_service
+
+
+def get_cloud_function_service(request: Request) -> CloudFunctionService:
+    """
+    Dependency returning the shared cloud function service.
+
+    :param request: The current request.
+    :type request: Request
+    :return: The cloud function service.
+    :rtype: CloudFunctionService
+    """
+    return request.app.state.container.cloud_function_service
+
+
+def get_cloud_function_runtime(request: Request) -> CloudFunctionRuntime:
+    """
+    Dependency returning the shared cloud function runtime.
+
+    :param request: The current request.
+    :type request: Request
+    :return: The cloud function runtime.
+    :rtype: CloudFunctionRuntime
+    """
+    return request.app.state.container.cloud_function_runtime
+
+
+def get_project_service(request: Request) -> ProjectService:
+    """
+    Dependency returning the shared project service.
+
+    :param request: The current request.
+    :type request: Request
+    :return: The project service.
+    :rtype: ProjectService
+    """
+    return request.app.state.container.project_service
+
+
+def get_organization_service(request: Request) -> OrganizationService:
+    """
+    Dependency returning the shared organization service.
+
+    :param request: The current request.
+    :type request: Request
+    :return: The organization service.
+    :rtype: OrganizationService
+    """
+    return request.app.state.container.organization_service
+
+
+def get_user_service(request: Request) -> UserService:
+    """
+    Dependency returning the shared user service.
+
+    :param request: The current request.
+    :type request: Request
+    :return: The user service.
+    :rtype: UserService
+    """
+    return request.app.state.container.user_service
+
+
+def get_project_config_service(request: Request) -> ProjectConfigService:
+    """
+    Dependency returning the shared project configuration service.
+
+    :param request: The current request.
+    :type request: Request
+    :return: The project configuration service.
+    :rtype: ProjectConfigService
+    :raises HTTPException: If no project configuration storage is configured.
+    """
+    service = request.app.state.container.project_config_service
+    if service is None:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail='Project configuration storage is not available.')
+    return service
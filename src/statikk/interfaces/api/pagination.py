@@ -0,0 +1,102 @@
+# interfaces/api/pagination.py
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Generic
+from typing import Optional
+from typing import TypeVar
+
+from fastapi import HTTPException
+from fastapi import Query
+from fastapi import status
+from pydantic import BaseModel
+
+T = TypeVar('T')
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class Page(BaseModel, Generic[T]):
+    """
+    Envelope for one page of a keyset-paginated list.
+
+    ``next_cursor`` is passed back as ``after`` to fetch the next page; it is None on the last page.
+    """
+
+    items: list[T]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(after: str | None) -> str | None:
+    """
+    Encode the key of the last item of a page into an opaque cursor.
+
+    :param after: The key to continue after, or None if there is no next page.
+    :type after: Optional[str]
+    :return: The cursor, or None if there is no next page.
+    :rtype: Optional[str]
+    """
+    if after is None:
+        return None
+    return base64.urlsafe_b64encode(json.dumps({'after': after}).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str | None) -> str | None:
+    """
+    Decode a cursor produced by ``encode_cursor`` back into the key to continue after.
+
+    :param cursor: The cursor received from the client, or None for the first page.
+    :type cursor: Optional[str]
+    :return: The key to continue after, or None for the first page.
+    :rtype: Optional[str]
+    :raises ValueError: If the cursor is malformed.
+    """
+    if cursor is None:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        after = payload['after']
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(after, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return after
+
+
+class PageParams:
+    """
+    Page size and position requested by a client.
+
+    :param limit: Maximum number of items in the page.
+    :type limit: int
+    :param after: Key of the last item of the previous page, or None for the first page.
+    :type after: Optional[str]
+    """
+
+    def __init__(self, limit: int, after: str | None = None):
+        self.limit = limit
+        self.after = after
+
+
+async def page_params(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = Query(None),
+) -> PageParams:
+    """
+    Dependency reading the ``limit`` and ``after`` query parameters shared by the paginated list routes.
+
+    :param limit: Maximum number of items in the page.
+    :type limit: int
+    :param after: Cursor returned as ``next_cursor`` by the previous page.
+    :type after: Optional[str]
+    :return: The requested page.
+    :rtype: PageParams
+    :raises HTTPException: If the cursor is malformed.
+    """
+    try:
+        return PageParams(limit, decode_cursor(after))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,143 @@
+# interfaces/api/responses.py
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+from typing import get_args
+from typing import get_origin
+
+import orjson
+from fastapi import Request
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from statikk.core.domain.entities.entity import Entity
+
+# Default response class of the application: serializes with orjson instead of the standard json module.
+JSONResponse = ORJSONResponse
+
+
+class ORJSONRequest(Request):
+    """
+    Request whose JSON body is decoded with orjson.
+
+    Invalid bodies raise ``orjson.JSONDecodeError``, a subclass of ``json.JSONDecodeError``, so FastAPI
+    still answers them with its usual 422 error.
+    """
+
+    async def json(self) -> Any:
+        if not hasattr(self, '_json'):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """
+    Route class decoding request bodies with orjson; pass it as ``route_class`` to each ``APIRouter``.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await handler(ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
+
+
+def _as_str(value: Any) -> Any:
+    return value if value is None or type(value) is str else str(value)
+
+
+def _as_str_values(values: Any) -> Any:
+    if all(type(value) is str for value in values.values()):
+        return values
+    return {key: _as_str(value) for key, value in values.items()}
+
+
+def _converter(annotation: Any) -> Callable[[Any], Any] | None:
+    # Entities hold objects where a response model may expect their string form, e.g. the roles of an
+    # organization's members; the other annotations are taken as they are.
+    if annotation is str:
+        return _as_str
+    if get_origin(annotation) is dict and get_args(annotation)[1:] == (str,):
+        return _as_str_values
+    return None
+
+
+@lru_cache(maxsize=None)
+def _fields(model: type[BaseModel]) -> tuple[tuple[str, Callable[[Any], Any] | None], ...]:
+    return tuple((name, _converter(field.annotation)) for name, field in model.model_fields.items())
+
+
+def project(entity: Entity, model: type[BaseModel]) -> dict[str, Any]:
+    """
+    Map an entity to the fields of a response model, without building or validating the model.
+
+    Values are converted to the type of their field where they differ, as validation would: fields typed
+    ``str`` and ``Dict[str, str]`` get the string form of the objects they hold, e.g. a ``Role``'s name.
+
+    :param entity: The entity to map.
+    :type entity: Entity
+    :param model: The response model whose fields are kept.
+    :type model: Type[BaseModel]
+    :return: The entity's values for the model's fields.
+    :rtype: Dict[str, Any]
+    """
+    values = entity.to_dict()
+    return {
+        name: values[name] if convert is None else convert(values[name]) for name, convert in _fields(model)
+    }
+
+
+def entity_response(entity: Entity, model: type[BaseModel], status_code: int = 200) -> ORJSONResponse:
+    """
+    Respond with an entity shaped as a response model, skipping Pydantic validation and serialization.
+
+    Entities are validated when they are built, so validating them again on the way out only costs time.
+    Returning a response object directly also makes FastAPI skip its own ``response_model`` validation;
+    keep ``response_model`` on the route for the OpenAPI schema.
+
+    :param entity: The entity to respond with.
+    :type entity: Entity
+    :param model: The response model documenting the route.
+    :type model: Type[BaseModel]
+    :param status_code: The HTTP status code of the response.
+    :type status_code: int
+    :return: The JSON response.
+    :rtype: ORJSONResponse
+    """
+    return ORJSONResponse(project(entity, model), status_code=status_code)
+
+
+def page_response(entities: Iterable[Entity], model: type[BaseModel], next_cursor: str | None) -> ORJSONResponse:
+    """
+    Respond with a page of entities shaped as ``Page[model]``, skipping Pydantic validation and serialization.
+
+    :param entities: The entities of the page.
+    :type entities: Iterable[Entity]
+    :param model: The response model of each item.
+    :type model: Type[BaseModel]
+    :param next_cursor: The cursor of the next page, or None if this is the last page.
+    :type next_cursor: Optional[str]
+    :return: The JSON response.
+    :rtype: ORJSONResponse
+    """
+    return ORJSONResponse({'items': [project(entity, model) for entity in entities], 'next_cursor': next_cursor})
+
+
+def list_response(entities: Iterable[Entity], model: type[BaseModel]) -> ORJSONResponse:
+    """
+    Respond with a list of entities shaped as ``List[model]``, skipping Pydantic validation and serialization.
+
+    :param entities: The entities to respond with.
+    :type entities: Iterable[Entity]
+    :param model: The response model of each item.
+    :type model: Type[BaseModel]
+    :return: The JSON response.
+    :rtype: ORJSONResponse
+    """
+    return ORJSONResponse([project(entity, model) for entity in entities])
@@ -0,0 +1,62 @@
+# interfaces/api/streaming.py
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from typing import TypeVar
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+T = TypeVar('T')
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+
+# Documents the NDJSON alternative of a list route in the OpenAPI schema.
+NDJSON_RESPONSES = {200: {'content': {NDJSON_MEDIA_TYPE: {}}}}
+
+# Rows are written to the socket in chunks of about this many bytes rather than one by one.
+FLUSH_SIZE = 64 * 1024
+
+
+def wants_ndjson(request: Request) -> bool:
+    """
+    Tell whether the client asked for a newline-delimited JSON stream.
+
+    :param request: The incoming request.
+    :type request: Request
+    :return: True if the ``Accept`` header lists ``application/x-ndjson``.
+    :rtype: bool
+    """
+    accept = request.headers.get('accept', '')
+    return any(media_range.split(';')[0].strip() == NDJSON_MEDIA_TYPE for media_range in accept.split(','))
+
+
+async def _ndjson_lines(items: AsyncIterator[T], serialize: Callable[[T], BaseModel]) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for item in items:
+        buffer += serialize(item).model_dump_json().encode()
+        buffer += b'\n'
+        if len(buffer) >= FLUSH_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def ndjson_response(items: AsyncIterator[T], serialize: Callable[[T], BaseModel]) -> StreamingResponse:
+    """
+    Stream items as newline-delimited JSON, one object per line, as the iterator produces them.
+
+    Only one buffer of at most about ``FLUSH_SIZE`` bytes is held at a time, so memory stays flat and the
+    first bytes are sent as soon as the first page is read, whatever the size of the result.
+
+    :param items: The items to stream.
+    :type items: AsyncIterator[T]
+    :param serialize: Maps an item to its response model.
+    :type serialize: Callable[[T], BaseModel]
+    :return: The streaming response.
+    :rtype: StreamingResponse
+    """
+    return StreamingResponse(_ndjson_lines(items, serialize), media_type=NDJSON_MEDIA_TYPE)
@@ -1,31 +1,81 @@
 # main.py
 from __future__ import annotations
 
-from fastapi import Depends
+import os
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from statikk.core.application.services.cloud_function_service import CloudFunctionService
-from statikk.core.application.services.collection_service import CollectionService
-from statikk.core.domain.repositories.collection_repository_impl import SubrrealDBCollectionRepository
+from statikk.container import Container
 from statikk.infrastructure.databases.subrreal_db_client import SubrrealDBClient
-from statikk.interfaces.api.controllers.user_controller import get_user_service
+from statikk.interfaces.api.controllers import authz_controller
+from statikk.interfaces.api.controllers import cloud_function_controller
+from statikk.interfaces.api.controllers import collection_controller
+from statikk.interfaces.api.controllers import organization_controller
+from statikk.interfaces.api.controllers import project_config_controller
+from statikk.interfaces.api.controllers import project_controller
 from statikk.interfaces.api.controllers.user_controller import user_router
+from statikk.interfaces.api.responses import JSONResponse
+
+
+def build_container() -> Container:
+    """
+    Build the application container on the default database, trusting callers of the batch authorization
+    and cloud function routes that present the ``STATIKK_AUTHZ_TOKEN`` environment variable's value.
+
+    The variable is removed from the environment once read, so processes started afterwards, like the
+    function workers, do not inherit it.
+
+    :return: The application container.
+    :rtype: Container
+    """
+    return Container(
+        SubrrealDBClient(host='localhost', port=1234, database='statikk_db'),
+        authz_token=os.environ.pop('STATIKK_AUTHZ_TOKEN', None),
+    )
+
+
+def create_app(container_factory: Callable[[], Container] = build_container) -> FastAPI:
+    """
+    Create the FastAPI application.
+
+    The container, and with it the connection pool, the repositories and the services, is built once when
+    the application starts and closed when it shuts down. Routes get the shared services through the
+    dependencies in ``interfaces.api.dependencies``.
 
-# Initialize the FastAPI application
-app = FastAPI()
+    :param container_factory: Callable building the application container.
+    :type container_factory: Callable[[], Container]
+    :return: The application.
+    :rtype: FastAPI
+    """
 
-# Initialize the database client
-db_client = SubrrealDBClient(host='localhost', port=1234, database='statikk_db')
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        container = container_factory()
+        await container.start()
+        app.state.container = container
+        try:
+            yield
+        finally:
+            await container.close()
 
+    app = FastAPI(default_response_class=JSONResponse, lifespan=lifespan)
 
-# Include the user_router from user_controller
-app.include_router(user_router, dependencies=[Depends(get_user_service)])
+    app.include_router(user_router)
+    app.include_router(collection_controller.router)
+    app.include_router(cloud_function_controller.router)
+    app.include_router(project_controller.router)
+    app.include_router(organization_controller.router)
+    app.include_router(authz_controller.router)
+    app.include_router(project_config_controller.router)
 
+    # Health check endpoint
+    @app.get('/')
+    async def root():
+        return {'message': 'Statikk API is running'}
 
-# Initialize the FastAPI application
-app = FastAPI()
+    return app
 
 
-# Health check endpoint
-@app.get('/')
-async def root():
-    return {'message': 'Statikk API is running'}
+app = create_app()
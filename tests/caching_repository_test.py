@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from statikk.core.application.services.organization_service import OrganizationService
+from statikk.core.domain.entities.organization import Organization
+from statikk.core.domain.entities.role import Role
+from statikk.core.domain.repositories.organization_repository import OrganizationRepository
+from statikk.core.domain.value_objects.organization_id import OrganizationID
+from statikk.core.domain.value_objects.permissions import Permission
+from statikk.core.domain.value_objects.role_id import RoleID
+from statikk.core.domain.value_objects.user_id import UserID
+from statikk.infrastructure.caching.caching_repository import CachingRepository
+from statikk.infrastructure.caching.entity_cache import EntityCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def mock_organization_repository():
+    repository = Mock(spec=OrganizationRepository)
+    repository.get_by_id.return_value = Organization(
+        organization_id=OrganizationID('org-123'),
+        name='Test Organization',
+        owner_id=UserID('user-123'),
+    )
+    return repository
+
+
+@pytest.fixture
+def caching_repository(mock_organization_repository):
+    return CachingRepository(mock_organization_repository, id_attribute='organization_id')
+
+
+def test_entity_cache_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache = EntityCache(ttl=10, clock=clock)
+    cache.put('a', 1)
+
+    # Act
+    clock.now = 9.9
+    fresh = cache.get('a')
+    clock.now = 10
+    expired = cache.get('a')
+
+    # Assert
+    assert (fresh, expired) == (1, None)
+    assert (cache.hits, cache.misses, cache.expirations) == (1, 1, 1)
+
+
+def test_entity_cache_evicts_least_recently_used():
+    cache = EntityCache(ttl=10, max_size=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+
+    # Act
+    cache.put('c', 3)
+
+    # Assert
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    assert cache.evictions == 1
+
+
+async def test_get_by_id_reads_through_once(caching_repository, mock_organization_repository):
+    # Act
+    first = await caching_repository.get_by_id(OrganizationID('org-123'))
+    second = await caching_repository.get_by_id(OrganizationID('org-123'))
+
+    # Assert
+    assert first.name == second.name == 'Test Organization'
+    assert first is not second
+    mock_organization_repository.get_by_id.assert_called_once()
+    assert caching_repository.cache.hit_ratio == 0.5
+
+
+async def test_changing_a_read_entity_does_not_change_the_cache(caching_repository):
+    organization = await caching_repository.get_by_id(OrganizationID('org-123'))
+
+    # Act
+    organization.add_member(UserID('user-456'), 'member')
+    organization.name = 'Renamed'
+    cached = await caching_repository.get_by_id(OrganizationID('org-123'))
+
+    # Assert
+    assert cached.members == {}
+    assert cached.name == 'Test Organization'
+
+
+async def test_concurrent_misses_share_one_read(caching_repository, mock_organization_repository):
+    # Act
+    await asyncio.gather(*(caching_repository.get_by_id(OrganizationID('org-123')) for _ in range(5)))
+
+    # Assert
+    mock_organization_repository.get_by_id.assert_called_once()
+
+
+async def test_update_writes_through(caching_repository, mock_organization_repository):
+    organization = await caching_repository.get_by_id(OrganizationID('org-123'))
+    organization.name = 'Renamed'
+
+    # Act
+    await caching_repository.update(organization)
+    cached = await caching_repository.get_by_id(OrganizationID('org-123'))
+
+    # Assert
+    assert cached.name == 'Renamed'
+    mock_organization_repository.update.assert_called_once_with(organization)
+    mock_organization_repository.get_by_id.assert_called_once()
+
+
+async def test_partially_loaded_entities_are_not_cached(caching_repository, mock_organization_repository):
+    await caching_repository.get_by_id(OrganizationID('org-123'))
+    partial = Organization(OrganizationID('org-123'), 'Renamed', UserID('user-123'))
+    partial.mark_partial()
+
+    # Act
+    await caching_repository.update(partial)
+    await caching_repository.get_by_id(OrganizationID('org-123'))
+
+    # Assert
+    assert mock_organization_repository.get_by_id.call_count == 2
+
+
+async def test_failed_update_invalidates(caching_repository, mock_organization_repository):
+    organization = await caching_repository.get_by_id(OrganizationID('org-123'))
+    mock_organization_repository.update.side_effect = Exception('Database error')
+
+    # Act
+    with pytest.raises(Exception):
+        await caching_repository.update(organization)
+    await caching_repository.get_by_id(OrganizationID('org-123'))
+
+    # Assert
+    assert mock_organization_repository.get_by_id.call_count == 2
+
+
+async def test_delete_invalidates(caching_repository, mock_organization_repository):
+    await caching_repository.get_by_id(OrganizationID('org-123'))
+
+    # Act
+    await caching_repository.delete(OrganizationID('org-123'))
+
+    # Assert
+    assert 'org-123' not in caching_repository.cache
+    mock_organization_repository.delete.assert_called_once_with(OrganizationID('org-123'))
+
+
+async def test_update_organization_reads_organization_once(mock_organization_repository):
+    organization = mock_organization_repository.get_by_id.return_value
+    organization.members['user-123'] = Role(RoleID('role-1'), 'admin', [Permission('update_organization')])
+    mock_organization_repository.get_with_members.return_value = organization
+    service = OrganizationService(CachingRepository(mock_organization_repository, id_attribute='organization_id'))
+
+    # Act
+    await service.update_organization('org-123', name='Renamed', requesting_user_id='user-123')
+
+    # Assert
+    mock_organization_repository.get_by_id.assert_called_once()
+    mock_organization_repository.update.assert_called_once()
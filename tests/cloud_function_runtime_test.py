@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from statikk.core.application.services.cloud_function_runtime import CloudFunctionRuntime
+from statikk.core.application.services.cloud_function_service import CloudFunctionService
+from statikk.core.application.services.trigger_registry import TriggerRegistry
+from statikk.core.domain.entities.cloud_function import CloudFunction
+from statikk.core.domain.exceptions import FunctionExecutionError
+from statikk.core.domain.value_objects.cloud_function_id import CloudFunctionID
+from statikk.infrastructure.execution.worker_pool import WorkerPool
+
+
+@pytest.fixture
+def mock_cloud_function_service():
+    service = Mock(spec=CloudFunctionService)
+    service.get_cloud_function.return_value = CloudFunction(
+        CloudFunctionID('f-1'), 'Echo', 'def handler(payload):\n    return payload\n', ['http'], version=3,
+    )
+    return service
+
+
+@pytest.fixture
+def mock_worker_pool():
+    return Mock(spec=WorkerPool)
+
+
+async def test_invoke_runs_the_current_version(mock_cloud_function_service, mock_worker_pool):
+    runtime = CloudFunctionRuntime(mock_cloud_function_service, mock_worker_pool, timeout=2.0, memory_limit=1024)
+    mock_worker_pool.run.return_value = {'ok': True}
+
+    # Act
+    result = await runtime.invoke('f-1', {'name': 'Ada'})
+
+    # Assert
+    assert result == {'ok': True}
+    mock_cloud_function_service.get_cloud_function.assert_awaited_once_with('f-1')
+    mock_worker_pool.run.assert_awaited_once_with(
+        'f-1@3', 'def handler(payload):\n    return payload\n', {'name': 'Ada'}, 2.0, 1024,
+    )
+
+
+async def test_invoke_propagates_missing_functions(mock_cloud_function_service, mock_worker_pool):
+    runtime = CloudFunctionRuntime(mock_cloud_function_service, mock_worker_pool)
+    mock_cloud_function_service.get_cloud_function.side_effect = KeyError('f-1')
+
+    # Act
+    with pytest.raises(KeyError):
+        await runtime.invoke('f-1')
+
+    # Assert
+    mock_worker_pool.run.assert_not_called()
+
+
+async def test_invoke_limits_concurrency_per_function(mock_cloud_function_service, mock_worker_pool):
+    runtime = CloudFunctionRuntime(mock_cloud_function_service, mock_worker_pool, max_concurrency=2)
+    running = 0
+    peak = 0
+
+    async def run(*args):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    mock_worker_pool.run.side_effect = run
+
+    # Act
+    await asyncio.gather(*(runtime.invoke('f-1') for _ in range(5)))
+
+    # Assert
+    assert peak == 2
+    assert mock_worker_pool.run.await_count == 5
+    assert runtime._slots == {}
+
+
+async def test_dispatch_invokes_every_matching_function(mock_cloud_function_service, mock_worker_pool):
+    registry = TriggerRegistry()
+    for function_id, trigger in (('f-1', 'collection:*:create'), ('f-2', 'collection:c-1:**'), ('f-3', 'http:/orders')):
+        registry.register(CloudFunction(CloudFunctionID(function_id), function_id, '', [trigger]))
+    runtime = CloudFunctionRuntime(mock_cloud_function_service, mock_worker_pool, trigger_registry=registry)
+    mock_cloud_function_service.get_cloud_function.side_effect = lambda function_id: CloudFunction(
+        CloudFunctionID(function_id), function_id, function_id, [],
+    )
+    failure = FunctionExecutionError('ValueError: bad payload', 'ValueError')
+
+    async def run(key, code, *args):
+        if code == 'f-2':
+            raise failure
+        return code
+
+    mock_worker_pool.run.side_effect = run
+
+    # Act
+    results = await runtime.dispatch('collection:c-1:create', {'id': 'd-1'})
+
+    # Assert
+    assert results == {'f-1': 'f-1', 'f-2': failure}
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import Mock
 
 import pytest
 from statikk.core.application.services.cloud_function_service import CloudFunctionService
+from statikk.core.application.services.cron_scheduler import CronScheduler
+from statikk.core.application.services.trigger_registry import TriggerRegistry
 from statikk.core.domain.entities.cloud_function import CloudFunction
+from statikk.core.domain.events import CloudFunctionCreated
+from statikk.core.domain.events import CloudFunctionDeleted
+from statikk.core.domain.events import CloudFunctionEvent
+from statikk.core.domain.events import CloudFunctionUpdated
 from statikk.core.domain.repositories.cloud_function_repository import CloudFunctionRepository
 from statikk.core.domain.value_objects.cloud_function_id import CloudFunctionID
+from statikk.infrastructure.events.event_bus import EventBus
+from statikk.infrastructure.events.publishing_repository import EventPublishingRepository
+from statikk.infrastructure.execution.code_cache import CodeCache
 
 
 @pytest.fixture
@@ -19,9 +29,9 @@ def cloud_function_service(mock_cloud_function_repository):
     return CloudFunctionService(mock_cloud_function_repository)
 
 
-def test_create_cloud_function(cloud_function_service, mock_cloud_function_repository):
+async def test_create_cloud_function(cloud_function_service, mock_cloud_function_repository):
     # Act
-    cloud_function = cloud_function_service.create_cloud_function(
+    cloud_function = await cloud_function_service.create_cloud_function(
         name='New Function',
         code='def handler(): pass',
         triggers=['http'],
@@ -34,7 +44,7 @@ def test_create_cloud_function(cloud_function_service, mock_cloud_function_repos
     mock_cloud_function_repository.save.assert_called_once_with(cloud_function)
 
 
-def test_get_cloud_function(cloud_function_service, mock_cloud_function_repository):
+async def test_get_cloud_function(cloud_function_service, mock_cloud_function_repository):
     function_id = 'func-123'
     mock_cloud_function = CloudFunction(
         function_id=CloudFunctionID(function_id),
@@ -45,14 +55,14 @@ def test_get_cloud_function(cloud_function_service, mock_cloud_function_reposito
     mock_cloud_function_repository.get_by_id.return_value = mock_cloud_function
 
     # Act
-    cloud_function = cloud_function_service.get_cloud_function(function_id)
+    cloud_function = await cloud_function_service.get_cloud_function(function_id)
 
     # Assert
     assert cloud_function.name == 'Existing Function'
     mock_cloud_function_repository.get_by_id.assert_called_once_with(CloudFunctionID(function_id))
 
 
-def test_update_cloud_function(cloud_function_service, mock_cloud_function_repository):
+async def test_update_cloud_function(cloud_function_service, mock_cloud_function_repository):
     function_id = 'func-123'
     new_code = 'def handler(): return "updated"'
     mock_cloud_function = CloudFunction(
@@ -64,7 +74,7 @@ def test_update_cloud_function(cloud_function_service, mock_cloud_function_repos
     mock_cloud_function_repository.get_by_id.return_value = mock_cloud_function
 
     # Act
-    updated_function = cloud_function_service.update_cloud_function(
+    updated_function = await cloud_function_service.update_cloud_function(
         function_id=function_id,
         new_code=new_code,
         triggers=['http'],
@@ -75,7 +85,111 @@ def test_update_cloud_function(cloud_function_service, mock_cloud_function_repos
     mock_cloud_function_repository.update.assert_called_once_with(updated_function)
 
 
-def test_delete_cloud_function(cloud_function_service, mock_cloud_function_repository):
+async def test_update_cloud_function_replaces_cached_code(mock_cloud_function_repository):
+    code_cache = Mock(spec=CodeCache)
+    service = CloudFunctionService(mock_cloud_function_repository, code_cache)
+    mock_cloud_function_repository.get_by_id.return_value = CloudFunction(
+        function_id=CloudFunctionID('func-123'),
+        name='Function',
+        code='def handler(): pass',
+        triggers=['http'],
+    )
+
+    # Act
+    await service.update_cloud_function(function_id='func-123', new_code='def handler(): return 1', triggers=['http'])
+
+    # Assert
+    code_cache.invalidate.assert_called_once_with('def handler(): pass')
+    code_cache.get.assert_called_once_with('def handler(): return 1')
+
+
+async def test_create_cloud_function_ignores_code_that_does_not_compile(mock_cloud_function_repository):
+    code_cache = CodeCache()
+    service = CloudFunctionService(mock_cloud_function_repository, code_cache)
+
+    # Act
+    await service.create_cloud_function(name='Broken', code='def handler(:', triggers=['http'])
+    await service.create_cloud_function(name='Working', code='def handler(payload): pass', triggers=['http'])
+
+    # Assert
+    assert mock_cloud_function_repository.save.call_count == 2
+    assert code_cache.misses == 2
+    code_cache.get('def handler(payload): pass')
+    assert code_cache.hits == 1
+
+
+async def test_trigger_registry_follows_committed_function_changes(mock_cloud_function_repository):
+    registry = TriggerRegistry()
+    event_bus = EventBus()
+    service = CloudFunctionService(
+        EventPublishingRepository(
+            mock_cloud_function_repository, event_bus, 'function_id',
+            CloudFunctionCreated, CloudFunctionUpdated, CloudFunctionDeleted,
+        ),
+        trigger_registry=registry,
+    )
+    event_bus.subscribe(service.handle_cloud_function_events, [CloudFunctionEvent])
+    await event_bus.start()
+
+    # Act
+    cloud_function = await service.create_cloud_function(name='On create', code='', triggers=['collection:c-1:create'])
+    function_id = str(cloud_function.function_id)
+    before_delivery = registry.match('collection:c-1:create')
+    await asyncio.sleep(0)
+    created = registry.match('collection:c-1:create')
+    mock_cloud_function_repository.get_by_id.return_value = cloud_function
+    await service.update_cloud_function(function_id=function_id, new_code='', triggers=['collection:c-1:delete'])
+    await asyncio.sleep(0)
+    updated = registry.match('collection:c-1:delete')
+    await service.delete_cloud_function(function_id)
+    await event_bus.close()
+
+    # Assert
+    assert before_delivery == set()
+    assert created == updated == {function_id}
+    assert registry.match('collection:c-1:create') == set()
+    assert function_id not in registry
+
+
+async def test_failed_writes_leave_the_triggers_alone(mock_cloud_function_repository):
+    registry = TriggerRegistry()
+    event_bus = EventBus()
+    service = CloudFunctionService(
+        EventPublishingRepository(
+            mock_cloud_function_repository, event_bus, 'function_id',
+            CloudFunctionCreated, CloudFunctionUpdated, CloudFunctionDeleted,
+        ),
+        trigger_registry=registry,
+    )
+    event_bus.subscribe(service.handle_cloud_function_events, [CloudFunctionEvent])
+    mock_cloud_function_repository.save.side_effect = Exception('Database error')
+    await event_bus.start()
+
+    # Act
+    with pytest.raises(Exception):
+        await service.create_cloud_function(name='On create', code='', triggers=['collection:c-1:create'])
+    await event_bus.close()
+
+    # Assert
+    assert registry.match('collection:c-1:create') == set()
+
+
+async def test_cron_scheduler_follows_function_events(mock_cloud_function_repository):
+    cron_scheduler = Mock(spec=CronScheduler)
+    service = CloudFunctionService(mock_cloud_function_repository, cron_scheduler=cron_scheduler)
+    cloud_function = CloudFunction(CloudFunctionID('func-123'), 'Nightly', '', ['cron:@daily'])
+
+    # Act
+    await service.handle_cloud_function_events([
+        CloudFunctionCreated('func-123', cloud_function), CloudFunctionDeleted('func-123'),
+    ])
+
+    # Assert
+    cron_scheduler.register.assert_called_once_with(cloud_function)
+    cron_scheduler.unregister.assert_called_once_with('func-123')
+
+
+async def test_delete_cloud_function(cloud_function_service, mock_cloud_function_repository):
     function_id = 'func-123'
     mock_cloud_function_repository.get_by_id.return_value = CloudFunction(
         function_id=CloudFunctionID(function_id),
@@ -85,13 +199,13 @@ def test_delete_cloud_function(cloud_function_service, mock_cloud_function_repos
     )
 
     # Act
-    cloud_function_service.delete_cloud_function(function_id)
+    await cloud_function_service.delete_cloud_function(function_id)
 
     # Assert
     mock_cloud_function_repository.delete.assert_called_once_with(CloudFunctionID(function_id))
 
 
-def test_list_all_cloud_functions(cloud_function_service, mock_cloud_function_repository):
+async def test_list_all_cloud_functions(cloud_function_service, mock_cloud_function_repository):
     mock_cloud_function_repository.list_all.return_value = [
         CloudFunction(
             function_id=CloudFunctionID('func-123'),
@@ -108,7 +222,7 @@ def test_list_all_cloud_functions(cloud_function_service, mock_cloud_function_re
     ]
 
     # Act
-    cloud_functions = cloud_function_service.list_all_cloud_functions()
+    cloud_functions = await cloud_function_service.list_all_cloud_functions()
 
     # Assert
     assert len(cloud_functions) == 2
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+from statikk.infrastructure.execution.code_cache import CodeCache
+
+SOURCE = 'def handler(payload):\n    return payload\n'
+
+
+def test_get_compiles_once_per_source():
+    code_cache = CodeCache()
+
+    # Act
+    first = code_cache.get(SOURCE)
+    second = code_cache.get(SOURCE)
+
+    # Assert
+    assert first is second
+    assert (code_cache.misses, code_cache.hits) == (1, 1)
+
+
+def test_entries_are_keyed_by_content_hash():
+    code_cache = CodeCache()
+
+    # Act
+    code = code_cache.get(SOURCE)
+    changed = code_cache.get(SOURCE + '\n# changed\n')
+
+    # Assert
+    assert code is not changed
+    assert code.co_filename == f"<cloud function {CodeCache.digest(SOURCE)[:12]}>"
+
+
+def test_other_processes_load_marshalled_bytecode(tmp_path):
+    CodeCache(str(tmp_path)).get(SOURCE)
+    code_cache = CodeCache(str(tmp_path))
+
+    # Act
+    code = code_cache.get(SOURCE)
+
+    # Assert
+    namespace = {}
+    exec(code, namespace)
+    assert namespace['handler'](42) == 42
+    assert (code_cache.misses, code_cache.hits) == (0, 1)
+
+
+def test_preload_reads_bytecode_into_memory(tmp_path):
+    CodeCache(str(tmp_path)).get(SOURCE)
+    code_cache = CodeCache(str(tmp_path))
+
+    # Act
+    loaded = code_cache.preload()
+
+    # Assert
+    assert loaded == 1
+    os.remove(os.path.join(tmp_path, os.listdir(tmp_path)[0]))
+    code_cache.get(SOURCE)
+    assert (code_cache.misses, code_cache.hits) == (0, 1)
+
+
+def test_invalid_bytecode_files_are_recompiled(tmp_path):
+    code_cache = CodeCache(str(tmp_path))
+    code_cache.get(SOURCE)
+    path = os.path.join(tmp_path, os.listdir(tmp_path)[0])
+    with open(path, 'wb') as file:
+        file.write(b'not bytecode')
+
+    # Act
+    code = CodeCache(str(tmp_path)).get(SOURCE)
+
+    # Assert
+    assert code.co_filename.startswith('<cloud function ')
+    assert CodeCache(str(tmp_path)).preload() == 1
+
+
+def test_invalidate_drops_memory_and_disk_entries(tmp_path):
+    code_cache = CodeCache(str(tmp_path))
+    code_cache.get(SOURCE)
+
+    # Act
+    code_cache.invalidate(SOURCE)
+
+    # Assert
+    assert os.listdir(tmp_path) == []
+    code_cache.get(SOURCE)
+    assert code_cache.misses == 2
+
+
+def test_syntax_errors_are_not_cached(tmp_path):
+    code_cache = CodeCache(str(tmp_path))
+
+    # Act
+    with pytest.raises(SyntaxError):
+        code_cache.get('def handler(:')
+
+    # Assert
+    assert os.listdir(tmp_path) == []
+
+
+def test_directory_is_created_private(tmp_path):
+    directory = os.path.join(tmp_path, 'code-cache')
+
+    # Act
+    CodeCache(directory)
+
+    # Assert
+    assert os.stat(directory).st_mode & 0o777 == 0o700
+
+
+def test_directories_others_can_access_are_refused(tmp_path):
+    directory = os.path.join(tmp_path, 'shared')
+    os.mkdir(directory)
+    os.chmod(directory, 0o777)
+
+    # Act
+    with pytest.raises(PermissionError):
+        CodeCache(directory)
+
+    # Assert
+    assert os.listdir(directory) == []
+
+
+def test_symlinked_directories_are_refused(tmp_path):
+    directory = os.path.join(tmp_path, 'link')
+    os.symlink(tmp_path, directory)
+
+    # Act
+    with pytest.raises(PermissionError):
+        CodeCache(directory)
+
+    # Assert
+    assert os.path.islink(directory)
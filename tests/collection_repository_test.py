@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from statikk.core.domain.entities.collection import Collection
+from statikk.core.domain.exceptions import ConcurrentUpdateError
+from statikk.core.domain.repositories.collection_repository_impl import SubrrealDBCollectionRepository
+from statikk.core.domain.value_objects.collection_id import CollectionID
+from statikk.infrastructure.databases.subrreal_db_client import SubrrealDBClient
+
+
+@pytest.fixture
+def mock_db_client():
+    return Mock(spec=SubrrealDBClient)
+
+
+@pytest.fixture
+def collection_repository(mock_db_client):
+    return SubrrealDBCollectionRepository(mock_db_client)
+
+
+async def test_update_writes_without_reading_first(collection_repository, mock_db_client):
+    mock_db_client.update.return_value = [{'id': 'col-123'}]
+    collection = Collection(collection_id=CollectionID('col-123'), name='Renamed', schema={})
+
+    # Act
+    await collection_repository.update(collection)
+
+    # Assert
+    mock_db_client.update.assert_called_once_with(
+        collection='collections', identifier='col-123', data={'name': 'Renamed', 'schema': {}, 'version': 1}, version=0,
+    )
+    mock_db_client.query.assert_not_called()
+    assert collection.version == 1
+
+
+async def test_update_raises_key_error_when_no_row_matched(collection_repository, mock_db_client):
+    mock_db_client.update.return_value = []
+    mock_db_client.query.return_value = []
+
+    # Act & Assert
+    with pytest.raises(KeyError):
+        await collection_repository.update(Collection(collection_id=CollectionID('col-404'), name='Missing', schema={}))
+
+
+async def test_update_raises_conflict_when_version_changed(collection_repository, mock_db_client):
+    mock_db_client.update.return_value = []
+    mock_db_client.query.return_value = [{'id': 'col-123'}]
+    collection = Collection(collection_id=CollectionID('col-123'), name='Renamed', schema={}, version=3)
+
+    # Act & Assert
+    with pytest.raises(ConcurrentUpdateError):
+        await collection_repository.update(collection)
+    assert collection.version == 3
+    assert mock_db_client.update.call_args.kwargs['version'] == 3
+
+
+async def test_delete_raises_key_error_when_no_row_matched(collection_repository, mock_db_client):
+    mock_db_client.delete.return_value = []
+
+    # Act & Assert
+    with pytest.raises(KeyError):
+        await collection_repository.delete(CollectionID('col-404'))
+
+
+async def test_get_by_id_looks_the_record_up_by_record_id(collection_repository, mock_db_client):
+    mock_db_client.query.return_value = [{'id': 'collections:col-123', 'name': 'Users', 'schema': {}}]
+
+    # Act
+    collection = await collection_repository.get_by_id(CollectionID('col-123'))
+
+    # Assert
+    mock_db_client.query.assert_awaited_once_with("SELECT * FROM type::thing('collections', $id)", {'id': 'col-123'})
+    assert collection.name == 'Users'
+
+
+async def test_loaded_collection_is_keyed_and_written_back_by_its_bare_id(collection_repository, mock_db_client):
+    mock_db_client.query.return_value = [{'id': 'collections:⟨0190-ab⟩', 'name': 'Users', 'schema': {}, 'version': 2}]
+    mock_db_client.update.return_value = [{'id': 'collections:⟨0190-ab⟩'}]
+
+    # Act
+    collection = await collection_repository.get_by_id(CollectionID('0190-ab'))
+    await collection_repository.update(collection)
+
+    # Assert
+    assert collection.collection_id == CollectionID('0190-ab')
+    assert collection.to_dict()['collection_id'] == '0190-ab'
+    assert mock_db_client.update.call_args.kwargs['identifier'] == '0190-ab'
@@ -5,6 +5,7 @@ from unittest.mock import Mock
 import pytest
 from statikk.core.application.services.collection_service import CollectionService
 from statikk.core.domain.entities.collection import Collection
+from statikk.core.domain.exceptions import ConcurrentUpdateError
 from statikk.core.domain.repositories.collection_repository import CollectionRepository
 from statikk.core.domain.value_objects.collection_id import CollectionID
 
@@ -19,9 +20,9 @@ def collection_service(mock_collection_repository):
     return CollectionService(mock_collection_repository)
 
 
-def test_create_collection(collection_service, mock_collection_repository):
+async def test_create_collection(collection_service, mock_collection_repository):
     # Act
-    collection = collection_service.create_collection(
+    collection = await collection_service.create_collection(
         name='New Collection',
         schema={'field1': 'string', 'field2': 'integer'},
     )
@@ -32,7 +33,7 @@ def test_create_collection(collection_service, mock_collection_repository):
     mock_collection_repository.save.assert_called_once_with(collection)
 
 
-def test_get_collection(collection_service, mock_collection_repository):
+async def test_get_collection(collection_service, mock_collection_repository):
     collection_id = 'col-123'
     mock_collection = Collection(
         collection_id=CollectionID(collection_id),
@@ -42,7 +43,7 @@ def test_get_collection(collection_service, mock_collection_repository):
     mock_collection_repository.get_by_id.return_value = mock_collection
 
     # Act
-    collection = collection_service.get_collection(collection_id)
+    collection = await collection_service.get_collection(collection_id)
 
     # Assert
     assert collection.name == 'Existing Collection'
@@ -50,7 +51,7 @@ def test_get_collection(collection_service, mock_collection_repository):
     mock_collection_repository.get_by_id.assert_called_once_with(CollectionID(collection_id))
 
 
-def test_update_collection(collection_service, mock_collection_repository):
+async def test_update_collection(collection_service, mock_collection_repository):
     collection_id = 'col-123'
     new_schema = {'field1': 'string', 'field2': 'integer'}
     mock_collection = Collection(
@@ -61,7 +62,7 @@ def test_update_collection(collection_service, mock_collection_repository):
     mock_collection_repository.get_by_id.return_value = mock_collection
 
     # Act
-    updated_collection = collection_service.update_collection(
+    updated_collection = await collection_service.update_collection(
         collection_id=collection_id,
         name='Updated Collection',
         schema=new_schema,
@@ -73,7 +74,7 @@ def test_update_collection(collection_service, mock_collection_repository):
     mock_collection_repository.update.assert_called_once_with(updated_collection)
 
 
-def test_delete_collection(collection_service, mock_collection_repository):
+async def test_delete_collection(collection_service, mock_collection_repository):
     collection_id = 'col-123'
     mock_collection_repository.get_by_id.return_value = Collection(
         collection_id=CollectionID(collection_id),
@@ -82,13 +83,13 @@ def test_delete_collection(collection_service, mock_collection_repository):
     )
 
     # Act
-    collection_service.delete_collection(collection_id)
+    await collection_service.delete_collection(collection_id)
 
     # Assert
     mock_collection_repository.delete.assert_called_once_with(CollectionID(collection_id))
 
 
-def test_list_all_collections(collection_service, mock_collection_repository):
+async def test_list_all_collections(collection_service, mock_collection_repository):
     mock_collection_repository.list_all.return_value = [
         Collection(
             collection_id=CollectionID('col-123'),
@@ -103,10 +104,64 @@ def test_list_all_collections(collection_service, mock_collection_repository):
     ]
 
     # Act
-    collections = collection_service.list_all_collections()
+    collections = await collection_service.list_all_collections()
 
     # Assert
     assert len(collections) == 2
     assert collections[0].name == 'Collection One'
     assert collections[1].name == 'Collection Two'
     mock_collection_repository.list_all.assert_called_once()
+
+
+async def test_list_collections_page_returns_cursor_when_more_follow(collection_service, mock_collection_repository):
+    mock_collection_repository.list_page.return_value = [
+        Collection(collection_id=CollectionID(f"col-{i}"), name=f"Collection {i}", schema={}) for i in range(3)
+    ]
+
+    # Act
+    collections, after = await collection_service.list_collections_page(2, after='col-0')
+
+    # Assert
+    assert [c.name for c in collections] == ['Collection 0', 'Collection 1']
+    assert after == 'col-1'
+    mock_collection_repository.list_page.assert_called_once_with(3, after=CollectionID('col-0'))
+
+
+async def test_list_collections_page_returns_no_cursor_on_last_page(collection_service, mock_collection_repository):
+    mock_collection_repository.list_page.return_value = [
+        Collection(collection_id=CollectionID('col-1'), name='Collection 1', schema={}),
+    ]
+
+    # Act
+    collections, after = await collection_service.list_collections_page(2)
+
+    # Assert
+    assert len(collections) == 1
+    assert after is None
+    mock_collection_repository.list_page.assert_called_once_with(3, after=None)
+
+
+async def test_update_collection_retries_after_concurrent_update(collection_service, mock_collection_repository):
+    mock_collection_repository.get_by_id.side_effect = [
+        Collection(collection_id=CollectionID('col-123'), name='Old', schema={}, version=1),
+        Collection(collection_id=CollectionID('col-123'), name='Old', schema={'field1': 'string'}, version=2),
+    ]
+    mock_collection_repository.update.side_effect = [ConcurrentUpdateError('stale'), None]
+
+    # Act
+    collection = await collection_service.update_collection('col-123', name='New', schema={'field2': 'integer'})
+
+    # Assert
+    assert collection.version == 2
+    assert collection.name == 'New'
+    assert mock_collection_repository.update.call_count == 2
+
+
+async def test_update_collection_gives_up_after_bounded_retries(collection_service, mock_collection_repository):
+    mock_collection_repository.get_by_id.return_value = Collection(collection_id=CollectionID('col-123'), name='Old', schema={})
+    mock_collection_repository.update.side_effect = ConcurrentUpdateError('stale')
+
+    # Act & Assert
+    with pytest.raises(ConcurrentUpdateError):
+        await collection_service.update_collection('col-123', name='New', schema={})
+    assert mock_collection_repository.update.call_count == 5
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from statikk.infrastructure.databases.connection_pool import ConnectionPool
+
+
+class FakeConnection:
+    def __init__(self, number):
+        self.number = number
+        self.healthy = True
+        self.closed = False
+
+
+@pytest.fixture
+def opened():
+    return []
+
+
+@pytest.fixture
+def pool_factory(opened):
+    def build(**kwargs):
+        async def factory():
+            connection = FakeConnection(len(opened))
+            opened.append(connection)
+            return connection
+
+        async def closer(connection):
+            connection.closed = True
+
+        async def health_check(connection):
+            if connection.healthy is None:
+                raise ConnectionResetError('reset')
+            return connection.healthy
+
+        return ConnectionPool(factory=factory, closer=closer, health_check=health_check, **kwargs)
+
+    return build
+
+
+async def test_open_creates_min_size_connections(pool_factory, opened):
+    pool = pool_factory(min_size=2, max_size=4)
+
+    # Act
+    await pool.open()
+
+    # Assert
+    assert pool.size == 2
+    assert pool.idle == 2
+    await pool.close()
+
+
+async def test_acquire_reuses_released_connection(pool_factory, opened):
+    pool = pool_factory(min_size=0, max_size=2)
+    await pool.open()
+
+    # Act
+    async with pool.acquire() as first:
+        pass
+    async with pool.acquire() as second:
+        pass
+
+    # Assert
+    assert first is second
+    assert len(opened) == 1
+    await pool.close()
+
+
+async def test_acquire_times_out_when_pool_is_exhausted(pool_factory):
+    pool = pool_factory(min_size=0, max_size=1)
+    await pool.open()
+
+    # Act & Assert
+    async with pool.acquire():
+        with pytest.raises(TimeoutError):
+            async with pool.acquire(timeout=0.01):
+                pass
+    await pool.close()
+
+
+async def test_unhealthy_connection_is_replaced_on_checkout(pool_factory, opened):
+    pool = pool_factory(min_size=1, max_size=1)
+    await pool.open()
+    opened[0].healthy = False
+
+    # Act
+    async with pool.acquire() as connection:
+        pass
+
+    # Assert
+    assert connection is opened[1]
+    assert opened[0].closed
+    assert pool.size == 1
+    await pool.close()
+
+
+async def test_connection_failing_health_check_is_closed_on_checkout(pool_factory, opened):
+    pool = pool_factory(min_size=1, max_size=1)
+    await pool.open()
+    opened[0].healthy = None
+
+    # Act
+    async with pool.acquire(timeout=0.01) as connection:
+        pass
+
+    # Assert
+    assert connection is opened[1]
+    assert opened[0].closed
+    assert pool.size == 1
+    await pool.close()
+
+
+async def test_connection_is_discarded_when_block_raises(pool_factory, opened):
+    pool = pool_factory(min_size=0, max_size=1)
+    await pool.open()
+
+    # Act
+    with pytest.raises(RuntimeError):
+        async with pool.acquire():
+            raise RuntimeError('boom')
+
+    # Assert
+    assert opened[0].closed
+    assert pool.size == 0
+    async with pool.acquire(timeout=0.01):
+        pass
+    await pool.close()
+
+
+async def test_reap_idle_keeps_min_size(pool_factory, opened):
+    pool = pool_factory(min_size=1, max_size=3, max_idle_time=0.0)
+    await pool.open()
+    async with pool.acquire(), pool.acquire(), pool.acquire():
+        pass
+    await asyncio.sleep(0.01)
+
+    # Act
+    await pool.reap_idle()
+
+    # Assert
+    assert pool.size == 1
+    assert sum(connection.closed for connection in opened) == 2
+    await pool.close()
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+from statikk.container import Container
+from statikk.core.application.unit_of_work import UnitOfWorkRepository
+from statikk.core.domain.entities.cloud_function import CloudFunction
+from statikk.core.domain.events import CloudFunctionCreated
+from statikk.core.domain.events import CloudFunctionDeleted
+from statikk.core.domain.events import CollectionCreated
+from statikk.core.domain.repositories.collection_repository_impl import SubrrealDBCollectionRepository
+from statikk.core.domain.value_objects.cloud_function_id import CloudFunctionID
+from statikk.infrastructure.caching.caching_repository import CachingRepository
+from statikk.infrastructure.databases.subrreal_db_client import SubrrealDBClient
+from statikk.infrastructure.events.publishing_repository import EventPublishingRepository
+from statikk.infrastructure.execution.code_cache import CodeCache
+from statikk.infrastructure.execution.worker_pool import WorkerPool
+from statikk.interfaces.api.pagination import encode_cursor
+from statikk.main import create_app
+
+
+async def no_pages(*args, **kwargs):
+    return
+    yield
+
+
+TRUSTED = {'Authorization': 'Bearer secret'}
+
+
+def create_container():
+    db_client = Mock(spec=SubrrealDBClient)
+    db_client.cursor.side_effect = no_pages
+    return Container(db_client, WorkerPool(size=1), CodeCache(), cron_checkpoint_path=None)
+
+
+def test_container_wraps_repositories_once():
+    container = create_container()
+
+    # Act
+    repository = container.collection_repository
+
+    # Assert
+    assert isinstance(repository, UnitOfWorkRepository)
+    assert isinstance(repository.repository, CachingRepository)
+    assert isinstance(repository.repository.repository, EventPublishingRepository)
+    assert repository.repository.repository.event_bus is container.event_bus
+    assert isinstance(repository.repository.repository.repository, SubrrealDBCollectionRepository)
+    assert repository.repository.repository.repository.db_client is container.db_client
+    assert container.collection_service.collection_repository is repository
+    assert container.organization_service.permission_cache is container.permission_cache
+
+
+def test_lifespan_starts_and_closes_the_container():
+    container = create_container()
+    container.db_client.query.return_value = []
+
+    # Act
+    with TestClient(create_app(lambda: container)) as client:
+        response = client.get('/')
+        started = container.db_client.connect.await_count
+        closed_while_running = container.db_client.close.await_count
+
+    # Assert
+    assert response.status_code == 200
+    assert started == 1
+    assert closed_while_running == 0
+    assert container.db_client.close.await_count == 1
+    assert client.app.state.container is container
+
+
+def test_requests_share_the_container_services():
+    container = create_container()
+
+    with TestClient(create_app(lambda: container)) as client:
+        container.db_client.query.reset_mock()
+        container.db_client.query.return_value = [{'id': 'u-1', 'username': 'ada', 'email': 'ada@example.com'}]
+
+        # Act
+        first = client.get('/users/u-1')
+        second = client.get('/users/u-1')
+
+    # Assert
+    assert first.json() == second.json() == {'user_id': 'u-1', 'username': 'ada', 'email': 'ada@example.com'}
+    # The second request hits the cache of the shared repository instead of the database.
+    assert container.db_client.query.await_count == 1
+
+
+def test_batch_authorization_is_wired():
+    container = create_container()
+    container.authz_token = 'secret'
+    container.db_client.query.return_value = []
+    container.db_client.batch.return_value = [[], []]
+
+    with TestClient(create_app(lambda: container)) as client:
+        # Act
+        response = client.post(
+            '/authz/batch',
+            json={'user_id': 'u-1', 'checks': [{'organization_id': 'o-1', 'permission': 'read'}]},
+            headers={'Authorization': 'Bearer secret'},
+        )
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {
+        'results': [{'organization_id': 'o-1', 'permission': 'read', 'allowed': False, 'error': None}],
+    }
+
+
+def test_batch_authorization_reports_malformed_organizations_per_check():
+    container = create_container()
+    container.authz_token = 'secret'
+    container.db_client.query.return_value = []
+
+    async def batch(statements):
+        if statements[0][1]['id'] == 'o:⟨':
+            raise Exception('Parse error: invalid record ID')
+        return [[], []]
+
+    container.db_client.batch.side_effect = batch
+
+    with TestClient(create_app(lambda: container)) as client:
+        # Act
+        response = client.post(
+            '/authz/batch',
+            json={
+                'user_id': 'u-1',
+                'checks': [{'organization_id': 'o-1', 'permission': 'read'}, {'organization_id': 'o:⟨', 'permission': 'read'}],
+            },
+            headers={'Authorization': 'Bearer secret'},
+        )
+
+    # Assert
+    assert response.status_code == 200
+    results = response.json()['results']
+    assert results[0] == {'organization_id': 'o-1', 'permission': 'read', 'allowed': False, 'error': None}
+    assert results[1]['allowed'] is False
+    assert results[1]['error']
+
+
+@pytest.mark.parametrize('token, headers', [(None, {}), ('secret', {}), ('secret', {'Authorization': 'Bearer guess'})])
+def test_batch_authorization_requires_the_trusted_caller_token(token, headers):
+    container = create_container()
+    container.authz_token = token
+    container.db_client.query.return_value = []
+
+    with TestClient(create_app(lambda: container)) as client:
+        # Act
+        response = client.post(
+            '/authz/batch',
+            json={'user_id': 'u-1', 'checks': [{'organization_id': 'o-1', 'permission': 'read'}]},
+            headers=headers,
+        )
+
+    # Assert
+    assert response.status_code == 401
+    container.db_client.batch.assert_not_called()
+
+
+@pytest.mark.parametrize('accept', ['application/json', 'application/x-ndjson'])
+def test_project_cursor_holding_an_invalid_id_is_rejected(accept):
+    container = create_container()
+    container.db_client.query.return_value = []
+
+    with TestClient(create_app(lambda: container)) as client:
+        # Act
+        response = client.get('/projects', params={'after': encode_cursor('not-a-uuid')}, headers={'Accept': accept})
+
+    # Assert
+    assert response.status_code == 400
+    assert 'Invalid ProjectID' in response.json()['detail']
+
+
+def test_project_config_routes_are_not_implemented_without_storage():
+    container = create_container()
+    container.db_client.query.return_value = []
+
+    with TestClient(create_app(lambda: container)) as client:
+        # Act
+        response = client.get('/projects/p-1/config')
+
+    # Assert
+    assert response.status_code == 501
+
+
+def test_invoke_runs_the_function_in_a_worker():
+    container = create_container()
+    container.authz_token = 'secret'
+    code = 'def handler(payload):\n    return {"greeting": "Hello " + payload["name"]}\n'
+
+    with TestClient(create_app(lambda: container)) as client:
+        container.db_client.query.return_value = [{'id': 'f-1', 'name': 'Greet', 'code': code, 'triggers': ['http']}]
+
+        # Act
+        response = client.post('/cloud_functions/f-1/invoke', json={'payload': {'name': 'Ada'}}, headers=TRUSTED)
+        failed = client.post('/cloud_functions/f-1/invoke', json={'payload': {}}, headers=TRUSTED)
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {'function_id': 'f-1', 'result': {'greeting': 'Hello Ada'}}
+    assert failed.status_code == 502
+    assert failed.json()['detail'].startswith('KeyError')
+
+
+@pytest.mark.parametrize(
+    'method, path', [
+        ('post', '/cloud_functions'),
+        ('put', '/cloud_functions/f-1'),
+        ('delete', '/cloud_functions/f-1'),
+        ('post', '/cloud_functions/f-1/invoke'),
+    ],
+)
+def test_cloud_function_writes_and_invocations_require_the_trusted_caller_token(method, path):
+    container = create_container()
+    container.authz_token = 'secret'
+    container.db_client.query.return_value = []
+
+    with TestClient(create_app(lambda: container)) as client:
+        # Act
+        response = client.request(
+            method, path, json={'name': 'Shell', 'code': 'def handler(payload): pass', 'triggers': []},
+            headers={'Authorization': 'Bearer guess'},
+        )
+
+    # Assert
+    assert response.status_code == 401
+    container.db_client.insert.assert_not_called()
+    container.db_client.batch.assert_not_called()
+
+
+def test_startup_indexes_cloud_function_triggers():
+    container = create_container()
+    container.db_client.query.return_value = []
+
+    async def pages(*args, **kwargs):
+        yield [{'id': 'f-1', 'name': 'On create', 'code': '', 'triggers': ['collection:*:create']}]
+
+    container.db_client.cursor.side_effect = pages
+
+    # Act
+    with TestClient(create_app(lambda: container)):
+        matched = container.trigger_registry.match('collection:c-1:create')
+
+    # Assert
+    assert matched == {'f-1'}
+
+
+def test_repository_writes_are_published_on_the_event_bus():
+    container = create_container()
+    container.db_client.query.return_value = []
+    received = []
+
+    async def handler(events):
+        received.extend(events)
+
+    container.event_bus.subscribe(handler, [CollectionCreated])
+
+    # Act
+    with TestClient(create_app(lambda: container)) as client:
+        response = client.post('/collections', json={'name': 'Orders', 'schema': {'total': 'float'}})
+
+    # Assert
+    assert response.status_code == 201
+    assert [type(event) for event in received] == [CollectionCreated]
+    assert received[0].entity_id == response.json()['collection_id']
+    assert received[0].trigger == f"collection:{response.json()['collection_id']}:create"
+
+
+def test_created_functions_are_indexed_once_committed():
+    container = create_container()
+    container.authz_token = 'secret'
+    container.db_client.query.return_value = []
+
+    # Act
+    with TestClient(create_app(lambda: container)) as client:
+        response = client.post(
+            '/cloud_functions', json={'name': 'On create', 'code': '', 'triggers': ['collection:*:create']},
+            headers=TRUSTED,
+        )
+
+    # Assert
+    assert response.status_code == 201
+    assert container.trigger_registry.match('collection:c-1:create') == {response.json()['function_id']}
+
+
+async def test_bursts_of_function_writes_all_reach_the_trigger_registry():
+    container = create_container()
+    functions = [
+        CloudFunction(CloudFunctionID(f"f-{index}"), 'On create', '', [f"collection:c-{index}:create"])
+        for index in range(3000)
+    ]
+
+    # Act
+    for cloud_function in functions:
+        container.event_bus.publish(CloudFunctionCreated(str(cloud_function.function_id), cloud_function))
+    await container.event_bus.start()
+    await container.event_bus.close()
+
+    # Assert
+    assert container.trigger_registry.match('collection:c-0:create') == {'f-0'}
+    assert container.trigger_registry.match('collection:c-2999:create') == {'f-2999'}
+
+
+async def test_bursts_of_function_writes_all_reach_the_cron_scheduler():
+    container = create_container()
+
+    # Act
+    for index in range(3000):
+        cloud_function = CloudFunction(CloudFunctionID(f"f-{index}"), 'Nightly', '', ['cron:0 3 * * *'])
+        container.event_bus.publish(CloudFunctionCreated(str(cloud_function.function_id), cloud_function))
+    container.event_bus.publish(CloudFunctionDeleted('f-0'))
+    await container.event_bus.start()
+    await container.event_bus.close()
+
+    # Assert
+    assert len(container.cron_scheduler) == 2999
+
+
+def test_conflicting_collection_update_is_retried():
+    container = create_container()
+    container.db_client.query.return_value = [{'id': 'c-1', 'name': 'Orders', 'schema': {}, 'version': 1}]
+    container.db_client.update.side_effect = [[], [{'id': 'c-1'}]]
+
+    with TestClient(create_app(lambda: container)) as client:
+        # Act
+        response = client.put('/collections/c-1', json={'name': 'Invoices', 'schema': {'total': 'float'}})
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json()['name'] == 'Invoices'
+    assert container.db_client.update.await_count == 2
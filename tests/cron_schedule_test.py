@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+import pytest
+from statikk.core.domain.value_objects.cron_schedule import CronSchedule
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    'expression, moment, expected', [
+        ('*/5 * * * *', utc(2026, 3, 1, 12, 3, 30), utc(2026, 3, 1, 12, 5)),
+        ('*/5 * * * *', utc(2026, 3, 1, 12, 5), utc(2026, 3, 1, 12, 10)),
+        ('0 9-17/4 * * mon-fri', utc(2026, 3, 6, 17, 30), utc(2026, 3, 9, 9, 0)),
+        ('30 2 * 2 *', utc(2026, 3, 1), utc(2027, 2, 1, 2, 30)),
+        ('0 0 29 2 *', utc(2026, 1, 1), utc(2028, 2, 29)),
+        ('0 0 13 * 5', utc(2026, 3, 1), utc(2026, 3, 6)),
+        ('15,45 * * * 7', utc(2026, 3, 7, 23, 50), utc(2026, 3, 8, 0, 15)),
+        ('@hourly', utc(2026, 12, 31, 23, 59), utc(2027, 1, 1, 0, 0)),
+    ],
+)
+def test_next_after(expression, moment, expected):
+    # Act
+    next_time = CronSchedule(expression).next_after(moment)
+
+    # Assert
+    assert next_time == expected
+
+
+@pytest.mark.parametrize('expression', ['* * * *', '60 * * * *', '*/0 * * * *', '* * * foo *', '5-1 * * * *', ''])
+def test_invalid_expressions_are_rejected(expression):
+    # Act
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+def test_schedules_that_never_fire_are_reported():
+    # Act
+    with pytest.raises(ValueError):
+        CronSchedule('0 0 30 2 *').next_after(utc(2026, 1, 1))
+
+
+def test_schedules_are_immutable_values():
+    schedule = CronSchedule('*/5  * * * *')
+
+    # Act
+    with pytest.raises(AttributeError):
+        schedule.minutes = frozenset()
+
+    # Assert
+    assert schedule == CronSchedule('*/5 * * * *')
+    assert {schedule: 1}[CronSchedule('*/5 * * * *')] == 1
+
+
+@pytest.mark.parametrize('expression', ['*/7 3-20/3 * * *', '0,30 9-17 * * mon-fri', '5 4 1,15 * sun', '59 23 31 * *'])
+def test_next_after_matches_a_minute_by_minute_scan(expression):
+    schedule = CronSchedule(expression)
+    times = {(hour, minute) for hour in schedule.hours for minute in schedule.minutes}
+    rng = random.Random(expression)
+
+    for _ in range(10):
+        moment = utc(2026, 1, 1) + timedelta(minutes=rng.randrange(0, 366 * 24 * 60), seconds=rng.randrange(60))
+        expected = moment.replace(second=0) + timedelta(minutes=1)
+        while (expected.hour, expected.minute) not in times or not schedule._matches_day(expected):
+            expected += timedelta(minutes=1)
+
+        # Act
+        next_time = schedule.next_after(moment)
+
+        # Assert
+        assert next_time == expected
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from datetime import timezone
+from unittest.mock import Mock
+
+import pytest
+from statikk.core.application.services.cloud_function_runtime import CloudFunctionRuntime
+from statikk.core.application.services.cron_scheduler import CronScheduler
+from statikk.core.domain.entities.cloud_function import CloudFunction
+from statikk.core.domain.value_objects.cloud_function_id import CloudFunctionID
+
+START = datetime(2026, 3, 1, 12, 0, 30, tzinfo=timezone.utc).timestamp()
+
+
+def cloud_function(function_id, *triggers):
+    return CloudFunction(CloudFunctionID(function_id), function_id, 'def handler(payload): pass', list(triggers))
+
+
+@pytest.fixture
+def mock_runtime():
+    return Mock(spec=CloudFunctionRuntime)
+
+
+def create_scheduler(runtime, now=START, **kwargs):
+    clock = Mock(return_value=now)
+    return CronScheduler(runtime, clock=clock, **kwargs)
+
+
+async def test_triggers_fire_on_schedule_with_jitter(mock_runtime):
+    scheduler = create_scheduler(mock_runtime, max_jitter=30.0)
+    scheduler.register(cloud_function('f-1', 'cron:*/5 * * * *', 'http:/ignored'))
+    jitter = scheduler._jitter('f-1')
+
+    # Act
+    early = scheduler.advance(START + 270 + jitter - 1)
+    fired = scheduler.advance(START + 270 + jitter)
+    await asyncio.gather(*fired)
+
+    # Assert
+    assert early == []
+    assert len(fired) == 1
+    mock_runtime.invoke.assert_awaited_once_with(
+        'f-1', {'trigger': 'cron:*/5 * * * *', 'scheduled_at': '2026-03-01T12:05:00+00:00'},
+    )
+    assert len(scheduler) == 1
+
+
+async def test_jitter_spreads_functions_of_the_same_minute(mock_runtime):
+    scheduler = create_scheduler(mock_runtime)
+
+    # Act
+    offsets = {scheduler._jitter(f"f-{i}") for i in range(100)}
+
+    # Assert
+    assert len(offsets) > 50
+    assert all(0 <= offset < 30 for offset in offsets)
+
+
+async def test_missed_firings_are_caught_up_once_after_restart(mock_runtime, tmp_path):
+    checkpoint = tmp_path / 'checkpoint'
+    checkpoint.write_text(repr(START))
+    restarted_at = START + 3600
+    scheduler = create_scheduler(mock_runtime, now=restarted_at, checkpoint_path=str(checkpoint), max_jitter=0)
+    scheduler.register(cloud_function('f-1', 'cron:*/5 * * * *'))
+
+    # Act
+    fired = scheduler.advance(restarted_at)
+    await asyncio.gather(*fired)
+    saved = float(checkpoint.read_text())
+    again = scheduler.advance(restarted_at + 60)
+
+    # Assert
+    assert len(fired) == 1
+    assert again == []
+    assert saved == restarted_at
+
+
+async def test_checkpoints_outside_private_directories_are_ignored(mock_runtime, tmp_path):
+    shared = tmp_path / 'shared'
+    shared.mkdir()
+    shared.chmod(0o777)
+    checkpoint = shared / 'checkpoint'
+    checkpoint.write_text(repr(START))
+    restarted_at = START + 3600
+    scheduler = create_scheduler(mock_runtime, now=restarted_at, checkpoint_path=str(checkpoint), max_jitter=0)
+    scheduler.register(cloud_function('f-1', 'cron:*/5 * * * *'))
+
+    # Act
+    fired = scheduler.advance(restarted_at)
+    await asyncio.gather(*fired)
+
+    # Assert
+    assert fired == []
+    assert float(checkpoint.read_text()) == START
+
+
+async def test_unregister_cancels_firings(mock_runtime):
+    scheduler = create_scheduler(mock_runtime)
+    scheduler.register(cloud_function('f-1', 'cron:* * * * *'))
+    scheduler.register(cloud_function('f-1', 'cron:@daily'))
+
+    # Act
+    scheduler.unregister('f-1')
+
+    # Assert
+    assert len(scheduler) == 0
+    assert scheduler.advance(START + 2 * 86400) == []
+
+
+async def test_invalid_triggers_are_skipped(mock_runtime):
+    scheduler = create_scheduler(mock_runtime)
+
+    # Act
+    scheduler.register(cloud_function('f-1', 'cron:not a schedule', 'cron:0 0 30 2 *', 'cron:@hourly'))
+
+    # Assert
+    assert len(scheduler) == 1
+
+
+async def test_failed_invocations_do_not_stop_the_scheduler(mock_runtime):
+    scheduler = create_scheduler(mock_runtime, max_jitter=0)
+    scheduler.register(cloud_function('f-1', 'cron:* * * * *'))
+    mock_runtime.invoke.side_effect = TimeoutError('too slow')
+
+    # Act
+    first = scheduler.advance(START + 30)
+    await asyncio.gather(*first)
+    second = scheduler.advance(START + 90)
+    await asyncio.gather(*second)
+
+    # Assert
+    assert mock_runtime.invoke.await_count == 2
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from statikk.core.domain.entities.collection import Collection
+from statikk.core.domain.entities.membership import Membership
+from statikk.core.domain.entities.organization import Organization
+from statikk.core.domain.entities.project_config import ProjectConfig
+from statikk.core.domain.entities.role import Role
+from statikk.core.domain.value_objects.collection_id import CollectionID
+from statikk.core.domain.value_objects.config_key import ConfigKey
+from statikk.core.domain.value_objects.organization_id import OrganizationID
+from statikk.core.domain.value_objects.permissions import Permission
+from statikk.core.domain.value_objects.project_id import ProjectID
+from statikk.core.domain.value_objects.role_id import RoleID
+from statikk.core.domain.value_objects.user_id import UserID
+
+
+def test_entities_have_no_instance_dict():
+    collection = Collection(CollectionID('c-1'), 'Users', {'name': 'string'})
+
+    # Act & Assert
+    assert not hasattr(collection, '__dict__')
+    with pytest.raises(AttributeError):
+        collection.unknown = 'value'
+
+
+def test_collection_round_trips_through_row():
+    collection = Collection(CollectionID('c-1'), 'Users', {'name': 'string'}, version=3)
+
+    # Act
+    row = collection.to_row()
+    loaded = Collection.from_row(row)
+
+    # Assert
+    assert row == {'id': 'c-1', 'name': 'Users', 'schema': {'name': 'string'}, 'version': 3}
+    assert loaded.collection_id == CollectionID('c-1')
+    assert loaded.to_dict() == {'collection_id': 'c-1', 'name': 'Users', 'schema': {'name': 'string'}, 'version': 3}
+
+
+def test_missing_columns_take_their_default():
+    # Act
+    collection = Collection.from_row({'id': 'c-1', 'name': 'Users', 'schema': {}})
+
+    # Assert
+    assert collection.version == 0
+
+
+def test_record_ids_read_back_keep_only_the_key():
+    # Act
+    collection = Collection.from_row({'id': 'collections:⟨0190-ab⟩', 'name': 'Users', 'schema': {}})
+    organization = Organization.from_row({'id': 'organizations:org-1', 'name': 'Org', 'owner_id': 'user-1'})
+
+    # Assert
+    assert collection.collection_id == CollectionID('0190-ab')
+    assert collection.to_row()['id'] == '0190-ab'
+    assert organization.organization_id == OrganizationID('org-1')
+
+
+def test_organization_row_leaves_out_members():
+    organization = Organization(OrganizationID('org-1'), 'Org', UserID('user-1'), members={'user-1': 'admin'})
+
+    # Act
+    row = organization.to_row()
+    loaded = Organization.from_row(row)
+
+    # Assert
+    assert row == {'id': 'org-1', 'name': 'Org', 'owner_id': 'user-1', 'version': 0}
+    assert organization.to_dict()['members'] == {'user-1': 'admin'}
+    assert loaded.members == {}
+    assert loaded.member_changes == {}
+
+
+def test_hand_written_codecs_round_trip():
+    project_config = ProjectConfig(ProjectID(), config={ConfigKey('region'): 'eu'})
+    role = Role(RoleID('role-1'), 'reader', [Permission('read')])
+
+    # Act
+    loaded_config = ProjectConfig.from_row(project_config.to_row())
+    loaded_role = Role.from_row(role.to_row())
+
+    # Assert
+    assert loaded_config.config == {ConfigKey('region'): 'eu'}
+    assert loaded_role.has_permission(Permission('read'))
+
+
+def test_membership_round_trips_its_role():
+    role = Role(RoleID('role-1'), 'editor', [Permission('read'), Permission('write')])
+    membership = Membership(OrganizationID('org-1'), UserID('user-1'), role)
+
+    # Act
+    row = membership.to_row()
+    loaded = Membership.from_row(json.loads(json.dumps(row)))
+
+    # Assert
+    assert row['role'] == {'id': 'role-1', 'name': 'editor', 'permissions': ['read', 'write']}
+    assert loaded.role == role
+    assert loaded.role.has_permission(Permission('write'))
+    assert membership.to_dict()['role'] == 'editor'
+
+
+def test_assigning_role_permissions_recompiles_mask():
+    role = Role(RoleID(), 'reader', [Permission('read')])
+
+    # Act
+    role.permissions = [Permission('write')]
+
+    # Assert
+    assert role.has_permission(Permission('write'))
+    assert not role.has_permission(Permission('read'))
+
+
+def test_copies_share_values_until_changed():
+    organization = Organization(OrganizationID('org-1'), 'Acme', UserID('u-1'), members={'u-2': 'member'})
+
+    # Act
+    copy = organization.copy()
+    copy.add_member(UserID('u-3'), 'admin')
+
+    # Assert
+    assert copy.members == {'u-2': 'member', 'u-3': 'admin'}
+    assert organization.members == {'u-2': 'member'}
+    assert organization.member_changes == {}
+    assert organization.copy().members is organization.members
+
+
+def test_member_changes_copy_members_only_once():
+    members = {'u-2': 'member'}
+    organization = Organization(OrganizationID('org-1'), 'Acme', UserID('u-1'), members=members)
+
+    # Act
+    organization.add_member(UserID('u-3'), 'admin')
+    owned = organization.members
+    organization.add_member(UserID('u-4'), 'member')
+    organization.remove_member(UserID('u-2'))
+    copy = organization.copy()
+    copy.update_member_role(UserID('u-3'), 'member')
+
+    # Assert
+    assert members == {'u-2': 'member'}
+    assert organization.members is owned
+    assert organization.members == {'u-3': 'admin', 'u-4': 'member'}
+    assert organization.member_changes == {'u-2': None, 'u-3': 'admin', 'u-4': 'member'}
+    assert copy.members == {'u-3': 'member', 'u-4': 'member'}
+    assert copy.member_changes == {'u-2': None, 'u-3': 'member', 'u-4': 'member'}
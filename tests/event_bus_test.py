@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from statikk.core.domain.events import CollectionCreated
+from statikk.core.domain.events import CollectionDeleted
+from statikk.core.domain.events import CollectionEvent
+from statikk.core.domain.events import CollectionUpdated
+from statikk.core.domain.events import EntityDeleted
+from statikk.core.domain.events import OrganizationMemberRemoved
+from statikk.core.domain.events import OrganizationMemberUpdated
+from statikk.core.domain.events import UserCreated
+from statikk.core.domain.events import UserDeleted
+from statikk.infrastructure.events.event_bus import COALESCE
+from statikk.infrastructure.events.event_bus import DROP_NEWEST
+from statikk.infrastructure.events.event_bus import DROP_OLDEST
+from statikk.infrastructure.events.event_bus import EventBus
+
+
+class Recorder:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.batches = []
+
+    async def __call__(self, events):
+        self.batches.append(events)
+        await asyncio.sleep(self.delay)
+
+    @property
+    def ids(self):
+        return [event.entity_id for batch in self.batches for event in batch]
+
+
+def test_events_carry_their_trigger_key():
+    # Act
+    event = CollectionUpdated('c-1')
+
+    # Assert
+    assert event.trigger == 'collection:c-1:update'
+    assert isinstance(event, CollectionEvent)
+    assert event.occurred_at > 0
+
+
+async def test_events_are_delivered_by_class():
+    bus = EventBus()
+    collections = Recorder()
+    deletions = Recorder()
+    bus.subscribe(collections, [CollectionEvent])
+    bus.subscribe(deletions, [EntityDeleted])
+    await bus.start()
+
+    # Act
+    bus.publish(CollectionCreated('c-1'))
+    bus.publish(UserCreated('u-1'))
+    bus.publish(UserDeleted('u-2'))
+    bus.publish(CollectionDeleted('c-2'))
+    await bus.close()
+
+    # Assert
+    assert collections.ids == ['c-1', 'c-2']
+    assert deletions.ids == ['u-2', 'c-2']
+
+
+async def test_publish_does_not_wait_for_subscribers():
+    bus = EventBus()
+    recorder = Recorder(delay=0.05)
+    bus.subscribe(recorder)
+    await bus.start()
+
+    # Act
+    for index in range(3):
+        bus.publish(CollectionCreated(f"c-{index}"))
+    pending = len(recorder.batches)
+    await bus.close()
+
+    # Assert
+    assert pending == 0
+    assert recorder.ids == ['c-0', 'c-1', 'c-2']
+
+
+async def test_events_published_while_the_handler_runs_are_batched():
+    bus = EventBus()
+    recorder = Recorder(delay=0.01)
+    subscription = bus.subscribe(recorder, batch_size=3)
+    await bus.start()
+    bus.publish(CollectionCreated('c-0'))
+    await asyncio.sleep(0)
+
+    # Act
+    for index in range(1, 6):
+        bus.publish(CollectionCreated(f"c-{index}"))
+    await bus.close()
+
+    # Assert
+    assert [len(batch) for batch in recorder.batches] == [1, 3, 2]
+    assert subscription.delivered == 6
+
+
+async def test_max_delay_fills_batches():
+    bus = EventBus()
+    recorder = Recorder()
+    bus.subscribe(recorder, max_delay=0.01)
+    await bus.start()
+
+    # Act
+    bus.publish(CollectionCreated('c-0'))
+    await asyncio.sleep(0)
+    bus.publish(CollectionCreated('c-1'))
+    await bus.close()
+
+    # Assert
+    assert [len(batch) for batch in recorder.batches] == [2]
+
+
+@pytest.mark.parametrize('overflow, expected', [(DROP_OLDEST, ['c-2', 'c-3']), (DROP_NEWEST, ['c-0', 'c-1'])])
+async def test_full_queues_drop_events(overflow, expected):
+    bus = EventBus()
+    recorder = Recorder()
+    subscription = bus.subscribe(recorder, max_size=2, overflow=overflow)
+
+    # Act
+    for index in range(4):
+        bus.publish(CollectionCreated(f"c-{index}"))
+    await bus.start()
+    await bus.close()
+
+    # Assert
+    assert recorder.ids == expected
+    assert subscription.dropped == 2
+
+
+async def test_coalescing_keeps_the_latest_event_per_entity():
+    bus = EventBus()
+    recorder = Recorder()
+    subscription = bus.subscribe(recorder, max_size=2, overflow=COALESCE)
+
+    # Act
+    bus.publish(CollectionCreated('c-1'))
+    bus.publish(CollectionCreated('c-2'))
+    bus.publish(CollectionUpdated('c-1'))
+    bus.publish(CollectionCreated('c-3'))
+    await bus.start()
+    await bus.close()
+
+    # Assert
+    assert [(type(event), event.entity_id) for batch in recorder.batches for event in batch] == [
+        (CollectionCreated, 'c-2'), (CollectionCreated, 'c-3'),
+    ]
+    assert subscription.coalesced == 1
+    assert subscription.dropped == 1
+
+
+async def test_unbounded_coalescing_queues_drop_nothing():
+    bus = EventBus()
+    recorder = Recorder()
+    subscription = bus.subscribe(recorder, max_size=None, overflow=COALESCE)
+
+    # Act
+    for index in range(3000):
+        bus.publish(CollectionCreated(f"c-{index}"))
+    bus.publish(CollectionDeleted('c-0'))
+    await bus.start()
+    await bus.close()
+
+    # Assert
+    assert len(recorder.ids) == 3000
+    assert type(recorder.batches[0][0]) is CollectionDeleted
+    assert (subscription.dropped, subscription.coalesced) == (0, 1)
+
+
+async def test_member_events_coalesce_per_member():
+    bus = EventBus()
+    recorder = Recorder()
+    subscription = bus.subscribe(recorder, overflow=COALESCE)
+
+    # Act
+    bus.publish(OrganizationMemberUpdated('org-1', 'u-1'))
+    bus.publish(OrganizationMemberUpdated('org-1', 'u-2'))
+    bus.publish(OrganizationMemberRemoved('org-1', 'u-1'))
+    await bus.start()
+    await bus.close()
+
+    # Assert
+    assert [(type(event), event.user_id) for batch in recorder.batches for event in batch] == [
+        (OrganizationMemberRemoved, 'u-1'), (OrganizationMemberUpdated, 'u-2'),
+    ]
+    assert subscription.coalesced == 1
+
+
+async def test_failing_handlers_do_not_stop_delivery():
+    bus = EventBus()
+    received = []
+
+    async def handler(events):
+        received.extend(events)
+        raise ValueError('boom')
+
+    bus.subscribe(handler, batch_size=1)
+    await bus.start()
+
+    # Act
+    bus.publish(CollectionCreated('c-1'))
+    bus.publish(CollectionCreated('c-2'))
+    await bus.close()
+
+    # Assert
+    assert [event.entity_id for event in received] == ['c-1', 'c-2']
+
+
+async def test_unsubscribe_stops_delivery():
+    bus = EventBus()
+    recorder = Recorder()
+    subscription = bus.subscribe(recorder)
+    await bus.start()
+    bus.publish(CollectionCreated('c-1'))
+
+    # Act
+    await bus.unsubscribe(subscription)
+    bus.publish(CollectionCreated('c-2'))
+    await bus.close()
+
+    # Assert
+    assert recorder.ids == ['c-1']
+    assert len(bus) == 0
+    assert not bus.has_subscribers(CollectionCreated)
+
+
+async def test_close_drops_events_it_cannot_deliver_in_time():
+    bus = EventBus()
+    subscription = bus.subscribe(Recorder(delay=1.0), batch_size=1)
+    await bus.start()
+
+    # Act
+    bus.publish(CollectionCreated('c-1'))
+    bus.publish(CollectionCreated('c-2'))
+    await bus.close(timeout=0.01)
+    bus.publish(CollectionCreated('c-3'))
+
+    # Assert
+    assert subscription.dropped == 1
+    assert len(subscription) == 0
+
+
+def test_subscribe_rejects_unknown_overflow_policies():
+    bus = EventBus()
+
+    # Act
+    with pytest.raises(ValueError):
+        bus.subscribe(Recorder(), overflow='block')
+
+    # Assert
+    assert len(bus) == 0
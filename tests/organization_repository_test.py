@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import Mock
+
+import pytest
+from statikk.core.domain.entities.organization import Organization
+from statikk.core.domain.entities.role import Role
+from statikk.core.domain.repositories.organization_repository_impl import SubrrrealDBOrganizationRepository
+from statikk.core.domain.value_objects.organization_id import OrganizationID
+from statikk.core.domain.value_objects.permissions import Permission
+from statikk.core.domain.value_objects.role_id import RoleID
+from statikk.core.domain.value_objects.user_id import UserID
+from statikk.infrastructure.databases.subrreal_db_client import SubrrealDBClient
+
+
+def role(name: str) -> Role:
+    return Role(RoleID(f"role-{name}"), name, [Permission('read')])
+
+
+def role_row(name: str) -> dict:
+    return {'id': f"role-{name}", 'name': name, 'permissions': ['read']}
+
+
+@pytest.fixture
+def mock_db_client():
+    return Mock(spec=SubrrealDBClient)
+
+
+@pytest.fixture
+def organization_repository(mock_db_client):
+    return SubrrrealDBOrganizationRepository(mock_db_client)
+
+
+@pytest.fixture
+def organization():
+    members = {f"user-{i}": role('member') for i in range(1000)}
+    return Organization(OrganizationID('org-123'), 'Test Organization', UserID('user-0'), members=members, version=4)
+
+
+async def test_update_writes_only_changed_memberships(organization_repository, mock_db_client, organization):
+    mock_db_client.query.return_value = [{'id': 'org-123'}]
+    organization.add_member(UserID('user-new'), role('admin'))
+    organization.remove_member(UserID('user-1'))
+
+    # Act
+    await organization_repository.update(organization)
+
+    # Assert
+    parameters = mock_db_client.query.call_args.args[1]
+    assert parameters['version'] == 4
+    assert parameters['data'] == {'name': 'Test Organization', 'owner_id': 'user-0', 'version': 5}
+    assert parameters['upserts'] == [{'organization_id': 'org-123', 'user_id': 'user-new', 'role': role_row('admin')}]
+    assert parameters['removals'] == ['user-1']
+    assert organization.version == 5
+    assert organization.member_changes == {}
+
+
+async def test_save_writes_one_row_per_member(organization_repository, mock_db_client, organization):
+    # Act
+    await organization_repository.save(organization)
+
+    # Assert
+    parameters = mock_db_client.query.call_args.args[1]
+    assert 'members' not in parameters['organization']
+    assert len(parameters['members']) == 1000
+    assert parameters['members'][0] == {'organization_id': 'org-123', 'user_id': 'user-0', 'role': role_row('member')}
+
+
+async def test_get_by_id_reads_organization_and_members_in_one_round_trip(organization_repository, mock_db_client):
+    mock_db_client.batch.return_value = [
+        [{'id': 'org-123', 'name': 'Test Organization', 'owner_id': 'user-0', 'version': 2}],
+        [{'user_id': 'user-0', 'role': role_row('admin')}, {'user_id': 'user-1', 'role': role_row('member')}],
+    ]
+
+    # Act
+    organization = await organization_repository.get_by_id(OrganizationID('org-123'))
+
+    # Assert
+    mock_db_client.batch.assert_called_once()
+    assert organization.members == {'user-0': role('admin'), 'user-1': role('member')}
+    assert organization.version == 2
+
+
+async def test_get_with_members_reads_only_their_membership_records(organization_repository, mock_db_client):
+    mock_db_client.batch.return_value = [
+        [{'id': 'organizations:org-123', 'name': 'Test Organization', 'owner_id': 'user-0', 'version': 2}],
+        [{'user_id': 'user-1', 'role': role_row('member')}],
+        [],
+    ]
+
+    # Act
+    organization = await organization_repository.get_with_members(OrganizationID('org-123'), [UserID('user-1'), UserID('user-2')])
+
+    # Assert
+    statements = mock_db_client.batch.call_args.args[0]
+    assert [parameters for _, parameters in statements[1:]] == [
+        {'identifier': 'org-123', 'user_id': 'user-1'}, {'identifier': 'org-123', 'user_id': 'user-2'},
+    ]
+    assert all('FROM type::thing' in query for query, _ in statements)
+    assert organization.members == {'user-1': role('member')}
+    assert organization.partial
+
+
+async def test_member_roles_survive_a_save_and_reload(organization_repository, mock_db_client):
+    editor = Role(RoleID('role-editor'), 'editor', [Permission('read'), Permission('update_organization')])
+    organization = Organization(OrganizationID('org-123'), 'Test Organization', UserID('user-0'))
+    organization.add_member(UserID('user-1'), editor)
+    await organization_repository.save(organization)
+    # What the database stores is JSON.
+    stored = json.loads(json.dumps(mock_db_client.query.call_args.args[1]))
+    mock_db_client.batch.return_value = [
+        [stored['organization']],
+        [{'user_id': member['user_id'], 'role': member['role']} for member in stored['members']],
+    ]
+
+    # Act
+    loaded = await organization_repository.get_by_id(OrganizationID('org-123'))
+
+    # Assert
+    role = loaded.get_member_role(UserID('user-1'))
+    assert isinstance(role, Role)
+    assert role == editor
+    assert role.has_permission(Permission('update_organization'))
+
+
+async def test_failed_update_keeps_member_changes(organization_repository, mock_db_client, organization):
+    mock_db_client.query.return_value = []
+    organization.add_member(UserID('user-new'), role('admin'))
+
+    # Act & Assert
+    with pytest.raises(KeyError):
+        await organization_repository.update(organization)
+    assert organization.member_changes == {'user-new': role('admin')}
+
+
+async def test_list_members_continues_after_cursor(organization_repository, mock_db_client):
+    mock_db_client.query.return_value = [{'organization_id': 'org-123', 'user_id': 'user-5', 'role': role_row('member')}]
+
+    # Act
+    members = await organization_repository.list_members(OrganizationID('org-123'), UserID('user-4'), limit=10)
+
+    # Assert
+    query, parameters = mock_db_client.query.call_args.args
+    assert 'user_id > $after ORDER BY user_id LIMIT $limit' in query
+    assert parameters == {'organization_id': 'org-123', 'after': 'user-4', 'limit': 10}
+    assert [str(m.user_id) for m in members] == ['user-5']
+
+
+async def test_list_organizations_for_user_queries_by_user(organization_repository, mock_db_client):
+    mock_db_client.query.return_value = [
+        {'organization_id': 'org-1', 'user_id': 'user-0', 'role': role_row('admin')},
+        {'organization_id': 'org-2', 'user_id': 'user-0', 'role': role_row('member')},
+    ]
+
+    # Act
+    memberships = await organization_repository.list_organizations_for_user(UserID('user-0'))
+
+    # Assert
+    assert mock_db_client.query.call_args.args[1] == {'user_id': 'user-0'}
+    assert [(str(m.organization_id), m.role) for m in memberships] == [('org-1', role('admin')), ('org-2', role('member'))]
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import Mock
 from unittest.mock import patch
 
 import pytest
 from statikk.core.application.services.organization_service import OrganizationService
+from statikk.core.application.services.permission_cache import PermissionCache
+from statikk.core.domain.entities.membership import Membership
 from statikk.core.domain.entities.organization import Organization
 from statikk.core.domain.entities.role import Role
 from statikk.core.domain.repositories.organization_repository import OrganizationRepository
@@ -24,12 +27,12 @@ def organization_service(mock_organization_repository):
     return OrganizationService(mock_organization_repository)
 
 
-def test_create_organization(organization_service, mock_organization_repository):
+async def test_create_organization(organization_service, mock_organization_repository):
     owner_id = 'user-123'
     org_name = 'Test Organization'
 
     # Act
-    organization = organization_service.create_organization(name=org_name, owner_id=owner_id)
+    organization = await organization_service.create_organization(name=org_name, owner_id=owner_id)
 
     # Assert
     assert organization.name == org_name
@@ -37,7 +40,7 @@ def test_create_organization(organization_service, mock_organization_repository)
     mock_organization_repository.save.assert_called_once_with(organization)
 
 
-def test_get_organization(organization_service, mock_organization_repository):
+async def test_get_organization(organization_service, mock_organization_repository):
     org_id = 'org-123'
     mock_organization = Organization(
         organization_id=OrganizationID(org_id),
@@ -47,7 +50,7 @@ def test_get_organization(organization_service, mock_organization_repository):
     mock_organization_repository.get_by_id.return_value = mock_organization
 
     # Act
-    organization = organization_service.get_organization(org_id)
+    organization = await organization_service.get_organization(org_id)
 
     # Assert
     assert organization.name == 'Existing Organization'
@@ -56,7 +59,7 @@ def test_get_organization(organization_service, mock_organization_repository):
 
 
 @patch.object(OrganizationService, 'check_permission', return_value=True)
-def test_update_organization(mock_check_permission, organization_service, mock_organization_repository):
+async def test_update_organization(mock_check_permission, organization_service, mock_organization_repository):
     org_id = 'org-123'
     new_name = 'Updated Organization'
     mock_organization = Organization(
@@ -67,7 +70,7 @@ def test_update_organization(mock_check_permission, organization_service, mock_o
     mock_organization_repository.get_by_id.return_value = mock_organization
 
     # Act
-    updated_org = organization_service.update_organization(org_id, new_name, 'owner-123')
+    updated_org = await organization_service.update_organization(org_id, new_name, 'owner-123')
 
     # Assert
     assert updated_org.name == new_name
@@ -75,7 +78,7 @@ def test_update_organization(mock_check_permission, organization_service, mock_o
 
 
 @patch.object(OrganizationService, 'check_permission', return_value=True)
-def test_delete_organization(mock_check_permission, organization_service, mock_organization_repository):
+async def test_delete_organization(mock_check_permission, organization_service, mock_organization_repository):
     org_id = 'org-123'
     mock_organization_repository.get_by_id.return_value = Organization(
         organization_id=OrganizationID(org_id),
@@ -84,14 +87,14 @@ def test_delete_organization(mock_check_permission, organization_service, mock_o
     )
 
     # Act
-    organization_service.delete_organization(org_id, 'owner-123')
+    await organization_service.delete_organization(org_id, 'owner-123')
 
     # Assert
     mock_organization_repository.delete.assert_called_once_with(OrganizationID(org_id))
 
 
 @patch.object(OrganizationService, 'check_permission', return_value=True)
-def test_add_member(mock_check_permission, organization_service, mock_organization_repository):
+async def test_add_member(mock_check_permission, organization_service, mock_organization_repository):
     org_id = 'org-123'
     user_id = 'user-456'
     role = Role(RoleID(), 'member', [Permission('read'), Permission('write')])
@@ -100,20 +103,22 @@ def test_add_member(mock_check_permission, organization_service, mock_organizati
         name='Org with Members',
         owner_id=UserID('owner-123'),
     )
-    mock_organization_repository.get_by_id.return_value = mock_organization
+    mock_organization_repository.get_with_members.return_value = mock_organization
 
     # Act
-    updated_org = organization_service.add_member(org_id, user_id, role, 'owner-123')
+    updated_org = await organization_service.add_member(org_id, user_id, role, 'owner-123')
 
     # Assert
     assert user_id in [str(uid) for uid in updated_org.members.keys()]
     print(updated_org.members)
     assert updated_org.members[user_id].name == 'member'
     mock_organization_repository.update.assert_called_once_with(mock_organization)
+    mock_organization_repository.get_with_members.assert_called_once_with(OrganizationID(org_id), [UserID(user_id)])
+    mock_organization_repository.get_by_id.assert_not_called()
 
 
 @patch.object(OrganizationService, 'check_permission', return_value=True)
-def test_remove_member(mock_check_permission, organization_service, mock_organization_repository):
+async def test_remove_member(mock_check_permission, organization_service, mock_organization_repository):
     org_id = 'org-123'
     user_id = 'user-456'
     mock_organization = Organization(
@@ -122,11 +127,156 @@ def test_remove_member(mock_check_permission, organization_service, mock_organiz
         owner_id=UserID('owner-123'),
         members={UserID(user_id).id: Role(RoleID(), 'member', [Permission('read')])},
     )
-    mock_organization_repository.get_by_id.return_value = mock_organization
+    mock_organization_repository.get_with_members.return_value = mock_organization
 
     # Act
-    updated_org = organization_service.remove_member(org_id, user_id, 'owner-123')
+    updated_org = await organization_service.remove_member(org_id, user_id, 'owner-123')
 
     # Assert
     assert user_id not in [str(uid) for uid in updated_org.members.keys()]
     mock_organization_repository.update.assert_called_once_with(mock_organization)
+
+
+async def test_list_members_page(organization_service, mock_organization_repository):
+    mock_organization_repository.list_members.return_value = [
+        Membership(OrganizationID('org-123'), UserID(f"user-{i}"), 'member') for i in range(3)
+    ]
+
+    # Act
+    members, after = await organization_service.list_members_page('org-123', 2, after='user-a')
+
+    # Assert
+    mock_organization_repository.list_members.assert_called_once_with(OrganizationID('org-123'), UserID('user-a'), limit=3)
+    assert len(members) == 2
+    assert after == 'user-1'
+
+
+async def test_check_permission_caches_member_mask(organization_service, mock_organization_repository):
+    mock_organization_repository.get_with_members.return_value = Organization(
+        organization_id=OrganizationID('org-123'),
+        name='Org with Members',
+        owner_id=UserID('owner-123'),
+        members={'user-456': Role(RoleID(), 'member', [Permission('read')])},
+    )
+
+    # Act
+    can_read = await organization_service.check_permission('org-123', 'user-456', Permission('read'))
+    can_write = await organization_service.check_permission('org-123', 'user-456', Permission('write'))
+
+    # Assert
+    assert can_read
+    assert not can_write
+    mock_organization_repository.get_with_members.assert_called_once()
+
+
+async def test_member_change_invalidates_cached_mask(mock_organization_repository):
+    organization = Organization(
+        organization_id=OrganizationID('org-123'),
+        name='Org with Members',
+        owner_id=UserID('owner-123'),
+        members={'owner-123': Role(RoleID(), 'admin', [Permission('add_member'), Permission('remove_member')])},
+    )
+    mock_organization_repository.get_with_members.return_value = organization
+    organization_service = OrganizationService(mock_organization_repository, PermissionCache())
+    assert not await organization_service.check_permission('org-123', 'user-456', Permission('read'))
+
+    # Act
+    await organization_service.add_member('org-123', 'user-456', Role(RoleID(), 'member', [Permission('read')]), 'owner-123')
+    after_add = await organization_service.check_permission('org-123', 'user-456', Permission('read'))
+    await organization_service.remove_member('org-123', 'user-456', 'owner-123')
+    after_remove = await organization_service.check_permission('org-123', 'user-456', Permission('read'))
+
+    # Assert
+    assert after_add
+    assert not after_remove
+
+
+async def test_delete_organization_invalidates_cached_masks(mock_organization_repository):
+    mock_organization_repository.get_with_members.return_value = Organization(
+        organization_id=OrganizationID('org-123'),
+        name='Org with Members',
+        owner_id=UserID('owner-123'),
+        members={'owner-123': Role(RoleID(), 'admin', [Permission('delete_organization')])},
+    )
+    organization_service = OrganizationService(mock_organization_repository, PermissionCache())
+
+    # Act
+    await organization_service.delete_organization('org-123', 'owner-123')
+    mock_organization_repository.get_with_members.side_effect = KeyError('org-123')
+
+    # Assert
+    with pytest.raises(KeyError):
+        await organization_service.check_permission('org-123', 'owner-123', Permission('delete_organization'))
+
+
+async def test_check_permissions_loads_each_organization_once(organization_service, mock_organization_repository):
+    reader = Role(RoleID(), 'reader', [Permission('read')])
+    writer = Role(RoleID(), 'writer', [Permission('write')])
+    organizations = {
+        'org-1': Organization(OrganizationID('org-1'), 'One', UserID('owner'), members={'user-1': reader}),
+        'org-2': Organization(OrganizationID('org-2'), 'Two', UserID('owner'), members={'user-1': writer}),
+    }
+
+    async def get_with_members(organization_id, user_ids):
+        if organization_id.id not in organizations:
+            raise KeyError(organization_id.id)
+        return organizations[organization_id.id]
+
+    mock_organization_repository.get_with_members.side_effect = get_with_members
+    checks = [
+        ('org-1', Permission('read')),
+        ('org-1', Permission('write')),
+        ('org-2', Permission('write')),
+        ('org-2', Permission('read')),
+        ('org-missing', Permission('read')),
+    ]
+
+    # Act
+    allowed = await organization_service.check_permissions('user-1', checks)
+
+    # Assert
+    assert allowed == [True, False, True, False, False]
+    assert mock_organization_repository.get_with_members.call_count == 3
+
+
+async def test_check_permissions_can_return_per_organization_errors(organization_service, mock_organization_repository):
+    reader = Role(RoleID(), 'reader', [Permission('read')])
+
+    async def get_with_members(organization_id, user_ids):
+        if organization_id.id == 'org:bad':
+            raise Exception('Database error: Could not retrieve organization.')
+        return Organization(OrganizationID('org-1'), 'One', UserID('owner'), members={'user-1': reader})
+
+    mock_organization_repository.get_with_members.side_effect = get_with_members
+    checks = [('org-1', Permission('read')), ('org:bad', Permission('read'))]
+
+    # Act
+    allowed = await organization_service.check_permissions('user-1', checks, return_exceptions=True)
+
+    # Assert
+    assert allowed[0] is True
+    assert isinstance(allowed[1], Exception)
+    with pytest.raises(Exception):
+        await organization_service.check_permissions('user-1', checks)
+
+
+async def test_check_permissions_bounds_concurrent_loads(mock_organization_repository):
+    in_flight = peak = 0
+
+    async def get_with_members(organization_id, user_ids):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return Organization(organization_id, 'Org', UserID('owner'))
+
+    mock_organization_repository.get_with_members.side_effect = get_with_members
+    organization_service = OrganizationService(mock_organization_repository, max_concurrent_loads=3)
+
+    # Act
+    allowed = await organization_service.check_permissions('user-1', [(f"org-{i}", Permission('read')) for i in range(50)])
+
+    # Assert
+    assert allowed == [False] * 50
+    assert peak == 3
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pytest
+from statikk.interfaces.api.pagination import decode_cursor
+from statikk.interfaces.api.pagination import encode_cursor
+
+
+def test_cursor_round_trip():
+    # Act
+    cursor = encode_cursor('col-123')
+
+    # Assert
+    assert 'col-123' not in cursor
+    assert decode_cursor(cursor) == 'col-123'
+
+
+def test_no_cursor_means_first_or_last_page():
+    # Act & Assert
+    assert encode_cursor(None) is None
+    assert decode_cursor(None) is None
+
+
+@pytest.mark.parametrize('cursor', ['not a cursor', 'e30', 'eyJhZnRlciI6IDF9'])
+def test_decode_cursor_rejects_malformed_cursors(cursor):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
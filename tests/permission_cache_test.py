@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from statikk.core.application.services.permission_cache import PermissionCache
+from statikk.core.domain.entities.role import Role
+from statikk.core.domain.value_objects.permissions import Permission
+from statikk.core.domain.value_objects.permissions import PermissionRegistry
+from statikk.core.domain.value_objects.role_id import RoleID
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_registry_interns_names_into_distinct_bits():
+    registry = PermissionRegistry()
+
+    # Act
+    read = registry.register('read')
+    write = registry.register('write')
+
+    # Assert
+    assert registry.register('read') == read
+    assert read & write == 0
+    assert registry.bit('unknown') == 0
+    assert registry.names(read | write) == ['read', 'write']
+
+
+def test_role_mask_follows_permission_changes():
+    role = Role(RoleID(), 'editor', [Permission('read')])
+
+    # Act
+    role.add_permission(Permission('write'))
+    role.remove_permission(Permission('read'))
+
+    # Assert
+    assert role.has_permission(Permission('write'))
+    assert not role.has_permission(Permission('read'))
+    assert not role.has_permission(Permission('never_granted'))
+
+
+def test_cache_evicts_least_recently_used():
+    cache = PermissionCache(max_size=2)
+    cache.put('org-1', 'user-1', 1)
+    cache.put('org-1', 'user-2', 2)
+    cache.get('org-1', 'user-1')
+
+    # Act
+    cache.put('org-2', 'user-1', 3)
+
+    # Assert
+    assert cache.get('org-1', 'user-2') is None
+    assert cache.get('org-1', 'user-1') == 1
+    assert len(cache) == 2
+
+
+def test_cache_entries_expire():
+    clock = FakeClock()
+    cache = PermissionCache(ttl=10.0, clock=clock)
+    cache.put('org-1', 'user-1', 1)
+
+    # Act
+    clock.now = 10.0
+
+    # Assert
+    assert cache.get('org-1', 'user-1') is None
+
+
+def test_invalidate_organization_drops_all_its_members():
+    cache = PermissionCache()
+    cache.put('org-1', 'user-1', 1)
+    cache.put('org-1', 'user-2', 2)
+    cache.put('org-2', 'user-1', 3)
+
+    # Act
+    cache.invalidate('org-1')
+
+    # Assert
+    assert cache.get('org-1', 'user-1') is None
+    assert cache.get('org-1', 'user-2') is None
+    assert cache.get('org-2', 'user-1') == 3
+
+
+def test_organization_ids_are_normalized_to_their_record_key():
+    cache = PermissionCache()
+    cache.put('organizations:⟨org-1⟩', 'user-1', 1)
+    cache.put('org-1', 'user-2', 2)
+
+    # Act
+    cached = cache.get('org-1', 'user-1')
+    cache.invalidate('organizations:org-1', 'user-2')
+
+    # Assert
+    assert cached == 1
+    assert cache.get('org-1', 'user-2') is None
+
+
+def test_put_skips_mask_computed_before_invalidation():
+    cache = PermissionCache()
+    generation = cache.generation
+    cache.invalidate('org-1', 'user-1')
+
+    # Act
+    cache.put('org-1', 'user-1', 1, generation=generation)
+
+    # Assert
+    assert cache.get('org-1', 'user-1') is None
@@ -20,14 +20,14 @@ def project_service(mock_project_repository):
     return ProjectService(project_repository=mock_project_repository)
 
 
-def test_create_project(project_service, mock_project_repository):
+async def test_create_project(project_service, mock_project_repository):
     # Arrange
     name = 'Test Project'
     description = 'Description of the test project'
     expected_project = Project(project_id=ProjectID(), name=name, description=description)
 
     # Act
-    project = project_service.create_project(name, description)
+    project = await project_service.create_project(name, description)
 
     # Assert
     assert project.name == expected_project.name
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from statikk.core.domain.entities.collection import Collection
+from statikk.core.domain.entities.organization import Organization
+from statikk.core.domain.entities.role import Role
+from statikk.core.domain.events import CollectionCreated
+from statikk.core.domain.events import CollectionDeleted
+from statikk.core.domain.events import CollectionEvent
+from statikk.core.domain.events import CollectionUpdated
+from statikk.core.domain.events import organization_member_events
+from statikk.core.domain.events import OrganizationCreated
+from statikk.core.domain.events import OrganizationDeleted
+from statikk.core.domain.events import OrganizationEvent
+from statikk.core.domain.events import OrganizationMemberRemoved
+from statikk.core.domain.events import OrganizationMemberUpdated
+from statikk.core.domain.events import OrganizationUpdated
+from statikk.core.domain.repositories.collection_repository_impl import SubrrealDBCollectionRepository
+from statikk.core.domain.repositories.organization_repository_impl import SubrrrealDBOrganizationRepository
+from statikk.core.domain.value_objects.collection_id import CollectionID
+from statikk.core.domain.value_objects.organization_id import OrganizationID
+from statikk.core.domain.value_objects.role_id import RoleID
+from statikk.core.domain.value_objects.user_id import UserID
+from statikk.infrastructure.databases.bulk_write import BulkWriteResult
+from statikk.infrastructure.databases.bulk_write import ChunkError
+from statikk.infrastructure.events.event_bus import EventBus
+from statikk.infrastructure.events.publishing_repository import EventPublishingRepository
+
+
+@pytest.fixture
+def mock_collection_repository():
+    return Mock(spec=SubrrealDBCollectionRepository)
+
+
+@pytest.fixture
+def event_bus():
+    bus = EventBus()
+    bus.published = []
+
+    async def record(events):
+        bus.published.extend(events)
+
+    bus.subscribe(record, [CollectionEvent])
+    return bus
+
+
+@pytest.fixture
+def repository(mock_collection_repository, event_bus):
+    return EventPublishingRepository(
+        mock_collection_repository, event_bus, 'collection_id', CollectionCreated, CollectionUpdated, CollectionDeleted,
+    )
+
+
+def collection(collection_id: str) -> Collection:
+    return Collection(CollectionID(collection_id), collection_id, {})
+
+
+async def test_writes_publish_their_events(repository, event_bus):
+    created = collection('c-1')
+    await event_bus.start()
+
+    # Act
+    await repository.save(created)
+    await repository.update(created)
+    await repository.delete(CollectionID('c-1'))
+    await event_bus.close()
+
+    # Assert
+    assert [type(event) for event in event_bus.published] == [CollectionCreated, CollectionUpdated, CollectionDeleted]
+    assert [event.entity_id for event in event_bus.published] == ['c-1'] * 3
+    assert event_bus.published[0].entity is not created
+    assert event_bus.published[0].entity.name == 'c-1'
+    assert event_bus.published[2].entity is None
+
+
+async def test_events_do_not_see_later_changes(repository, event_bus):
+    updated = collection('c-1')
+    await event_bus.start()
+
+    # Act
+    await repository.update(updated)
+    updated.name = 'renamed'
+    await event_bus.close()
+
+    # Assert
+    assert event_bus.published[0].entity.name == 'c-1'
+
+
+async def test_organization_writes_publish_their_member_changes():
+    bus = EventBus()
+    published = []
+
+    async def record(events):
+        published.extend(events)
+
+    bus.subscribe(record, [OrganizationEvent])
+    repository = EventPublishingRepository(
+        Mock(spec=SubrrrealDBOrganizationRepository), bus, 'organization_id',
+        OrganizationCreated, OrganizationUpdated, OrganizationDeleted, details=organization_member_events,
+    )
+    organization = Organization(OrganizationID('org-1'), 'Acme', UserID('u-1'), members={'u-2': Role(RoleID(), 'viewer', [])})
+    editor = Role(RoleID(), 'editor', [])
+    organization.add_member(UserID('u-3'), editor)
+    organization.remove_member(UserID('u-2'))
+    await bus.start()
+
+    # Act
+    await repository.update(organization)
+    await bus.close()
+
+    # Assert
+    assert [type(event) for event in published] == [OrganizationUpdated, OrganizationMemberUpdated, OrganizationMemberRemoved]
+    assert [(event.entity_id, event.user_id) for event in published[1:]] == [('org-1', 'u-3'), ('org-1', 'u-2')]
+    assert published[1].role is editor
+
+
+async def test_failed_writes_publish_nothing(repository, mock_collection_repository, event_bus):
+    mock_collection_repository.update.side_effect = KeyError('c-1')
+    await event_bus.start()
+
+    # Act
+    with pytest.raises(KeyError):
+        await repository.update(collection('c-1'))
+    await event_bus.close()
+
+    # Assert
+    assert event_bus.published == []
+
+
+async def test_save_many_publishes_the_chunks_written(repository, mock_collection_repository, event_bus):
+    result = BulkWriteResult()
+    result.errors.append(ChunkError(1, 2, 2, ValueError('duplicate')))
+
+    async def save_many(collections, chunk_size, upsert):
+        list(collections)
+        return result
+
+    mock_collection_repository.save_many.side_effect = save_many
+    await event_bus.start()
+
+    # Act
+    returned = await repository.save_many((collection(f"c-{index}") for index in range(5)), chunk_size=2)
+    await event_bus.close()
+
+    # Assert
+    assert returned is result
+    assert [event.entity_id for event in event_bus.published] == ['c-0', 'c-1', 'c-4']
+
+
+async def test_other_methods_are_passed_through(repository, mock_collection_repository):
+    mock_collection_repository.get_by_id.return_value = collection('c-1')
+
+    # Act
+    found = await repository.get_by_id(CollectionID('c-1'))
+
+    # Assert
+    assert found.name == 'c-1'
+    mock_collection_repository.get_by_id.assert_awaited_once_with(CollectionID('c-1'))
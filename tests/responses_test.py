@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from statikk.core.domain.entities.collection import Collection
+from statikk.core.domain.entities.membership import Membership
+from statikk.core.domain.entities.organization import Organization
+from statikk.core.domain.entities.role import Role
+from statikk.core.domain.value_objects.collection_id import CollectionID
+from statikk.core.domain.value_objects.organization_id import OrganizationID
+from statikk.core.domain.value_objects.permissions import Permission
+from statikk.core.domain.value_objects.role_id import RoleID
+from statikk.core.domain.value_objects.user_id import UserID
+from statikk.interfaces.api.pagination import Page
+from statikk.interfaces.api.responses import entity_response
+from statikk.interfaces.api.responses import JSONResponse
+from statikk.interfaces.api.responses import list_response
+from statikk.interfaces.api.responses import ORJSONRoute
+from statikk.interfaces.api.responses import page_response
+from statikk.interfaces.api.responses import project
+
+
+class CollectionResponse(BaseModel):
+    collection_id: str
+    name: str
+    schema: dict[str, str]
+
+
+class CollectionRequest(BaseModel):
+    name: str
+
+
+def create_app(collections):
+    router = APIRouter(route_class=ORJSONRoute)
+
+    @router.get('/collections', response_model=Page[CollectionResponse])
+    async def list_collections():
+        return page_response(collections, CollectionResponse, 'next')
+
+    @router.get('/collections/{collection_id}', response_model=CollectionResponse)
+    async def get_collection(collection_id: str):
+        return entity_response(collections[0], CollectionResponse)
+
+    @router.post('/collections')
+    async def create_collection(request: CollectionRequest):
+        return {'name': request.name}
+
+    app = FastAPI(default_response_class=JSONResponse)
+    app.include_router(router)
+    return app
+
+
+def test_project_keeps_only_model_fields():
+    collection = Collection(CollectionID('c-1'), 'Users', {'name': 'string'}, version=2)
+
+    # Act
+    values = project(collection, CollectionResponse)
+
+    # Assert
+    assert values == {'collection_id': 'c-1', 'name': 'Users', 'schema': {'name': 'string'}}
+
+
+def test_fast_responses_match_validated_models():
+    collections = [Collection(CollectionID(f"c-{i}"), f"Collection {i}", {'name': 'string'}) for i in range(3)]
+    client = TestClient(create_app(collections))
+    expected = Page[CollectionResponse](
+        items=[CollectionResponse(**c.to_dict()) for c in collections],
+        next_cursor='next',
+    )
+
+    # Act
+    page = client.get('/collections')
+    single = client.get('/collections/c-0')
+
+    # Assert
+    assert page.json() == expected.model_dump()
+    assert single.json() == expected.items[0].model_dump()
+
+
+class OrganizationResponse(BaseModel):
+    organization_id: str
+    name: str
+    owner_id: str
+    members: dict[str, str]
+
+
+class MembershipResponse(BaseModel):
+    organization_id: str
+    user_id: str
+    role: str
+
+
+def test_fast_responses_convert_roles_like_validation():
+    editor = Role(RoleID('role-1'), 'editor', [Permission('read')])
+    organization = Organization(OrganizationID('org-1'), 'Acme', UserID('u-1'), members={'u-2': editor})
+    membership = Membership(OrganizationID('org-1'), UserID('u-2'), editor)
+    router = APIRouter(route_class=ORJSONRoute)
+
+    @router.get('/organization', response_model=OrganizationResponse)
+    async def get_organization():
+        return entity_response(organization, OrganizationResponse)
+
+    @router.get('/memberships', response_model=list[MembershipResponse])
+    async def list_memberships():
+        return list_response([membership], MembershipResponse)
+
+    app = FastAPI(default_response_class=JSONResponse)
+    app.include_router(router)
+    client = TestClient(app)
+
+    # Act
+    single = client.get('/organization')
+    memberships = client.get('/memberships')
+
+    # Assert
+    assert single.json() == OrganizationResponse.model_validate(
+        {'organization_id': 'org-1', 'name': 'Acme', 'owner_id': 'u-1', 'members': {'u-2': 'editor'}},
+    ).model_dump()
+    assert memberships.json() == [
+        MembershipResponse.model_validate({'organization_id': 'org-1', 'user_id': 'u-2', 'role': 'editor'}).model_dump(),
+    ]
+
+
+def test_request_bodies_are_decoded_and_invalid_json_rejected():
+    client = TestClient(create_app([]))
+
+    # Act
+    valid = client.post('/collections', json={'name': 'Users'})
+    invalid = client.post('/collections', content=b'{"name":', headers={'content-type': 'application/json'})
+
+    # Assert
+    assert valid.json() == {'name': 'Users'}
+    assert invalid.status_code == 422
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from statikk.infrastructure.databases.statement_cache import PreparedStatement
+from statikk.infrastructure.databases.statement_cache import StatementCache
+
+
+def test_parse_normalizes_whitespace_outside_literals():
+    # Act
+    statement = PreparedStatement.parse("SELECT *\n    FROM users\n    WHERE name = 'a  b' AND id = $id;")
+
+    # Assert
+    assert statement.text == "SELECT * FROM users WHERE name = 'a  b' AND id = $id"
+    assert statement.variables == ['id']
+    assert statement.statement_count == 1
+
+
+def test_parse_ignores_variables_and_separators_inside_literals():
+    # Act
+    statement = PreparedStatement.parse("SELECT * FROM users WHERE note = '$id; x' AND id = $id")
+
+    # Assert
+    assert statement.variables == ['id']
+    assert statement.statement_count == 1
+
+
+def test_parse_counts_statements():
+    # Act
+    statement = PreparedStatement.parse('LET $x = 1; RETURN $x')
+
+    # Assert
+    assert statement.statement_count == 2
+
+
+def test_render_prefixes_only_bound_variables():
+    statement = PreparedStatement.parse('UPDATE users SET seen = $value WHERE id = $id RETURN $before')
+
+    # Act
+    text = statement.render('s1_', {'id': '1', 'value': True})
+
+    # Assert
+    assert text == 'UPDATE users SET seen = $s1_value WHERE id = $s1_id RETURN $before'
+
+
+def test_cache_counts_hits_and_misses():
+    cache = StatementCache()
+
+    # Act
+    first = cache.prepare('SELECT * FROM users WHERE id = $id')
+    second = cache.prepare('SELECT * FROM users WHERE id = $id')
+
+    # Assert
+    assert first is second
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_ratio == 0.5
+
+
+def test_cache_evicts_least_recently_used():
+    cache = StatementCache(max_size=2)
+    cache.prepare('SELECT * FROM a')
+    cache.prepare('SELECT * FROM b')
+    cache.prepare('SELECT * FROM a')
+
+    # Act
+    cache.prepare('SELECT * FROM c')
+
+    # Assert
+    assert len(cache) == 2
+    cache.prepare('SELECT * FROM a')
+    assert cache.misses == 3
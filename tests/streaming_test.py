@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from fastapi import Depends
+from fastapi import FastAPI
+from fastapi import Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from statikk.interfaces.api import streaming
+from statikk.interfaces.api.streaming import ndjson_response
+from statikk.interfaces.api.streaming import wants_ndjson
+
+
+class ItemResponse(BaseModel):
+    item_id: str
+
+
+def create_app(count):
+    app = FastAPI()
+
+    async def items():
+        for i in range(count):
+            yield str(i)
+
+    async def negotiate(request: Request):
+        return wants_ndjson(request)
+
+    @app.get('/items')
+    async def list_items(ndjson: bool = Depends(negotiate)):
+        if ndjson:
+            return ndjson_response(items(), lambda item: ItemResponse(item_id=item))
+        return [ItemResponse(item_id=item) async for item in items()]
+
+    return TestClient(app)
+
+
+def test_ndjson_streams_one_object_per_line():
+    client = create_app(3)
+
+    # Act
+    response = client.get('/items', headers={'Accept': 'application/json;q=0.5, application/x-ndjson'})
+
+    # Assert
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert response.text == '{"item_id":"0"}\n{"item_id":"1"}\n{"item_id":"2"}\n'
+
+
+async def test_ndjson_is_flushed_in_chunks(monkeypatch):
+    monkeypatch.setattr(streaming, 'FLUSH_SIZE', 32)
+
+    async def items():
+        for i in range(5):
+            yield str(i)
+
+    response = ndjson_response(items(), lambda item: ItemResponse(item_id=item))
+
+    # Act
+    chunks = [chunk async for chunk in response.body_iterator]
+
+    # Assert
+    assert len(chunks) == 3
+    assert b''.join(chunks).count(b'\n') == 5
+
+
+def test_json_is_returned_without_ndjson_accept_header():
+    client = create_app(1)
+
+    # Act
+    response = client.get('/items', headers={'Accept': 'application/json'})
+
+    # Assert
+    assert response.json() == [{'item_id': '0'}]
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from statikk.infrastructure.databases.statement_batcher import StatementBatcher
+from statikk.infrastructure.databases.subrreal_db_client import record_key
+from statikk.infrastructure.databases.subrreal_db_client import SubrrealDBClient
+
+
+class FakeSurreal:
+    """
+    Stand-in for a driver connection that records every query and replays canned results.
+    """
+
+    def __init__(self, results):
+        self.results = results
+        self.queries = []
+
+    async def query(self, sql, vars=None):
+        self.queries.append((sql, vars))
+        return [{'status': 'OK', 'result': result} for result in self.results.pop(0)]
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def connection():
+    return FakeSurreal(results=[])
+
+
+@pytest.fixture
+async def db_client(connection):
+    client = SubrrealDBClient(host='localhost', port=8000, database='test', max_idle_time=None)
+
+    async def create_connection():
+        return connection
+
+    async def check_connection(_):
+        return True
+
+    client.pool.factory = create_connection
+    client.pool.health_check = check_connection
+    await client.connect()
+    yield client
+    await client.close()
+
+
+async def test_query_returns_rows_of_last_statement(db_client, connection):
+    connection.results.append([[{'id': '1'}], [{'id': '2'}]])
+
+    # Act
+    rows = await db_client.query('SELECT * FROM a; SELECT * FROM b')
+
+    # Assert
+    assert rows == [{'id': '2'}]
+
+
+async def test_query_raises_on_statement_error(db_client, connection):
+    async def failing_query(sql, vars=None):
+        return [{'status': 'ERR', 'result': 'Parse error'}]
+
+    connection.query = failing_query
+
+    # Act & Assert
+    with pytest.raises(Exception, match='Parse error'):
+        await db_client.query('SELEC * FROM a')
+
+
+async def test_update_binds_identifier_and_data(db_client, connection):
+    connection.results.append([[{'id': '1', 'name': 'New'}]])
+
+    # Act
+    await db_client.update('collections', '1', {'name': 'New'})
+
+    # Assert
+    sql, parameters = connection.queries[0]
+    assert 'MERGE $data' in sql
+    assert parameters == {'collection': 'collections', 'identifier': '1', 'data': {'name': 'New'}}
+
+
+async def test_batch_sends_statements_in_one_round_trip(db_client, connection):
+    connection.results.append([[{'id': '1'}], [{'id': '1', 'name': 'New'}]])
+
+    # Act
+    existing, updated = await db_client.batch([
+        ("SELECT id FROM type::thing('collections', $id)", {'id': '1'}),
+        db_client.update_statement('collections', '1', {'name': 'New'}),
+    ])
+
+    # Assert
+    assert existing == [{'id': '1'}]
+    assert updated == [{'id': '1', 'name': 'New'}]
+    assert len(connection.queries) == 1
+    sql, parameters = connection.queries[0]
+    assert sql.startswith("SELECT id FROM type::thing('collections', $s0_id);")
+    assert 'UPDATE type::thing($s1_collection, $s1_identifier) MERGE $s1_data RETURN id' in sql
+    assert parameters['s0_id'] == '1'
+    assert parameters['s1_data'] == {'name': 'New'}
+
+
+async def test_batch_raises_with_index_of_failed_statement(db_client, connection):
+    async def partially_failing_query(sql, vars=None):
+        return [{'status': 'OK', 'result': []}, {'status': 'ERR', 'result': 'Parse error'}]
+
+    connection.query = partially_failing_query
+
+    # Act & Assert
+    with pytest.raises(Exception, match='statement 1: Parse error'):
+        await db_client.batch([('SELECT * FROM a', None), ('SELEC * FROM b', None)])
+
+
+async def test_auto_batching_coalesces_concurrent_calls(connection):
+    client = SubrrealDBClient(host='localhost', port=8000, database='test', max_idle_time=None, auto_batch_window=0.01)
+
+    async def create_connection():
+        return connection
+
+    client.pool.factory = create_connection
+    client.pool.health_check = None
+    await client.connect()
+    connection.results.append([[{'id': '1'}], [{'id': '2'}], []])
+
+    # Act
+    first, second, third = await asyncio.gather(
+        client.query('SELECT * FROM users WHERE id = $id', {'id': '1'}),
+        client.query('SELECT * FROM users WHERE id = $id', {'id': '2'}),
+        client.delete('users', '3'),
+    )
+
+    # Assert
+    assert (first, second, third) == ([{'id': '1'}], [{'id': '2'}], [])
+    assert len(connection.queries) == 1
+    await client.close()
+
+
+async def test_auto_batching_fails_statements_missing_from_a_short_response():
+    async def execute(statements):
+        return [{'status': 'OK', 'result': [{'id': '1'}]}]
+
+    batcher = StatementBatcher(execute, window=0.01)
+
+    # Act
+    first, second = await asyncio.wait_for(
+        asyncio.gather(batcher.submit('SELECT * FROM a'), batcher.submit('SELECT * FROM b'), return_exceptions=True),
+        timeout=1,
+    )
+
+    # Assert
+    assert first == [{'id': '1'}]
+    assert isinstance(second, Exception)
+
+
+async def test_repeated_queries_are_served_from_statement_cache(db_client, connection):
+    connection.results.extend([[[{'id': '1'}]], [[{'id': '2'}]]])
+
+    # Act
+    await db_client.query('SELECT * FROM users WHERE id = $id', {'id': '1'})
+    await db_client.query('SELECT * FROM users WHERE id = $id', {'id': '2'})
+
+    # Assert
+    assert db_client.statement_cache.hits == 1
+    assert db_client.statement_cache.misses == 1
+    assert connection.queries[1] == ('SELECT * FROM users WHERE id = $id', {'id': '2'})
+
+
+async def test_insert_many_writes_one_statement_per_chunk(db_client, connection):
+    connection.results.extend([[[]], [[]], [[]]])
+
+    # Act
+    result = await db_client.insert_many('users', ({'id': str(i)} for i in range(5)), chunk_size=2)
+
+    # Assert
+    assert result.ok
+    assert (result.chunks, result.written) == (3, 5)
+    assert [len(parameters['rows']) for _, parameters in connection.queries] == [2, 2, 1]
+    assert connection.queries[0][0] == 'INSERT INTO users $rows'
+
+
+async def test_insert_many_reports_failed_chunks(db_client, connection):
+    async def failing_second_chunk(sql, vars=None):
+        if vars['rows'][0]['id'] == '2':
+            return [{'status': 'ERR', 'result': 'Database record already exists'}]
+        return [{'status': 'OK', 'result': []}]
+
+    connection.query = failing_second_chunk
+
+    # Act
+    result = await db_client.insert_many('users', [{'id': str(i)} for i in range(5)], chunk_size=2)
+
+    # Assert
+    assert not result.ok
+    assert result.written == 3
+    assert [(error.index, error.offset, error.size) for error in result.errors] == [(1, 2, 2)]
+
+
+async def test_insert_many_rejects_invalid_collection_name(db_client):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        await db_client.insert_many('users; DELETE users', [{'id': '1'}])
+
+
+async def test_upsert_many_accepts_async_iterables(db_client, connection):
+    async def rows():
+        for i in range(3):
+            yield {'id': str(i)}
+
+    connection.results.extend([[[]], [[]]])
+
+    # Act
+    result = await db_client.upsert_many('users', rows(), chunk_size=2)
+
+    # Assert
+    assert (result.chunks, result.written) == (2, 3)
+    assert connection.queries[0][0].startswith('FOR $row IN $rows')
+
+
+async def test_cursor_pages_by_key_until_short_page(db_client, connection):
+    connection.results.extend([[[{'id': 'collections:1'}, {'id': 'collections:2'}]], [[{'id': 'collections:3'}]]])
+
+    # Act
+    pages = [page async for page in db_client.cursor('collections', page_size=2)]
+
+    # Assert
+    assert pages == [[{'id': 'collections:1'}, {'id': 'collections:2'}], [{'id': 'collections:3'}]]
+    assert 'WHERE id >' not in connection.queries[0][0]
+    sql, parameters = connection.queries[1]
+    assert 'WHERE id > type::thing($collection, $after) ORDER BY id LIMIT $limit' in sql
+    assert parameters == {'collection': 'collections', 'limit': 2, 'after': '2'}
+
+
+async def test_update_reports_no_match_in_one_statement(db_client, connection):
+    connection.results.append([[]])
+
+    # Act
+    updated = await db_client.update('collections', 'missing', {'name': 'New'})
+
+    # Assert
+    assert updated == []
+    assert len(connection.queries) == 1
+    assert connection.queries[0][0] == 'UPDATE type::thing($collection, $identifier) MERGE $data RETURN id'
+
+
+async def test_versioned_update_writes_the_record_directly(db_client, connection):
+    connection.results.append([[{'id': 'collections:1'}]])
+
+    # Act
+    await db_client.update('collections', 'collections:⟨1⟩', {'name': 'New'}, version=3)
+
+    # Assert
+    sql, parameters = connection.queries[0]
+    assert sql == 'UPDATE type::thing($collection, $identifier) MERGE $data WHERE (version ?? 0) = $version RETURN id'
+    assert (parameters['identifier'], parameters['version']) == ('1', 3)
+
+
+async def test_delete_returns_deleted_rows(db_client, connection):
+    connection.results.append([[{'id': '1', 'name': 'Old'}]])
+
+    # Act
+    deleted = await db_client.delete('collections', '1')
+
+    # Assert
+    assert deleted == [{'id': '1', 'name': 'Old'}]
+    assert connection.queries[0] == (
+        'DELETE type::thing($collection, $identifier) RETURN BEFORE', {'collection': 'collections', 'identifier': '1'},
+    )
+
+
+@pytest.mark.parametrize('identifier', ['0190-ab', 'collections:0190-ab', 'collections:⟨0190-ab⟩'])
+def test_record_key_accepts_keys_and_record_ids(identifier):
+    # Act
+    key = record_key('collections', identifier)
+
+    # Assert
+    assert key == '0190-ab'
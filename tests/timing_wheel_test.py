@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import random
+
+from statikk.infrastructure.scheduling.timing_wheel import TimingWheel
+
+
+def test_items_come_due_at_their_deadline():
+    wheel = TimingWheel(start=0, wheel_size=4)
+    for deadline in (1, 3, 5, 17, 70):
+        wheel.schedule(deadline, deadline)
+
+    # Act
+    batches = [wheel.advance(now) for now in (0, 1, 4, 16, 17, 69, 70)]
+
+    # Assert
+    assert batches == [[], [1], [3], [5], [17], [], [70]]
+    assert len(wheel) == 0
+
+
+def test_past_deadlines_are_due_on_the_next_advance():
+    wheel = TimingWheel(start=100)
+
+    # Act
+    wheel.schedule(50, 'late')
+
+    # Assert
+    assert wheel.advance(100) == ['late']
+
+
+def test_cancelled_items_never_come_due():
+    wheel = TimingWheel(start=0, wheel_size=4)
+    kept = wheel.schedule(40, 'kept')
+    cancelled = wheel.schedule(40, 'cancelled')
+
+    # Act
+    assert wheel.cancel(cancelled)
+
+    # Assert
+    assert wheel.advance(40) == ['kept']
+    assert not wheel.cancel(kept)
+
+
+def test_matches_a_sorted_reference():
+    rng = random.Random(7)
+    wheel = TimingWheel(start=0, tick=0.5, wheel_size=8)
+    deadlines = [rng.uniform(0, 5000) for _ in range(2000)]
+    for deadline in deadlines:
+        wheel.schedule(deadline, deadline)
+
+    # Act
+    fired = []
+    now = 0.0
+    while now < 5000:
+        now += rng.uniform(0, 40)
+        for deadline in wheel.advance(now):
+            assert deadline // 0.5 <= now // 0.5
+            fired.append(deadline)
+
+    # Assert
+    assert sorted(fired) == sorted(deadlines)
+    assert [deadline // 0.5 for deadline in fired] == sorted(deadline // 0.5 for deadline in deadlines)
+
+
+def test_idle_wheel_jumps_to_the_target():
+    wheel = TimingWheel(start=0)
+
+    # Act
+    wheel.advance(10 ** 9)
+
+    # Assert
+    assert wheel.time == 10 ** 9
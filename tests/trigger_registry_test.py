@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import pytest
+from statikk.core.application.services.trigger_registry import split_trigger
+from statikk.core.application.services.trigger_registry import TriggerRegistry
+from statikk.core.domain.entities.cloud_function import CloudFunction
+from statikk.core.domain.value_objects.cloud_function_id import CloudFunctionID
+
+
+def cloud_function(function_id, *triggers):
+    return CloudFunction(CloudFunctionID(function_id), function_id, 'def handler(payload): pass', list(triggers))
+
+
+@pytest.fixture
+def registry():
+    registry = TriggerRegistry()
+    registry.register(cloud_function('exact', 'collection:c-1:create'))
+    registry.register(cloud_function('any-collection', 'collection:*:create'))
+    registry.register(cloud_function('everything-in-c-1', 'collection:c-1:**'))
+    registry.register(cloud_function('orders', 'http:/orders/**', 'http:/invoices'))
+    return registry
+
+
+def test_split_trigger_splits_keys_and_paths():
+    # Act
+    segments = [split_trigger('collection:c-1:create'), split_trigger(' http:/orders/*/items/ ')]
+
+    # Assert
+    assert segments == [('collection', 'c-1', 'create'), ('http', 'orders', '*', 'items')]
+
+
+def test_match_exact_and_wildcard_triggers(registry):
+    # Act
+    created = registry.match('collection:c-1:create')
+    other_collection = registry.match('collection:c-2:create')
+    deleted = registry.match('collection:c-1:delete')
+
+    # Assert
+    assert created == {'exact', 'any-collection', 'everything-in-c-1'}
+    assert other_collection == {'any-collection'}
+    assert deleted == {'everything-in-c-1'}
+
+
+def test_tail_wildcard_matches_any_number_of_segments(registry):
+    # Act
+    matches = [registry.match(path) for path in ('http:/orders', 'http:/orders/o-1/items', 'http:/invoices/i-1')]
+
+    # Assert
+    assert matches == [{'orders'}, {'orders'}, set()]
+
+
+def test_register_replaces_previous_triggers(registry):
+    # Act
+    registry.register(cloud_function('exact', 'collection:c-1:update'))
+
+    # Assert
+    assert 'exact' not in registry.match('collection:c-1:create')
+    assert 'exact' in registry.match('collection:c-1:update')
+
+
+def test_unregister_prunes_the_trie(registry):
+    # Act
+    for function_id in ('exact', 'any-collection', 'everything-in-c-1', 'orders'):
+        registry.unregister(function_id)
+
+    # Assert
+    assert len(registry) == 0
+    assert registry._root.children == {}
+
+
+async def test_load_indexes_every_function():
+    registry = TriggerRegistry()
+
+    async def cloud_functions():
+        yield cloud_function('f-1', 'collection:c-1:create')
+        yield cloud_function('f-2')
+
+    # Act
+    await registry.load(cloud_functions())
+
+    # Assert
+    assert registry.match('collection:c-1:create') == {'f-1'}
+    assert 'f-1' in registry and 'f-2' not in registry
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from statikk.core.application.services.organization_service import OrganizationService
+from statikk.core.application.unit_of_work import UnitOfWork
+from statikk.core.application.unit_of_work import UnitOfWorkRepository
+from statikk.core.domain.entities.organization import Organization
+from statikk.core.domain.entities.role import Role
+from statikk.core.domain.exceptions import ConcurrentUpdateError
+from statikk.core.domain.repositories.organization_repository import OrganizationRepository
+from statikk.core.domain.value_objects.organization_id import OrganizationID
+from statikk.core.domain.value_objects.permissions import Permission
+from statikk.core.domain.value_objects.role_id import RoleID
+from statikk.core.domain.value_objects.user_id import UserID
+
+
+@pytest.fixture
+def mock_organization_repository():
+    repository = Mock(spec=OrganizationRepository)
+
+    async def get_by_id(organization_id):
+        return Organization(organization_id=organization_id, name='Test Organization', owner_id=UserID('user-123'))
+
+    repository.get_by_id.side_effect = get_by_id
+    return repository
+
+
+@pytest.fixture
+def repository(mock_organization_repository):
+    return UnitOfWorkRepository(mock_organization_repository, id_attribute='organization_id')
+
+
+async def test_identity_map_returns_same_object(repository, mock_organization_repository):
+    with UnitOfWork():
+        # Act
+        first = await repository.get_by_id(OrganizationID('org-123'))
+        second = await repository.get_by_id(OrganizationID('org-123'))
+
+    # Assert
+    assert first is second
+    mock_organization_repository.get_by_id.assert_called_once()
+
+
+async def test_calls_pass_through_without_unit_of_work(repository, mock_organization_repository):
+    organization = await repository.get_by_id(OrganizationID('org-123'))
+
+    # Act
+    await repository.update(organization)
+
+    # Assert
+    mock_organization_repository.update.assert_called_once_with(organization)
+
+
+async def test_repeated_updates_are_flushed_once_at_commit(repository, mock_organization_repository):
+    with UnitOfWork() as work:
+        organization = await repository.get_by_id(OrganizationID('org-123'))
+        organization.name = 'First'
+        await repository.update(organization)
+        organization.name = 'Second'
+        await repository.update(organization)
+        mock_organization_repository.update.assert_not_called()
+
+        # Act
+        await work.commit()
+
+    # Assert
+    mock_organization_repository.update.assert_called_once_with(organization)
+
+
+async def test_organizations_with_members_are_not_written_when_only_read(repository, mock_organization_repository):
+    async def get_by_id(organization_id):
+        role = Role(RoleID('role-1'), 'member', [Permission('read')])
+        return Organization(organization_id, 'Test Organization', UserID('user-123'), members={'user-456': role})
+
+    mock_organization_repository.get_by_id.side_effect = get_by_id
+
+    with UnitOfWork() as work:
+        organization = await repository.get_by_id(OrganizationID('org-123'))
+        await repository.update(organization)
+
+        # Act
+        await work.commit()
+
+    # Assert
+    mock_organization_repository.update.assert_not_called()
+
+
+async def test_unchanged_entities_are_not_written(repository, mock_organization_repository):
+    with UnitOfWork() as work:
+        organization = await repository.get_by_id(OrganizationID('org-123'))
+        await repository.update(organization)
+
+        # Act
+        await work.commit()
+
+    # Assert
+    mock_organization_repository.update.assert_not_called()
+
+
+async def test_entity_saved_then_deleted_is_never_written(repository, mock_organization_repository):
+    organization = Organization(organization_id=OrganizationID('org-456'), name='New', owner_id=UserID('user-123'))
+    with UnitOfWork() as work:
+        await repository.save(organization)
+        await repository.delete(organization.organization_id)
+
+        # Act
+        await work.commit()
+
+    # Assert
+    mock_organization_repository.save.assert_not_called()
+    mock_organization_repository.delete.assert_not_called()
+
+
+async def test_rollback_discards_changes(repository, mock_organization_repository):
+    with UnitOfWork() as work:
+        organization = await repository.get_by_id(OrganizationID('org-123'))
+        organization.name = 'Renamed'
+        await repository.update(organization)
+
+        # Act
+        work.rollback()
+        await work.commit()
+
+    # Assert
+    mock_organization_repository.update.assert_not_called()
+
+
+async def test_add_member_reads_only_the_members_involved(repository, mock_organization_repository):
+    service = OrganizationService(repository)
+    admin = Role(RoleID('role-1'), 'admin', [Permission('add_member')])
+
+    async def get_with_members(organization_id, user_ids):
+        members = {'user-123': admin, 'user-789': admin}
+        return Organization(
+            organization_id, 'Test Organization', UserID('user-123'),
+            members={user_id.id: members[user_id.id] for user_id in user_ids if user_id.id in members},
+        )
+
+    mock_organization_repository.get_with_members.side_effect = get_with_members
+    with UnitOfWork() as work:
+        # Act
+        updated = await service.add_member('org-123', user_id='user-456', role=admin, requesting_user_id='user-123')
+        await work.commit()
+
+    # Assert
+    mock_organization_repository.get_by_id.assert_not_called()
+    mock_organization_repository.update.assert_called_once_with(updated)
+    assert set(updated.members) == {'user-456'}
+
+
+async def test_retries_under_a_unit_of_work_write_and_read_afresh(repository, mock_organization_repository):
+    service = OrganizationService(repository)
+    owner = Role(RoleID('role-1'), 'owner', [Permission('update_organization')])
+
+    async def get_by_id(organization_id):
+        return Organization(organization_id, 'Test Organization', UserID('user-123'), members={'user-123': owner})
+
+    async def get_with_members(organization_id, user_ids):
+        return await get_by_id(organization_id)
+
+    mock_organization_repository.get_by_id.side_effect = get_by_id
+    mock_organization_repository.get_with_members.side_effect = get_with_members
+    mock_organization_repository.update.side_effect = [ConcurrentUpdateError('stale'), None]
+    with UnitOfWork() as work:
+        stale = await repository.get_by_id(OrganizationID('org-123'))
+
+        # Act
+        updated = await service.update_organization('org-123', 'Renamed', requesting_user_id='user-123')
+        current = await repository.get_by_id(OrganizationID('org-123'))
+        await work.commit()
+
+    # Assert
+    assert mock_organization_repository.update.call_count == 2
+    assert mock_organization_repository.update.call_args_list[0].args[0] is stale
+    assert updated is current is not stale
+    assert updated.name == 'Renamed'
@@ -34,7 +34,7 @@ def user_service(mock_user_repository):
     return UserService(user_repository=mock_user_repository)
 
 
-def test_get_user_success(user_service, mock_user_repository):
+async def test_get_user_success(user_service, mock_user_repository):
     """
     Test retrieving a user successfully.
 
@@ -49,14 +49,14 @@ def test_get_user_success(user_service, mock_user_repository):
     mock_user_repository.get_by_id.return_value = expected_user
 
     # Act
-    user = user_service.get_user(user_id.id)
+    user = await user_service.get_user(user_id.id)
 
     # Assert
     assert user == expected_user
     mock_user_repository.get_by_id.assert_called_once_with(user_id.id)
 
 
-def test_get_user_not_found(user_service, mock_user_repository):
+async def test_get_user_not_found(user_service, mock_user_repository):
     """
     Test retrieving a user that does not exist.
 
@@ -69,10 +69,10 @@ def test_get_user_not_found(user_service, mock_user_repository):
 
     # Act & Assert
     with pytest.raises(ValueError, match=f"User with ID {user_id.id} does not exist."):
-        user_service.get_user(user_id.id)
+        await user_service.get_user(user_id.id)
 
 
-def test_create_user(user_service, mock_user_repository):
+async def test_create_user(user_service, mock_user_repository):
     """
     Test creating a new user.
 
@@ -84,7 +84,7 @@ def test_create_user(user_service, mock_user_repository):
     email = 'newuser@example.com'
 
     # Act
-    user = user_service.create_user(username=username, email=email)
+    user = await user_service.create_user(username=username, email=email)
 
     # Assert
     assert user.username == username
@@ -93,7 +93,7 @@ def test_create_user(user_service, mock_user_repository):
     mock_user_repository.save.assert_called_once_with(user)
 
 
-def test_update_user_email(user_service, mock_user_repository):
+async def test_update_user_email(user_service, mock_user_repository):
     """
     Test updating an existing user's email.
 
@@ -109,7 +109,7 @@ def test_update_user_email(user_service, mock_user_repository):
     new_email = 'new@example.com'
 
     # Act
-    updated_user = user_service.update_user_email(user_id.id, new_email)
+    updated_user = await user_service.update_user_email(user_id.id, new_email)
 
     # Assert
     assert updated_user.email == new_email
@@ -117,7 +117,7 @@ def test_update_user_email(user_service, mock_user_repository):
     mock_user_repository.save.assert_called_once_with(updated_user)
 
 
-def test_delete_user(user_service, mock_user_repository):
+async def test_delete_user(user_service, mock_user_repository):
     """
     Test deleting a user.
 
@@ -132,7 +132,7 @@ def test_delete_user(user_service, mock_user_repository):
     mock_user_repository.get_by_id.return_value = existing_user
 
     # Act
-    user_service.delete_user(user_id.id)
+    await user_service.delete_user(user_id.id)
 
     # Assert
     mock_user_repository.get_by_id.assert_called_once_with(user_id.id)
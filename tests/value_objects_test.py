@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import copy
+import gc
+import pickle
+import uuid
+
+import pytest
+from statikk.core.domain.entities.project_config import ProjectConfig
+from statikk.core.domain.value_objects.cloud_function_id import CloudFunctionID
+from statikk.core.domain.value_objects.collection_id import CollectionID
+from statikk.core.domain.value_objects.config_key import ConfigKey
+from statikk.core.domain.value_objects.permissions import Permission
+from statikk.core.domain.value_objects.project_id import ProjectID
+from statikk.core.domain.value_objects.user_id import UserID
+
+
+def test_ids_are_hashable_by_value():
+    # Act
+    members = {UserID('user-1'): 'admin'}
+
+    # Assert
+    assert members[UserID('user-1')] == 'admin'
+    assert {Permission('read'), Permission('read')} == {Permission('read')}
+
+
+def test_ids_of_different_types_are_not_equal():
+    # Assert
+    assert CollectionID('abc') != CloudFunctionID('abc')
+
+
+def test_ids_are_immutable():
+    user_id = UserID('user-1')
+
+    # Act & Assert
+    with pytest.raises(AttributeError):
+        user_id.id = 'user-2'
+    with pytest.raises(AttributeError):
+        user_id.other = 'value'
+    with pytest.raises(AttributeError):
+        ConfigKey('key').key = 'other'
+
+
+def test_project_id_validates_unless_trusted():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        ProjectID('not-a-uuid')
+    assert str(ProjectID.from_trusted('not-a-uuid')) == 'not-a-uuid'
+
+
+def test_intern_returns_shared_instance():
+    # Act
+    first = UserID.intern('user-interned')
+    second = UserID.intern('user-interned')
+
+    # Assert
+    assert first is second
+    assert first == UserID('user-interned')
+
+
+def test_intern_drops_unreferenced_ids():
+    UserID.intern('user-dropped')
+
+    # Act
+    gc.collect()
+
+    # Assert
+    assert 'user-dropped' not in UserID._interned
+
+
+def test_copies_and_pickles_keep_the_value():
+    user_id = UserID('user-1')
+
+    # Assert
+    assert copy.deepcopy(user_id) is user_id
+    assert pickle.loads(pickle.dumps(user_id)) == user_id
+    assert pickle.loads(pickle.dumps(ConfigKey('key'))) == ConfigKey('key')
+
+
+def test_config_keys_work_as_dict_keys():
+    project_config = ProjectConfig(ProjectID(), config={ConfigKey('region'): 'eu'})
+
+    # Act
+    project_config.update_config(ConfigKey('region'), 'us')
+
+    # Assert
+    assert project_config.config == {ConfigKey('region'): 'us'}
+
+
+def test_new_ids_are_time_ordered_uuid7():
+    # Act
+    ids = [CollectionID() for _ in range(1000)]
+
+    # Assert
+    assert all(uuid.UUID(str(i)).version == 7 for i in ids)
+    assert [str(i) for i in ids] == sorted(str(i) for i in ids)
+
+
+def test_uuid4_can_still_be_generated_and_validated(monkeypatch):
+    monkeypatch.setattr(ProjectID, 'UUID_VERSION', 4)
+
+    # Act
+    project_id = ProjectID()
+
+    # Assert
+    assert uuid.UUID(str(project_id)).version == 4
+    assert ProjectID(str(uuid.uuid4())) is not None
+    assert uuid.UUID(str(CollectionID())).version == 7
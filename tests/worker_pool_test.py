@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from statikk.core.domain.exceptions import FunctionExecutionError
+from statikk.infrastructure.execution.code_cache import CodeCache
+from statikk.infrastructure.execution.worker import WORKER_ENVIRONMENT
+from statikk.infrastructure.execution.worker_pool import WorkerPool
+
+ECHO = '''
+def handler(payload):
+    return {'echo': payload}
+'''
+
+PID = '''
+import os
+
+def handler(payload):
+    return os.getpid()
+'''
+
+COUNTER = '''
+calls = 0
+
+def handler(payload):
+    global calls
+    calls += 1
+    return calls
+'''
+
+
+@pytest.fixture
+async def pool():
+    pool = WorkerPool(size=1)
+    await pool.start()
+    yield pool
+    await pool.close()
+
+
+async def test_run_returns_handler_result(pool):
+    # Act
+    result = await pool.run('f-1@0', ECHO, {'name': 'Ada'}, timeout=5)
+
+    # Assert
+    assert result == {'echo': {'name': 'Ada'}}
+
+
+async def test_run_supports_coroutine_handlers(pool):
+    code = 'async def handler(payload):\n    return payload * 2\n'
+
+    # Act
+    result = await pool.run('f-1@0', code, 21, timeout=5)
+
+    # Assert
+    assert result == 42
+
+
+async def test_workers_are_reused_with_code_loaded(pool):
+    # Act
+    first = await pool.run('f-1@0', COUNTER, None, timeout=5)
+    second = await pool.run('f-1@0', 'not sent again', None, timeout=5)
+    reloaded = await pool.run('f-1@1', COUNTER, None, timeout=5)
+
+    # Assert
+    assert (first, second, reloaded) == (1, 2, 1)
+
+
+async def test_handler_errors_are_reported(pool):
+    code = 'def handler(payload):\n    raise ValueError("bad payload")\n'
+
+    # Act
+    with pytest.raises(FunctionExecutionError) as error:
+        await pool.run('f-1@0', code, None, timeout=5)
+
+    # Assert
+    assert error.value.error_type == 'ValueError'
+    assert 'bad payload' in str(error.value)
+    assert '<cloud function ' in error.value.traceback
+    assert await pool.run('f-2@0', ECHO, 1, timeout=5) == {'echo': 1}
+
+
+async def test_code_without_handler_is_rejected(pool):
+    # Act
+    with pytest.raises(FunctionExecutionError) as error:
+        await pool.run('f-1@0', 'x = 1', None, timeout=5)
+
+    # Assert
+    assert error.value.error_type == 'TypeError'
+
+
+async def test_timeout_replaces_the_worker(pool):
+    code = 'import time\n\ndef handler(payload):\n    time.sleep(10)\n'
+    pid = await pool.run('pid@0', PID, None, timeout=5)
+
+    # Act
+    with pytest.raises(TimeoutError):
+        await pool.run('slow@0', code, None, timeout=0.2)
+
+    # Assert
+    assert await pool.run('pid@0', PID, None, timeout=5) != pid
+
+
+async def test_memory_limit_raises_memory_error(pool):
+    code = 'def handler(payload):\n    return len(bytearray(payload))\n'
+
+    # Act
+    with pytest.raises(FunctionExecutionError) as error:
+        await pool.run('f-1@0', code, 1024 ** 3, timeout=5, memory_limit=256 * 1024 ** 2)
+
+    # Assert
+    assert error.value.error_type == 'MemoryError'
+    assert await pool.run('f-1@0', code, 1024, timeout=5, memory_limit=256 * 1024 ** 2) == 1024
+
+
+async def test_functions_cannot_lift_the_worker_memory_cap():
+    code = (
+        'import resource\n\n'
+        'def handler(payload):\n'
+        '    soft, hard = resource.getrlimit(resource.RLIMIT_AS)\n'
+        '    resource.setrlimit(resource.RLIMIT_AS, (hard, hard))\n'
+        '    return len(bytearray(payload))\n'
+    )
+    pool = WorkerPool(size=1, memory_limit=256 * 1024 ** 2)
+    await pool.start()
+
+    try:
+        # Act
+        with pytest.raises(FunctionExecutionError) as error:
+            await pool.run('f-1@0', code, 1024 ** 3, timeout=5, memory_limit=128 * 1024 ** 2)
+        lifted = await pool.run('f-1@0', code, 192 * 1024 ** 2, timeout=5, memory_limit=128 * 1024 ** 2)
+    finally:
+        await pool.close()
+
+    # Assert
+    assert error.value.error_type == 'MemoryError'
+    assert lifted == 192 * 1024 ** 2
+
+
+async def test_functions_only_see_harmless_environment_variables(pool):
+    code = 'import os\n\ndef handler(payload):\n    return sorted(os.environ)\n'
+
+    # Act
+    names = await pool.run('f-1@0', code, None, timeout=5)
+
+    # Assert
+    assert set(names) <= set(WORKER_ENVIRONMENT)
+
+
+async def test_large_messages_reach_the_worker(pool):
+    payload = 'x' * (1024 ** 2)
+
+    # Act
+    result = await pool.run('f-1@0', ECHO, payload, timeout=5)
+
+    # Assert
+    assert result == {'echo': payload}
+
+
+async def test_invocations_beyond_size_wait_for_a_worker(pool):
+    code = 'import time\n\ndef handler(payload):\n    time.sleep(0.2)\n    return payload\n'
+
+    # Act
+    results = await asyncio.gather(*(pool.run('f-1@0', code, i, timeout=0.5) for i in range(3)))
+
+    # Assert
+    assert results == [0, 1, 2]
+
+
+async def test_run_requires_a_started_pool():
+    # Act
+    with pytest.raises(RuntimeError):
+        await WorkerPool(size=1).run('f-1@0', ECHO, None, timeout=5)
+
+
+async def test_workers_load_bytecode_from_the_code_cache(tmp_path):
+    # Store other bytecode under ECHO's hash: a worker returning its result did not compile ECHO itself.
+    code_cache = CodeCache(str(tmp_path))
+    code_cache._write(code_cache._path(CodeCache.digest(ECHO)), compile(PID.replace('os.getpid()', "'cached'"), '<test>', 'exec'))
+    pool = WorkerPool(size=1, code_cache_directory=str(tmp_path))
+    await pool.start()
+
+    try:
+        # Act
+        result = await pool.run('f-1@0', ECHO, None, timeout=5)
+    finally:
+        await pool.close()
+
+    # Assert
+    assert result == 'cached'